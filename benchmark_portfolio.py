@@ -3,22 +3,57 @@
 Benchmark Portfolio — 5 profiles spanning trivial to hardest.
 
 Usage:
-    .venv/bin/python benchmark_portfolio.py [num_boards]
+    .venv/bin/python benchmark_portfolio.py [num_boards] [--exact]
+        [--profile cpu|mem] [--profile-dir DIR] [--top N]
+        [--json PATH] [--compare BASELINE.json] [--threshold PCT]
 
-Default: 20 boards per profile. Outputs per-profile timing stats.
+Default: 20 boards per profile. Outputs per-profile timing stats and builder
+attempts per board.  --exact deals with the exact constructive sampler
+(ENABLE_EXACT_SAMPLER) instead of shape help.
+
+--profile cpu wraps each profile's generate_deals() call in cProfile, writes
+<DIR>/<profile>.pstats (open with `python -m pstats` or snakeviz) and prints
+the top N functions by own time plus the builder's known hot spots
+(HOT_FUNCTIONS).  --profile mem does the same with tracemalloc: peak traced
+memory and the top N allocation sites still held when the run ends (caches,
+compiled tables), written to <DIR>/<profile>.mem.txt.
+Profiling slows the run (tracemalloc by several times), so compare wall
+times only between runs in the same mode.
+
+--json PATH writes the results with their raw per-board samples and the
+environment (commit, Python, CPU) so they can serve as a baseline.
+--compare BASELINE.json reports each profile's change in median and p95
+board time and in attempts/board against that baseline, with bootstrap
+95% confidence intervals, and exits with status 1 when a profile's median
+is more than --threshold percent slower (default 10) and the interval
+excludes zero.  Profiles whose baseline median is under MIN_COMPARED_MS
+are reported but never fail the run.  Keep a baseline per machine:
+
+    python benchmark_portfolio.py 50 --json baseline.json
+    python benchmark_portfolio.py 50 --compare baseline.json
 """
 
+import argparse
+import cProfile
+import io
 import json
+import os
+import platform
+import pstats
 import random
+import re
 import statistics
+import subprocess
 import sys
 import time
+import tracemalloc
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from bridge_engine.hand_profile import HandProfile
+from bridge_engine import deal_generator
 from bridge_engine.deal_generator import generate_deals
 from bridge_engine.setup_env import run_setup
 
@@ -36,6 +71,30 @@ BENCHMARK_PROFILES = [
 PROFILE_DIR = Path(__file__).resolve().parent / "profiles"
 SEED = 778899  # Canonical deterministic seed
 
+# Default output directory of --profile reports.
+PROFILE_REPORT_DIR = Path("out") / "benchmark_profile"
+
+# Builder functions always listed in --profile cpu output (name prefixes, so
+# the card-id variants such as _constrained_fill_ids are included).
+HOT_FUNCTIONS = (
+    "_build_single_constrained_deal_v2",
+    "_deal_with_help",
+    "_constrained_fill",
+    "_match_seat",
+    "_compute_suit_analysis",
+)
+
+# Stack depth recorded per allocation by --profile mem.
+TRACEMALLOC_FRAMES = 8
+
+# Bumped when the --json layout changes incompatibly.
+RESULTS_FORMAT = 1
+
+# --compare: bootstrap resamples per interval, and the baseline median
+# (ms) under which timing noise dominates and slowdowns are not failures.
+BOOTSTRAP_RESAMPLES = 2000
+MIN_COMPARED_MS = 0.5
+
 
 def load_profile(filename: str) -> HandProfile:
     path = PROFILE_DIR / filename
@@ -43,10 +102,69 @@ def load_profile(filename: str) -> HandProfile:
     return HandProfile.from_dict(raw)
 
 
-def run_benchmark(num_boards: int = 20) -> list[dict]:
-    """Run all 5 profiles and collect timing data."""
+def _report_stem(label: str) -> str:
+    """File-name stem of a profile's reports: 'Profile A (Loose)' -> 'Profile_A_Loose'."""
+    return re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_")
+
+
+def _cpu_report(profiler: cProfile.Profile, path: Path, top: int) -> str:
+    """Dump profiler to path (.pstats) and return the text summary."""
+    profiler.dump_stats(str(path))
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+
+    stream.write("  Builder hot spots (calls, own s, cumulative s):\n")
+    rows = [
+        (func, stat)
+        for func, stat in stats.stats.items()  # type: ignore[attr-defined]
+        if func[2].startswith(HOT_FUNCTIONS)
+    ]
+    for (filename, line, name), (_cc, ncalls, tottime, cumtime, _callers) in sorted(
+        rows, key=lambda row: -row[1][3]
+    ):
+        stream.write(
+            f"    {name:<40} {ncalls:>10} {tottime:>9.3f} {cumtime:>9.3f}"
+            f"  {Path(filename).name}:{line}\n"
+        )
+    return stream.getvalue()
+
+
+def _mem_report(snapshot: tracemalloc.Snapshot, peak: int, path: Path, top: int) -> str:
+    """Write the top allocation sites of snapshot to path and return them."""
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    lines = [f"  Peak traced memory: {peak / 1024:.1f} KiB"]
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"    {stat.size / 1024:>9.1f} KiB {stat.count:>8} blocks  "
+            f"{Path(frame.filename).name}:{frame.lineno}"
+        )
+    text = "\n".join(lines) + "\n"
+    path.write_text(text, encoding="utf-8")
+    return text
+
+
+def run_benchmark(
+    num_boards: int = 20,
+    profile_mode: str | None = None,
+    report_dir: Path = PROFILE_REPORT_DIR,
+    top: int = 15,
+) -> list[dict]:
+    """
+    Run all 5 profiles and collect timing data.
+
+    profile_mode "cpu" or "mem" profiles each generate_deals() call and adds
+    "report" (text summary) and "report_path" to that profile's result.
+    """
     import tempfile
 
+    if profile_mode is not None:
+        report_dir.mkdir(parents=True, exist_ok=True)
+
     results = []
 
     for label, filename in BENCHMARK_PROFILES:
@@ -63,18 +181,36 @@ def run_benchmark(num_boards: int = 20) -> list[dict]:
             )
 
             # Time the full generation
+            profiler = cProfile.Profile() if profile_mode == "cpu" else None
+            if profile_mode == "mem":
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+            elif profiler is not None:
+                profiler.enable()
             t0 = time.monotonic()
-            deal_set = generate_deals(
-                setup, profile, num_boards, enable_rotation=False,
-            )
-            wall_time = time.monotonic() - t0
+            try:
+                deal_set = generate_deals(
+                    setup, profile, num_boards, enable_rotation=False,
+                )
+                wall_time = time.monotonic() - t0
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+                if profile_mode == "mem":
+                    snapshot = tracemalloc.take_snapshot()
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
 
         board_times = deal_set.board_times
+        board_attempts = deal_set.board_attempts
         result = {
             "label": label,
             "boards": len(deal_set.deals),
             "wall_time": wall_time,
             "reseeds": deal_set.reseed_count,
+            "avg_attempts": statistics.mean(board_attempts) if board_attempts else 0,
+            "max_attempts": max(board_attempts) if board_attempts else 0,
+            "board_times": list(board_times),
+            "board_attempts": list(board_attempts),
             "avg_ms": statistics.mean(board_times) * 1000 if board_times else 0,
             "median_ms": statistics.median(board_times) * 1000 if board_times else 0,
             "max_ms": max(board_times) * 1000 if board_times else 0,
@@ -85,39 +221,288 @@ def run_benchmark(num_boards: int = 20) -> list[dict]:
                 else max(board_times) * 1000 if board_times else 0
             ),
         }
+        if profile_mode == "cpu":
+            report_path = report_dir / f"{_report_stem(label)}.pstats"
+            result["report"] = _cpu_report(profiler, report_path, top)
+            result["report_path"] = str(report_path)
+        elif profile_mode == "mem":
+            report_path = report_dir / f"{_report_stem(label)}.mem.txt"
+            result["report"] = _mem_report(snapshot, peak, report_path, top)
+            result["report_path"] = str(report_path)
         results.append(result)
 
     return results
 
 
-def print_results(results: list[dict], num_boards: int) -> None:
+def print_results(results: list[dict], num_boards: int, mode: str = "shape help") -> None:
     """Print benchmark results as a formatted table."""
-    print(f"\n{'='*90}")
-    print(f"  BENCHMARK PORTFOLIO — {num_boards} boards/profile, seed={SEED}")
-    print(f"{'='*90}")
+    print(f"\n{'='*107}")
+    print(f"  BENCHMARK PORTFOLIO — {num_boards} boards/profile, seed={SEED}, {mode}")
+    print(f"{'='*107}")
     print(
         f"  {'Profile':<28} {'Boards':>6} {'Wall(s)':>8} "
-        f"{'Avg(ms)':>8} {'Med(ms)':>8} {'P95(ms)':>8} {'Max(ms)':>8} {'Reseed':>6}"
+        f"{'Avg(ms)':>8} {'Med(ms)':>8} {'P95(ms)':>8} {'Max(ms)':>8} {'Reseed':>6} "
+        f"{'Att/bd':>7} {'MaxAtt':>7}"
+    )
+    print(
+        f"  {'-'*28} {'-'*6} {'-'*8} {'-'*8} {'-'*8} {'-'*8} {'-'*8} {'-'*6} "
+        f"{'-'*7} {'-'*7}"
     )
-    print(f"  {'-'*28} {'-'*6} {'-'*8} {'-'*8} {'-'*8} {'-'*8} {'-'*8} {'-'*6}")
 
     for r in results:
         print(
             f"  {r['label']:<28} {r['boards']:>6} {r['wall_time']:>8.3f} "
             f"{r['avg_ms']:>8.1f} {r['median_ms']:>8.1f} {r['p95_ms']:>8.1f} "
-            f"{r['max_ms']:>8.1f} {r['reseeds']:>6}"
+            f"{r['max_ms']:>8.1f} {r['reseeds']:>6} "
+            f"{r['avg_attempts']:>7.1f} {r['max_attempts']:>7}"
         )
 
     total_wall = sum(r["wall_time"] for r in results)
     total_boards = sum(r["boards"] for r in results)
     print(f"  {'-'*28} {'-'*6} {'-'*8}")
     print(f"  {'TOTAL':<28} {total_boards:>6} {total_wall:>8.3f}")
-    print(f"{'='*90}\n")
+    print(f"{'='*107}\n")
+
+
+def print_reports(results: list[dict], profile_mode: str) -> None:
+    """Print the --profile summaries written by run_benchmark()."""
+    for r in results:
+        print(f"--- {r['label']} ({profile_mode}) -> {r['report_path']}")
+        print(r["report"])
+
+
+# ---------------------------------------------------------------------------
+# Stored results and regression comparison
+# ---------------------------------------------------------------------------
+
+
+def _git_commit() -> str | None:
+    """HEAD commit of the checkout (suffixed '+dirty' with local edits), if any."""
+    root = Path(__file__).resolve().parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=root, capture_output=True,
+            text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "diff", "--quiet", "HEAD", "--", "bridge_engine"], cwd=root,
+        ).returncode != 0
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("+dirty" if dirty else "")
+
+
+def _cpu_model() -> str:
+    """CPU model name (platform.processor() is often empty on Linux)."""
+    try:
+        for line in Path("/proc/cpuinfo").read_text().splitlines():
+            if line.startswith("model name"):
+                return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def environment_info() -> dict:
+    """Where and on what the benchmark ran."""
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_results(path: Path, results: list[dict], num_boards: int, mode: str) -> None:
+    """Write results (with raw samples) and the environment as JSON."""
+    payload = {
+        "format": RESULTS_FORMAT,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "num_boards": num_boards,
+        "seed": SEED,
+        "mode": mode,
+        "environment": environment_info(),
+        "profiles": [
+            {k: v for k, v in r.items() if k != "report"} for r in results
+        ],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> dict:
+    """Read a write_results() file; raises ValueError if it is not one."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or payload.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"{path} is not a benchmark_portfolio.py --json file")
+    return payload
+
+
+def _p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def bootstrap_delta(
+    baseline: list[float],
+    current: list[float],
+    stat,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: int = SEED,
+) -> tuple[float, float, float]:
+    """
+    stat(current) - stat(baseline) with a percentile-bootstrap 95% interval
+    (both samples resampled independently; seeded, so reports repeat).
+    """
+    rng = random.Random(seed)
+    delta = stat(current) - stat(baseline)
+    deltas = sorted(
+        stat(rng.choices(current, k=len(current)))
+        - stat(rng.choices(baseline, k=len(baseline)))
+        for _ in range(resamples)
+    )
+    return delta, deltas[int(resamples * 0.025)], deltas[int(resamples * 0.975) - 1]
+
+
+def compare_results(
+    baseline: dict, results: list[dict], threshold_pct: float = 10.0,
+) -> list[dict]:
+    """
+    Per-profile deltas of results against a load_results() baseline.
+
+    Each row has the baseline/current median, p95 (ms) and attempts/board,
+    their (delta, ci_low, ci_high) and "regression": the median is more than
+    threshold_pct slower with an interval above zero, on a profile whose
+    baseline median is at least MIN_COMPARED_MS.  Profiles missing from
+    the baseline are skipped.
+    """
+    by_label = {p["label"]: p for p in baseline["profiles"]}
+    rows = []
+    for r in results:
+        base = by_label.get(r["label"])
+        if base is None or not base["board_times"] or not r["board_times"]:
+            continue
+        base_ms = [t * 1000 for t in base["board_times"]]
+        cur_ms = [t * 1000 for t in r["board_times"]]
+        base_att = [float(a) for a in base["board_attempts"]]
+        cur_att = [float(a) for a in r["board_attempts"]]
+        row = {
+            "label": r["label"],
+            "median_ms": (statistics.median(base_ms), statistics.median(cur_ms)),
+            "p95_ms": (_p95(base_ms), _p95(cur_ms)),
+            "attempts": (statistics.mean(base_att), statistics.mean(cur_att)),
+            "median_delta": bootstrap_delta(base_ms, cur_ms, statistics.median),
+            "p95_delta": bootstrap_delta(base_ms, cur_ms, _p95),
+            "attempts_delta": bootstrap_delta(base_att, cur_att, statistics.mean),
+        }
+        base_median = row["median_ms"][0]
+        delta, ci_low, _ = row["median_delta"]
+        row["median_pct"] = 100.0 * delta / base_median if base_median else 0.0
+        row["regression"] = (
+            base_median >= MIN_COMPARED_MS
+            and row["median_pct"] > threshold_pct
+            and ci_low > 0
+        )
+        rows.append(row)
+    return rows
+
+
+def print_comparison(rows: list[dict], baseline: dict, threshold_pct: float) -> None:
+    """Print compare_results() rows as a table."""
+    env = baseline.get("environment", {})
+    print(
+        f"  Against {env.get('commit') or 'unknown commit'} "
+        f"(Python {env.get('python', '?')}, {env.get('cpu', '?')}), "
+        f"threshold +{threshold_pct:g}% median"
+    )
+    print(
+        f"  {'Profile':<28} {'Median ms (95% CI)':>34} {'P95 ms (95% CI)':>34} "
+        f"{'Att/bd (95% CI)':>34}"
+    )
+
+    def _cell(pair, delta) -> str:
+        (old, new), (d, lo, hi) = pair, delta
+        return f"{old:.1f}->{new:.1f} {d:+.1f} [{lo:+.1f},{hi:+.1f}]"
+
+    for row in rows:
+        flag = "  SLOWER" if row["regression"] else ""
+        print(
+            f"  {row['label']:<28} {_cell(row['median_ms'], row['median_delta']):>34} "
+            f"{_cell(row['p95_ms'], row['p95_delta']):>34} "
+            f"{_cell(row['attempts'], row['attempts_delta']):>34}{flag}"
+        )
+    print()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the 5-profile portfolio.")
+    parser.add_argument(
+        "num_boards", nargs="?", type=int, default=20, help="boards per profile (default 20)",
+    )
+    parser.add_argument(
+        "--exact", action="store_true", help="deal with the exact constructive sampler",
+    )
+    parser.add_argument(
+        "--profile", choices=("cpu", "mem"), dest="profile_mode",
+        help="profile each run with cProfile (cpu) or tracemalloc (mem)",
+    )
+    parser.add_argument(
+        "--profile-dir", type=Path, default=PROFILE_REPORT_DIR,
+        help=f"where --profile reports go (default {PROFILE_REPORT_DIR})",
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="functions / allocation sites listed (default 15)",
+    )
+    parser.add_argument(
+        "--json", type=Path, dest="json_path",
+        help="write results, raw samples and environment to this JSON file",
+    )
+    parser.add_argument(
+        "--compare", type=Path, metavar="BASELINE",
+        help="compare with a --json file; exit 1 on a significant slowdown",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=10.0, metavar="PCT",
+        help="median slowdown (percent) that fails --compare (default 10)",
+    )
+    return parser
 
 
 if __name__ == "__main__":
-    num_boards = int(sys.argv[1]) if len(sys.argv) > 1 else 20
-    print(f"Running benchmark: {num_boards} boards per profile...")
+    args = build_parser().parse_args()
+    baseline = None
+    if args.compare is not None:
+        try:
+            baseline = load_results(args.compare)
+        except (OSError, ValueError) as exc:
+            print(f"ERROR: cannot read baseline: {exc}", file=sys.stderr)
+            sys.exit(2)
+    num_boards = args.num_boards
+    mode = "exact sampler" if args.exact else "shape help"
+    if args.profile_mode:
+        mode += f", {args.profile_mode} profile"
+    print(f"Running benchmark: {num_boards} boards per profile ({mode})...")
 
-    results = run_benchmark(num_boards)
-    print_results(results, num_boards)
+    deal_generator.ENABLE_EXACT_SAMPLER = args.exact
+    results = run_benchmark(num_boards, args.profile_mode, args.profile_dir, args.top)
+    print_results(results, num_boards, mode)
+    if args.profile_mode:
+        print_reports(results, args.profile_mode)
+    if args.json_path is not None:
+        write_results(args.json_path, results, num_boards, mode)
+        print(f"Results written to {args.json_path}")
+    if baseline is not None:
+        if (baseline["num_boards"], baseline["seed"], baseline["mode"]) != (num_boards, SEED, mode):
+            print(
+                f"WARNING: baseline ran {baseline['num_boards']} boards, seed "
+                f"{baseline['seed']}, {baseline['mode']}; attempts are only "
+                f"comparable for identical settings."
+            )
+        rows = compare_results(baseline, results, args.threshold)
+        print_comparison(rows, baseline, args.threshold)
+        slower = [row["label"] for row in rows if row["regression"]]
+        if slower:
+            print(f"REGRESSION: {', '.join(slower)}")
+            sys.exit(1)
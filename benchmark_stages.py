@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Stage micro-benchmarks: each step of the v2 builder timed in isolation.
+
+Usage:
+    .venv/bin/python benchmark_stages.py [--stage NAME ...] [--time S]
+
+Every stage runs on fixed inputs built once from "Defense to 3 Weak 2s" and
+SEED (a shuffled deck, the N opener / W weak-two subprofiles, a 13-card
+hand, a finished deal), so numbers are comparable between commits on one
+machine.  Where the v2 builder uses the integer-card-id variant of a
+function (_pre_allocate_ids, _constrained_fill_ids, ...), that is the one
+timed; the string-card wrappers are not on the hot path.
+
+Columns:
+    ns/op       best of REPEATS timing runs of at least --time seconds each
+                (gc disabled, as timeit does)
+    peak B/op   bytes allocated above the starting level during one call
+                (tracemalloc peak), averaged over MEMORY_OPS calls: the
+                transient allocations the call makes
+    blocks/op   memory blocks still held per call afterwards (should be ~0;
+                anything else is caching or a leak)
+
+Stages that consume a deck copy it first (list(deck), roughly 150 ns and
+one 52-slot list), so their figures include that copy.
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bridge_engine.deal_generator import _select_subprofiles_for_board
+from bridge_engine.deal_generator_helpers import (
+    _build_deck_ids,
+    _check_hcp_feasibility,
+    _deck_hcp_stats,
+    _ids_to_cards,
+)
+from bridge_engine.deal_generator_types import PRE_ALLOCATE_FRACTION, Deal
+from bridge_engine.deal_generator_v2 import (
+    _constrained_fill_ids,
+    _pre_allocate_ids,
+    _pre_allocate_rs_ids,
+)
+from bridge_engine.deal_output import _format_single_board_text
+from bridge_engine.hand_profile import HandProfile
+from bridge_engine.lin_encoder import encode_deal_to_lin_line
+from bridge_engine.seat_viability import (
+    _compile_subprofile,
+    _compute_suit_analysis,
+    _compute_suit_analysis_ids,
+    _hand_suit_stats_ids,
+    _match_seat,
+    _match_seat_compiled,
+    _match_standard,
+)
+
+PROFILE_PATH = Path(__file__).resolve().parent / "profiles" / "Defense_to_3_Weak_2s_v0.2.json"
+SEED = 778899  # Same canonical seed as benchmark_portfolio.py
+
+REPEATS = 5
+MEMORY_OPS = 200
+
+
+@dataclass(frozen=True)
+class StageResult:
+    name: str
+    ns_per_op: float
+    peak_bytes_per_op: float
+    blocks_per_op: float
+
+
+class Fixture:
+    """Fixed inputs shared by all stages (built once, never mutated)."""
+
+    def __init__(self, seed: int = SEED) -> None:
+        self.profile = HandProfile.from_dict(json.loads(PROFILE_PATH.read_text()))
+        self.rng = random.Random(seed)
+        deck = _build_deck_ids()
+        self.rng.shuffle(deck)
+        self.deck: Tuple[int, ...] = tuple(deck)
+
+        # N: balanced 15-18 opener (standard minima -> _pre_allocate).
+        # W: weak two (RS, one suit of exactly 6 cards with 5-7 HCP).
+        self.opener = self.profile.seat_profiles["N"].subprofiles[0]
+        self.weak_two_seat = self.profile.seat_profiles["W"]
+        self.weak_two = self.weak_two_seat.subprofiles[0]
+        self.rs_suits = ["H"]
+
+        work = list(self.deck)
+        self.rs_cards = _pre_allocate_rs_ids(self.rng, work, self.weak_two, self.rs_suits)
+        self.hand_ids = self.rs_cards + _constrained_fill_ids(
+            work, 13 - len(self.rs_cards), self.rs_cards, (6, 6, 6, 6), 11,
+        )
+        self.hand = _ids_to_cards(self.hand_ids)
+        self.analysis = _compute_suit_analysis(self.hand)
+        self.lengths, self.suit_hcp = _hand_suit_stats_ids(self.hand_ids)
+        self.compiled = _compile_subprofile(self.weak_two)
+
+        # Opener mid-fill: 6 of 13 cards held, 40 left in the deck.
+        rest = _ids_to_cards(self.deck[6:46])
+        self.deck_hcp_sum, self.deck_hcp_sum_sq = _deck_hcp_stats(rest)
+        self.dealing_order = list(self.profile.hand_dealing_order)
+
+        cards = _ids_to_cards(self.deck)
+        self.deal = Deal(
+            board_number=1,
+            dealer="N",
+            vulnerability="None",
+            hands={seat: cards[i * 13:(i + 1) * 13] for i, seat in enumerate("NESW")},
+        )
+
+
+def _build_deck_and_shuffle(fx: Fixture) -> Callable[[], object]:
+    rng = fx.rng
+
+    def op():
+        deck = _build_deck_ids()
+        rng.shuffle(deck)
+        return deck
+
+    return op
+
+
+def _stage_pre_allocate(fx: Fixture) -> Callable[[], object]:
+    rng, deck, sub = fx.rng, fx.deck, fx.opener
+    return lambda: _pre_allocate_ids(rng, list(deck), sub, PRE_ALLOCATE_FRACTION)
+
+
+def _stage_pre_allocate_rs(fx: Fixture) -> Callable[[], object]:
+    rng, deck, sub, suits = fx.rng, fx.deck, fx.weak_two, fx.rs_suits
+    return lambda: _pre_allocate_rs_ids(rng, list(deck), sub, suits)
+
+
+def _stage_constrained_fill(fx: Fixture) -> Callable[[], object]:
+    deck, pre = fx.deck, fx.rs_cards
+    n = 13 - len(pre)
+    return lambda: _constrained_fill_ids(list(deck), n, pre, (6, 6, 6, 6), 11)
+
+
+def _stage_check_hcp_feasibility(fx: Fixture) -> Callable[[], object]:
+    hcp_sum, hcp_sum_sq = fx.deck_hcp_sum, fx.deck_hcp_sum_sq
+    return lambda: _check_hcp_feasibility(4, 7, 40, hcp_sum, hcp_sum_sq, 15, 18)
+
+
+def _stage_compute_suit_analysis(fx: Fixture) -> Callable[[], object]:
+    hand = fx.hand
+    return lambda: _compute_suit_analysis(hand)
+
+
+def _stage_compute_suit_analysis_ids(fx: Fixture) -> Callable[[], object]:
+    hand = fx.hand_ids
+    return lambda: _compute_suit_analysis_ids(hand)
+
+
+def _stage_hand_suit_stats(fx: Fixture) -> Callable[[], object]:
+    hand = fx.hand_ids
+    return lambda: _hand_suit_stats_ids(hand)
+
+
+def _stage_match_standard(fx: Fixture) -> Callable[[], object]:
+    analysis, std = fx.analysis, fx.opener.standard
+    return lambda: _match_standard(analysis, std)
+
+
+def _stage_match_seat(fx: Fixture) -> Callable[[], object]:
+    profile, hand, seat_profile, sub = fx.profile, fx.hand, fx.weak_two_seat, fx.weak_two
+    rng, pre = fx.rng, {"W": fx.rs_suits}
+    return lambda: _match_seat(profile, "W", hand, seat_profile, sub, 1, {}, rng, pre)
+
+
+def _stage_match_seat_compiled(fx: Fixture) -> Callable[[], object]:
+    profile, compiled, lengths, hcp = fx.profile, fx.compiled, fx.lengths, fx.suit_hcp
+    rng, pre = fx.rng, {"W": fx.rs_suits}
+    return lambda: _match_seat_compiled(profile, "W", compiled, 1, lengths, hcp, {}, rng, pre)
+
+
+def _stage_select_subprofiles(fx: Fixture) -> Callable[[], object]:
+    rng, profile, order = fx.rng, fx.profile, fx.dealing_order
+    return lambda: _select_subprofiles_for_board(rng, profile, order)
+
+
+def _stage_encode_lin(fx: Fixture) -> Callable[[], object]:
+    deal = fx.deal
+    return lambda: encode_deal_to_lin_line(deal)
+
+
+def _stage_format_text(fx: Fixture) -> Callable[[], object]:
+    deal = fx.deal
+    return lambda: _format_single_board_text(deal)
+
+
+# Name -> factory(fixture) returning the zero-argument operation to time.
+# In pipeline order.
+STAGES: Dict[str, Callable[[Fixture], Callable[[], object]]] = {
+    "_build_deck_ids+shuffle": _build_deck_and_shuffle,
+    "_select_subprofiles_for_board": _stage_select_subprofiles,
+    "_pre_allocate_rs_ids": _stage_pre_allocate_rs,
+    "_pre_allocate_ids": _stage_pre_allocate,
+    "_check_hcp_feasibility": _stage_check_hcp_feasibility,
+    "_constrained_fill_ids": _stage_constrained_fill,
+    "_hand_suit_stats_ids": _stage_hand_suit_stats,
+    "_compute_suit_analysis_ids": _stage_compute_suit_analysis_ids,
+    "_compute_suit_analysis": _stage_compute_suit_analysis,
+    "_match_standard": _stage_match_standard,
+    "_match_seat": _stage_match_seat,
+    "_match_seat_compiled": _stage_match_seat_compiled,
+    "encode_deal_to_lin_line": _stage_encode_lin,
+    "_format_single_board_text": _stage_format_text,
+}
+
+
+def measure(
+    name: str,
+    op: Callable[[], object],
+    min_time: float = 0.2,
+    repeats: int = REPEATS,
+    memory_ops: int = MEMORY_OPS,
+) -> StageResult:
+    """Time op (best of repeats) and measure its allocations."""
+    timer = timeit.Timer(op)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        # Aim just past min_time from the last run's rate.
+        number = max(number * 2, int(number * min_time * 1.2 / max(elapsed, 1e-9)))
+    best = min([elapsed] + timer.repeat(repeats - 1, number))
+
+    tracemalloc.start()
+    try:
+        peak_total = 0
+        for _ in range(memory_ops):
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            op()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - start
+    finally:
+        tracemalloc.stop()
+
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(memory_ops):
+        op()
+    gc.collect()
+    blocks_after = sys.getallocatedblocks()
+
+    return StageResult(
+        name=name,
+        ns_per_op=best / number * 1e9,
+        peak_bytes_per_op=peak_total / memory_ops,
+        blocks_per_op=(blocks_after - blocks_before) / memory_ops,
+    )
+
+
+def run_stages(
+    names: Optional[List[str]] = None, min_time: float = 0.2, **kwargs,
+) -> List[StageResult]:
+    """Measure the named stages (all of STAGES by default), in STAGES order."""
+    fixture = Fixture()
+    selected = [n for n in STAGES if names is None or n in names]
+    return [measure(n, STAGES[n](fixture), min_time, **kwargs) for n in selected]
+
+
+def print_results(results: List[StageResult]) -> None:
+    print(f"\n{'='*70}")
+    print(f"  STAGE MICRO-BENCHMARKS — Defense to 3 Weak 2s fixture, seed={SEED}")
+    print(f"{'='*70}")
+    print(f"  {'Stage':<32} {'ns/op':>10} {'peak B/op':>11} {'blocks/op':>10}")
+    print(f"  {'-'*32} {'-'*10} {'-'*11} {'-'*10}")
+    for r in results:
+        print(
+            f"  {r.name:<32} {r.ns_per_op:>10,.0f} {r.peak_bytes_per_op:>11,.0f} "
+            f"{r.blocks_per_op:>10.2f}"
+        )
+    print(f"{'='*70}\n")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Time each v2 builder stage in isolation.")
+    parser.add_argument(
+        "--stage", action="append", choices=list(STAGES), metavar="NAME",
+        help="only this stage (repeatable); default all",
+    )
+    parser.add_argument(
+        "--time", type=float, default=0.2, metavar="S",
+        help="minimum seconds per timing run (default 0.2)",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    print_results(run_stages(args.stage, args.time))
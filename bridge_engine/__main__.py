@@ -3,13 +3,20 @@ Package entry point.
 
 Allows:
   python -m bridge_engine ...
+  python -m bridge_engine generate PROFILE [options]
+  python -m bridge_engine generate --manifest jobs.json [options]
+  python -m bridge_engine serve [--port 8765] [options]
+  python -m bridge_engine --profile-import-time
 
 Delegates to the orchestrator CLI.
 """
 
 from __future__ import annotations
+
+import sys
+
 from .orchestrator import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
     
\ No newline at end of file
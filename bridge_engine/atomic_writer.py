@@ -0,0 +1,155 @@
+# bridge_engine/atomic_writer.py
+#
+# Buffered, incrementally-written output file with an atomic commit.
+#
+# Same idea as profile_store._atomic_write(), but for content produced one
+# record at a time: the file is opened once, records go through a large
+# buffered handle (flushed to the OS every `flush_every` records), and on
+# close() the data is fsync'ed and the temp file renamed over the target.
+# A crash or abort() mid-export leaves the previous file untouched.
+# finish() does the fsync without the rename, so a caller writing several
+# files can finish all of them before committing any.
+# mkstemp() creates the temp file 0600, so it is chmod'ed to the mode of the
+# file it replaces (or 0666 & ~umask for a new file) before anything is
+# written: exports stay readable by whoever could read them before.
+#
+# append=True writes straight to the target instead (renaming a temp file
+# would mean copying the existing content first).  Appending is O(1) in the
+# existing file size; close() still flushes and fsyncs.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import IO, Optional
+
+# Buffer size for the underlying file handle.
+WRITER_BUFFER_BYTES: int = 1024 * 1024
+
+# Records written between explicit flushes to the OS.
+WRITER_FLUSH_EVERY: int = 256
+
+
+def _committed_mode(path: Path) -> int:
+    """Permission bits for the committed file: the replaced file's, else umask's."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+class AtomicBufferedWriter:
+    """
+    Text file written record by record, committed atomically on close().
+
+    Use as a context manager: a clean exit commits, an exception aborts
+    (temp file removed, target unchanged).  close() and abort() are
+    idempotent, and whichever runs first wins.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        append: bool = False,
+        flush_every: int = WRITER_FLUSH_EVERY,
+        buffer_size: int = WRITER_BUFFER_BYTES,
+    ) -> None:
+        self.path = Path(path)
+        self.append = append
+        self.flush_every = max(1, flush_every)
+        self.records = 0
+        self._tmp: Optional[str] = None
+        self._f: Optional[IO[str]] = None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if append:
+            self._f = open(
+                self.path, "a", encoding="utf-8", buffering=buffer_size
+            )
+        else:
+            fd, self._tmp = tempfile.mkstemp(
+                dir=str(self.path.parent), suffix=".tmp", prefix=self.path.stem + "_"
+            )
+            try:
+                os.chmod(self._tmp, _committed_mode(self.path))
+                self._f = os.fdopen(fd, "w", encoding="utf-8", buffering=buffer_size)
+            except BaseException:
+                os.close(fd)
+                Path(self._tmp).unlink(missing_ok=True)
+                raise
+
+    # -- writing -------------------------------------------------------------
+
+    def write(self, text: str) -> None:
+        """Write raw text (not counted as a record)."""
+        assert self._f is not None, "writer is closed"
+        self._f.write(text)
+
+    def write_record(self, text: str) -> None:
+        """Write one record, flushing to the OS every flush_every records."""
+        self.write(text)
+        self.records += 1
+        if self.records % self.flush_every == 0:
+            self._f.flush()  # type: ignore[union-attr]
+
+    # -- finishing -----------------------------------------------------------
+
+    @property
+    def closed(self) -> bool:
+        return self._f is None
+
+    def finish(self) -> None:
+        """
+        Flush, fsync and close the file without renaming it into place, so
+        several writers can all be finished before any of them is committed.
+        close() then only renames.
+        """
+        f, self._f = self._f, None
+        if f is None:
+            return
+        try:
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            self._discard_tmp()
+            raise
+        f.close()
+
+    def close(self) -> None:
+        """Flush, fsync and (unless appending) rename into place."""
+        self.finish()
+        if self._tmp is not None:
+            try:
+                # os.replace is atomic on POSIX and Windows.
+                os.replace(self._tmp, str(self.path))
+            except BaseException:
+                self._discard_tmp()
+                raise
+            self._tmp = None
+
+    def abort(self) -> None:
+        """Discard the temp file; in append mode what was written is kept."""
+        f, self._f = self._f, None
+        if f is not None:
+            f.close()
+        self._discard_tmp()
+
+    def _discard_tmp(self) -> None:
+        if self._tmp is not None:
+            Path(self._tmp).unlink(missing_ok=True)
+            self._tmp = None
+
+    def __enter__(self) -> "AtomicBufferedWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -0,0 +1,480 @@
+# bridge_engine/batch_cli.py
+#
+# Non-interactive deal generation: `python -m bridge_engine generate ...`.
+#
+# Runs the same pipeline as the interactive session
+# (orchestrator._run_deal_generation_session): validate_profile ->
+# run_setup -> generate_deals -> render_deals, driven by command-line
+# options for one profile or by a JSON manifest listing many jobs.  Each
+# profile is loaded and validated once per run however many jobs use it,
+# and a JSON summary of every job is written at the end.
+#
+# Manifest format (JSON):
+#
+#   {"defaults": {"boards": 24, "workers": 4},
+#    "jobs": [{"profile": "Defense to 3 Weak 2s", "seed": 1},
+#             {"profile": "profiles/Big_Hands_v0.1.json", "format": "lin"}]}
+#
+# or just the list of jobs.  Job options are the keys of GenerateJob.
+# Precedence: job > manifest defaults > command-line options > GenerateJob
+# defaults.  Seeded jobs never touch the deal pool, so a manifest with
+# seeds reproduces byte-identical files.
+#
+# Every job checkpoints its boards to <output-dir>/logs/ while it runs (see
+# deal_checkpoint.py).  Re-running an interrupted job with --resume (job
+# option "resume") continues from its checkpoint; without a seed it takes
+# the seed of the profile's latest checkpoint.
+#
+# --telemetry (job option "telemetry") also writes per-board builder
+# telemetry to <output-dir>/logs/<output stem>.telemetry.jsonl (see
+# board_telemetry.py); --telemetry-attempts N adds every Nth failed attempt.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .atomic_writer import AtomicBufferedWriter
+from .board_telemetry import BoardTelemetry, telemetry_path_for
+from .deal_checkpoint import checkpoint_path_for, checkpoint_seed, latest_checkpoint
+from .deal_generator import DealGenerationError, generate_deals
+from .deal_output import OutputError, render_deals
+from .deal_policy import DealPolicy, find_policy
+from .hand_profile import HandProfile, ProfileError, validate_profile
+from .profile_store import PROFILE_DIR_NAME, is_draft_path, load_profile_dir
+from .setup_env import SetupError, run_setup
+
+OUTPUT_FORMATS = ("both", "txt", "lin")
+
+# Bumped when the run-summary layout changes incompatibly.
+RUN_SUMMARY_FORMAT = 1
+
+
+class BatchError(Exception):
+    """Raised for an unusable manifest, job option or profile reference."""
+
+
+@dataclass(frozen=True)
+class GenerateJob:
+    """One profile's worth of boards in a batch run."""
+
+    profile: str                    # profile path, file name or profile_name
+    boards: int = 6
+    seed: Optional[int] = None      # None -> fresh random seed (recorded)
+    rotate: Optional[bool] = None   # None -> profile.rotate_deals_by_default
+    workers: Optional[int] = None   # None -> serial; N -> per-board seeding
+    format: str = "both"            # one of OUTPUT_FORMATS
+    owner: str = "Lee"
+    output_dir: str = "out"
+    label: Optional[str] = None     # filename label; default profile_name
+    resume: bool = False            # continue from this job's checkpoint
+    telemetry: bool = False         # write logs/<stem>.telemetry.jsonl
+    telemetry_attempt_every: int = 0  # also log every Nth failed attempt
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "GenerateJob":
+        """Build and check a job from manifest / command-line options."""
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(data) - known)
+        if unknown:
+            raise BatchError(f"unknown job option(s): {', '.join(unknown)}")
+        if not data.get("profile"):
+            raise BatchError("every job needs a 'profile'")
+        try:
+            job = cls(**data)
+        except TypeError as exc:
+            raise BatchError(f"bad job options: {exc}") from exc
+
+        def _int(name: str, value: Any, minimum: int) -> None:
+            if value is not None and (
+                isinstance(value, bool) or not isinstance(value, int) or value < minimum
+            ):
+                raise BatchError(f"job option {name!r} must be an integer >= {minimum}")
+
+        _int("boards", job.boards, 1)
+        _int("seed", job.seed, 0)
+        _int("workers", job.workers, 1)
+        _int("telemetry_attempt_every", job.telemetry_attempt_every, 0)
+        if job.rotate is not None and not isinstance(job.rotate, bool):
+            raise BatchError("job option 'rotate' must be true or false")
+        if not isinstance(job.resume, bool):
+            raise BatchError("job option 'resume' must be true or false")
+        if not isinstance(job.telemetry, bool):
+            raise BatchError("job option 'telemetry' must be true or false")
+        if job.format not in OUTPUT_FORMATS:
+            raise BatchError(
+                f"job option 'format' must be one of {', '.join(OUTPUT_FORMATS)}"
+            )
+        return job
+
+
+def load_manifest(
+    path: Path, defaults: Optional[Mapping[str, Any]] = None,
+) -> List[GenerateJob]:
+    """
+    Read a manifest file into jobs.
+
+    ``defaults`` (the command-line options) apply under the manifest's own
+    "defaults" block, which applies under each job's options.
+    """
+    try:
+        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise BatchError(f"could not read manifest {path}: {exc}") from exc
+
+    manifest_defaults: Mapping[str, Any] = {}
+    if isinstance(raw, dict):
+        manifest_defaults = raw.get("defaults", {})
+        raw = raw.get("jobs")
+    if not isinstance(raw, list) or not isinstance(manifest_defaults, dict):
+        raise BatchError(
+            f"manifest {path} must be a list of jobs or "
+            '{"defaults": {...}, "jobs": [...]}'
+        )
+    if not raw:
+        raise BatchError(f"manifest {path} has no jobs")
+
+    jobs: List[GenerateJob] = []
+    for index, entry in enumerate(raw, start=1):
+        if not isinstance(entry, dict):
+            raise BatchError(f"manifest job {index} is not an object")
+        try:
+            jobs.append(GenerateJob.from_dict(
+                {**(defaults or {}), **manifest_defaults, **entry}
+            ))
+        except BatchError as exc:
+            raise BatchError(f"manifest job {index}: {exc}") from None
+    return jobs
+
+
+# ---------------------------------------------------------------------------
+# Profile resolution (each profile loaded and validated once per run)
+# ---------------------------------------------------------------------------
+
+
+class ProfileCatalog:
+    """
+    Resolves job profile references to validated profiles.
+
+    A reference is a path to a profile JSON, a file name in profiles_dir,
+    or a profile_name (case-insensitive).  Results, including the dealing
+    policy found next to the profile, are cached for the whole run.
+    """
+
+    def __init__(self, profiles_dir: Path) -> None:
+        self.profiles_dir = Path(profiles_dir)
+        self._by_ref: Dict[str, Tuple[Path, HandProfile, Optional[DealPolicy]]] = {}
+        self._by_path: Dict[Path, Tuple[Path, HandProfile, Optional[DealPolicy]]] = {}
+
+    def resolve(self, ref: str) -> Tuple[Path, HandProfile, Optional[DealPolicy]]:
+        """Return (path, validated profile, dealing policy or None)."""
+        cached = self._by_ref.get(ref)
+        if cached is None:
+            path, profile = self._locate(ref)
+            key = path.resolve()
+            cached = self._by_path.get(key)
+            if cached is None:
+                try:
+                    profile = validate_profile(profile)
+                except ProfileError as exc:
+                    raise BatchError(f"profile {ref!r} is not valid: {exc}") from exc
+                cached = (path, profile, find_policy(path.parent, profile))
+                self._by_path[key] = cached
+            self._by_ref[ref] = cached
+        return cached
+
+    def _locate(self, ref: str) -> Tuple[Path, HandProfile]:
+        candidate = Path(ref).expanduser()
+        if candidate.suffix == ".json" and candidate.is_file():
+            try:
+                raw = json.loads(candidate.read_text(encoding="utf-8"))
+                return candidate, HandProfile.from_dict(raw)
+            except (OSError, json.JSONDecodeError, TypeError, KeyError,
+                    ValueError, ProfileError) as exc:
+                raise BatchError(f"could not load profile {candidate}: {exc}") from exc
+
+        loaded = load_profile_dir(self.profiles_dir, include_drafts=True)
+        by_file = [(p, prof) for p, prof in loaded if ref in (p.name, p.stem)]
+        if by_file:
+            return by_file[0]
+        by_name = [
+            (p, prof) for p, prof in loaded
+            if not is_draft_path(p) and prof.profile_name.casefold() == ref.casefold()
+        ]
+        if not by_name:
+            raise BatchError(
+                f"no profile matches {ref!r} (not a file, nor a name in {self.profiles_dir})"
+            )
+        if len(by_name) > 1:
+            names = ", ".join(p.name for p, _ in by_name)
+            raise BatchError(f"profile name {ref!r} is ambiguous: {names}")
+        return by_name[0]
+
+
+# ---------------------------------------------------------------------------
+# Running jobs
+# ---------------------------------------------------------------------------
+
+
+def run_job(job: GenerateJob, catalog: ProfileCatalog, label: str) -> Dict[str, Any]:
+    """
+    Run one job and return its run-summary entry.
+
+    Raises BatchError, ProfileError, SetupError, DealGenerationError or
+    OutputError on failure (run_batch() records these per job).
+    """
+    path, profile, deal_policy = catalog.resolve(job.profile)
+    base_dir = Path(job.output_dir).expanduser().resolve()
+    seed = job.seed
+    if seed is None and job.resume:
+        latest = latest_checkpoint(base_dir / "logs", profile)
+        if latest is not None:
+            seed = checkpoint_seed(latest)
+    if seed is None:
+        seed = random.randint(1, 2**31 - 1)
+    rotate = (
+        job.rotate if job.rotate is not None
+        else getattr(profile, "rotate_deals_by_default", True)
+    )
+
+    setup = run_setup(
+        base_dir=base_dir,
+        owner=job.owner,
+        profile_name=label,
+        seed=seed,
+    )
+    checkpoint = checkpoint_path_for(setup.log_dir, profile, seed)
+    resumed = job.resume and checkpoint.exists()
+    telemetry = (
+        BoardTelemetry(
+            telemetry_path_for(setup), attempt_every=job.telemetry_attempt_every,
+        )
+        if job.telemetry else None
+    )
+    start = time.monotonic()
+    extra: Dict[str, Any] = {}
+    if deal_policy is not None:
+        extra["deal_policy"] = deal_policy
+    try:
+        deal_set = generate_deals(
+            setup=setup,
+            profile=profile,
+            num_deals=job.boards,
+            enable_rotation=rotate,
+            workers=job.workers,
+            checkpoint=checkpoint,
+            resume=job.resume,
+            telemetry=telemetry,
+            **extra,
+        )
+    finally:
+        if telemetry is not None:
+            telemetry.close()
+    gen_elapsed = time.monotonic() - start
+    summary = render_deals(
+        setup=setup,
+        profile=profile,
+        deal_set=deal_set,
+        print_to_console=False,
+        write_txt=job.format in ("both", "txt"),
+        write_lin=job.format in ("both", "lin"),
+    )
+    return {
+        "profile_name": profile.profile_name,
+        "profile_path": str(path),
+        "label": label,
+        "seed": seed,
+        "rotate": rotate,
+        "resumed": resumed,
+        "deal_policy": deal_policy is not None,
+        "boards_written": summary.num_deals,
+        "txt_path": None if summary.txt_path is None else str(summary.txt_path),
+        "lin_path": None if summary.lin_path is None else str(summary.lin_path),
+        "telemetry_path": None if telemetry is None else str(telemetry.path),
+        "generate_s": round(gen_elapsed, 4),
+        "reseed_count": deal_set.reseed_count,
+        "board_attempts": sum(deal_set.board_attempts),
+        "warnings": list(summary.warnings),
+    }
+
+
+def run_batch(
+    jobs: Sequence[GenerateJob],
+    catalog: ProfileCatalog,
+    *,
+    quiet: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run every job (a failing job does not stop the rest) and return the
+    run summary.  Jobs that resolve to the same filename label get _2, _3,
+    ... suffixes so no job overwrites another's files.
+    """
+    started = datetime.now()
+    run_start = time.monotonic()
+    entries: List[Dict[str, Any]] = []
+    label_counts: Dict[Tuple[str, str, str], int] = {}
+
+    for index, job in enumerate(jobs, start=1):
+        entry: Dict[str, Any] = {"index": index, **asdict(job)}
+        job_start = time.monotonic()
+        try:
+            label = job.label
+            if label is None:
+                label = catalog.resolve(job.profile)[1].profile_name
+            key = (job.output_dir, job.owner, label)
+            label_counts[key] = label_counts.get(key, 0) + 1
+            if label_counts[key] > 1:
+                label = f"{label}_{label_counts[key]}"
+            entry.update(run_job(job, catalog, label))
+            entry["status"] = "ok"
+        except (BatchError, ProfileError, SetupError, DealGenerationError,
+                OutputError) as exc:
+            entry["status"] = "error"
+            entry["error"] = f"{type(exc).__name__}: {exc}"
+        entry["elapsed_s"] = round(time.monotonic() - job_start, 4)
+        entries.append(entry)
+
+        if entry["status"] == "ok":
+            if not quiet:
+                outputs = ", ".join(
+                    p for p in (entry["txt_path"], entry["lin_path"]) if p
+                )
+                print(
+                    f"[{index}/{len(jobs)}] {entry['profile_name']}: "
+                    f"{entry['boards_written']} boards in {entry['elapsed_s']:.1f}s "
+                    f"(seed {entry['seed']}) -> {outputs}"
+                )
+        else:
+            print(f"[{index}/{len(jobs)}] {job.profile}: {entry['error']}", file=sys.stderr)
+
+    failed = sum(1 for e in entries if e["status"] != "ok")
+    return {
+        "format": RUN_SUMMARY_FORMAT,
+        "command": "generate",
+        "started": started.isoformat(timespec="seconds"),
+        "elapsed_s": round(time.monotonic() - run_start, 4),
+        "jobs_total": len(entries),
+        "jobs_failed": failed,
+        "jobs": entries,
+    }
+
+
+def write_run_summary(path: Path, summary: Mapping[str, Any]) -> None:
+    """Write the run summary as JSON (atomically)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with AtomicBufferedWriter(path) as writer:
+        writer.write(json.dumps(summary, indent=1) + "\n")
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m bridge_engine generate",
+        description=(
+            "Generate deals without prompts, for one profile or for every job "
+            "in a JSON manifest, and write a JSON run summary."
+        ),
+    )
+    parser.add_argument(
+        "profile", nargs="?",
+        help="profile JSON path, file name in --profiles-dir, or profile name",
+    )
+    parser.add_argument("--manifest", type=Path, help="JSON manifest of jobs")
+    parser.add_argument("-n", "--boards", type=int, help="boards per job (default 6)")
+    parser.add_argument("--seed", type=int, help="seed (default: random, recorded)")
+    parser.add_argument(
+        "--rotate", action=argparse.BooleanOptionalAction, default=None,
+        help="randomly swap N/S and E/W (default: the profile's setting)",
+    )
+    parser.add_argument(
+        "--workers", type=int,
+        help="build boards in N processes with per-board seeding",
+    )
+    parser.add_argument(
+        "--resume", action="store_true", default=None,
+        help="continue interrupted jobs from their checkpoints in <output-dir>/logs",
+    )
+    parser.add_argument(
+        "--telemetry", action="store_true", default=None,
+        help="write per-board builder telemetry to <output-dir>/logs/*.telemetry.jsonl",
+    )
+    parser.add_argument(
+        "--telemetry-attempts", type=int, metavar="N",
+        help="with --telemetry, also log every Nth failed attempt",
+    )
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, help="files to write (default both)")
+    parser.add_argument("--owner", help="owner name used in file names (default Lee)")
+    parser.add_argument(
+        "--output-dir", help="base directory for txt/, lin/ and logs/ (default out)",
+    )
+    parser.add_argument(
+        "--profiles-dir", type=Path, default=Path(PROFILE_DIR_NAME),
+        help="where profile names are looked up (default ./profiles)",
+    )
+    parser.add_argument(
+        "--summary", type=Path,
+        help="run-summary JSON path (default <output-dir>/logs/generate_<time>.json)",
+    )
+    parser.add_argument("-q", "--quiet", action="store_true", help="only report errors")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point of the `generate` subcommand.
+
+    Returns the process exit code: 0 if every job succeeded, 1 if any job
+    failed, 2 for a usage error (bad options or manifest).
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if (args.profile is None) == (args.manifest is None):
+        parser.error("give exactly one of PROFILE or --manifest")
+
+    options = {
+        name: value
+        for name, value in (
+            ("boards", args.boards), ("seed", args.seed), ("rotate", args.rotate),
+            ("workers", args.workers), ("format", args.format),
+            ("owner", args.owner), ("output_dir", args.output_dir),
+            ("resume", args.resume), ("telemetry", args.telemetry),
+            ("telemetry_attempt_every", args.telemetry_attempts),
+        )
+        if value is not None
+    }
+    try:
+        if args.manifest is not None:
+            jobs = load_manifest(args.manifest, options)
+        else:
+            jobs = [GenerateJob.from_dict({"profile": args.profile, **options})]
+    except BatchError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+
+    summary = run_batch(jobs, ProfileCatalog(args.profiles_dir), quiet=args.quiet)
+
+    summary_path = args.summary
+    if summary_path is None:
+        base = Path(options.get("output_dir", GenerateJob.output_dir)).expanduser()
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        summary_path = base / "logs" / f"generate_{stamp}.json"
+    try:
+        write_run_summary(summary_path, summary)
+    except OSError as exc:
+        print(f"ERROR: could not write run summary {summary_path}: {exc}", file=sys.stderr)
+        return 1
+    if not args.quiet:
+        ok = summary["jobs_total"] - summary["jobs_failed"]
+        print(f"{ok}/{summary['jobs_total']} job(s) succeeded; summary: {summary_path}")
+    return 1 if summary["jobs_failed"] else 0
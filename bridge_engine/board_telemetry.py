@@ -0,0 +1,141 @@
+# bridge_engine/board_telemetry.py
+#
+# Per-board telemetry from the v2 builder, written as JSON Lines.
+#
+# A BoardTelemetry is passed to one run (generate_deals(telemetry=...)), not
+# installed as a module hook, so two runs never share one.  The builder keeps
+# the counters it always kept and hands them over once per builder call;
+# BoardTelemetry sums the calls (retries) of a board and writes one "board"
+# record when the board is done:
+#
+#   {"event": "board", "board": 3, "success": true, "attempts": 412,
+#    "builder_calls": 1, "reseeds": 0, "subprofile_rerolls": 0,
+#    "rs_rerolls": 0, "hcp_early_rejections": 57,
+#    "seat_fail": {"N": 300}, "seat_seen": {"N": 412, "E": 112},
+#    "seat_fail_hcp": {...}, "seat_fail_shape": {...},
+#    "subprofile_indices": {"N": 1, "E": 0}, "rs_suits": {"W": ["H"]},
+#    "elapsed_s": 0.081}
+#
+# With attempt_every=N, every Nth failed attempt also gets an "attempt"
+# record (failing seat and reason).  Counting is deterministic and never
+# touches the board RNG, so telemetry does not change the deals.
+#
+# Unlike _DEBUG_ON_ATTEMPT_FAILURE_ATTRIBUTION (dict copies of every counter
+# on every failed attempt), the per-attempt cost with attempt_every=0 is one
+# integer test.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .atomic_writer import AtomicBufferedWriter
+
+_SEAT_COUNTERS = ("seat_fail", "seat_seen", "seat_fail_hcp", "seat_fail_shape")
+_CALL_COUNTERS = ("attempts", "subprofile_rerolls", "rs_rerolls", "hcp_early_rejections")
+
+
+def telemetry_path_for(setup: Any) -> Path:
+    """JSONL file for a run: logs/<output file stem>.telemetry.jsonl."""
+    return Path(setup.log_dir) / f"{Path(setup.output_txt_file).stem}.telemetry.jsonl"
+
+
+class BoardTelemetry:
+    """
+    Telemetry sink for one run.
+
+    path=None keeps the records in memory (``records``); otherwise they are
+    appended to path, one flushed line per record.  Use as a context manager
+    or call close().
+    """
+
+    def __init__(self, path: Optional[Path] = None, *, attempt_every: int = 0) -> None:
+        if attempt_every < 0:
+            raise ValueError(f"attempt_every must be >= 0, got {attempt_every}")
+        self.path = None if path is None else Path(path)
+        self.attempt_every = attempt_every
+        self.records: List[Dict[str, Any]] = []
+        self._writer: Optional[AtomicBufferedWriter] = (
+            None if path is None
+            else AtomicBufferedWriter(self.path, append=True, flush_every=1)
+        )
+        self._board: Optional[Dict[str, Any]] = None
+
+    # -- called by the builder ----------------------------------------------
+
+    def attempt(self, board_number: int, attempt: int, seat: Optional[str], reason: Optional[str]) -> None:
+        """A sampled failed attempt (the builder applies attempt_every)."""
+        self.emit({
+            "event": "attempt", "board": board_number, "attempt": attempt,
+            "seat": seat, "reason": reason,
+        })
+
+    def builder_call(
+        self,
+        board_number: int,
+        *,
+        attempts: int,
+        subprofile_rerolls: int,
+        rs_rerolls: int,
+        hcp_early_rejections: int,
+        seat_fail: Mapping[str, int],
+        seat_seen: Mapping[str, int],
+        seat_fail_hcp: Mapping[str, int],
+        seat_fail_shape: Mapping[str, int],
+        subprofile_indices: Mapping[str, int],
+        rs_suits: Mapping[str, Sequence[str]],
+    ) -> None:
+        """Add one builder call (success or exhaustion) to the open board."""
+        board = self._board
+        if board is None or board["board"] != board_number:
+            board = self._board = {
+                "event": "board", "board": board_number, "builder_calls": 0,
+                **{name: 0 for name in _CALL_COUNTERS},
+                **{name: {} for name in _SEAT_COUNTERS},
+            }
+        board["builder_calls"] += 1
+        for name, value in (
+            ("attempts", attempts), ("subprofile_rerolls", subprofile_rerolls),
+            ("rs_rerolls", rs_rerolls), ("hcp_early_rejections", hcp_early_rejections),
+        ):
+            board[name] += value
+        for name, counts in (
+            ("seat_fail", seat_fail), ("seat_seen", seat_seen),
+            ("seat_fail_hcp", seat_fail_hcp), ("seat_fail_shape", seat_fail_shape),
+        ):
+            total = board[name]
+            for seat, n in counts.items():
+                total[seat] = total.get(seat, 0) + n
+        board["subprofile_indices"] = dict(subprofile_indices)
+        board["rs_suits"] = {seat: list(suits) for seat, suits in rs_suits.items()}
+
+    # -- called by the retry loop -------------------------------------------
+
+    def end_board(self, board_number: int, *, success: bool, elapsed: float, reseeds: int) -> None:
+        """Write the board record summing all builder calls for the board."""
+        board = self._board
+        if board is None or board["board"] != board_number:
+            board = {"event": "board", "board": board_number, "builder_calls": 0}
+        self._board = None
+        board.update(success=success, reseeds=reseeds, elapsed_s=round(elapsed, 6))
+        self.emit(board)
+
+    # -- output ---------------------------------------------------------------
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        """Write one record (also used to replay records built elsewhere)."""
+        if self._writer is None:
+            self.records.append(record)
+        else:
+            self._writer.write_record(json.dumps(record) + "\n")
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self) -> "BoardTelemetry":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
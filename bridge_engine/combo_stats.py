@@ -0,0 +1,174 @@
+# bridge_engine/combo_stats.py
+#
+# Online success-rate statistics per subprofile combination.
+#
+# The v2 builder works in "rounds": one subprofile selection plus one RS
+# pre-selection, dealt until it succeeds or its attempt budget runs out.
+# ComboStats records (attempts, successes) per round key and turns them into
+# the next round's budget (see ADAPTIVE_REROLL_* in deal_generator_types).
+#
+# A store lives for one generate_deals() run by default, so what the first
+# boards learn speeds up the rest.  save()/load() persist it as JSON next to
+# other session output; a stored file is tied to the profile's constraints
+# (deal_pool.pool_key) and ignored for any other profile.
+#
+# Determinism: budgets are drawn from the board RNG and the store only
+# changes between rounds, so a seeded serial run stays reproducible as long
+# as it starts from the same store (an empty one, by default).  Per-board
+# (workers) mode never uses a store.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import json
+import math
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+from .atomic_writer import AtomicBufferedWriter
+from .deal_generator_types import (
+    ADAPTIVE_REROLL_MAX,
+    ADAPTIVE_REROLL_PROBE,
+    ADAPTIVE_REROLL_TARGET,
+    SUBPROFILE_REROLL_INTERVAL,
+    Seat,
+)
+from .deal_pool import pool_key
+from .hand_profile import HandProfile
+
+# (sorted (seat, subprofile index) pairs, sorted (seat, RS suits) pairs)
+ComboKey = Tuple[Tuple[Tuple[Seat, int], ...], Tuple[Tuple[Seat, Tuple[str, ...]], ...]]
+
+_STATS_FORMAT_VERSION = 1
+
+
+def combo_key(
+    chosen_indices: Mapping[Seat, int],
+    rs_pre_selections: Mapping[Seat, Sequence[str]],
+) -> ComboKey:
+    """Hashable round key for a subprofile selection plus RS choice."""
+    return (
+        tuple(sorted(chosen_indices.items())),
+        tuple(sorted((seat, tuple(suits)) for seat, suits in rs_pre_selections.items())),
+    )
+
+
+class ComboStats:
+    """
+    Attempts / successes per round key, and the budgets derived from them.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[ComboKey, List[int]] = {}
+        # Same counts summed over RS choices, per subprofile selection.
+        self._by_indices: Dict[Tuple[Tuple[Seat, int], ...], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def counts(self, key: ComboKey) -> Tuple[int, int]:
+        """(attempts, successes) recorded for key."""
+        entry = self._counts.get(key)
+        return (entry[0], entry[1]) if entry else (0, 0)
+
+    def record(self, key: ComboKey, attempts: int, success: bool) -> None:
+        """Record a finished round: attempts spent, and whether it succeeded."""
+        if attempts <= 0:
+            return
+        self._add(key, attempts, int(success))
+
+    def _add(self, key: ComboKey, attempts: int, successes: int) -> None:
+        for entry in (
+            self._counts.setdefault(key, [0, 0]),
+            self._by_indices.setdefault(key[0], [0, 0]),
+        ):
+            entry[0] += attempts
+            entry[1] += successes
+
+    def budget(self, key: ComboKey, rng: random.Random) -> int:
+        """
+        Attempt budget for the next round on key (Thompson sampling).
+
+        A success rate theta is sampled from Beta(1 + successes, 1 + failures)
+        of the key, or of its subprofile selection over all RS choices if the
+        key itself is unseen; the budget is ADAPTIVE_REROLL_TARGET / theta,
+        or ADAPTIVE_REROLL_PROBE if that exceeds ADAPTIVE_REROLL_MAX.
+        Selections never seen at all get SUBPROFILE_REROLL_INTERVAL.
+        """
+        attempts, successes = self.counts(key)
+        if attempts == 0:
+            attempts, successes = self._by_indices.get(key[0], (0, 0))
+        if attempts == 0:
+            return SUBPROFILE_REROLL_INTERVAL
+        theta = rng.betavariate(1 + successes, 1 + attempts - successes)
+        want = ADAPTIVE_REROLL_TARGET / theta if theta > 0.0 else math.inf
+        if want > ADAPTIVE_REROLL_MAX:
+            return ADAPTIVE_REROLL_PROBE
+        return max(ADAPTIVE_REROLL_PROBE, math.ceil(want))
+
+    # -- persistence ---------------------------------------------------------
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """The store as JSON-ready rows (the "combos" list of save())."""
+        return [
+            {
+                "indices": dict(indices),
+                "rs": {seat: list(suits) for seat, suits in rs},
+                "attempts": a,
+                "successes": s,
+            }
+            for (indices, rs), (a, s) in sorted(self._counts.items())
+        ]
+
+    def restore(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        """
+        Replace the store's contents with rows from rows().  Raises KeyError,
+        TypeError, ValueError or AttributeError for malformed rows.
+        """
+        self._counts.clear()
+        self._by_indices.clear()
+        for row in rows:
+            key = combo_key(
+                {seat: int(i) for seat, i in row["indices"].items()},
+                {seat: list(suits) for seat, suits in row["rs"].items()},
+            )
+            self._add(key, int(row["attempts"]), int(row["successes"]))
+
+    def save(self, path: Path, profile: HandProfile) -> None:
+        """Write the store as JSON (atomically), tagged with the profile key."""
+        payload = {
+            "format": _STATS_FORMAT_VERSION,
+            "profile_key": pool_key(profile),
+            "combos": self.rows(),
+        }
+        with AtomicBufferedWriter(path) as writer:
+            writer.write(json.dumps(payload, indent=1) + "\n")
+
+    @classmethod
+    def load(cls, path: Path, profile: HandProfile) -> "ComboStats":
+        """
+        Read a store written by save().  Missing, unreadable, or other-profile
+        files give an empty store.
+        """
+        stats = cls()
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return stats
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != _STATS_FORMAT_VERSION
+            or payload.get("profile_key") != pool_key(profile)
+        ):
+            return stats
+        try:
+            stats.restore(payload.get("combos", []))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return cls()
+        return stats
+
+
+def stats_path_for(directory: Path, profile: HandProfile) -> Path:
+    """Conventional location of a profile's persisted store."""
+    return Path(directory) / f"{pool_key(profile)}.stats.json"
+
@@ -0,0 +1,98 @@
+# bridge_engine/deal_async.py
+#
+# asyncio front end for deal generation: agenerate_deals().
+#
+# Boards are built one at a time in an executor thread by iter_deals(), so
+# the event loop stays free and the boards are exactly those of
+# iter_deals() / generate_deals(workers=1) for the same seed.  A threading
+# Event is passed down as iter_deals(should_stop=...); the builder polls it
+# before every attempt, so cancelling the awaiting task or passing the
+# deadline stops the worker thread within one attempt instead of after
+# MAX_BOARD_RETRIES x MAX_BOARD_ATTEMPTS.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor
+from typing import AsyncIterator, Optional
+
+from .deal_generator import (
+    Deal,
+    DealGenerationCancelled,
+    iter_deals,
+)
+from .setup_env import SetupResult
+
+_DONE = object()  # next() sentinel: the iterator is exhausted
+
+
+async def agenerate_deals(
+    setup: SetupResult,
+    profile,
+    num_deals: Optional[int],
+    enable_rotation: bool = True,
+    *,
+    timeout: Optional[float] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[Deal]:
+    """
+    Yield deals as they are built, without blocking the event loop.
+
+        async for deal in agenerate_deals(setup, profile, 24, timeout=30):
+            ...
+
+    Each board is built by iter_deals() in ``executor`` (a thread pool; the
+    loop's default executor when None), so the output matches
+    generate_deals(setup, profile, n, enable_rotation, workers=1).
+    num_deals=None streams until the caller stops iterating.
+
+    Cancelling the consuming task stops the worker thread at its next
+    builder attempt.  timeout is an overall limit in seconds for the whole
+    run, measured from the first iteration: when it passes, generation stops
+    the same way and TimeoutError is raised (boards already yielded stay
+    valid).
+
+    Raises
+    ------
+    DealGenerationError
+        If num_deals is not positive or a board cannot be built.
+    TimeoutError
+        If timeout seconds pass before the last board is built.
+    """
+    stop = threading.Event()
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    def _should_stop() -> bool:
+        if deadline is not None and time.monotonic() >= deadline:
+            stop.set()
+        return stop.is_set()
+
+    deals = iter_deals(
+        setup, profile, enable_rotation, num_deals, should_stop=_should_stop,
+    )
+    loop = asyncio.get_running_loop()
+    built = 0
+    try:
+        while True:
+            try:
+                # The next board is built in the executor; one call at a
+                # time, so the generator never runs on two threads at once.
+                deal = await loop.run_in_executor(executor, next, deals, _DONE)
+            except DealGenerationCancelled as exc:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Deal generation exceeded {timeout:g}s after "
+                        f"{built} board(s)."
+                    ) from exc
+                raise
+            if deal is _DONE:
+                return
+            built += 1
+            yield deal
+    finally:
+        # Cancelled, timed out or closed early: a board still building in the
+        # executor stops at its next attempt.
+        stop.set()
+
@@ -0,0 +1,238 @@
+# bridge_engine/deal_checkpoint.py
+#
+# Checkpoint / resume for long generate_deals() runs.
+#
+# While a run with generate_deals(checkpoint=path) is building boards, the
+# boards finished so far are written to `path` (normally
+# checkpoint_path_for(setup.log_dir, profile, seed), in the run's logs/
+# directory) at most every CHECKPOINT_INTERVAL_SECONDS, and once more on
+# Ctrl-C or a generation error.  The file also carries what the rest of the
+# run depends on, as of the last finished board:
+#
+#   serial mode     the shared RNG state and the ComboStats store, both of
+#                   which evolve from board to board;
+#   per-board mode  nothing else (every board has its own derived stream).
+#
+# Boards are stored before vulnerability/rotation, which generate_deals
+# applies once at the end, so a run resumed with generate_deals(...,
+# resume=True) returns exactly the DealSet an uninterrupted run would have.
+# A finished run deletes its checkpoint.
+#
+# A checkpoint is tied to the profile's constraints (deal_pool.pool_key),
+# the seed, the board count, rotation and the mode; resuming with anything
+# else raises DealGenerationError rather than mixing two runs.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .atomic_writer import AtomicBufferedWriter
+from .deal_generator_types import Deal, DealGenerationError
+from .deal_pool import pool_key
+from .hand_profile import HandProfile
+
+# Minimum seconds between two checkpoint writes of one run.
+CHECKPOINT_INTERVAL_SECONDS: float = 15.0
+
+_CHECKPOINT_FORMAT = 1
+
+# Length of the profile-key prefix used in checkpoint file names.
+_KEY_CHARS = 16
+
+
+def checkpoint_path_for(log_dir: Path, profile: HandProfile, seed: int) -> Path:
+    """Conventional checkpoint file of a (profile, seed) run in log_dir."""
+    return Path(log_dir) / f"checkpoint_{pool_key(profile)[:_KEY_CHARS]}_{seed}.json"
+
+
+def latest_checkpoint(log_dir: Path, profile: HandProfile) -> Optional[Path]:
+    """Most recently written checkpoint for profile in log_dir, if any."""
+    pattern = f"checkpoint_{pool_key(profile)[:_KEY_CHARS]}_*.json"
+    found = sorted(Path(log_dir).glob(pattern), key=lambda p: p.stat().st_mtime)
+    return found[-1] if found else None
+
+
+def checkpoint_seed(path: Path) -> int:
+    """The seed a checkpoint_path_for() file name was made from."""
+    return int(Path(path).stem.rsplit("_", 1)[1])
+
+
+@dataclass
+class DealCheckpoint:
+    """The finished part of a run (boards before vulnerability/rotation)."""
+
+    seed: int
+    num_deals: int
+    enable_rotation: bool
+    mode: str                                   # "serial" or "per_board"
+    deals: List[Deal] = field(default_factory=list)
+    board_times: List[float] = field(default_factory=list)
+    board_attempts: List[int] = field(default_factory=list)
+    reseed_count: int = 0
+    pool_served: int = 0
+    rng_state: Optional[tuple] = None           # serial mode: random.getstate()
+    combo_rows: Optional[List[Dict[str, Any]]] = None   # serial: ComboStats.rows()
+
+    def save(self, path: Path, profile: HandProfile) -> None:
+        """Write the checkpoint as JSON (atomically)."""
+        payload = {
+            "format": _CHECKPOINT_FORMAT,
+            "profile_key": pool_key(profile),
+            "seed": self.seed,
+            "num_deals": self.num_deals,
+            "enable_rotation": self.enable_rotation,
+            "mode": self.mode,
+            "deals": [
+                {
+                    "board": d.board_number,
+                    "dealer": d.dealer,
+                    "vulnerability": d.vulnerability,
+                    "hands": d.hands,
+                }
+                for d in self.deals
+            ],
+            "board_times": self.board_times,
+            "board_attempts": self.board_attempts,
+            "reseed_count": self.reseed_count,
+            "pool_served": self.pool_served,
+            "rng_state": (
+                None if self.rng_state is None
+                else [self.rng_state[0], list(self.rng_state[1]), self.rng_state[2]]
+            ),
+            "combo_rows": self.combo_rows,
+        }
+        with AtomicBufferedWriter(path) as writer:
+            writer.write(json.dumps(payload) + "\n")
+
+    @classmethod
+    def load(cls, path: Path, profile: HandProfile) -> Optional["DealCheckpoint"]:
+        """
+        Read a checkpoint written by save().  Missing files give None;
+        unreadable ones and other profiles' raise DealGenerationError.
+        """
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            raise DealGenerationError(f"Unreadable checkpoint {path}: {exc}") from exc
+        if not isinstance(payload, dict) or payload.get("format") != _CHECKPOINT_FORMAT:
+            raise DealGenerationError(f"Unsupported checkpoint format in {path}.")
+        if payload.get("profile_key") != pool_key(profile):
+            raise DealGenerationError(
+                f"Checkpoint {path} was written for a different profile."
+            )
+        try:
+            rng_state = payload["rng_state"]
+            return cls(
+                seed=int(payload["seed"]),
+                num_deals=int(payload["num_deals"]),
+                enable_rotation=bool(payload["enable_rotation"]),
+                mode=str(payload["mode"]),
+                deals=[
+                    Deal(
+                        board_number=int(d["board"]),
+                        dealer=d["dealer"],
+                        vulnerability=d["vulnerability"],
+                        hands={seat: list(cards) for seat, cards in d["hands"].items()},
+                    )
+                    for d in payload["deals"]
+                ],
+                board_times=[float(t) for t in payload["board_times"]],
+                board_attempts=[int(a) for a in payload["board_attempts"]],
+                reseed_count=int(payload["reseed_count"]),
+                pool_served=int(payload["pool_served"]),
+                rng_state=(
+                    None if rng_state is None
+                    else (rng_state[0], tuple(rng_state[1]), rng_state[2])
+                ),
+                combo_rows=payload["combo_rows"],
+            )
+        except (KeyError, TypeError, ValueError, AttributeError) as exc:
+            raise DealGenerationError(f"Corrupt checkpoint {path}: {exc}") from exc
+
+
+class CheckpointWriter:
+    """
+    Checkpointing for one generate_deals() run: resume() reads the previous
+    state, update() is called after every board and writes when due,
+    discard() removes the file once the run has finished.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        profile: HandProfile,
+        seed: int,
+        num_deals: int,
+        enable_rotation: bool,
+        mode: str,
+    ) -> None:
+        self.path = Path(path)
+        self.profile = profile
+        self.seed = seed
+        self.num_deals = num_deals
+        self.enable_rotation = enable_rotation
+        self.mode = mode
+        self._last_write = time.monotonic()
+
+    def resume(self) -> Optional[DealCheckpoint]:
+        """
+        The checkpoint to continue from, or None to start afresh.  Raises
+        DealGenerationError if it belongs to a different run.
+        """
+        checkpoint = DealCheckpoint.load(self.path, self.profile)
+        if checkpoint is None:
+            return None
+        wanted = (self.seed, self.num_deals, self.enable_rotation, self.mode)
+        found = (checkpoint.seed, checkpoint.num_deals,
+                 checkpoint.enable_rotation, checkpoint.mode)
+        if found != wanted:
+            raise DealGenerationError(
+                f"Checkpoint {self.path} is for another run "
+                f"(seed, boards, rotation, mode = {found}; this run {wanted})."
+            )
+        return checkpoint
+
+    def update(
+        self,
+        deals: List[Deal],
+        board_times: List[float],
+        board_attempts: List[int],
+        reseed_count: int,
+        *,
+        pool_served: int = 0,
+        rng_state: Optional[tuple] = None,
+        combo_rows: Optional[List[Dict[str, Any]]] = None,
+        force: bool = False,
+    ) -> None:
+        """
+        Write the run so far if CHECKPOINT_INTERVAL_SECONDS have passed.
+
+        rng_state and combo_rows (serial mode) must be the state right after
+        the last finished board, not the live state of a board in progress.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_write < CHECKPOINT_INTERVAL_SECONDS:
+            return
+        DealCheckpoint(
+            seed=self.seed,
+            num_deals=self.num_deals,
+            enable_rotation=self.enable_rotation,
+            mode=self.mode,
+            deals=list(deals),
+            board_times=list(board_times),
+            board_attempts=list(board_attempts),
+            reseed_count=reseed_count,
+            pool_served=pool_served,
+            rng_state=rng_state,
+            combo_rows=combo_rows,
+        ).save(self.path, self.profile)
+        self._last_write = now
+
+    def discard(self) -> None:
+        self.path.unlink(missing_ok=True)
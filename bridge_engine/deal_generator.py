@@ -9,6 +9,7 @@
 #   deal_generator_types.py   — types, constants, dataclasses, debug hooks
 #   deal_generator_helpers.py — shared utilities (viability, HCP, deck, etc.)
 #   deal_generator_v1.py      — v1 builder + hardest-seat + constructive help
+#                               (imported on first use; see __getattr__)
 #   deal_generator_v2.py      — v2 shape-based help system (active path)
 #
 # This module retains:
@@ -16,10 +17,17 @@
 #   _select_subprofiles_for_board()   — must live here because tests
 #       monkeypatch deal_generator.SeatProfile for isinstance checks
 #   generate_deals()                  — public entry point
+#   iter_deals()                      — streaming entry point (one board at a time)
+#   _build_board_with_retries()       — per-board retry + re-seed loop
+#   _generate_deals_per_board()       — per-board seeding / multi-process mode
 #
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
+from itertools import count, product, repeat
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple,
+)
 
 import random
 import time
@@ -33,6 +41,14 @@ from .hand_profile import (
 )
 from .seat_viability import _match_seat
 from .profile_viability import _cross_seat_feasible
+from .combo_stats import ComboStats
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .board_telemetry import BoardTelemetry
+    from .deal_checkpoint import CheckpointWriter
+    from .deal_policy import DealPolicy
 
 # ---------------------------------------------------------------------------
 # Re-export ALL names from sub-modules via wildcard so that existing callers
@@ -54,23 +70,39 @@ from .deal_generator_types import (   # _-prefixed names for v1/v2 late imports
 
 from .deal_generator_helpers import *   # noqa: F401,F403
 from .deal_generator_helpers import (   # _-prefixed names for this module + tests
-    _choose_index_for_seat,
+    _choose_index_for_seat, _weights_for_seat_profile,
     _card_hcp, _deck_hcp_stats, _check_hcp_feasibility,
     _build_deck, _weighted_choice_index,
     _compute_viability_summary, _summarize_profile_viability,
     _deal_single_board_simple, _apply_vulnerability_and_rotation,
+    _derive_seed, _vulnerability_for_board,
+    _iter_vulnerability_and_rotation,
 )
 
-# v1 builder + helpers — extracted to deal_generator_v1.py (#7 Batch 4B)
-from .deal_generator_v1 import (
-    _seat_has_nonstandard_constraints,
-    _is_shape_dominant_failure,
-    _choose_hardest_seat_for_board,
-    _extract_standard_suit_minima,
-    _construct_hand_for_seat,
-    _build_single_board_random_suit_w_only,
-    _build_single_constrained_deal,
-)
+# v1 builder + helpers — extracted to deal_generator_v1.py (#7 Batch 4B).
+# Only the rs_w_only path still runs v1 code, so the module is imported on
+# first access to one of these names rather than at start-up.
+_V1_NAMES = frozenset({
+    "_seat_has_nonstandard_constraints",
+    "_is_shape_dominant_failure",
+    "_choose_hardest_seat_for_board",
+    "_extract_standard_suit_minima",
+    "_construct_hand_for_seat",
+    "_build_single_board_random_suit_w_only",
+    "_build_single_constrained_deal",
+})
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily imported v1 names (PEP 562)."""
+    if name not in _V1_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import deal_generator_v1
+
+    value = getattr(deal_generator_v1, name)
+    globals()[name] = value
+    return value
+
 
 # v2 shape-based help system — extracted to deal_generator_v2.py (#7)
 from .deal_generator_v2 import (
@@ -134,14 +166,183 @@ def _try_pair_coupling(
         chosen_subprofiles[follower_seat] = follower_sp.subprofiles[idx]
 
 
+# Feasible-combination index: per (profile, NS driver, EW driver), every
+# feasible subprofile index combination and its cumulative coupled weight.
+# The NS driver slot is "NS" for the joint table of a random_driver profile
+# (_random_driver_combo_table).
+# Keyed by id(profile); the entry keeps the profile (and the SeatProfile class
+# in force when it was built, which tests monkeypatch) for an identity check.
+# A None table means "enumeration not usable" (too many combinations, zero
+# total weight, or nothing feasible) -- use the rejection loop instead.
+_ComboTable = Tuple[List[Tuple[Dict[Seat, SubProfile], Dict[Seat, int]]], List[int]]
+_FEASIBLE_COMBO_INDEX: Dict[
+    Tuple[int, Optional[Seat], Seat], Tuple[object, type, Optional[_ComboTable]]
+] = {}
+_FEASIBLE_COMBO_INDEX_CACHE_MAX = 256
+
+
+def _coupled_pair_ok(sp_a: object, sp_b: object) -> bool:
+    """Coupling preconditions of _try_pair_coupling()."""
+    return (
+        isinstance(sp_a, SeatProfile)
+        and isinstance(sp_b, SeatProfile)
+        and len(sp_a.subprofiles) > 1
+        and len(sp_b.subprofiles) > 1
+        and len(sp_a.subprofiles) == len(sp_b.subprofiles)
+    )
+
+
+def _selection_units(
+    profile: HandProfile,
+    ns_driver: Optional[Seat],
+    ew_driver: Seat,
+) -> List[Tuple[Tuple[Seat, ...], List[Tuple[int, int]]]]:
+    """
+    Independent draws made by one round of subprofile selection.
+
+    Each unit is (seats, [(index, integer weight), ...]): a coupled NS/EW
+    pair (driver first, sharing one index drawn with the driver's weights)
+    or a single seat.  Weights are scaled exactly as _weighted_choice_index
+    scales them; zero-weight indices are dropped.  Units come in the order
+    _select_subprofiles_for_board fills its dicts.
+    """
+    seat_profiles = profile.seat_profiles
+    units: List[Tuple[Tuple[Seat, ...], List[Tuple[int, int]]]] = []
+    taken: set = set()
+
+    def _weighted(sp: SeatProfile) -> List[Tuple[int, int]]:
+        if len(sp.subprofiles) == 1:
+            return [(0, 1)]
+        scaled = [int(round(w * 10.0)) for w in _weights_for_seat_profile(sp)]
+        return [(i, w) for i, w in enumerate(scaled) if w > 0]
+
+    pairs: List[Tuple[Seat, Seat, Seat]] = []
+    if ns_driver is not None:
+        pairs.append(("N", "S", ns_driver))
+    pairs.append(("E", "W", ew_driver))
+    for seat_a, seat_b, driver in pairs:
+        if not _coupled_pair_ok(seat_profiles.get(seat_a), seat_profiles.get(seat_b)):
+            continue
+        follower = seat_b if driver == seat_a else seat_a
+        units.append(((driver, follower), _weighted(seat_profiles[driver])))
+        taken.update((seat_a, seat_b))
+
+    for seat_name, seat_profile in seat_profiles.items():
+        if not isinstance(seat_profile, SeatProfile):
+            continue
+        if not seat_profile.subprofiles or seat_name in taken:
+            continue
+        units.append(((seat_name,), _weighted(seat_profile)))
+    return units
+
+
+def _feasible_combo_table(
+    profile: HandProfile,
+    ns_driver: Optional[Seat],
+    ew_driver: Seat,
+) -> Optional[_ComboTable]:
+    """
+    Cached table of feasible subprofile combinations for one driver pair.
+
+    Returns (combos, cumulative_weights) where combos[i] is the
+    (chosen_subprofiles, chosen_indices) pair and the weight of a combination
+    is the product of its units' weights -- the probability one round of the
+    rejection loop would draw it.  A single rng.randrange(total) over the
+    table therefore samples exactly the loop's distribution conditioned on
+    feasibility, in O(log n).  None if the table cannot be used.
+    """
+    key = (id(profile), ns_driver, ew_driver)
+    entry = _FEASIBLE_COMBO_INDEX.get(key)
+    if entry is not None and entry[0] is profile and entry[1] is SeatProfile:
+        return entry[2]
+
+    table: Optional[_ComboTable] = None
+    units = _selection_units(profile, ns_driver, ew_driver)
+    space = 1
+    for _seats, options in units:
+        space *= len(options)
+    if 0 < space <= FEASIBLE_COMBO_INDEX_MAX:
+        combos: List[Tuple[Dict[Seat, SubProfile], Dict[Seat, int]]] = []
+        cumulative: List[int] = []
+        total = 0
+        for choice in product(*(options for _seats, options in units)):
+            subs: Dict[Seat, SubProfile] = {}
+            indices: Dict[Seat, int] = {}
+            weight = 1
+            for (seats, _options), (idx, w) in zip(units, choice):
+                weight *= w
+                for seat in seats:
+                    indices[seat] = idx
+                    subs[seat] = profile.seat_profiles[seat].subprofiles[idx]
+            if not _cross_seat_feasible(subs)[0]:
+                continue
+            total += weight
+            combos.append((subs, indices))
+            cumulative.append(total)
+        if combos:
+            table = (combos, cumulative)
+
+    if len(_FEASIBLE_COMBO_INDEX) >= _FEASIBLE_COMBO_INDEX_CACHE_MAX:
+        _FEASIBLE_COMBO_INDEX.clear()
+    _FEASIBLE_COMBO_INDEX[key] = (profile, SeatProfile, table)
+    return table
+
+
+def _random_driver_combo_table(
+    profile: HandProfile,
+    ew_driver: Seat,
+) -> Optional[_ComboTable]:
+    """
+    Cached joint table over both NS drivers of a random_driver profile.
+
+    One round of the rejection loop picks the driver d (N or S, evenly) and
+    then a combination c with probability w_d(c) / space_d, where space_d is
+    the total weight of d's whole combination space, feasible or not.
+    Weighting d's feasible entries by w_d(c) * space_other gives, in
+    integers, that joint distribution conditioned on feasibility: a driver
+    whose combinations are mostly infeasible is drawn correspondingly less
+    often.  None if either driver's table cannot be used.
+    """
+    key = (id(profile), "NS", ew_driver)
+    entry = _FEASIBLE_COMBO_INDEX.get(key)
+    if entry is not None and entry[0] is profile and entry[1] is SeatProfile:
+        return entry[2]
+
+    table: Optional[_ComboTable] = None
+    parts = [(d, _feasible_combo_table(profile, d, ew_driver)) for d in ("N", "S")]
+    if all(t is not None for _d, t in parts):
+        space: Dict[Seat, int] = {}
+        for d, _t in parts:
+            space[d] = 1
+            for _seats, options in _selection_units(profile, d, ew_driver):
+                space[d] *= sum(w for _idx, w in options)
+        combos: List[Tuple[Dict[Seat, SubProfile], Dict[Seat, int]]] = []
+        cumulative: List[int] = []
+        total = 0
+        for d, (part_combos, part_cumulative) in parts:  # type: ignore[misc]
+            scale = space["S" if d == "N" else "N"]
+            previous = 0
+            for combo, cum in zip(part_combos, part_cumulative):
+                total += (cum - previous) * scale
+                previous = cum
+                combos.append(combo)
+                cumulative.append(total)
+        table = (combos, cumulative)
+
+    if len(_FEASIBLE_COMBO_INDEX) >= _FEASIBLE_COMBO_INDEX_CACHE_MAX:
+        _FEASIBLE_COMBO_INDEX.clear()
+    _FEASIBLE_COMBO_INDEX[key] = (profile, SeatProfile, table)
+    return table
+
+
 def _select_subprofiles_for_board(
     rng: random.Random,
     profile: HandProfile,
     dealing_order: List[Seat],
 ) -> Tuple[Dict[Seat, SubProfile], Dict[Seat, int]]:
     """
-    Select a concrete subprofile index for each seat, with cross-seat
-    feasibility rejection.
+    Select a concrete subprofile index for each seat, restricted to
+    cross-seat feasible combinations.
 
     NS:
       * If ns_role_mode is not "no_driver_no_index" and both N/S have >1
@@ -156,25 +357,67 @@ def _select_subprofiles_for_board(
 
     Any remaining seats just choose their own index by their local weights.
 
-    After selecting, _cross_seat_feasible() checks whether the chosen
-    combination can possibly succeed (HCP sums, per-suit card counts).
-    If infeasible, we retry up to MAX_SUBPROFILE_FEASIBILITY_RETRIES times.
-    If all retries are exhausted, the last selection is returned (the
-    attempt loop will handle it, but this should be extremely rare).
+    Feasibility (_cross_seat_feasible: HCP sums, per-suit card counts) is
+    handled by a precomputed table (_feasible_combo_table): one weighted draw
+    picks among the feasible combinations, with weights renormalised over
+    that set.  For ns_role_mode "random_driver" the NS driver is part of the
+    same draw (_random_driver_combo_table), so driver and combination follow
+    the rejection loop's joint distribution conditioned on feasibility.  The
+    tables are built once per profile and driver pair.
+
+    Fallback (combination space above FEASIBLE_COMBO_INDEX_MAX, or no
+    feasible combination): draw and reject up to
+    MAX_SUBPROFILE_FEASIBILITY_RETRIES times, then return the last
+    selection (the attempt loop will handle it; this should be rare).
     """
+    ns_mode = (
+        getattr(profile, "ns_role_mode", "no_driver_no_index")
+        or "no_driver_no_index"
+    )
+    ew_driver_seat: Seat = next(
+        (s for s in dealing_order if s in ("E", "W")), "E"
+    )
+    ns_candidates: Tuple[Optional[Seat], ...] = (
+        (None,) if ns_mode == "no_driver_no_index" else ("N", "S")
+    )
+    tables = {
+        d: _feasible_combo_table(profile, d, ew_driver_seat) for d in ns_candidates
+    }
+    table: Optional[_ComboTable] = None
+    if None not in tables.values():
+        if ns_mode.lower() == "random_driver":
+            table = _random_driver_combo_table(profile, ew_driver_seat)
+        else:
+            ns_driver_seat: Optional[Seat] = None
+            if ns_mode != "no_driver_no_index":
+                # Fixed by the mode: draws nothing from rng.
+                ns_driver_seat = profile.ns_driver_seat(rng)
+                if ns_driver_seat not in ("N", "S"):
+                    ns_driver_seat = next(
+                        (s for s in dealing_order if s in ("N", "S")), "N"
+                    )
+            table = tables[ns_driver_seat]
+    if table is not None:
+        combos, cumulative = table
+        # A single feasible combination needs no draw (keeps the RNG stream
+        # of single-subprofile profiles unchanged).
+        pick = (
+            bisect_right(cumulative, rng.randrange(cumulative[-1]))
+            if len(combos) > 1 else 0
+        )
+        chosen_subprofiles, chosen_indices = combos[pick]
+        return dict(chosen_subprofiles), dict(chosen_indices)
 
-    def _pick_once() -> Tuple[Dict[Seat, SubProfile], Dict[Seat, int]]:
+    def _pick_once(
+        ns_mode: str, ew_driver: Seat,
+    ) -> Tuple[Dict[Seat, SubProfile], Dict[Seat, int]]:
         """Single round of subprofile selection (no feasibility check)."""
         chosen_subprofiles: Dict[Seat, SubProfile] = {}
         chosen_indices: Dict[Seat, int] = {}
 
         # --- NS coupling ---
         # Enabled for all ns_role_mode values EXCEPT "no_driver_no_index".
-        _ns_mode = (
-            getattr(profile, "ns_role_mode", "no_driver_no_index")
-            or "no_driver_no_index"
-        )
-        if _ns_mode != "no_driver_no_index":
+        if ns_mode != "no_driver_no_index":
             ns_driver: Optional[Seat] = profile.ns_driver_seat(rng)
             if ns_driver not in ("N", "S"):
                 ns_driver = next(
@@ -186,9 +429,6 @@ def _select_subprofiles_for_board(
             )
 
         # --- EW coupling (always attempted) ---
-        ew_driver: Seat = next(
-            (s for s in dealing_order if s in ("E", "W")), "E"
-        )
         _try_pair_coupling(
             rng, profile.seat_profiles, "E", "W", ew_driver,
             chosen_subprofiles, chosen_indices,
@@ -209,14 +449,12 @@ def _select_subprofiles_for_board(
 
         return chosen_subprofiles, chosen_indices
 
-    # --- Feasibility retry loop -------------------------------------------
-    # Try up to MAX_SUBPROFILE_FEASIBILITY_RETRIES times to find a feasible
-    # combination.  For easy profiles (all combos feasible) this always
-    # succeeds on the first try — zero overhead.  For hard profiles like
-    # "Defense to Weak 2s" (43.8% of N×E combos infeasible), this eliminates
-    # all wasted 1000-attempt chunks on impossible combinations.
+    # --- Feasibility retry loop (fallback) ----------------------------------
+    # Only reached when the combination table is unusable.  Try up to
+    # MAX_SUBPROFILE_FEASIBILITY_RETRIES times to find a feasible
+    # combination.
     for _ in range(MAX_SUBPROFILE_FEASIBILITY_RETRIES):
-        chosen_subprofiles, chosen_indices = _pick_once()
+        chosen_subprofiles, chosen_indices = _pick_once(ns_mode, ew_driver_seat)
         feasible, _reason = _cross_seat_feasible(chosen_subprofiles)
         if feasible:
             return chosen_subprofiles, chosen_indices
@@ -237,12 +475,47 @@ def generate_deals(
     profile,
     num_deals: int,
     enable_rotation: bool = True,
+    workers: Optional[int] = None,
+    pool=None,
+    combo_stats: Optional[ComboStats] = None,
+    deal_policy: Optional[DealPolicy] = None,
+    checkpoint: Optional[Path] = None,
+    resume: bool = False,
+    telemetry: Optional[BoardTelemetry] = None,
 ) -> DealSet:
     """
     Generate a set of deals.
 
     If `profile` is a real HandProfile:
       - Use the full constrained v2 pipeline (shape help, HCP rejection, etc.).
+      - workers=None (default): one RNG stream shared by all boards.
+      - workers=N: per-board seeding — each board gets its own RNG derived
+        from (SetupResult.seed, board_number), built in N processes (or
+        in-process for N=1).  Output is identical for every N.
+      - pool (a deal_pool.DealPool): unseeded serial runs take boards from
+        the pool first and build only the shortfall.  Pooled boards get the
+        same vulnerability/rotation pass as built ones.  Seeded runs and
+        per-board mode never read the pool (they must be reproducible).
+      - combo_stats (a combo_stats.ComboStats): opt-in.  Serial runs learn
+        per subprofile-combination success rates into this store and size
+        their reroll rounds from it (see ADAPTIVE_REROLL_*); pass a loaded
+        one to start from persisted stats.  None keeps the fixed
+        SUBPROFILE_REROLL_INTERVAL schedule.  Per-board mode never uses a
+        store.
+      - deal_policy (a deal_policy.DealPolicy): per subprofile-combination
+        dealing order and pre-allocation fraction measured offline by
+        optimize_deal_policy(); used in both serial and per-board mode.
+      - checkpoint (a path, normally deal_checkpoint.checkpoint_path_for(
+        setup.log_dir, profile, setup.seed)): the boards built so far, plus
+        the RNG and ComboStats state in serial mode, are saved there every
+        CHECKPOINT_INTERVAL_SECONDS and on Ctrl-C; the file is deleted when
+        the run finishes.  With resume=True an existing checkpoint is
+        continued, giving exactly the DealSet of an uninterrupted run.
+      - telemetry (a board_telemetry.BoardTelemetry): one record per board
+        built (attempts, rerolls, per-seat counters, chosen subprofiles and
+        RS suits, time) plus sampled attempt events, in board order in both
+        modes.  The caller owns and closes it.  Resumed boards and pooled
+        boards get no record.
 
     If `profile` is not a HandProfile (e.g. tests using DummyProfile):
       - Fallback to simple random dealing, seeded by SetupResult.seed.
@@ -286,6 +559,8 @@ def generate_deals(
     # the full matching pipeline.
     # ---------------------------------------------------------------
     if getattr(profile, "use_rs_w_only_path", False):
+        from .deal_generator_v1 import _build_single_board_random_suit_w_only
+
         deals: List[Deal] = []
         for board_number in range(1, num_deals + 1):
             deal = _build_single_board_random_suit_w_only(
@@ -306,58 +581,106 @@ def generate_deals(
     # Full constrained path
     # -------------------------
     #
-    # Board-level retry: each board gets up to MAX_BOARD_RETRIES chances.
-    # Each retry calls the v2 builder with a fresh RNG state (advanced by
-    # the previous failed attempt's 10K+ random operations), giving it
-    # different subprofile selections, RS suits, and random fills.
-    # For easy profiles, every board succeeds on retry 1 (no overhead).
-    # For hard profiles (e.g. "Defense to Weak 2s" at ~10% per-retry
-    # success rate), 50 retries gives ~99.5% per-board success.
+    # Board-level retry: each board gets up to MAX_BOARD_RETRIES chances
+    # (see _build_board_with_retries).  For easy profiles, every board
+    # succeeds on retry 1 (no overhead).  For hard profiles (e.g. "Defense
+    # to Weak 2s" at ~10% per-retry success rate), 50 retries gives ~99.5%
+    # per-board success.
     try:
+        writer = None
+        if checkpoint is not None:
+            from .deal_checkpoint import CheckpointWriter
+
+            writer = CheckpointWriter(
+                checkpoint, profile, setup.seed, num_deals, enable_rotation,
+                "serial" if workers is None else "per_board",
+            )
+        if workers is not None:
+            return _generate_deals_per_board(
+                setup.seed, profile, num_deals, enable_rotation, workers,
+                deal_policy=deal_policy, checkpoint=writer, resume=resume,
+                telemetry=telemetry,
+            )
+
         deals: List[Deal] = []
         board_times: List[float] = []   # Per-board elapsed seconds
+        board_attempts: List[int] = []  # Per-board builder attempts
         reseed_count: int = 0           # Number of adaptive re-seeds
 
-        for board_number in range(1, num_deals + 1):
-            board_start = time.monotonic()
-            deal = None
-            last_exc: Optional[Exception] = None
-            for _retry in range(MAX_BOARD_RETRIES):
-                try:
-                    deal = _build_single_constrained_deal_v2(
-                        rng=rng,
-                        profile=profile,
+        resumed = writer.resume() if writer is not None and resume else None
+        if resumed is not None:
+            deals = list(resumed.deals)
+            board_times = list(resumed.board_times)
+            board_attempts = list(resumed.board_attempts)
+            reseed_count = resumed.reseed_count
+            rng.setstate(resumed.rng_state)
+            # A run that learned into a store continues with its state, so
+            # the resumed boards match the uninterrupted run.
+            if resumed.combo_rows is not None:
+                if combo_stats is None:
+                    combo_stats = ComboStats()
+                combo_stats.restore(resumed.combo_rows)
+        # Pooled boards first (unseeded runs only), renumbered from 1.
+        elif pool is not None and not setup.use_seeded_run:
+            for hands in pool.take(profile, num_deals):
+                board_number = len(deals) + 1
+                deals.append(
+                    Deal(
                         board_number=board_number,
+                        dealer=profile.dealer,
+                        vulnerability=_vulnerability_for_board(board_number),
+                        hands=hands,
                     )
-                    break  # Board succeeded.
-                except DealGenerationError as exc:
-                    last_exc = exc
-
-                    # Adaptive re-seeding: if this board is taking too long,
-                    # the current RNG trajectory is probably unfavorable.
-                    # Replace with a fresh random seed (OS entropy) and keep
-                    # trying. The timer resets so the new seed gets a full
-                    # time budget.
-                    if RESEED_TIME_THRESHOLD_SECONDS > 0.0:
-                        elapsed = time.monotonic() - board_start
-                        if elapsed >= RESEED_TIME_THRESHOLD_SECONDS:
-                            new_seed = random.SystemRandom().randint(
-                                1, 2**31 - 1
-                            )
-                            rng = random.Random(new_seed)
-                            reseed_count += 1
-                            board_start = time.monotonic()
-
-            board_elapsed = time.monotonic() - board_start
-            board_times.append(board_elapsed)
-
-            if deal is None:
-                raise DealGenerationError(
-                    f"Failed to generate board {board_number} after "
-                    f"{MAX_BOARD_RETRIES} retries of "
-                    f"{MAX_BOARD_ATTEMPTS} attempts each."
-                ) from last_exc
-            deals.append(deal)
+                )
+        pool_served = (
+            resumed.pool_served if resumed is not None
+            else len(deals)
+        )
+
+        # RNG and ComboStats state as of the last finished board.  A board
+        # interrupted halfway has already advanced both, so the checkpoint
+        # must record this snapshot, not the live objects.
+        finished_state: Tuple[Optional[tuple], Optional[List[Dict[str, Any]]]] = (
+            None, None,
+        )
+
+        def _snapshot() -> None:
+            nonlocal finished_state
+            if writer is not None:
+                finished_state = (
+                    rng.getstate(),
+                    None if combo_stats is None else combo_stats.rows(),
+                )
+
+        def _save(force: bool = False) -> None:
+            if writer is not None:
+                rng_state, combo_rows = finished_state
+                writer.update(
+                    deals, board_times, board_attempts, reseed_count,
+                    pool_served=pool_served, rng_state=rng_state,
+                    combo_rows=combo_rows, force=force,
+                )
+
+        _snapshot()
+        try:
+            for board_number in range(len(deals) + 1, num_deals + 1):
+                attempt_log: List[int] = []
+                deal, rng, board_elapsed, reseeds = _build_board_with_retries(
+                    rng, profile, board_number, _derived_reseed(setup.seed),
+                    combo_stats=combo_stats, attempt_log=attempt_log,
+                    deal_policy=deal_policy, telemetry=telemetry,
+                )
+                board_times.append(board_elapsed)
+                board_attempts.append(sum(attempt_log))
+                reseed_count += reseeds
+                deals.append(deal)
+                _snapshot()
+                _save()
+        except (KeyboardInterrupt, DealGenerationError):
+            _save(force=True)
+            raise
+        if writer is not None:
+            writer.discard()
 
         deals = _apply_vulnerability_and_rotation(
             rng,
@@ -368,8 +691,400 @@ def generate_deals(
             deals=deals,
             board_times=board_times,
             reseed_count=reseed_count,
+            pool_served=pool_served,
+            board_attempts=board_attempts,
         )
     except DealGenerationError:
         raise  # Pass through domain errors without wrapping.
     except (ProfileError, ValueError, TypeError) as exc:
         raise DealGenerationError(f"Failed to generate deals: {exc}") from exc
+
+
+def iter_deals(
+    setup: SetupResult,
+    profile,
+    enable_rotation: bool = True,
+    num_deals: Optional[int] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Iterator[Deal]:
+    """
+    Yield deals one at a time as they are built (streaming generate_deals).
+
+    Nothing is accumulated: vulnerability and rotation are applied per board
+    from their own derived RNG stream, so memory stays constant however many
+    boards are pulled and the first board is available as soon as it is
+    built.  num_deals=None streams until the caller stops iterating.
+
+    For a HandProfile every board uses per-board seeding (as in
+    generate_deals(workers=...)), so the first N boards are exactly those of
+    generate_deals(setup, profile, N, enable_rotation, workers=1).  Dummy
+    profiles stream the simple random deals of generate_deals(); the RS-W-only
+    test path is reproducible per seed but not board-for-board identical to
+    generate_deals().
+
+    should_stop is polled between boards and, for a HandProfile, before
+    every builder attempt; once it returns True the iterator raises
+    DealGenerationCancelled (deal_async.agenerate_deals uses this for
+    cancellation and deadlines).
+
+    Raises
+    ------
+    DealGenerationError
+        If num_deals is not positive or a board cannot be built.
+    """
+    if num_deals is not None and num_deals <= 0:
+        raise DealGenerationError(f"num_deals must be positive, got {num_deals}.")
+    return _iter_deals(setup, profile, enable_rotation, num_deals, should_stop)
+
+
+def _iter_deals(
+    setup: SetupResult,
+    profile,
+    enable_rotation: bool,
+    num_deals: Optional[int],
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Iterator[Deal]:
+    # Separate from iter_deals() so argument errors raise at call time rather
+    # than on the first next().
+    board_numbers: Iterable[int] = (
+        count(1) if num_deals is None else range(1, num_deals + 1)
+    )
+    if should_stop is not None:
+        board_numbers = _until_stopped(board_numbers, should_stop)
+
+    if not isinstance(profile, HandProfile):
+        rng = random.Random(setup.seed)
+        dealer: Seat = getattr(profile, "dealer", "N")
+        dealing_order: List[Seat] = list(
+            getattr(profile, "hand_dealing_order", ["N", "E", "S", "W"])
+        )
+        for board_number in board_numbers:
+            yield _deal_single_board_simple(
+                rng=rng,
+                board_number=board_number,
+                dealer=dealer,
+                dealing_order=dealing_order,
+            )
+        return
+
+    if getattr(profile, "use_rs_w_only_path", False):
+        from .deal_generator_v1 import _build_single_board_random_suit_w_only
+
+        rng = random.Random(setup.seed)
+        built: Iterator[Deal] = (
+            _build_single_board_random_suit_w_only(
+                rng=rng, profile=profile, board_number=board_number,
+            )
+            for board_number in board_numbers
+        )
+    else:
+        built = (
+            _build_board_from_seed(
+                profile, setup.seed, board_number, should_stop=should_stop,
+            )[0]
+            for board_number in board_numbers
+        )
+
+    try:
+        yield from _iter_vulnerability_and_rotation(
+            random.Random(_derive_seed(setup.seed, "vulnerability")),
+            built,
+            rotate=enable_rotation,
+        )
+    except DealGenerationError:
+        raise
+    except (ProfileError, ValueError, TypeError) as exc:
+        raise DealGenerationError(f"Failed to generate deals: {exc}") from exc
+
+
+def _until_stopped(
+    board_numbers: Iterable[int], should_stop: Callable[[], bool],
+) -> Iterator[int]:
+    for board_number in board_numbers:
+        if should_stop():
+            raise DealGenerationCancelled(
+                f"Stopped before board {board_number}."
+            )
+        yield board_number
+
+
+# ---------------------------------------------------------------------------
+# Board retry loop + per-board (multi-process) generation
+# ---------------------------------------------------------------------------
+
+
+def _system_reseed(board_number: int, reseed_k: int) -> random.Random:
+    """Re-seed from OS entropy (not reproducible); used by DealPool fills."""
+    return random.Random(random.SystemRandom().randint(1, 2**31 - 1))
+
+
+def _derived_reseed(seed: int) -> Callable[[int, int], random.Random]:
+    """
+    Re-seed function for a run: re-seed k of board b gets its own stream
+    derived from (seed, b, "reseed", k), so runs replay bit-for-bit.
+    """
+    def _reseed(board_number: int, reseed_k: int) -> random.Random:
+        return random.Random(_derive_seed(seed, board_number, "reseed", reseed_k))
+
+    return _reseed
+
+
+def _build_board_with_retries(
+    rng: random.Random,
+    profile: HandProfile,
+    board_number: int,
+    reseed: Callable[[int, int], random.Random],
+    combo_stats: Optional[ComboStats] = None,
+    attempt_log: Optional[List[int]] = None,
+    deal_policy: Optional[DealPolicy] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    telemetry: Optional[BoardTelemetry] = None,
+) -> Tuple[Deal, random.Random, float, int]:
+    """
+    Build one board, retrying the v2 builder up to MAX_BOARD_RETRIES times.
+
+    The first try uses rng; every retry after a failed one runs on a new
+    stream, ``reseed(board_number, k)`` (k counts re-seeds on this board,
+    from 1).  Re-seeding on failures rather than on elapsed time means that,
+    with a derived reseed (_derived_reseed), the board depends only on its
+    inputs and never on machine speed or load.
+
+    combo_stats (adaptive rounds), deal_policy, should_stop and telemetry
+    are passed through to the v2 builder; attempt_log gets one entry per
+    builder call (retries included).  should_stop is also polled before each
+    retry, and DealGenerationCancelled is never retried.  telemetry gets its
+    board record once the board succeeds or every retry has failed.
+
+    Returns (deal, rng, elapsed_seconds, reseeds).  The returned rng is the
+    one in use when the board succeeded — callers sharing one stream across
+    boards must carry it forward.
+
+    Raises DealGenerationError if every retry fails, DealGenerationCancelled
+    if should_stop returned True.
+    """
+    board_start = time.monotonic()
+    reseeds = 0
+    last_exc: Optional[Exception] = None
+    for retry in range(MAX_BOARD_RETRIES):
+        if should_stop is not None and should_stop():
+            raise DealGenerationCancelled(f"Board {board_number} stopped.")
+        if retry > 0:
+            reseeds += 1
+            rng = reseed(board_number, reseeds)
+        try:
+            deal = _build_single_constrained_deal_v2(
+                rng=rng,
+                profile=profile,
+                board_number=board_number,
+                combo_stats=combo_stats,
+                attempt_log=attempt_log,
+                deal_policy=deal_policy,
+                should_stop=should_stop,
+                telemetry=telemetry,
+            )
+            elapsed = time.monotonic() - board_start
+            if telemetry is not None:
+                telemetry.end_board(
+                    board_number, success=True, elapsed=elapsed, reseeds=reseeds
+                )
+            return deal, rng, elapsed, reseeds
+        except DealGenerationCancelled:
+            raise
+        except DealGenerationError as exc:
+            last_exc = exc
+
+    if telemetry is not None:
+        telemetry.end_board(
+            board_number, success=False,
+            elapsed=time.monotonic() - board_start, reseeds=reseeds,
+        )
+    raise DealGenerationError(
+        f"Failed to generate board {board_number} after "
+        f"{MAX_BOARD_RETRIES} retries of "
+        f"{MAX_BOARD_ATTEMPTS} attempts each."
+    ) from last_exc
+
+
+def _build_board_from_seed(
+    profile: HandProfile,
+    seed: int,
+    board_number: int,
+    deal_policy: Optional[DealPolicy] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    telemetry: Optional[BoardTelemetry] = None,
+) -> Tuple[Deal, float, int, int]:
+    """
+    Build one board on its own RNG stream derived from (seed, board_number).
+
+    Returns (deal, elapsed_seconds, reseeds, attempts).
+
+    Module-level (not a closure) so ProcessPoolExecutor can pickle it.
+    Re-seeds are derived too, so the board is fully determined by its inputs
+    whichever process builds it.  should_stop and telemetry (in-process
+    callers only) are passed to _build_board_with_retries.
+    """
+    rng = random.Random(_derive_seed(seed, board_number))
+    attempt_log: List[int] = []
+    deal, _rng, elapsed, reseeds = _build_board_with_retries(
+        rng, profile, board_number, _derived_reseed(seed), attempt_log=attempt_log,
+        deal_policy=deal_policy, should_stop=should_stop, telemetry=telemetry,
+    )
+    return deal, elapsed, reseeds, sum(attempt_log)
+
+
+def _build_board_from_seed_recorded(
+    profile: HandProfile,
+    seed: int,
+    board_number: int,
+    deal_policy: Optional[DealPolicy],
+    attempt_every: int,
+) -> Tuple[Tuple[Deal, float, int, int], List[Dict[str, Any]]]:
+    """
+    _build_board_from_seed() with telemetry, for worker processes: returns
+    (result, telemetry records) so the parent can write them in board order.
+    """
+    from .board_telemetry import BoardTelemetry
+
+    recorder = BoardTelemetry(attempt_every=attempt_every)
+    result = _build_board_from_seed(
+        profile, seed, board_number, deal_policy, telemetry=recorder,
+    )
+    return result, recorder.records
+
+
+def _generate_deals_per_board(
+    seed: int,
+    profile: HandProfile,
+    num_deals: int,
+    enable_rotation: bool,
+    workers: int,
+    deal_policy: Optional[DealPolicy] = None,
+    deadline: Optional[float] = None,
+    checkpoint: Optional[CheckpointWriter] = None,
+    resume: bool = False,
+    telemetry: Optional[BoardTelemetry] = None,
+) -> DealSet:
+    """
+    Per-board seeding mode of generate_deals() (``workers`` is not None).
+
+    Every board is built from its own derived seed, so the output depends
+    only on ``seed`` (SetupResult.seed) — never on how many processes built
+    it.  workers == 1 builds in-process; workers > 1 fans boards out over a
+    ProcessPoolExecutor and collects them back in board order.
+
+    deadline (a time.time() value, in-process builds only) stops the run
+    with TimeoutError once it passes: the builder polls it before every
+    attempt, so even a board that can never be built is abandoned within
+    one attempt.  The deal service uses it to bound each request.
+
+    checkpoint (a deal_checkpoint.CheckpointWriter) receives the boards
+    finished so far, in board order; with resume=True its saved boards are
+    reused and only the rest are built.  telemetry records are written in
+    board order; worker processes record into memory and send them back.
+    """
+    if workers < 1:
+        raise DealGenerationError(f"workers must be >= 1, got {workers}.")
+
+    deals: List[Deal] = []
+    board_times: List[float] = []
+    board_attempts: List[int] = []
+    reseed_count = 0
+    resumed = checkpoint.resume() if checkpoint is not None and resume else None
+    if resumed is not None:
+        deals = list(resumed.deals)
+        board_times = list(resumed.board_times)
+        board_attempts = list(resumed.board_attempts)
+        reseed_count = resumed.reseed_count
+
+    def _collect(results: Iterable[Tuple[Deal, float, int, int]]) -> None:
+        nonlocal reseed_count
+        for deal, elapsed, reseeds, attempts in results:
+            deals.append(deal)
+            board_times.append(elapsed)
+            reseed_count += reseeds
+            board_attempts.append(attempts)
+            if checkpoint is not None:
+                checkpoint.update(deals, board_times, board_attempts, reseed_count)
+
+    board_numbers = range(len(deals) + 1, num_deals + 1)
+    try:
+        if workers == 1 or len(board_numbers) <= 1:
+            past_deadline = (
+                None if deadline is None else (lambda: time.time() > deadline)
+            )
+
+            def _in_process() -> Iterator[Tuple[Deal, float, int, int]]:
+                for board_number in board_numbers:
+                    stopped = f"stopped after {board_number - 1} of {num_deals} boards"
+                    if past_deadline is not None and past_deadline():
+                        raise TimeoutError(stopped)
+                    try:
+                        result = _build_board_from_seed(
+                            profile, seed, board_number, deal_policy,
+                            should_stop=past_deadline, telemetry=telemetry,
+                        )
+                    except DealGenerationCancelled:
+                        raise TimeoutError(stopped) from None
+                    yield result
+
+            _collect(_in_process())
+        else:
+            # multiprocessing is costly to import; only this branch needs it.
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Small chunks keep slow boards from starving other workers.
+            chunksize = max(1, len(board_numbers) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(board_numbers))
+            ) as pool:
+                if telemetry is None:
+                    _collect(
+                        pool.map(
+                            _build_board_from_seed,
+                            repeat(profile),
+                            repeat(seed),
+                            board_numbers,
+                            repeat(deal_policy),
+                            chunksize=chunksize,
+                        )
+                    )
+                else:
+                    def _replayed(recorded) -> Iterator[Tuple[Deal, float, int, int]]:
+                        for result, records in recorded:
+                            for record in records:
+                                telemetry.emit(record)
+                            yield result
+
+                    _collect(_replayed(
+                        pool.map(
+                            _build_board_from_seed_recorded,
+                            repeat(profile),
+                            repeat(seed),
+                            board_numbers,
+                            repeat(deal_policy),
+                            repeat(telemetry.attempt_every),
+                            chunksize=chunksize,
+                        )
+                    ))
+    except KeyboardInterrupt:
+        if checkpoint is not None:
+            checkpoint.update(
+                deals, board_times, board_attempts, reseed_count, force=True
+            )
+        raise
+    if checkpoint is not None:
+        checkpoint.discard()
+
+    # Vulnerability/rotation get their own derived stream too, so they are
+    # independent of how far each board's RNG advanced.
+    deals = _apply_vulnerability_and_rotation(
+        random.Random(_derive_seed(seed, "vulnerability")),
+        deals,
+        rotate=enable_rotation,
+    )
+    return DealSet(
+        deals=deals,
+        board_times=board_times,
+        reseed_count=reseed_count,
+        board_attempts=board_attempts,
+    )
@@ -0,0 +1,347 @@
+# bridge_engine/deal_generator_batch.py
+#
+# Optional NumPy batch-attempt engine for standard-only profiles.
+#
+# The scalar v2 builder spends one Python loop iteration per attempt:
+# shuffle, deal, analyse, match.  For profiles whose subprofiles are all
+# standard-only (no RS / PC / OC — nothing that depends on another seat's
+# choices), every check is a fixed per-seat bound on suit lengths, suit HCP
+# and total HCP.  That vectorises: deal BATCH_ENGINE_SIZE decks at once,
+# compute a (decks × seats × suits) length/HCP tensor, and test every bound
+# in a handful of NumPy operations.
+#
+# NumPy is optional.  It is imported lazily on first use; if it is missing,
+# or the profile has any RS / PC / OC subprofile, _batch_engine_supports()
+# returns False and the v2 builder stays on its scalar path.  The v2 builder
+# also stays scalar when given should_stop, telemetry, a dealing policy or a
+# ComboStats store: the batch engine honours none of them.
+#
+# Gated by ENABLE_NUMPY_BATCH_ENGINE (deal_generator_types.py), read through
+# the facade at call time so tests can monkeypatch it.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import random
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .deal_generator_types import (
+    Seat, Deal, DealGenerationError, SeatFailCounts, SeatSeenCounts,
+    BATCH_ENGINE_SIZE, BATCH_ENGINE_MIN_SIZE,
+    SHAPE_PROB_THRESHOLD,
+    _ID_HCP, _ID_SUIT,
+)
+from .deal_generator_helpers import (
+    _compute_viability_summary, _ids_to_cards, _vulnerability_for_board,
+)
+from .hand_profile import HandProfile, SeatProfile, SubProfile
+from .hand_combinatorics import (
+    subprofile_shape_probability, subprofile_suit_windows,
+)
+from .seat_viability import _match_seat, _compute_suit_analysis_ids
+
+
+_SUIT_ATTRS: Tuple[str, ...] = ("spades", "hearts", "diamonds", "clubs")
+
+# Cached NumPy module: None = not tried yet, False = not installed.
+_NUMPY = None
+
+
+def _numpy():
+    """Return the numpy module, or None if it is not installed."""
+    global _NUMPY
+    if _NUMPY is None:
+        try:
+            import numpy
+            _NUMPY = numpy
+        except ImportError:
+            _NUMPY = False
+    return _NUMPY or None
+
+
+def _is_standard_only(sub: SubProfile) -> bool:
+    """True if the subprofile has no RS, PC or OC constraint."""
+    return (
+        getattr(sub, "random_suit_constraint", None) is None
+        and getattr(sub, "partner_contingent_constraint", None) is None
+        and getattr(sub, "opponents_contingent_suit_constraint", None) is None
+    )
+
+
+def _batch_engine_supports(profile: HandProfile) -> bool:
+    """
+    True if the batch engine can build boards for this profile.
+
+    Requires NumPy and standard-only subprofiles on every seat.  RS / PC / OC
+    constraints depend on suit choices made per attempt, so those profiles
+    always use the scalar path.  So do profiles with any "tight" seat
+    (see _dispersion_check): the batch engine is plain rejection
+    sampling, and losing the scalar path's shape pre-allocation costs far
+    more than vectorising saves.
+    """
+    if _numpy() is None:
+        return False
+    for sp in profile.seat_profiles.values():
+        if not isinstance(sp, SeatProfile):
+            continue
+        for sub in sp.subprofiles:
+            if not _is_standard_only(sub) or _is_tight_shape(sub):
+                return False
+    return True
+
+
+def _is_tight_shape(sub: SubProfile) -> bool:
+    """True if _dispersion_check would flag this subprofile's seat as tight."""
+    windows = subprofile_suit_windows(sub)
+    if not any(w[0] > 0 for w in windows):
+        return False
+    return subprofile_shape_probability(sub) <= SHAPE_PROB_THRESHOLD
+
+
+def _seat_bounds(sub: Optional[SubProfile]) -> Tuple[list, list, list, list, int, int]:
+    """
+    Flatten one seat's standard constraints into bound lists.
+
+    Returns (len_lo, len_hi, hcp_lo, hcp_hi, total_lo, total_hi), the first
+    four indexed by suit (S, H, D, C).  A seat without a subprofile gets
+    fully open bounds.
+    """
+    std = getattr(sub, "standard", None) if sub is not None else None
+    if std is None:
+        return [0] * 4, [13] * 4, [0] * 4, [40] * 4, 0, 40
+    ranges = [getattr(std, attr) for attr in _SUIT_ATTRS]
+    return (
+        [sr.min_cards for sr in ranges],
+        [sr.max_cards for sr in ranges],
+        [sr.min_hcp for sr in ranges],
+        [sr.max_hcp for sr in ranges],
+        std.total_min_hcp,
+        std.total_max_hcp,
+    )
+
+
+# (length table, HCP table) as NumPy arrays, built on first use.
+_PACKED_TABLES = None
+
+
+def _packed_tables():
+    """Per-card-id int64 tables: 1 << 8*suit, and HCP << 8*suit."""
+    global _PACKED_TABLES
+    if _PACKED_TABLES is None:
+        np = _numpy()
+        _PACKED_TABLES = (
+            np.array([1 << (8 * _ID_SUIT[c]) for c in range(52)], dtype=np.int64),
+            np.array(
+                [_ID_HCP[c] << (8 * _ID_SUIT[c]) for c in range(52)],
+                dtype=np.int64,
+            ),
+        )
+    return _PACKED_TABLES
+
+
+def _batch_deal(gen, seats: List[Seat], chosen_subprofiles, size: int):
+    """
+    Deal `size` random decks and test every seat's standard bounds.
+
+    Seat j (in `seats` order) receives deck positions 13j .. 13j+12.
+
+    Returns (hands, ok): hands is an int array (size, 4, 13) of card ids,
+    ok a bool array (size, 4) — ok[k, j] is True if seat j's hand in deck k
+    satisfies its length, per-suit HCP and total HCP bounds.
+    """
+    np = _numpy()
+    bounds = [_seat_bounds(chosen_subprofiles.get(seat)) for seat in seats]
+    len_lo = np.array([b[0] for b in bounds])
+    len_hi = np.array([b[1] for b in bounds])
+    hcp_lo = np.array([b[2] for b in bounds])
+    hcp_hi = np.array([b[3] for b in bounds])
+    tot_lo = np.array([b[4] for b in bounds])
+    tot_hi = np.array([b[5] for b in bounds])
+
+    # Argsort of uniform keys = one uniformly random permutation per row.
+    decks = np.argsort(gen.random((size, 52)), axis=1)
+    hands = decks.reshape(size, 4, 13)
+
+    # Packed per-suit counters: each card adds 1 (length) and its HCP into
+    # byte `suit` of an int64, so one gather + sum per hand yields all four
+    # suit lengths / suit HCPs at once; unpack by shifting out each byte.
+    len_table, hcp_table = _packed_tables()
+    shifts = np.array([0, 8, 16, 24])
+    packed_len = len_table[hands].sum(axis=2)                  # (size, 4)
+    packed_hcp = hcp_table[hands].sum(axis=2)                  # (size, 4)
+    lengths = (packed_len[..., None] >> shifts) & 0xFF         # (size, 4, 4)
+    suit_hcp = (packed_hcp[..., None] >> shifts) & 0xFF        # (size, 4, 4)
+    total = suit_hcp.sum(axis=2)                               # (size, 4)
+
+    ok = (
+        ((lengths >= len_lo) & (lengths <= len_hi)).all(axis=2)
+        & ((suit_hcp >= hcp_lo) & (suit_hcp <= hcp_hi)).all(axis=2)
+        & (total >= tot_lo)
+        & (total <= tot_hi)
+    )
+    return hands, ok
+
+
+def _build_single_constrained_deal_batch(
+    rng: random.Random,
+    profile: HandProfile,
+    board_number: int,
+    max_attempts: int,
+    debug_board_stats: Optional[
+        Callable[[SeatFailCounts, SeatSeenCounts], None]
+    ] = None,
+    attempt_log: Optional[List[int]] = None,
+) -> Deal:
+    """
+    Batch-engine counterpart of _build_single_constrained_deal_v2().
+
+    Each chunk of BATCH_ENGINE_SIZE decks re-selects subprofiles and seeds a
+    NumPy generator from `rng` (so seeded runs stay reproducible).  Within a
+    chunk, batches grow from BATCH_ENGINE_MIN_SIZE decks by 4x; the first
+    deck whose four hands pass their bounds and _match_seat() (which also
+    applies exclusions) wins.  Every dealt deck counts as one attempt
+    against max_attempts.
+
+    Per-seat fail/seen counters follow the scalar path's "first failing seat
+    in order" attribution and are passed to debug_board_stats; the per-attempt
+    attribution hook is not fired (attempts are not visited one at a time).
+    attempt_log, if given, gets the decks used up to and including the winner
+    (or all of them on exhaustion) appended.
+
+    Raises:
+        DealGenerationError: If no deck passes within max_attempts.
+    """
+    from . import deal_generator as _dg
+
+    np = _numpy()
+    seats: List[Seat] = list(profile.hand_dealing_order)
+    constrained = [
+        j for j, seat in enumerate(seats)
+        if isinstance(profile.seat_profiles.get(seat), SeatProfile)
+        and profile.seat_profiles[seat].subprofiles
+    ]
+
+    seat_fail_counts: Dict[Seat, int] = {}
+    seat_seen_counts: Dict[Seat, int] = {}
+    chosen_indices: Dict[Seat, int] = {}
+    attempts = 0
+
+    while attempts < max_attempts:
+        # One chunk = one subprofile selection, BATCH_ENGINE_SIZE decks.
+        chunk_budget = min(BATCH_ENGINE_SIZE, max_attempts - attempts)
+        chosen_subprofiles, chosen_indices = _dg._select_subprofiles_for_board(
+            rng, profile, seats
+        )
+        gen = np.random.default_rng(rng.getrandbits(64))
+
+        # Grow the batch geometrically within the chunk: easy profiles
+        # succeed in the first few decks and should not pay for 1000.
+        size = BATCH_ENGINE_MIN_SIZE
+        while chunk_budget > 0:
+            size = min(size, chunk_budget)
+            hands, ok = _batch_deal(gen, seats, chosen_subprofiles, size)
+            attempts += size
+            chunk_budget -= size
+
+            # Attribution: a seat is "seen" on decks where every earlier
+            # seat passed, and "failed" where it is the first seat to fail.
+            still_ok = np.ones(size, dtype=bool)
+            for j in constrained:
+                seat = seats[j]
+                seen = int(still_ok.sum())
+                failed = int((still_ok & ~ok[:, j]).sum())
+                seat_seen_counts[seat] = seat_seen_counts.get(seat, 0) + seen
+                if failed:
+                    seat_fail_counts[seat] = seat_fail_counts.get(seat, 0) + failed
+                still_ok &= ok[:, j]
+
+            for k in np.flatnonzero(still_ok):
+                hand_ids = {
+                    seat: hands[k, j].tolist() for j, seat in enumerate(seats)
+                }
+                excluded_seat = _first_rejected_seat(
+                    rng, profile, seats, hand_ids,
+                    chosen_subprofiles, chosen_indices,
+                )
+                if excluded_seat is not None:
+                    seat_fail_counts[excluded_seat] = (
+                        seat_fail_counts.get(excluded_seat, 0) + 1
+                    )
+                    continue
+                if debug_board_stats is not None:
+                    debug_board_stats(
+                        dict(seat_fail_counts), dict(seat_seen_counts)
+                    )
+                if attempt_log is not None:
+                    attempt_log.append(attempts - size + int(k) + 1)
+                return Deal(
+                    board_number=board_number,
+                    dealer=profile.dealer,
+                    vulnerability=_vulnerability_for_board(board_number),
+                    hands={
+                        seat: _ids_to_cards(h) for seat, h in hand_ids.items()
+                    },
+                )
+            size *= 4
+
+    # Exhausted all attempts — fire hooks before raising.
+    if attempt_log is not None:
+        attempt_log.append(attempts)
+    if debug_board_stats is not None:
+        debug_board_stats(dict(seat_fail_counts), dict(seat_seen_counts))
+
+    if _dg._DEBUG_ON_MAX_ATTEMPTS is not None:
+        try:
+            _dg._DEBUG_ON_MAX_ATTEMPTS(
+                profile,
+                board_number,
+                attempts,
+                dict(chosen_indices),
+                dict(seat_fail_counts),
+                _compute_viability_summary(
+                    seat_fail_counts=seat_fail_counts,
+                    seat_seen_counts=seat_seen_counts,
+                ),
+            )
+        except Exception as exc:
+            print(f"WARNING: debug hook failed: {exc}", file=sys.stderr)
+
+    raise DealGenerationError(
+        f"v2 (batch): Failed to construct constrained deal for board "
+        f"{board_number} after {max_attempts} attempts."
+    )
+
+
+def _first_rejected_seat(
+    rng: random.Random,
+    profile: HandProfile,
+    seats: List[Seat],
+    hand_ids: Dict[Seat, List[int]],
+    chosen_subprofiles: Dict[Seat, SubProfile],
+    chosen_indices: Dict[Seat, int],
+) -> Optional[Seat]:
+    """
+    Run the full _match_seat() check on a deck that passed the bounds.
+
+    The vectorised bounds already cover standard constraints; this catches
+    subprofile exclusions.  Returns the first rejected seat, or None.
+    """
+    for seat in seats:
+        sp = profile.seat_profiles.get(seat)
+        if not isinstance(sp, SeatProfile) or not sp.subprofiles:
+            continue
+        idx0 = chosen_indices.get(seat)
+        matched, _chosen_rs, _reason = _match_seat(
+            profile=profile,
+            seat=seat,
+            hand=hand_ids[seat],
+            seat_profile=sp,
+            chosen_subprofile=chosen_subprofiles.get(seat),
+            chosen_subprofile_index_1based=None if idx0 is None else idx0 + 1,
+            random_suit_choices={},
+            rng=rng,
+            analysis=_compute_suit_analysis_ids(hand_ids[seat]),
+        )
+        if not matched:
+            return seat
+    return None
@@ -4,13 +4,14 @@
 # the #7 refactor.
 #
 # Contains: viability helpers, subprofile selection, deck helpers,
-# constructive mode, HCP utilities, simple board generator, and
-# vulnerability/rotation enrichment.
+# constructive mode, HCP utilities, simple board generator,
+# vulnerability/rotation enrichment, and per-board seed derivation.
 from __future__ import annotations
 
+import hashlib
 import math
 import random
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
 from .deal_generator_types import (
     Seat, Card, SeatFailCounts, SeatSeenCounts,
@@ -19,6 +20,7 @@ from .deal_generator_types import (
     HCP_FEASIBILITY_NUM_SD,
     UNVIABLE_MIN_FAILS, UNVIABLE_MIN_RATE,
     _MASTER_DECK, _CARD_HCP,
+    _MASTER_DECK_IDS, _ID_TO_CARD, _CARD_TO_ID,
 )
 from .hand_profile import (
     HandProfile,
@@ -233,6 +235,23 @@ def _build_deck() -> List[Card]:
     return list(_MASTER_DECK)
 
 
+def _build_deck_ids() -> List[int]:
+    """Return a fresh 52-card deck of integer card ids (0..51)."""
+    return list(_MASTER_DECK_IDS)
+
+
+def _cards_to_ids(cards: Sequence[Card]) -> List[int]:
+    """Convert "AS"-style card strings to integer card ids."""
+    to_id = _CARD_TO_ID
+    return [to_id[c] for c in cards]
+
+
+def _ids_to_cards(ids: Sequence[int]) -> List[Card]:
+    """Convert integer card ids back to "AS"-style card strings."""
+    to_card = _ID_TO_CARD
+    return [to_card[i] for i in ids]
+
+
 def _get_constructive_mode(profile: HandProfile) -> Dict[str, bool]:
     """
     Decide which constructive-help modes are eligible for this profile.
@@ -415,11 +434,25 @@ def _apply_vulnerability_and_rotation(
     """
     if not deals:
         return deals
+    return list(_iter_vulnerability_and_rotation(rng, deals, rotate=rotate))
+
 
-    start_idx = rng.randrange(0, len(VULNERABILITY_SEQUENCE))
+def _iter_vulnerability_and_rotation(
+    rng: random.Random,
+    deals: Iterable[Deal],
+    rotate: bool = True,
+) -> Iterator[Deal]:
+    """
+    Lazy form of _apply_vulnerability_and_rotation(): enriches each deal as
+    it is pulled, drawing from rng in exactly the same order.
 
-    enriched: List[Deal] = []
+    The starting vulnerability index is drawn when the first deal arrives,
+    so rng must not be shared with whatever produces the deals.
+    """
+    start_idx = -1
     for i, deal in enumerate(deals):
+        if start_idx < 0:
+            start_idx = rng.randrange(0, len(VULNERABILITY_SEQUENCE))
         vul = VULNERABILITY_SEQUENCE[(start_idx + i) % len(VULNERABILITY_SEQUENCE)]
 
         # Start with base deal
@@ -438,13 +471,29 @@ def _apply_vulnerability_and_rotation(
             # Rotate dealer
             dealer = ROTATE_MAP.get(dealer, dealer)
 
-        enriched.append(
-            Deal(
-                board_number=deal.board_number,
-                dealer=dealer,
-                vulnerability=vul,
-                hands=hands,
-            )
+        yield Deal(
+            board_number=deal.board_number,
+            dealer=dealer,
+            vulnerability=vul,
+            hands=hands,
         )
 
-    return enriched
+
+# ---------------------------------------------------------------------------
+# Per-board seed derivation
+# ---------------------------------------------------------------------------
+
+def _derive_seed(*parts: object) -> int:
+    """
+    Derive a stable 63-bit seed from the run seed plus any identifying parts.
+
+    Used to give each board its own RNG stream (e.g. ``_derive_seed(seed,
+    board_number)``) so that boards can be generated independently — in any
+    order, in any process — and still reproduce exactly.
+
+    Uses SHA-256 over the ``repr`` of the parts rather than ``hash()``, whose
+    value for strings changes between interpreter runs (PYTHONHASHSEED).
+    """
+    material = ":".join(repr(part) for part in parts).encode("utf-8")
+    digest = hashlib.sha256(material).digest()
+    return int.from_bytes(digest[:8], "big") >> 1
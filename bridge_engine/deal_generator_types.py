@@ -8,7 +8,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
 # Type aliases
@@ -29,6 +29,10 @@ class DealGenerationError(Exception):
     """Raised when something goes wrong during deal generation."""
 
 
+class DealGenerationCancelled(DealGenerationError):
+    """Raised when a should_stop callback ends generation between attempts."""
+
+
 # ---------------------------------------------------------------------------
 # Dataclasses
 # ---------------------------------------------------------------------------
@@ -46,6 +50,8 @@ class DealSet:
     deals: List[Deal]
     board_times: List[float] = field(default_factory=list)   # Per-board seconds
     reseed_count: int = 0                                     # Number of mid-run re-seeds
+    pool_served: int = 0                                      # Boards taken from a DealPool
+    board_attempts: List[int] = field(default_factory=list)  # Per-board builder attempts
 
 
 @dataclass(frozen=True)
@@ -115,7 +121,9 @@ ROTATE_MAP: Dict[Seat, Seat] = {
 #
 # P(random 13-card hand has >= N cards in one suit).
 # Derived from hypergeometric distribution: X ~ Hypergeometric(N=52, K=13, n=13).
-# Used by _dispersion_check() to identify tight seats needing shape help.
+# Single-suit quick reference only: _dispersion_check() now uses the exact
+# shape probability from hand_combinatorics (all four suit-length windows
+# together, HCP ignored) and compares it against SHAPE_PROB_THRESHOLD.
 # ---------------------------------------------------------------------------
 SHAPE_PROB_GTE: Dict[int, float] = {
     0:  1.000,
@@ -134,8 +142,8 @@ SHAPE_PROB_GTE: Dict[int, float] = {
     13: 0.00000003,
 }
 
-# Probability threshold: seats with any suit at or below this probability
-# are considered "tight" and eligible for shape pre-allocation help.
+# Probability threshold: seats whose suit-length windows jointly accept at
+# most this fraction of hands are "tight" and get shape pre-allocation help.
 SHAPE_PROB_THRESHOLD: float = 0.19
 
 # Fraction of suit minima to pre-allocate for tight seats.
@@ -155,12 +163,52 @@ RS_REROLL_INTERVAL: int = 500
 # Set to 0 to disable subprofile re-rolling.
 SUBPROFILE_REROLL_INTERVAL: int = 1000
 
-# Number of retry attempts when pre-allocating RS suit cards to find a
-# sample whose HCP is on-track for the suit's HCP target.  This is a
-# form of rejection sampling: try multiple random samples and pick the
-# first whose pro-rated HCP lands in the target range.
-# Set to 0 to disable HCP targeting (pure random pre-allocation).
-RS_PRE_ALLOCATE_HCP_RETRIES: int = 10
+# Adaptive reroll budgets (combo_stats.ComboStats).  When the v2 builder is
+# given a ComboStats store (opt-in: generate_deals(combo_stats=...) for serial
+# runs; no caller in the package passes one by default), the
+# fixed SUBPROFILE_/RS_REROLL_INTERVAL schedule is replaced by one "round"
+# per (subprofile index tuple, RS pre-selection) whose length comes from the
+# key's observed success rate: a Thompson sample theta ~ Beta(1+s, 1+f) gives
+# a budget of ADAPTIVE_REROLL_TARGET / theta attempts, so every finishable
+# key succeeds in ~95% (1 - e^-3) of its rounds and the subprofile weights
+# are preserved among them.  The fixed schedule only served a key needing
+# 1/p attempts in 1 - e^(-1000 p) of its rounds (39% at p = 1/2000).
+# Keys whose budget would exceed ADAPTIVE_REROLL_MAX (expected cost above
+# SUBPROFILE_REROLL_INTERVAL) are treated as unfinishable and only get
+# ADAPTIVE_REROLL_PROBE attempts, which keeps exploring them cheaply; the
+# fixed schedule spent a full 1000 on e.g. the "Defense to Weak 2s" E2/N2
+# combination, which essentially never succeeds.  Unseen keys fall back to
+# their subprofile selection's stats, then to SUBPROFILE_REROLL_INTERVAL.
+ADAPTIVE_REROLL_TARGET: float = 3.0
+ADAPTIVE_REROLL_MAX: int = 3000
+ADAPTIVE_REROLL_PROBE: int = 50
+
+# Offline dealing-order optimizer (deal_policy.optimize_deal_policy, Admin
+# menu).  For each subprofile combination the builder draws, every one of
+# the 24 dealing orders is tried with each standard pre-allocation fraction
+# below, DEAL_POLICY_ATTEMPTS dealing attempts apiece; combinations are
+# found by drawing DEAL_POLICY_SELECTION_SAMPLES subprofile selections.
+# The best of 72 noisy rates is biased upwards, so the top
+# DEAL_POLICY_CONFIRM_TOP candidates and the default are re-measured on a
+# fresh seed with DEAL_POLICY_CONFIRM_FACTOR times the attempts, and only
+# that second measurement decides: the winner is adopted only if its
+# success rate beats the default's by at least DEAL_POLICY_MIN_Z standard
+# errors (two-proportion z-test).  PRE_ALLOCATE_FRACTION is always tried
+# (it is the default).
+DEAL_POLICY_FRACTIONS: Tuple[float, ...] = (0.5, 0.75, 1.0)
+DEAL_POLICY_ATTEMPTS: int = 300
+DEAL_POLICY_SELECTION_SAMPLES: int = 2000
+DEAL_POLICY_CONFIRM_TOP: int = 3
+DEAL_POLICY_CONFIRM_FACTOR: int = 4
+DEAL_POLICY_MIN_Z: float = 2.0
+
+# HCP targeting for RS suit pre-allocation: the pre-allocated cards are
+# drawn uniformly among the subsets whose HCP is on-track for the suit's
+# (pro-rated) HCP window, using exact_sampler's per-(honor set, spot count)
+# holding tables.  This replaced up to 10 rejection-sampling retries that
+# could still end on an off-target sample.
+# Set to False to disable HCP targeting (pure random pre-allocation).
+RS_PRE_ALLOCATE_HCP_TARGETING: bool = True
 
 # Fraction of RS suit minima to pre-allocate.  Set to 1.0 so that RS suits
 # are fully populated at pre-allocation time with HCP targeting.  This
@@ -178,25 +226,25 @@ RS_PRE_ALLOCATE_FRACTION: float = 1.0
 # all wasted 1000-attempt chunks on impossible combinations.
 MAX_SUBPROFILE_FEASIBILITY_RETRIES: int = 100
 
+# Largest subprofile-combination space enumerated up front.  Below this,
+# _select_subprofiles_for_board() builds (once per profile and driver) the
+# table of every feasible index combination with its coupled weight and
+# makes a single weighted draw from it -- no rejection loop.  Larger spaces
+# (none of the shipped profiles come close; the biggest is 4x4) fall back to
+# the MAX_SUBPROFILE_FEASIBILITY_RETRIES loop.
+FEASIBLE_COMBO_INDEX_MAX: int = 4096
+
 # Maximum number of full retries per board in generate_deals().
-# Each retry calls the v2 builder with MAX_BOARD_ATTEMPTS attempts.
-# Between retries, the RNG has advanced significantly, so subprofile
-# selections, RS suits, and random fills will all be different.
+# Each retry calls the v2 builder with MAX_BOARD_ATTEMPTS attempts on a fresh
+# RNG stream: after every failed retry the board re-seeds to a stream derived
+# from (seed, board, "reseed", k), so subprofile selections, RS suits, and
+# random fills all differ, and seeded runs replay on any machine.
 # For easy profiles, every board succeeds on the first try (retry 1).
 # For hard profiles (e.g. "Defense to Weak 2s"), multiple retries give
 # multiple chances to find a workable subprofile + RS combination.
 # Total budget per board = MAX_BOARD_RETRIES * MAX_BOARD_ATTEMPTS.
 MAX_BOARD_RETRIES: int = 50
 
-# Per-board wall-clock time budget (seconds) before adaptive re-seeding.
-# If a board's retry loop exceeds this threshold, the RNG is replaced with
-# a fresh random seed (via SystemRandom) to escape an unfavorable trajectory.
-# The timer resets after each re-seed, so multiple re-seeds per board are
-# possible.  Set to 0.0 to disable adaptive re-seeding entirely.
-# 1.75s chosen because good seeds produce boards in 0.6-2.1s (avg ~1.2s);
-# a board still running at 1.75s is likely on an unfavorable trajectory.
-RESEED_TIME_THRESHOLD_SECONDS: float = 1.75
-
 # For v1 constructive sampling, only use suit minima when the total is
 # "reasonable" – we don't want to pre-commit too many cards.
 CONSTRUCTIVE_MAX_SUM_MIN_CARDS: int = 11
@@ -240,6 +288,53 @@ ENABLE_HCP_FEASIBILITY_CHECK: bool = True
 # this band means "even a 1-sigma-favourable outcome can't reach the target".
 HCP_FEASIBILITY_NUM_SD: float = 1.0
 
+# Gate flag for per-seat rejection during the fill phase.  When True, the v2
+# builder matches each constrained seat as soon as its hand (and every seat
+# before it in processing order) has been dealt, and abandons the attempt at
+# the first failure instead of filling the remaining seats first.  Seeded
+# output and failure attribution are unchanged: the fill phase draws no
+# random numbers, and seats are still matched in processing order.
+ENABLE_EARLY_SEAT_REJECTION: bool = True
+
+
+# ---------------------------------------------------------------------------
+# Optional NumPy batch engine (deal_generator_batch.py)
+# ---------------------------------------------------------------------------
+
+# Gate flag for the vectorised batch-attempt engine.  When True, NumPy is
+# importable, and every subprofile in the profile is standard-only (no RS /
+# PC / OC), the v2 builder deals and checks BATCH_ENGINE_SIZE decks per
+# NumPy call instead of one deck per Python loop iteration.
+# Off by default: the batch engine draws from its own NumPy generator, so a
+# seeded run produces different (equally valid) boards than the scalar path,
+# and seeded output must not depend on whether NumPy happens to be installed.
+ENABLE_NUMPY_BATCH_ENGINE: bool = False
+
+# Decks per batch.  Equal to SUBPROFILE_REROLL_INTERVAL so that one batch is
+# one subprofile "chunk": subprofiles are re-selected between batches exactly
+# as the scalar path re-selects them every 1000 attempts.
+BATCH_ENGINE_SIZE: int = 1000
+
+# First batch size within a chunk; later batches grow 4x up to the chunk
+# budget.  Easy profiles succeed within a few decks, and a full 1000-deck
+# batch (~10 ms) would cost far more than the scalar path's handful of
+# attempts.
+BATCH_ENGINE_MIN_SIZE: int = 16
+
+
+# ---------------------------------------------------------------------------
+# Exact constructive sampler (exact_sampler.py)
+# ---------------------------------------------------------------------------
+
+# Gate flag for the exact dealing mode.  When True, the v2 builder deals with
+# _deal_exact_ids instead of _deal_with_help_ids: every seat except the last
+# is drawn uniformly from the hands in the remaining deck that meet its
+# standard (+ pre-selected RS) suit windows and total HCP window, so only
+# cross-seat effects, PC/OC constraints and exclusions are left to rejection.
+# Off by default: sampling a seat from a depleted deck costs up to ~1 ms, more
+# than loose profiles spend on a whole board, and seeded output changes.
+ENABLE_EXACT_SAMPLER: bool = False
+
 
 # ---------------------------------------------------------------------------
 # Pre-built master deck: avoids 52 string concatenations per attempt.
@@ -255,6 +350,38 @@ _MASTER_DECK: List[Card] = [
 _CARD_HCP: Dict[str, int] = {card: {"A": 4, "K": 3, "Q": 2, "J": 1}.get(card[0], 0) for card in _MASTER_DECK}
 
 
+# ---------------------------------------------------------------------------
+# Integer card encoding (v2 hot path)
+#
+# Card id i (0..51) is _MASTER_DECK[i]: suit index i // 13 (0=S, 1=H, 2=D,
+# 3=C) and rank index i % 13 (0=A ... 12=2).  The v2 builder deals, fills
+# and matches on ids — tuple indexing instead of string slicing + dict
+# lookups — and converts back to "AS"-style strings only for the final Deal.
+# ---------------------------------------------------------------------------
+_SUIT_LETTERS: Tuple[str, ...] = ("S", "H", "D", "C")
+
+# Suit letter → suit index (0..3).
+_SUIT_INDEX: Dict[str, int] = {s: i for i, s in enumerate(_SUIT_LETTERS)}
+
+# Card id ↔ card string.
+_ID_TO_CARD: Tuple[Card, ...] = tuple(_MASTER_DECK)
+_CARD_TO_ID: Dict[Card, int] = {card: i for i, card in enumerate(_MASTER_DECK)}
+
+# Master deck of ids.  Callers copy it (list(_MASTER_DECK_IDS)) before shuffling.
+_MASTER_DECK_IDS: Tuple[int, ...] = tuple(range(52))
+
+# Per-id suit index and HCP.
+_ID_SUIT: Tuple[int, ...] = tuple(i // 13 for i in range(52))
+_ID_HCP: Tuple[int, ...] = tuple(_CARD_HCP[card] for card in _MASTER_DECK)
+
+# HCP of every 13-bit rank set (bit r = rank index r, so bits 0-3 = AKQJ).
+# 8192 entries; hand_combinatorics counts suit holdings by HCP with it.
+_RANKSET_HCP: Tuple[int, ...] = tuple(
+    4 * (r & 1) + 3 * ((r >> 1) & 1) + 2 * ((r >> 2) & 1) + ((r >> 3) & 1)
+    for r in range(1 << 13)
+)
+
+
 # ---------------------------------------------------------------------------
 # Debug hooks
 #
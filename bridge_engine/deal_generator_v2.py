@@ -11,20 +11,20 @@
 from __future__ import annotations
 
 import sys
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
 
 import math
 import random
 
 from .deal_generator_types import (
     Seat, Card, SeatFailCounts, SeatSeenCounts,
-    Deal, DealGenerationError,
-    SHAPE_PROB_GTE, SHAPE_PROB_THRESHOLD,
+    Deal, DealGenerationError, DealGenerationCancelled,
+    SHAPE_PROB_THRESHOLD,
     PRE_ALLOCATE_FRACTION,
-    RS_PRE_ALLOCATE_FRACTION, RS_PRE_ALLOCATE_HCP_RETRIES,
+    RS_PRE_ALLOCATE_FRACTION, RS_PRE_ALLOCATE_HCP_TARGETING,
     MAX_BOARD_ATTEMPTS, SUBPROFILE_REROLL_INTERVAL, RS_REROLL_INTERVAL,
     FULL_DECK_HCP_SUM, FULL_DECK_HCP_SUM_SQ, MAX_HAND_HCP,
-    _CARD_HCP,
+    _ID_HCP, _ID_SUIT, _SUIT_INDEX, _SUIT_LETTERS,
 )
 # _DEBUG_ON_MAX_ATTEMPTS and _DEBUG_ON_ATTEMPT_FAILURE_ATTRIBUTION are
 # mutable module-level hooks that tests set on the facade module (dg).
@@ -36,9 +36,25 @@ from .deal_generator_types import (
 from .deal_generator_helpers import (
     _check_hcp_feasibility, _build_deck, _compute_viability_summary,
     _vulnerability_for_board,
+    _build_deck_ids, _cards_to_ids, _ids_to_cards,
 )
 from .hand_profile import HandProfile, SeatProfile, SubProfile, SuitRange
-from .seat_viability import _match_seat
+from .seat_viability import (
+    _compile_subprofile, _hand_suit_stats_ids, _match_seat_compiled,
+)
+from .hand_combinatorics import (
+    subprofile_acceptance_probability, subprofile_shape_probability,
+    subprofile_suit_windows,
+)
+from .combo_stats import ComboKey, ComboStats, combo_key
+from .exact_sampler import sample_hand_exact, sample_suit_holding
+from .deal_generator_batch import (
+    _batch_engine_supports, _build_single_constrained_deal_batch,
+)
+
+if TYPE_CHECKING:
+    from .board_telemetry import BoardTelemetry
+    from .deal_policy import DealPolicy
 
 
 # ---------------------------------------------------------------------------
@@ -101,14 +117,24 @@ def _dispersion_check(
     """
     Identify seats with tight shape constraints that need pre-allocation help.
 
-    For each seat, examines every suit's min_cards in the standard constraints.
-    If any suit has P(>= min_cards) <= threshold, the seat is "tight".
-
-    When rs_pre_selections is provided, also checks the RS (Random Suit)
-    constraint for pre-selected suits.  This allows RS seats whose shape
-    requirement lives entirely in the RS constraint (not in standard
-    min_cards) to be flagged as tight — e.g. a weak-2 opener needing
-    exactly 6 cards in one suit.
+    A seat is "tight" when its suit-length windows, taken jointly across all
+    four suits, accept at most `threshold` of random hands (exact
+    probability from hand_combinatorics) and it has at least one suit
+    minimum for pre-allocation to place.  A seat needing 4+ spades and 4+
+    hearts is therefore tight even though neither suit alone is, while
+    HCP-only constraints never are (pre-allocation only helps shape).
+
+    HCP windows are deliberately left out: classifying by the joint
+    shape+HCP acceptance probability (subprofile_acceptance_probability)
+    also flags balanced 15-17 seats and similar, which cut attempts on some
+    profiles but cost 4.5x on "Ops interference over our 1NT".  The joint
+    probability is used only as a dealing-order tiebreaker.
+
+    When rs_pre_selections is provided, the RS (Random Suit) ranges for each
+    seat's pre-selected suits are intersected into its windows.  This allows
+    RS seats whose shape requirement lives entirely in the RS constraint (not
+    in standard min_cards) to be flagged as tight — e.g. a weak-2 opener
+    needing exactly 6 cards in one suit.
 
     Args:
         chosen_subprofiles: The selected subprofile for each seat.
@@ -128,44 +154,18 @@ def _dispersion_check(
         if std is None:
             continue
 
-        # Check each suit for tight shape constraints (standard).
-        for suit_attr in ("spades", "hearts", "diamonds", "clubs"):
-            suit_range = getattr(std, suit_attr, None)
-            if suit_range is None:
-                continue
-            min_cards = getattr(suit_range, "min_cards", 0)
-            if min_cards <= 0:
-                continue
-            prob = SHAPE_PROB_GTE.get(min_cards, 0.0)
-            if prob <= threshold:
-                tight_seats.add(seat)
-                break  # One tight suit is enough to flag the seat
-
-    # --- RS-aware tightness check ---
-    # For seats with pre-selected RS suits, check whether the RS
-    # suit_ranges have min_cards tight enough to flag the seat.
-    if rs_pre_selections:
-        for seat, pre_suits in rs_pre_selections.items():
-            if seat in tight_seats:
-                continue  # Already flagged by standard constraints
-            sub = chosen_subprofiles.get(seat)
-            if sub is None:
-                continue
-            rs = getattr(sub, "random_suit_constraint", None)
-            if rs is None:
-                continue
-
-            ranges_by_suit = _resolve_rs_ranges(rs, pre_suits)
+        # RS-aware: fold the pre-selected RS suits' ranges into the windows.
+        rs_ranges = None
+        pre_suits = rs_pre_selections.get(seat) if rs_pre_selections else None
+        rs = getattr(sub, "random_suit_constraint", None)
+        if pre_suits and rs is not None:
+            rs_ranges = _resolve_rs_ranges(rs, pre_suits)
 
-            # Check each RS suit's min_cards against the probability table.
-            for suit_letter, sr in ranges_by_suit.items():
-                min_cards = getattr(sr, "min_cards", 0)
-                if min_cards <= 0:
-                    continue
-                prob = SHAPE_PROB_GTE.get(min_cards, 0.0)
-                if prob <= threshold:
-                    tight_seats.add(seat)
-                    break  # One tight RS suit is enough
+        windows = subprofile_suit_windows(sub, rs_ranges)
+        if not any(w[0] > 0 for w in windows):
+            continue  # No suit minimum: nothing to pre-allocate.
+        if subprofile_shape_probability(sub, rs_ranges) <= threshold:
+            tight_seats.add(seat)
 
     return tight_seats
 
@@ -315,63 +315,105 @@ def _constrained_fill(
 
     Returns:
         List of accepted cards (may be fewer than n if deck exhausted).
+
+    String-card wrapper around _constrained_fill_ids() (same selection).
     """
     if n <= 0:
         return []
 
+    ids = _cards_to_ids(deck)
+    accepted = _constrained_fill_ids(
+        ids,
+        n,
+        _cards_to_ids(pre_cards),
+        tuple(suit_maxima.get(s, 13) for s in _SUIT_LETTERS),
+        total_max_hcp,
+        _suit_hcp_caps(rs_suit_hcp_max),
+    )
+    deck[:] = _ids_to_cards(ids)
+    return _ids_to_cards(accepted)
+
+
+def _suit_hcp_caps(
+    rs_suit_hcp_max: Optional[Dict[str, int]],
+) -> Optional[Tuple[int, int, int, int]]:
+    """Convert a {suit letter: HCP cap} dict to a per-suit-index tuple."""
+    if not rs_suit_hcp_max:
+        return None
+    return tuple(  # type: ignore[return-value]
+        rs_suit_hcp_max.get(s, _NO_SUIT_HCP_CAP) for s in _SUIT_LETTERS
+    )
+
+
+# Per-suit HCP "cap" used for suits without one: above any suit's 10 HCP.
+_NO_SUIT_HCP_CAP: int = 99
+
+
+def _constrained_fill_ids(
+    deck: List[int],
+    n: int,
+    pre_cards: List[int],
+    suit_maxima: Tuple[int, int, int, int],
+    total_max_hcp: int = 40,
+    suit_hcp_caps: Optional[Tuple[int, int, int, int]] = None,
+) -> List[int]:
+    """
+    Integer-id version of _constrained_fill() (v2 hot path).
+
+    suit_maxima and suit_hcp_caps are indexed by suit index (S=0 ... C=3);
+    suit_hcp_caps is None when no suit has an HCP cap.
+    """
+    if n <= 0:
+        return []
+
+    id_suit = _ID_SUIT
+    id_hcp = _ID_HCP
+
     # Count suits and HCP already held from pre-allocation.
-    suit_count: Dict[str, int] = {"S": 0, "H": 0, "D": 0, "C": 0}
+    suit_count = [0, 0, 0, 0]
+    suit_hcp = [0, 0, 0, 0]
     current_hcp = 0
     for c in pre_cards:
-        suit_count[c[1]] += 1
-        current_hcp += _CARD_HCP[c]
-
-    # Track per-suit HCP for RS suits that have a cap.
-    # Only initialized when rs_suit_hcp_max is provided (zero overhead otherwise).
-    suit_hcp: Dict[str, int] = {}
-    if rs_suit_hcp_max:
-        for c in pre_cards:
-            s = c[1]
-            if s in rs_suit_hcp_max:
-                suit_hcp[s] = suit_hcp.get(s, 0) + _CARD_HCP[c]
-
-    accepted: List[Card] = []
-    remaining: List[Card] = []
-
-    for card in deck:
+        s = id_suit[c]
+        suit_count[s] += 1
+        suit_hcp[s] += id_hcp[c]
+        current_hcp += id_hcp[c]
+
+    accepted: List[int] = []
+    remaining: List[int] = []
+
+    for pos, card in enumerate(deck):
         if len(accepted) >= n:
-            # Already have enough — push rest to remaining untouched.
-            remaining.append(card)
-            continue
+            # Already have enough — rest of the deck stays, untouched.
+            remaining.extend(deck[pos:])
+            break
 
-        card_hcp = _CARD_HCP[card]
-        suit = card[1]
+        suit = id_suit[card]
 
         # Skip if this card would bust the suit maximum.
-        if suit_count[suit] >= suit_maxima.get(suit, 13):
+        if suit_count[suit] >= suit_maxima[suit]:
             remaining.append(card)
             continue
 
-        # Skip if this honor card would push total HCP over the maximum.
-        # Only skip cards with HCP > 0 — spot cards are always accepted
-        # since they don't change the HCP situation.
-        if card_hcp > 0 and current_hcp + card_hcp > total_max_hcp:
-            remaining.append(card)
-            continue
-
-        # Skip if this honor card would bust the per-suit HCP cap (#13).
-        # Only applies to RS suits with an explicit max_hcp.
-        if rs_suit_hcp_max and suit in rs_suit_hcp_max:
-            if card_hcp > 0 and suit_hcp.get(suit, 0) + card_hcp > rs_suit_hcp_max[suit]:
+        card_hcp = id_hcp[card]
+        if card_hcp > 0:
+            # Skip honors that would push total HCP over the maximum, or
+            # bust the per-suit HCP cap for RS suits (#13).  Spot cards are
+            # always accepted since they don't change the HCP situation.
+            if current_hcp + card_hcp > total_max_hcp:
+                remaining.append(card)
+                continue
+            if (
+                suit_hcp_caps is not None
+                and suit_hcp[suit] + card_hcp > suit_hcp_caps[suit]
+            ):
                 remaining.append(card)
                 continue
 
         accepted.append(card)
         suit_count[suit] += 1
+        suit_hcp[suit] += card_hcp
         current_hcp += card_hcp
-        # Update per-suit HCP tracking for RS suits.
-        if rs_suit_hcp_max and suit in rs_suit_hcp_max:
-            suit_hcp[suit] = suit_hcp.get(suit, 0) + card_hcp
 
     deck[:] = remaining
     return accepted
@@ -409,25 +451,44 @@ def _pre_allocate(
 
     Returns:
         List of pre-allocated cards (may be empty).
+
+    String-card wrapper around _pre_allocate_ids() (same RNG draws).
     """
+    ids = _cards_to_ids(deck)
+    chosen = _pre_allocate_ids(rng, ids, subprofile, fraction)
+    deck[:] = _ids_to_cards(ids)
+    return _ids_to_cards(chosen)
+
+
+_SUIT_ATTRS: Tuple[str, ...] = ("spades", "hearts", "diamonds", "clubs")
+
+
+def _remove_from_deck(deck: List[int], chosen: List[int]) -> None:
+    """Remove all chosen card ids from deck in one pass (order preserved)."""
+    chosen_set = set(chosen)
+    deck[:] = [c for c in deck if c not in chosen_set]
+
+
+def _pre_allocate_ids(
+    rng: random.Random,
+    deck: List[int],
+    subprofile: "SubProfile",
+    fraction: float = PRE_ALLOCATE_FRACTION,
+) -> List[int]:
+    """Integer-id version of _pre_allocate() (v2 hot path)."""
     std = getattr(subprofile, "standard", None)
     if std is None:
         return []
 
     # Build suit index once — avoids N full-deck scans (one per suit).
-    # Pre-initialized dict avoids setdefault overhead on every card.
-    suit_cards: Dict[str, List[Card]] = {"S": [], "H": [], "D": [], "C": []}
+    id_suit = _ID_SUIT
+    suit_cards: Tuple[List[int], ...] = ([], [], [], [])
     for c in deck:
-        suit_cards[c[1]].append(c)
+        suit_cards[id_suit[c]].append(c)
 
-    pre_allocated: List[Card] = []
+    pre_allocated: List[int] = []
 
-    # Process each suit's minimum.  Card format is rank+suit, e.g. "AS".
-    # Suit letter is at index 1 (S/H/D/C).
-    for suit_letter, suit_attr in [
-        ("S", "spades"), ("H", "hearts"),
-        ("D", "diamonds"), ("C", "clubs"),
-    ]:
+    for suit_idx, suit_attr in enumerate(_SUIT_ATTRS):
         suit_range = getattr(std, suit_attr, None)
         if suit_range is None:
             continue
@@ -439,19 +500,16 @@ def _pre_allocate(
         if to_allocate <= 0:
             continue
 
-        available = suit_cards.get(suit_letter, [])
+        available = suit_cards[suit_idx]
         if not available:
             continue
 
         # Don't try to allocate more than available.
         actual = min(to_allocate, len(available))
-        chosen = rng.sample(available, actual)
-        pre_allocated.extend(chosen)
+        pre_allocated.extend(rng.sample(available, actual))
 
-    # Remove all chosen cards from deck in one pass (instead of per-suit).
     if pre_allocated:
-        chosen_set = set(pre_allocated)
-        deck[:] = [c for c in deck if c not in chosen_set]
+        _remove_from_deck(deck, pre_allocated)
 
     return pre_allocated
 
@@ -484,7 +542,25 @@ def _pre_allocate_rs(
 
     Returns:
         List of pre-allocated cards (may be empty).
+
+    String-card wrapper around _pre_allocate_rs_ids() (same RNG draws).
     """
+    ids = _cards_to_ids(deck)
+    chosen = _pre_allocate_rs_ids(
+        rng, ids, subprofile, pre_selected_suits, fraction
+    )
+    deck[:] = _ids_to_cards(ids)
+    return _ids_to_cards(chosen)
+
+
+def _pre_allocate_rs_ids(
+    rng: random.Random,
+    deck: List[int],
+    subprofile: "SubProfile",
+    pre_selected_suits: List[str],
+    fraction: float = RS_PRE_ALLOCATE_FRACTION,
+) -> List[int]:
+    """Integer-id version of _pre_allocate_rs() (v2 hot path)."""
     rs = getattr(subprofile, "random_suit_constraint", None)
     if rs is None:
         return []
@@ -493,12 +569,12 @@ def _pre_allocate_rs(
 
     # Build suit index once — suits are disjoint so processing order
     # doesn't affect available pools across different suits.
-    # Pre-initialized dict avoids setdefault overhead on every card.
-    suit_cards: Dict[str, List[Card]] = {"S": [], "H": [], "D": [], "C": []}
+    id_suit = _ID_SUIT
+    suit_cards: Tuple[List[int], ...] = ([], [], [], [])
     for c in deck:
-        suit_cards[c[1]].append(c)
+        suit_cards[id_suit[c]].append(c)
 
-    pre_allocated: List[Card] = []
+    pre_allocated: List[int] = []
 
     for suit_letter, sr in ranges_by_suit.items():
         min_cards = getattr(sr, "min_cards", 0)
@@ -509,49 +585,41 @@ def _pre_allocate_rs(
         if to_allocate <= 0:
             continue
 
-        available = suit_cards.get(suit_letter, [])
+        available = suit_cards[_SUIT_INDEX[suit_letter]]
         if not available:
             continue
 
         # Don't try to allocate more than available.
         actual = min(to_allocate, len(available))
 
-        # HCP-targeted rejection sampling: try multiple samples and pick
-        # the first whose pro-rated HCP is on-track for the suit's target.
-        # This dramatically improves success rates for tight HCP constraints
-        # (e.g. W in "Defense to Weak 2s" needs 5-7 HCP in exactly 6 cards).
+        # HCP-targeted sampling: draw the cards uniformly among the subsets
+        # whose HCP is on-track for the suit's target, in one pass.  This
+        # matters for tight HCP windows (e.g. W in "Defense to Weak 2s"
+        # needs 5-7 HCP in exactly 6 cards).
         min_hcp = getattr(sr, "min_hcp", None)
         max_hcp = getattr(sr, "max_hcp", None)
-        use_hcp_targeting = (
-            RS_PRE_ALLOCATE_HCP_RETRIES > 0
+        chosen = None
+        if (
+            RS_PRE_ALLOCATE_HCP_TARGETING
             and min_hcp is not None
             and max_hcp is not None
-            and min_cards > 0
-        )
-
-        if use_hcp_targeting:
+        ):
             # Pro-rate HCP target to the pre-allocated card count.
             # E.g. 6 cards need 5-7 HCP → 3 pre-allocated need 2-4 HCP.
             target_low = math.floor(min_hcp * actual / min_cards)
             target_high = math.ceil(max_hcp * actual / min_cards)
-
-            chosen = rng.sample(available, actual)
-            for _retry in range(RS_PRE_ALLOCATE_HCP_RETRIES):
-                sample_hcp = sum(_CARD_HCP[c] for c in chosen)
-                if target_low <= sample_hcp <= target_high:
-                    break  # Good HCP — use this sample.
-                # Bad HCP — resample.
-                chosen = rng.sample(available, actual)
-            # After retries, use whatever we ended up with (last sample).
-        else:
+            chosen = sample_suit_holding(
+                rng, available, actual, target_low, target_high
+            )
+        if chosen is None:
+            # No targeting, or no subset of the available cards is on
+            # target: plain random sample.
             chosen = rng.sample(available, actual)
 
         pre_allocated.extend(chosen)
 
-    # Remove all chosen cards from deck in one pass (instead of per-suit).
     if pre_allocated:
-        chosen_set = set(pre_allocated)
-        deck[:] = [c for c in deck if c not in chosen_set]
+        _remove_from_deck(deck, pre_allocated)
 
     return pre_allocated
 
@@ -593,6 +661,41 @@ def _deal_with_help(
     Returns:
         (hands, None)           — on success: hands maps each seat to 13 cards.
         (None, rejected_seat)   — on early HCP rejection: the seat that failed.
+
+    String-card wrapper around _deal_with_help_ids() (same RNG draws).
+    """
+    ids = _cards_to_ids(deck)
+    hands, rejected = _deal_with_help_ids(
+        rng, ids, chosen_subprofiles, tight_seats, dealing_order,
+        rs_pre_selections=rs_pre_selections,
+    )
+    deck[:] = _ids_to_cards(ids)
+    if hands is None:
+        return None, rejected
+    return {seat: _ids_to_cards(h) for seat, h in hands.items()}, None
+
+
+def _deal_with_help_ids(
+    rng: random.Random,
+    deck: List[int],
+    chosen_subprofiles: Dict[Seat, "SubProfile"],
+    tight_seats: Set[str],
+    dealing_order: List[Seat],
+    rs_pre_selections: Optional[Dict[Seat, List[str]]] = None,
+    pre_allocate_fraction: float = PRE_ALLOCATE_FRACTION,
+    on_seat_dealt: Optional[Callable[[Dict[Seat, List[int]]], bool]] = None,
+) -> Tuple[Optional[Dict[Seat, List[int]]], Optional[Seat]]:
+    """
+    Integer-id version of _deal_with_help() (v2 hot path).
+
+    pre_allocate_fraction is the fraction of standard suit minima
+    pre-allocated for tight seats (a deal policy may override the default).
+
+    on_seat_dealt, if given, is called with the hands dealt so far after
+    each seat's fill.  The fill phase draws nothing from rng (the deck is
+    already shuffled; unconstrained seats take a slice of it), so stopping
+    early never changes the random stream.  If it returns False the deal
+    stops and (None, None) is returned.
     """
     # Late import: read gate flags from the facade module so that tests
     # which monkeypatch dg.ENABLE_HCP_FEASIBILITY_CHECK still work.
@@ -600,12 +703,13 @@ def _deal_with_help(
     _enable_hcp = _dg.ENABLE_HCP_FEASIBILITY_CHECK
     _hcp_num_sd = _dg.HCP_FEASIBILITY_NUM_SD
 
-    hands: Dict[Seat, List[Card]] = {}
+    id_hcp = _ID_HCP
+    hands: Dict[Seat, List[int]] = {}
 
     # Phase 1: Pre-allocate for ALL tight seats (including last seat).
     # This ensures every tight seat gets some guaranteed cards from its
     # required suits, regardless of dealing order position.
-    pre_allocated: Dict[Seat, List[Card]] = {}
+    pre_allocated: Dict[Seat, List[int]] = {}
     for seat in dealing_order:
         if seat not in tight_seats:
             continue
@@ -613,10 +717,10 @@ def _deal_with_help(
         if sub is None:
             continue
         # Standard pre-allocation.
-        pre = _pre_allocate(rng, deck, sub)
+        pre = _pre_allocate_ids(rng, deck, sub, pre_allocate_fraction)
         # RS pre-allocation: if this seat has pre-selected RS suits.
         if rs_pre_selections and seat in rs_pre_selections:
-            rs_pre = _pre_allocate_rs(
+            rs_pre = _pre_allocate_rs_ids(
                 rng, deck, sub, rs_pre_selections[seat]
             )
             pre = pre + rs_pre
@@ -631,13 +735,11 @@ def _deal_with_help(
     # hcp_sum_sq=120.  Subtract pre-allocated cards' contributions
     # to avoid scanning the remaining deck.
     if _enable_hcp and pre_allocated:
-        # Compute deck HCP stats from known full-deck constants
-        # minus what was removed by pre-allocation.
         removed_hcp_sum = 0
         removed_hcp_sum_sq = 0
         for cards in pre_allocated.values():
             for c in cards:
-                v = _CARD_HCP[c]
+                v = id_hcp[c]
                 removed_hcp_sum += v
                 removed_hcp_sum_sq += v * v
         deck_hcp_sum = FULL_DECK_HCP_SUM - removed_hcp_sum
@@ -654,7 +756,7 @@ def _deal_with_help(
             std = getattr(sub, "standard", None)
             if std is None:
                 continue
-            drawn_hcp = sum(_CARD_HCP[c] for c in pre)
+            drawn_hcp = sum(id_hcp[c] for c in pre)
             cards_remaining = 13 - len(pre)
             if cards_remaining > 0 and deck_size > 0:
                 if not _check_hcp_feasibility(
@@ -672,13 +774,14 @@ def _deal_with_help(
     # Phase 3: Fill each seat to 13 cards.
     # For non-last seats, use constrained fill to skip cards that would
     # bust a suit maximum.  Skipped cards stay in the deck for later seats.
+    # on_seat_dealt may stop the deal after any seat: no fill uses rng.
     for i, seat in enumerate(dealing_order):
         is_last = (i == len(dealing_order) - 1)
         pre = pre_allocated.get(seat, [])
 
         if is_last:
             # Last seat: pre-allocated cards + whatever remains in the deck.
-            hands[seat] = pre + list(deck)
+            hands[seat] = pre + deck
             deck.clear()
         else:
             remaining_needed = 13 - len(pre)
@@ -710,17 +813,78 @@ def _deal_with_help(
                             mhcp = getattr(sr, "max_hcp", None)
                             if mhcp is not None and mhcp < MAX_HAND_HCP:
                                 rs_hcp_max[s_letter] = mhcp
-                        if not rs_hcp_max:
-                            rs_hcp_max = None
 
-                fill = _constrained_fill(
-                    deck, remaining_needed, pre, maxima, max_hcp,
-                    rs_hcp_max,
+                fill = _constrained_fill_ids(
+                    deck,
+                    remaining_needed,
+                    pre,
+                    (maxima["S"], maxima["H"], maxima["D"], maxima["C"]),
+                    max_hcp,
+                    _suit_hcp_caps(rs_hcp_max),
                 )
             else:
                 fill = _random_deal(rng, deck, remaining_needed)
             hands[seat] = pre + fill
 
+        if on_seat_dealt is not None and not on_seat_dealt(hands):
+            return None, None
+
+    return hands, None
+
+
+def _deal_exact_ids(
+    rng: random.Random,
+    deck: List[int],
+    chosen_subprofiles: Dict[Seat, "SubProfile"],
+    tight_seats: Set[str],
+    dealing_order: List[Seat],
+    rs_pre_selections: Optional[Dict[Seat, List[str]]] = None,
+    pre_allocate_fraction: float = PRE_ALLOCATE_FRACTION,
+    on_seat_dealt: Optional[Callable[[Dict[Seat, List[int]]], bool]] = None,
+) -> Tuple[Optional[Dict[Seat, List[int]]], Optional[Seat]]:
+    """
+    Exact alternative to _deal_with_help_ids() (ENABLE_EXACT_SAMPLER).
+
+    Every seat except the last is drawn with exact_sampler.sample_hand_exact()
+    from the cards still in the deck, uniformly among the hands that meet its
+    standard suit windows (pre-selected RS ranges intersected in) and total
+    HCP window.  PC/OC constraints and exclusions are still checked by
+    matching.  The last seat gets the remainder.
+
+    tight_seats, pre_allocate_fraction and on_seat_dealt are ignored (every
+    constrained seat is sampled exactly, with rng, so stopping early would
+    change the random stream); they are accepted so the two dealers share a
+    signature.
+
+    Returns:
+        (hands, None)   — hands maps each seat to 13 card ids.
+        (None, seat)    — no hand left in the deck meets seat's windows.
+    """
+    hands: Dict[Seat, List[int]] = {}
+    for seat in dealing_order[:-1]:
+        sub = chosen_subprofiles.get(seat)
+        if sub is None:
+            hands[seat] = _random_deal(rng, deck, 13)
+            continue
+        rs_ranges = None
+        pre_suits = rs_pre_selections.get(seat) if rs_pre_selections else None
+        rs = getattr(sub, "random_suit_constraint", None)
+        if pre_suits and rs is not None:
+            rs_ranges = _resolve_rs_ranges(rs, pre_suits)
+        std = getattr(sub, "standard", None)
+        hand = sample_hand_exact(
+            rng,
+            deck,
+            subprofile_suit_windows(sub, rs_ranges),
+            getattr(std, "total_min_hcp", 0),
+            getattr(std, "total_max_hcp", MAX_HAND_HCP),
+        )
+        if hand is None:
+            return None, seat
+        hands[seat] = hand
+
+    hands[dealing_order[-1]] = list(deck)
+    deck.clear()
     return hands, None
 
 
@@ -767,7 +931,9 @@ def _compute_dealing_order(
 
     Tiebreakers:
       1. Narrower total HCP range = higher effective risk (dealt earlier).
-      2. Clockwise position from dealer (earlier = dealt earlier).
+      2. Lower exact acceptance probability (hand_combinatorics) = harder
+         seat (dealt earlier).
+      3. Clockwise position from dealer (earlier = dealt earlier).
 
     Args:
         chosen_subprofiles: The subprofile selected for each seat this board.
@@ -784,27 +950,32 @@ def _compute_dealing_order(
         sub = chosen_subprofiles.get(seat)
         if sub is None:
             # No subprofile → unconstrained → lowest risk, ideal for last.
-            return (0.0, 0, 0)
+            return (0.0, 0, 1.0, 0)
 
         ctype = _subprofile_constraint_type(sub)
         risk = _CONSTRAINT_RISK[ctype]
 
         # HCP tiebreaker: narrower range = harder = higher effective risk.
+        # Then the exact probability that a random hand meets the standard
+        # constraints (shape + HCP jointly): lower = harder = dealt earlier.
         std = getattr(sub, "standard", None)
         if std is not None:
             hcp_min = getattr(std, "total_min_hcp", 0)
             hcp_max = getattr(std, "total_max_hcp", 37)
             hcp_range = max(hcp_max - hcp_min, 0)
+            p_accept = subprofile_acceptance_probability(sub)
         else:
             hcp_range = 37  # unconstrained
+            p_accept = 1.0
 
         # Clockwise tiebreaker: earlier clockwise = dealt earlier.
         cw_pos = clockwise_from_dealer.index(seat)
 
         # Sort descending by risk, ascending by hcp_range (narrow=first),
-        # ascending by clockwise position.
-        # Negate risk so default ascending sort puts high risk first.
-        return (-risk, hcp_range, cw_pos)
+        # ascending by acceptance probability, ascending by clockwise
+        # position.  Negate risk so default ascending sort puts high risk
+        # first.
+        return (-risk, hcp_range, p_accept, cw_pos)
 
     return sorted(clockwise_from_dealer, key=_sort_key)
 
@@ -848,6 +1019,67 @@ def _build_processing_order(
 # ---------------------------------------------------------------------------
 
 
+def _start_round(
+    rng: random.Random,
+    profile: "HandProfile",
+    profile_dealing_order: List[Seat],
+    deal_policy: Optional[DealPolicy] = None,
+) -> Tuple[
+    Dict[Seat, "SubProfile"], Dict[Seat, int], List[Seat],
+    Dict[Seat, List[str]], Set[Seat], List[Seat], float,
+]:
+    """
+    Select subprofiles and derive everything that depends on them.
+
+    A deal_policy entry for the selected combination overrides the computed
+    dealing order and the standard pre-allocation fraction.
+
+    Returns (chosen_subprofiles, chosen_indices, dealing_order,
+    rs_pre_selections, tight_seats, processing_order, pre_allocate_fraction).
+    """
+    from . import deal_generator as _dg
+
+    # Select subprofiles (index-coupled where applicable).
+    chosen_subprofiles, chosen_indices = _dg._select_subprofiles_for_board(
+        rng, profile, profile_dealing_order
+    )
+
+    # Auto-compute dealing order from chosen subprofiles:
+    # least constrained seat last (gets remainder without constrained fill).
+    dealing_order = _compute_dealing_order(chosen_subprofiles, profile.dealer)
+    pre_allocate_fraction = PRE_ALLOCATE_FRACTION
+
+    # An optimized policy (deal_policy.py) for this combination wins.
+    entry = (
+        deal_policy.lookup(chosen_indices) if deal_policy is not None else None
+    )
+    if entry is not None:
+        dealing_order = list(entry.dealing_order)
+        pre_allocate_fraction = entry.pre_allocate_fraction
+
+    # Pre-select RS suits BEFORE dealing so we can:
+    #   (a) flag RS seats as tight in the dispersion check,
+    #   (b) pre-allocate cards for the RS suit(s),
+    #   (c) use the pre-committed suits during matching.
+    rs_pre_selections = _pre_select_rs_suits(rng, chosen_subprofiles)
+
+    # Identify tight seats that need shape help (RS-aware).
+    tight_seats = _dispersion_check(
+        chosen_subprofiles, rs_pre_selections=rs_pre_selections
+    )
+
+    # Build processing order: RS seats first so PC/OC can see partner's
+    # RS choices, then everything else.
+    processing_order = _build_processing_order(
+        profile, dealing_order, chosen_subprofiles
+    )
+    return (
+        chosen_subprofiles, chosen_indices, dealing_order,
+        rs_pre_selections, tight_seats, processing_order,
+        pre_allocate_fraction,
+    )
+
+
 def _build_single_constrained_deal_v2(
     rng: random.Random,
     profile: "HandProfile",
@@ -855,6 +1087,11 @@ def _build_single_constrained_deal_v2(
     debug_board_stats: Optional[
         Callable[["SeatFailCounts", "SeatSeenCounts"], None]
     ] = None,
+    combo_stats: Optional[ComboStats] = None,
+    attempt_log: Optional[List[int]] = None,
+    deal_policy: Optional[DealPolicy] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+    telemetry: Optional["BoardTelemetry"] = None,
 ) -> "Deal":
     """
     Build a single constrained deal using shape-based help (v2 algorithm).
@@ -874,12 +1111,27 @@ def _build_single_constrained_deal_v2(
         board_number: 1-based board number.
         debug_board_stats: Optional callback receiving (seat_fail_counts,
             seat_seen_counts) on success or exhaustion.
+        combo_stats: Optional ComboStats store.  When given, subprofile and
+            RS re-rolls follow learned per-combination round budgets instead
+            of the fixed intervals, and every round is recorded into it.
+        attempt_log: Optional list; the number of attempts this call used
+            is appended on success and on exhaustion.
+        deal_policy: Optional DealPolicy (deal_policy.py).  Subprofile
+            combinations it covers are dealt in its dealing order with its
+            pre-allocation fraction.
+        should_stop: Optional callable polled before every attempt; when it
+            returns True the build stops with DealGenerationCancelled.
+        telemetry: Optional BoardTelemetry (board_telemetry.py).  Receives
+            this call's counters on success or exhaustion, plus every
+            telemetry.attempt_every-th failed attempt.  Not used by the
+            invariants-safety and NumPy batch paths.
 
     Returns:
         A Deal instance with matched hands.
 
     Raises:
         DealGenerationError: If no valid deal found after MAX_BOARD_ATTEMPTS.
+        DealGenerationCancelled: If should_stop returned True.
     """
     # Late import: _select_subprofiles_for_board lives in the facade module
     # (deal_generator.py) because it uses isinstance(x, SeatProfile) checks
@@ -902,6 +1154,8 @@ def _build_single_constrained_deal_v2(
         for seat in profile_dealing_order:
             hands[seat] = deck[idx : idx + 13]
             idx += 13
+        if attempt_log is not None:
+            attempt_log.append(1)
         return Deal(
             board_number=board_number,
             dealer=profile.dealer,
@@ -910,34 +1164,44 @@ def _build_single_constrained_deal_v2(
         )
 
     # ------------------------------------------------------------------
-    # Full constrained path
+    # Optional NumPy batch engine (standard-only profiles)
     # ------------------------------------------------------------------
+    # The batch engine has no stop polling, telemetry, dealing policy or
+    # adaptive rounds, so a call using any of them stays on the scalar path.
+    if (
+        _dg.ENABLE_NUMPY_BATCH_ENGINE
+        and should_stop is None
+        and telemetry is None
+        and deal_policy is None
+        and combo_stats is None
+        and _batch_engine_supports(profile)
+    ):
+        return _build_single_constrained_deal_batch(
+            rng, profile, board_number, _dg.MAX_BOARD_ATTEMPTS,
+            debug_board_stats=debug_board_stats,
+            attempt_log=attempt_log,
+        )
 
-    # Select subprofiles once per board (index-coupled where applicable).
-    chosen_subprofiles, chosen_indices = _dg._select_subprofiles_for_board(
-        rng, profile, profile_dealing_order
-    )
-
-    # Auto-compute dealing order from chosen subprofiles:
-    # least constrained seat last (gets remainder without constrained fill).
-    dealing_order = _compute_dealing_order(chosen_subprofiles, profile.dealer)
-
-    # Pre-select RS suits BEFORE dealing so we can:
-    #   (a) flag RS seats as tight in the dispersion check,
-    #   (b) pre-allocate cards for the RS suit(s),
-    #   (c) use the pre-committed suits during matching.
-    rs_pre_selections = _pre_select_rs_suits(rng, chosen_subprofiles)
+    # ------------------------------------------------------------------
+    # Full constrained path
+    # ------------------------------------------------------------------
 
-    # Identify tight seats that need shape help (RS-aware).
-    tight_seats = _dispersion_check(
-        chosen_subprofiles, rs_pre_selections=rs_pre_selections
-    )
-
-    # Build processing order: RS seats first so PC/OC can see partner's
-    # RS choices, then everything else.
-    processing_order = _build_processing_order(
-        profile, dealing_order, chosen_subprofiles
-    )
+    # Select subprofiles for the first round (see _start_round).
+    (
+        chosen_subprofiles, chosen_indices, dealing_order,
+        rs_pre_selections, tight_seats, processing_order,
+        pre_allocate_fraction,
+    ) = _start_round(rng, profile, profile_dealing_order, deal_policy)
+
+    # Adaptive rounds: with a ComboStats store, each (subprofile selection,
+    # RS choice) gets a learned attempt budget instead of the fixed
+    # SUBPROFILE_/RS_REROLL_INTERVAL schedule (see ADAPTIVE_REROLL_*).
+    round_key: Optional[ComboKey] = None
+    round_attempts = 0
+    round_budget = 0
+    if combo_stats is not None:
+        round_key = combo_key(chosen_indices, rs_pre_selections)
+        round_budget = combo_stats.budget(round_key, rng)
 
     # ------------------------------------------------------------------
     # Per-board failure attribution counters (D7)
@@ -956,9 +1220,119 @@ def _build_single_constrained_deal_v2(
     seat_seen_counts: Dict[Seat, int] = {}
 
     board_attempts = 0
+    # Telemetry-only counters (cheap enough to keep unconditionally).
+    subprofile_rerolls = 0
+    rs_rerolls = 0
+    hcp_early_rejections = 0
+    sample_every = telemetry.attempt_every if telemetry is not None else 0
+
+    def _report(rs_suits: Dict[Seat, List[str]]) -> None:
+        telemetry.builder_call(  # type: ignore[union-attr]
+            board_number,
+            attempts=board_attempts,
+            subprofile_rerolls=subprofile_rerolls,
+            rs_rerolls=rs_rerolls,
+            hcp_early_rejections=hcp_early_rejections,
+            seat_fail=seat_fail_counts,
+            seat_seen=seat_seen_counts,
+            seat_fail_hcp=seat_fail_hcp,
+            seat_fail_shape=seat_fail_shape,
+            subprofile_indices=chosen_indices,
+            rs_suits=rs_suits,
+        )
+
+    # ------------------------------------------------------------------
+    # Per-attempt matching state (reset before every deal)
+    # ------------------------------------------------------------------
+    # Seats are matched in processing_order.  _match_dealt() matches every
+    # seat whose turn has come and whose hand is dealt, so with
+    # ENABLE_EARLY_SEAT_REJECTION the dealer can call it after each seat's
+    # fill and stop at the first failure; otherwise it runs once on the full
+    # deal.  Either way the same seats are matched in the same order, so
+    # the attribution counters below do not depend on the flag.
+    random_suit_choices: Dict[Seat, List[str]] = {}
+    checked_seats_in_attempt: List[Seat] = []
+    first_failed_seat: Optional[Seat] = None
+    first_failed_stage_idx: Optional[int] = None
+    fail_reason: Optional[str] = None
+    match_pos = 0
+
+    def _match_dealt(hands: Dict[Seat, List[int]]) -> bool:
+        """Match the dealt seats next in processing_order; False on a failure."""
+        nonlocal match_pos, first_failed_seat, first_failed_stage_idx, fail_reason
+        while match_pos < len(processing_order):
+            seat = processing_order[match_pos]
+            sp = profile.seat_profiles.get(seat)
+            if not isinstance(sp, SeatProfile) or not sp.subprofiles:
+                match_pos += 1
+                continue
+            hand = hands.get(seat)
+            if hand is None:
+                return True  # not dealt yet
+            match_pos += 1
+
+            sub = chosen_subprofiles.get(seat)
+            idx0 = chosen_indices.get(seat)
+
+            if sub is None or idx0 is None:
+                return False
+
+            # Track that we checked this seat.
+            checked_seats_in_attempt.append(seat)
+            seat_seen_counts[seat] = seat_seen_counts.get(seat, 0) + 1
+
+            # Compiled matcher: flat bounds checked against the hand's suit
+            # lengths / HCP.  Total HCP is tested first, so a hand outside
+            # the subprofile's HCP range is rejected before any suit work
+            # (attributed "hcp" even if the shape is also wrong).
+            lengths, suit_hcp = _hand_suit_stats_ids(hand)
+            matched, chosen_rs, fail_reason = _match_seat_compiled(
+                profile,
+                seat,
+                _compile_subprofile(sub),
+                idx0 + 1,
+                lengths,
+                suit_hcp,
+                random_suit_choices,
+                rng,
+                rs_pre_selections,
+            )
+
+            if matched and chosen_rs is not None:
+                # Store RS choice so PC/OC seats can reference it.
+                random_suit_choices[seat] = chosen_rs
+
+            if not matched:
+                seat_fail_counts[seat] = seat_fail_counts.get(seat, 0) + 1
+
+                # This seat is the first failing seat on this attempt.
+                seat_fail_as_seat[seat] = seat_fail_as_seat.get(seat, 0) + 1
+
+                # Classify failure as HCP vs shape.
+                if fail_reason == "hcp":
+                    seat_fail_hcp[seat] = seat_fail_hcp.get(seat, 0) + 1
+                elif fail_reason == "shape":
+                    seat_fail_shape[seat] = seat_fail_shape.get(seat, 0) + 1
+                # else: "other" or None — not classified
+
+                # Record first-failure markers.
+                first_failed_seat = seat
+                first_failed_stage_idx = len(checked_seats_in_attempt) - 1
+                return False
+        return True
+
+    # Dealer: shape help (default) or exact constructive sampling.
+    deal_hands = (
+        _deal_exact_ids if _dg.ENABLE_EXACT_SAMPLER else _deal_with_help_ids
+    )
+    on_seat_dealt = _match_dealt if _dg.ENABLE_EARLY_SEAT_REJECTION else None
 
     _max_attempts = _dg.MAX_BOARD_ATTEMPTS
     while board_attempts < _max_attempts:
+        if should_stop is not None and should_stop():
+            raise DealGenerationCancelled(
+                f"Board {board_number} stopped after {board_attempts} attempts."
+            )
         board_attempts += 1
 
         # Periodic subprofile re-roll: try different subprofile combinations.
@@ -967,26 +1341,35 @@ def _build_single_constrained_deal_v2(
         # Re-selecting subprofiles also re-selects RS suits and rebuilds
         # processing order since different subprofiles may have different
         # constraint types (RS, OC, etc.).
-        if (
+        if combo_stats is not None:
+            # Adaptive: a round ends when its budget is spent; the next one
+            # re-selects subprofiles and RS suits together.
+            if round_attempts >= round_budget:
+                combo_stats.record(round_key, round_attempts, False)
+                subprofile_rerolls += 1
+                (
+                    chosen_subprofiles, chosen_indices, dealing_order,
+                    rs_pre_selections, tight_seats, processing_order,
+                    pre_allocate_fraction,
+                ) = _start_round(rng, profile, profile_dealing_order, deal_policy)
+                round_key = combo_key(chosen_indices, rs_pre_selections)
+                round_budget = combo_stats.budget(round_key, rng)
+                round_attempts = 0
+            round_attempts += 1
+
+        elif (
             board_attempts > 1
             and SUBPROFILE_REROLL_INTERVAL > 0
             and (board_attempts - 1) % SUBPROFILE_REROLL_INTERVAL == 0
         ):
-            chosen_subprofiles, chosen_indices = _dg._select_subprofiles_for_board(
-                rng, profile, profile_dealing_order
-            )
-            # Recompute dealing order for new subprofile combination.
-            dealing_order = _compute_dealing_order(
-                chosen_subprofiles, profile.dealer
-            )
-            rs_pre_selections = _pre_select_rs_suits(rng, chosen_subprofiles)
-            tight_seats = _dispersion_check(
-                chosen_subprofiles, rs_pre_selections=rs_pre_selections
-            )
-            # Rebuild processing order since RS seats may have changed.
-            processing_order = _build_processing_order(
-                profile, dealing_order, chosen_subprofiles
-            )
+            # Re-select subprofiles; dealing order, RS suits and processing
+            # order are rebuilt for the new combination.
+            subprofile_rerolls += 1
+            (
+                chosen_subprofiles, chosen_indices, dealing_order,
+                rs_pre_selections, tight_seats, processing_order,
+                pre_allocate_fraction,
+            ) = _start_round(rng, profile, profile_dealing_order, deal_policy)
 
         # Periodic RS re-roll (more frequent): try different RS suit
         # combinations within the same subprofile selection.
@@ -995,25 +1378,46 @@ def _build_single_constrained_deal_v2(
             and RS_REROLL_INTERVAL > 0
             and (board_attempts - 1) % RS_REROLL_INTERVAL == 0
         ):
+            rs_rerolls += 1
             rs_pre_selections = _pre_select_rs_suits(rng, chosen_subprofiles)
             tight_seats = _dispersion_check(
                 chosen_subprofiles, rs_pre_selections=rs_pre_selections
             )
 
-        # Build and shuffle a full deck.
-        deck = _build_deck()
+        # Build and shuffle a full deck of integer card ids.
+        deck = _build_deck_ids()
         rng.shuffle(deck)
 
-        # Deal with shape help for tight seats (RS-aware).
-        hands, hcp_rejected_seat = _deal_with_help(
+        # Reset the matching state.  random_suit_choices is pre-seeded with
+        # the RS pre-selections so that:
+        #   (a) RS matching uses the pre-committed suits instead of random,
+        #   (b) PC/OC seats can see partner/opponent RS choices immediately.
+        random_suit_choices = dict(rs_pre_selections)
+        checked_seats_in_attempt = []
+        first_failed_seat = None
+        first_failed_stage_idx = None
+        fail_reason = None
+        match_pos = 0
+
+        # Deal with shape help for tight seats (RS-aware), or exactly.
+        # (None, None) means on_seat_dealt already rejected a seat.
+        hands, hcp_rejected_seat = deal_hands(
             rng, deck, chosen_subprofiles, tight_seats, dealing_order,
             rs_pre_selections=rs_pre_selections,
+            pre_allocate_fraction=pre_allocate_fraction,
+            on_seat_dealt=on_seat_dealt,
         )
 
         # ----- Early HCP rejection handling -----
         # If _deal_with_help detected that a tight seat's pre-allocated cards
-        # make its HCP target statistically implausible, skip matching entirely.
+        # make its HCP target statistically implausible (or the exact sampler
+        # found no qualifying hand left for it), skip matching entirely.
         if hcp_rejected_seat is not None:
+            hcp_early_rejections += 1
+            if sample_every and board_attempts % sample_every == 0:
+                telemetry.attempt(  # type: ignore[union-attr]
+                    board_number, board_attempts, hcp_rejected_seat, "hcp_early"
+                )
             # Attribute failure to the rejected seat (HCP-driven).
             seat_fail_as_seat[hcp_rejected_seat] = (
                 seat_fail_as_seat.get(hcp_rejected_seat, 0) + 1
@@ -1054,98 +1458,14 @@ def _build_single_constrained_deal_v2(
             continue  # Skip matching, next attempt.
         # ----- end early HCP rejection handling -----
 
-        # Match all seats against their constraints.
-        all_matched = True
-        # Pre-seed random_suit_choices with RS pre-selections so that:
-        #   (a) RS matching uses the pre-committed suits instead of random,
-        #   (b) PC/OC seats can see partner/opponent RS choices immediately.
-        random_suit_choices: Dict[Seat, List[str]] = dict(rs_pre_selections)
-        # Per-attempt tracking for global attribution.
-        checked_seats_in_attempt: List[Seat] = []
-        first_failed_seat: Optional[Seat] = None
-        first_failed_stage_idx: Optional[int] = None
-
-        for seat in processing_order:
-            sp = profile.seat_profiles.get(seat)
-            if not isinstance(sp, SeatProfile) or not sp.subprofiles:
-                continue
+        # Match the seats not yet matched during the deal.
+        all_matched = hands is not None and _match_dealt(hands)
 
-            sub = chosen_subprofiles.get(seat)
-            idx0 = chosen_indices.get(seat)
-
-            if sub is None or idx0 is None:
-                all_matched = False
-                break
-
-            # ---- Early total-HCP pre-check (perf optimisation) ----
-            # Quick O(13) sum before the full _match_seat / _compute_suit_analysis
-            # pipeline.  If the hand's total HCP is outside the subprofile's
-            # standard range, we can reject immediately — avoids suit analysis,
-            # RS matching, and all subprofile iteration overhead.
-            # NOTE: Attribution is always "hcp" here even though the hand might
-            # also fail shape checks.  This is a known diagnostic imprecision —
-            # HCP is the *detected* cause since we check it first for speed.
-            std_early = getattr(sub, "standard", None)
-            if std_early is not None:
-                hand_hcp_quick = sum(_CARD_HCP[c] for c in hands[seat])
-                if (
-                    hand_hcp_quick < std_early.total_min_hcp
-                    or hand_hcp_quick > std_early.total_max_hcp
-                ):
-                    # Count as checked + failed (HCP).
-                    checked_seats_in_attempt.append(seat)
-                    seat_seen_counts[seat] = seat_seen_counts.get(seat, 0) + 1
-                    all_matched = False
-                    seat_fail_counts[seat] = seat_fail_counts.get(seat, 0) + 1
-                    seat_fail_as_seat[seat] = seat_fail_as_seat.get(seat, 0) + 1
-                    seat_fail_hcp[seat] = seat_fail_hcp.get(seat, 0) + 1
-                    if first_failed_seat is None:
-                        first_failed_seat = seat
-                        first_failed_stage_idx = len(checked_seats_in_attempt) - 1
-                    break
-            # ---- end early total-HCP pre-check ----
-
-            # Track that we checked this seat.
-            checked_seats_in_attempt.append(seat)
-            seat_seen_counts[seat] = seat_seen_counts.get(seat, 0) + 1
-
-            matched, chosen_rs, fail_reason = _match_seat(
-                profile=profile,
-                seat=seat,
-                hand=hands[seat],
-                seat_profile=sp,
-                chosen_subprofile=sub,
-                chosen_subprofile_index_1based=idx0 + 1,
-                random_suit_choices=random_suit_choices,
-                rng=rng,
-                rs_pre_selections=rs_pre_selections,
+        if not all_matched and sample_every and board_attempts % sample_every == 0:
+            telemetry.attempt(  # type: ignore[union-attr]
+                board_number, board_attempts, first_failed_seat, fail_reason
             )
 
-            if matched and chosen_rs is not None:
-                # Store RS choice so PC/OC seats can reference it.
-                random_suit_choices[seat] = chosen_rs
-
-            if not matched:
-                all_matched = False
-                seat_fail_counts[seat] = seat_fail_counts.get(seat, 0) + 1
-
-                # This seat is the first failing seat on this attempt.
-                seat_fail_as_seat[seat] = seat_fail_as_seat.get(seat, 0) + 1
-
-                # Classify failure as HCP vs shape.
-                if fail_reason == "hcp":
-                    seat_fail_hcp[seat] = seat_fail_hcp.get(seat, 0) + 1
-                elif fail_reason == "shape":
-                    seat_fail_shape[seat] = seat_fail_shape.get(seat, 0) + 1
-                # else: "other" or None — not classified
-
-                # Record first-failure markers (only once per attempt).
-                if first_failed_seat is None:
-                    first_failed_seat = seat
-                    first_failed_stage_idx = len(checked_seats_in_attempt) - 1
-
-                break
-
         # ---- Attempt-level global attribution ----
         if not all_matched and first_failed_stage_idx is not None:
             # Seats checked BEFORE the first failure → "globally impacted (other)"
@@ -1182,17 +1502,30 @@ def _build_single_constrained_deal_v2(
                     print(f"WARNING: debug hook failed: {exc}", file=sys.stderr)
 
         if all_matched:
+            if combo_stats is not None:
+                combo_stats.record(round_key, round_attempts, True)
+            if attempt_log is not None:
+                attempt_log.append(board_attempts)
+            if telemetry is not None:
+                _report(random_suit_choices)
             # Fire debug_board_stats callback on success.
             if debug_board_stats is not None:
                 debug_board_stats(dict(seat_fail_counts), dict(seat_seen_counts))
+            # Convert card ids back to strings only for the final Deal.
             return Deal(
                 board_number=board_number,
                 dealer=profile.dealer,
                 vulnerability=_vulnerability_for_board(board_number),
-                hands=hands,
+                hands={seat: _ids_to_cards(h) for seat, h in hands.items()},
             )
 
     # Exhausted all attempts — fire hooks before raising.
+    if combo_stats is not None:
+        combo_stats.record(round_key, round_attempts, False)
+    if attempt_log is not None:
+        attempt_log.append(board_attempts)
+    if telemetry is not None:
+        _report(rs_pre_selections)
     if debug_board_stats is not None:
         debug_board_stats(dict(seat_fail_counts), dict(seat_seen_counts))
 
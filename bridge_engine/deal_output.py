@@ -21,12 +21,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence
 
+from .atomic_writer import AtomicBufferedWriter
 from .deal_generator import Deal, DealSet
 from .hand_profile import HandProfile
 from .lin_encoder import Deal as LinDeal
-from .lin_encoder import write_lin_file
+from .lin_encoder import LinFileWriter, write_lin_file
 from .setup_env import SetupResult
 
 
@@ -44,8 +45,8 @@ class DealOutputSummary:
     """Summary of what render_deals() produced."""
 
     num_deals: int
-    txt_path: Path
-    lin_path: Path
+    txt_path: Optional[Path]    # None when the TXT file was not requested
+    lin_path: Optional[Path]    # None when the LIN file was not requested
     warnings: List[str]
 
 
@@ -172,77 +173,108 @@ def _format_single_board_text(board: Deal) -> List[str]:
     return lines
 
 
-def _convert_to_formatted_deals(
-    profile: HandProfile, deals: Sequence[Deal]
-) -> List[str]:
+def _format_profile_header(profile: HandProfile) -> List[str]:
     """
-    Build the full TXT file content as a list of lines, including:
-
-      - One-time header:
-          Profile, Tag, Author, Version
-          "You and your partner are always North–South."
-      - For each deal:
-          Board number, dealer, vulnerability
-          Compass layout
-          Separator line between deals
+    One-time TXT header: Profile, Tag, Author, Version and the
+    "You and your partner are always North–South." line.
     """
-    lines: List[str] = []
-
-    # One-time profile header
     profile_name = getattr(profile, "profile_name", "UnknownProfile")
     tag = getattr(profile, "tag", "UnknownTag")
     author = getattr(profile, "author", "UnknownAuthor")
     version = getattr(profile, "version", "0.0")
 
-    lines.append(f"Profile : {profile_name}")
-    lines.append(f"Tag     : {tag}")
-    lines.append(f"Author  : {author}")
-    lines.append(f"Version : {version}")
-    lines.append("")
-    lines.append("You and your partner are always North–South.")
-    lines.append("")
-    lines.append("========================================")
-    lines.append("")
-
-    # Per-board sections
-    first = True
-    for d in deals:
-        if not first:
-            # Visual separator between boards
-            lines.append("")
-            lines.append("========================================")
-            lines.append("")
-        first = False
+    return [
+        f"Profile : {profile_name}",
+        f"Tag     : {tag}",
+        f"Author  : {author}",
+        f"Version : {version}",
+        "",
+        "You and your partner are always North–South.",
+        "",
+        "========================================",
+        "",
+    ]
 
-        lines.extend(_format_single_board_text(d))
 
-    return lines
+# Visual separator between boards.
+_BOARD_SEPARATOR: List[str] = ["", "========================================", ""]
 
 
 def _write_text_output(
     path: Path,
-    formatted_deals: Sequence[str],
+    profile: HandProfile,
+    deals: Iterable[Deal],
     *,
     append: bool,
     print_to_console: bool,
 ) -> None:
     """
     Write the TXT output file and optionally mirror to stdout.
-    """
-    text = "\n".join(formatted_deals) + ("\n" if formatted_deals else "")
-
-    if print_to_console:
-        print(text)
 
+    Each board goes through TxtDealWriter as soon as it is formatted, so no
+    full rendering is held in memory.  Appending opens the existing file in
+    append mode (no read-back); overwriting goes through a temp file renamed
+    into place.
+    """
     try:
-        if append and path.exists():
-            existing = path.read_text(encoding="utf-8")
-            path.write_text(existing + text, encoding="utf-8")
-        else:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(text, encoding="utf-8")
+        with TxtDealWriter(
+            path, profile, append=append, print_to_console=print_to_console,
+        ) as writer:
+            for deal in deals:
+                writer.write_deal(deal)
     except OSError as exc:
         raise OutputError(f"Failed to write text output to {path}: {exc}") from exc
+    if print_to_console:
+        print("")
+
+
+def _print_text_output(profile: HandProfile, deals: Iterable[Deal]) -> None:
+    """Print the TXT rendering to stdout only, one board at a time."""
+    print("\n".join(_format_profile_header(profile)))
+    for i, deal in enumerate(deals):
+        lines = _format_single_board_text(deal)
+        if i:
+            lines = _BOARD_SEPARATOR + lines
+        print("\n".join(lines))
+
+
+class TxtDealWriter(AtomicBufferedWriter):
+    """
+    Incremental TXT writer: the profile header on open, then one board
+    block (with separator) per write_deal() call.
+
+    Boards are separated by _BOARD_SEPARATOR.  Overwrites atomically on
+    close() or appends in place with append=True; see
+    atomic_writer.AtomicBufferedWriter.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        profile: HandProfile,
+        *,
+        append: bool = False,
+        print_to_console: bool = False,
+        **kwargs,
+    ) -> None:
+        super().__init__(path, append=append, **kwargs)
+        self.print_to_console = print_to_console
+        self._emit(_format_profile_header(profile), record=False)
+
+    def write_deal(self, deal: Deal) -> None:
+        lines = _format_single_board_text(deal)
+        if self.records:
+            lines = _BOARD_SEPARATOR + lines
+        self._emit(lines, record=True)
+
+    def _emit(self, lines: List[str], *, record: bool) -> None:
+        chunk = "".join(line + "\n" for line in lines)
+        if record:
+            self.write_record(chunk)
+        else:
+            self.write(chunk)
+        if self.print_to_console:
+            print(chunk, end="")
 
 
 # ---------------------------------------------------------------------------
@@ -250,25 +282,25 @@ def _write_text_output(
 # ---------------------------------------------------------------------------
 
 
-def _convert_to_lin_deals(deals: Sequence[Deal]) -> List[LinDeal]:
+def _to_lin_deal(d: Deal) -> LinDeal:
     """
-    Map internal Section C Deal objects into lin_encoder.Deal structures
-    ready for LIN encoding.
+    Map an internal Section C Deal into a lin_encoder.Deal ready for LIN
+    encoding.
 
     We pass board_number, dealer, hands, AND vulnerability so BBO can show
     the correct 'sv' tag.
     """
-    lin_deals: List[LinDeal] = []
-    for d in deals:
-        lin_deals.append(
-            LinDeal(
-                board_number=d.board_number,
-                dealer=d.dealer,
-                hands=d.hands,
-                vulnerability=d.vulnerability,
-            )
-        )
-    return lin_deals
+    return LinDeal(
+        board_number=d.board_number,
+        dealer=d.dealer,
+        hands=d.hands,
+        vulnerability=d.vulnerability,
+    )
+
+
+def _convert_to_lin_deals(deals: Sequence[Deal]) -> List[LinDeal]:
+    """_to_lin_deal() for every deal."""
+    return [_to_lin_deal(d) for d in deals]
 
 
 # ---------------------------------------------------------------------------
@@ -283,13 +315,16 @@ def render_deals(
     *,
     print_to_console: bool = True,
     append_txt: bool = False,
+    write_txt: bool = True,
+    write_lin: bool = True,
 ) -> DealOutputSummary:
     """
     Render all deals to text and LIN outputs.
 
     This function is a thin coordination layer for Section D:
       • Converts internal Deal objects into text and LIN representations.
-      • Writes to the canonical paths from SetupResult.
+      • Writes to the canonical paths from SetupResult (write_txt /
+        write_lin=False skips that file; its summary path is then None).
       • Optionally prints deals to the console.
 
     It MUST NOT:
@@ -299,33 +334,36 @@ def render_deals(
     warnings: List[str] = []
 
     try:
-        # TXT representation
-        formatted = _convert_to_formatted_deals(profile, deal_set.deals)
-
-        # LIN representation (now with correct dealer + vulnerability)
-        lin_deals = _convert_to_lin_deals(deal_set.deals)
-
-        # Write text file
-        _write_text_output(
-            setup.output_txt_file,
-            formatted_deals=formatted,
-            append=append_txt,
-            print_to_console=print_to_console,
-        )
-
-        # Always overwrite LIN file for a run
-        try:
-            setup.output_lin_file.parent.mkdir(parents=True, exist_ok=True)
-            write_lin_file(setup.output_lin_file, lin_deals)
-        except OSError as exc:
-            raise OutputError(
-                f"Failed to write LIN output to {setup.output_lin_file}: {exc}"
-            ) from exc
+        if write_txt:
+            # Write text file, board by board
+            _write_text_output(
+                setup.output_txt_file,
+                profile,
+                deal_set.deals,
+                append=append_txt,
+                print_to_console=print_to_console,
+            )
+        elif print_to_console:
+            _print_text_output(profile, deal_set.deals)
+
+        if write_lin:
+            # Always overwrite LIN file for a run; each board is encoded
+            # (with correct dealer + vulnerability) as it is written.
+            try:
+                setup.output_lin_file.parent.mkdir(parents=True, exist_ok=True)
+                write_lin_file(
+                    setup.output_lin_file,
+                    (_to_lin_deal(d) for d in deal_set.deals),
+                )
+            except OSError as exc:
+                raise OutputError(
+                    f"Failed to write LIN output to {setup.output_lin_file}: {exc}"
+                ) from exc
 
         return DealOutputSummary(
             num_deals=len(deal_set.deals),
-            txt_path=setup.output_txt_file,
-            lin_path=setup.output_lin_file,
+            txt_path=setup.output_txt_file if write_txt else None,
+            lin_path=setup.output_lin_file if write_lin else None,
             warnings=warnings,
         )
     except OutputError:
@@ -333,4 +371,81 @@ def render_deals(
         raise
     except Exception as exc:
         # Narrow, local wrapping into domain error
-        raise OutputError(f"Failed while rendering deals: {exc}") from exc
\ No newline at end of file
+        raise OutputError(f"Failed while rendering deals: {exc}") from exc
+
+
+def stream_deals(
+    setup: SetupResult,
+    profile: HandProfile,
+    deals: Iterable[Deal],
+    *,
+    print_to_console: bool = False,
+    append_txt: bool = False,
+) -> DealOutputSummary:
+    """
+    Write deals to the TXT and LIN outputs one board at a time.
+
+    The streaming counterpart of render_deals(), meant for iter_deals():
+    each board is formatted, written to both files and dropped before the
+    next one is pulled, so memory stays flat for any number of boards.  The
+    files end up byte-identical to render_deals() for the same deals.
+
+    Both files are replaced atomically when the stream ends.  If the
+    iterator raises part-way, the boards already written are still
+    committed and the exception propagates unchanged (DealGenerationError
+    from the generator is not an output failure); a write failure leaves
+    the previous files untouched.
+    """
+    txt_path = setup.output_txt_file
+    lin_path = setup.output_lin_file
+
+    txt_w: Optional[TxtDealWriter] = None
+    lin_w: Optional[LinFileWriter] = None
+    try:
+        txt_w = TxtDealWriter(
+            txt_path, profile, append=append_txt, print_to_console=print_to_console,
+        )
+        lin_w = LinFileWriter(lin_path)
+    except OSError as exc:
+        if txt_w is not None:
+            txt_w.abort()
+        raise OutputError(f"Failed while streaming deals: {exc}") from exc
+
+    def _commit() -> None:
+        if not lin_w.records:
+            lin_w.write("\n")
+        try:
+            # Finish both temp files before renaming either: a failed flush
+            # or fsync then leaves both previous files in place.
+            txt_w.finish()
+            lin_w.finish()
+            txt_w.close()
+            lin_w.close()
+        except OSError as exc:
+            txt_w.abort()
+            lin_w.abort()
+            raise OutputError(f"Failed while streaming deals: {exc}") from exc
+
+    try:
+        for deal in deals:
+            txt_w.write_deal(deal)
+            lin_w.write_deal(_to_lin_deal(deal))
+    except OSError as exc:
+        txt_w.abort()
+        lin_w.abort()
+        raise OutputError(f"Failed while streaming deals: {exc}") from exc
+    except BaseException:
+        # Generator failed (or was interrupted): keep the boards written so far.
+        _commit()
+        raise
+    _commit()
+
+    if print_to_console:
+        print("")
+
+    return DealOutputSummary(
+        num_deals=lin_w.records,
+        txt_path=txt_path,
+        lin_path=lin_path,
+        warnings=[],
+    )
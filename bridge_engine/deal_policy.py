@@ -0,0 +1,435 @@
+# bridge_engine/deal_policy.py
+#
+# Per-combination dealing policies, measured offline.
+#
+# _compute_dealing_order() ranks seats with a fixed constraint-risk table and
+# HCP-range width, and every tight seat pre-allocates PRE_ALLOCATE_FRACTION
+# of its suit minima.  Neither is tuned to where a profile actually fails.
+# optimize_deal_policy() measures it instead: for each subprofile combination
+# the builder draws, it deals DEAL_POLICY_ATTEMPTS attempts with each of the
+# 24 dealing orders and each DEAL_POLICY_FRACTIONS value, attributing every
+# failed attempt to its first failing seat.  The leaders are re-measured on
+# a fresh seed (the best of 72 noisy rates is biased upwards), and the
+# confirmed winner is kept when it significantly beats the computed default
+# there too (DEAL_POLICY_MIN_Z).
+#
+# The result is a DealPolicy, saved as JSON in a sidecar file next to the
+# profile JSON (<profile file stem>.policy, see policy_path_for).  Like
+# combo_stats, a file is tagged with the profile's constraints
+# (deal_pool.pool_key) and ignored for any other profile.  The orchestrator
+# finds a profile's policy with find_policy() and passes it to
+# generate_deals(deal_policy=...); the v2 builder's _start_round() then uses
+# the policy's entry for each combination it selects.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import json
+import math
+import random
+from dataclasses import dataclass, field
+from itertools import permutations
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from .atomic_writer import AtomicBufferedWriter
+from .deal_generator_types import (
+    DEAL_POLICY_ATTEMPTS,
+    DEAL_POLICY_CONFIRM_FACTOR,
+    DEAL_POLICY_CONFIRM_TOP,
+    DEAL_POLICY_FRACTIONS,
+    DEAL_POLICY_MIN_Z,
+    DEAL_POLICY_SELECTION_SAMPLES,
+    PRE_ALLOCATE_FRACTION,
+    Seat,
+)
+from .deal_pool import pool_key
+from .hand_profile import HandProfile, SeatProfile, SubProfile
+
+# Sorted (seat, subprofile index) pairs of one subprofile selection.
+PolicyKey = Tuple[Tuple[Seat, int], ...]
+
+POLICY_SUFFIX = ".policy"
+
+_POLICY_FORMAT_VERSION = 1
+
+_SEATS: Tuple[Seat, ...] = ("N", "E", "S", "W")
+
+
+def policy_key(chosen_indices: Mapping[Seat, int]) -> PolicyKey:
+    """Hashable key for a subprofile selection."""
+    return tuple(sorted(chosen_indices.items()))
+
+
+@dataclass(frozen=True)
+class PolicyEntry:
+    """Winning dealing order and pre-allocation fraction for one combination."""
+
+    dealing_order: Tuple[Seat, ...]
+    pre_allocate_fraction: float
+    # Measured per-attempt success rates (winner, computed default).
+    success_rate: float = 0.0
+    baseline_rate: float = 0.0
+
+
+class DealPolicy:
+    """
+    PolicyEntry per subprofile combination.  Combinations without an entry
+    keep the computed dealing order and PRE_ALLOCATE_FRACTION.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[PolicyKey, PolicyEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, chosen_indices: Mapping[Seat, int]) -> Optional[PolicyEntry]:
+        """Entry for a subprofile selection, or None."""
+        return self._entries.get(policy_key(chosen_indices))
+
+    def set(self, chosen_indices: Mapping[Seat, int], entry: PolicyEntry) -> None:
+        self._entries[policy_key(chosen_indices)] = entry
+
+    # -- persistence ---------------------------------------------------------
+
+    def save(self, path: Path, profile: HandProfile) -> None:
+        """Write the policy as JSON (atomically), tagged with the profile key."""
+        rows = [
+            {
+                "indices": dict(key),
+                "dealing_order": list(entry.dealing_order),
+                "pre_allocate_fraction": entry.pre_allocate_fraction,
+                "success_rate": entry.success_rate,
+                "baseline_rate": entry.baseline_rate,
+            }
+            for key, entry in sorted(self._entries.items())
+        ]
+        payload = {
+            "format": _POLICY_FORMAT_VERSION,
+            "profile_key": pool_key(profile),
+            "profile_name": profile.profile_name,
+            "entries": rows,
+        }
+        with AtomicBufferedWriter(path) as writer:
+            writer.write(json.dumps(payload, indent=1) + "\n")
+
+    @classmethod
+    def load(cls, path: Path, profile: HandProfile) -> "DealPolicy":
+        """
+        Read a policy written by save().  Missing, unreadable, or
+        other-profile files give an empty policy.
+        """
+        policy = cls()
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return policy
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != _POLICY_FORMAT_VERSION
+            or payload.get("profile_key") != pool_key(profile)
+        ):
+            return policy
+        try:
+            for row in payload.get("entries", []):
+                order = tuple(row["dealing_order"])
+                if sorted(order) != sorted(_SEATS):
+                    raise ValueError(f"bad dealing order {order!r}")
+                policy.set(
+                    {seat: int(i) for seat, i in row["indices"].items()},
+                    PolicyEntry(
+                        dealing_order=order,
+                        pre_allocate_fraction=float(row["pre_allocate_fraction"]),
+                        success_rate=float(row.get("success_rate", 0.0)),
+                        baseline_rate=float(row.get("baseline_rate", 0.0)),
+                    ),
+                )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return cls()
+        return policy
+
+
+def policy_path_for(profile_path: Path) -> Path:
+    """Sidecar location of the policy for a profile JSON file."""
+    return Path(profile_path).with_suffix(POLICY_SUFFIX)
+
+
+def find_policy(directory: Path, profile: HandProfile) -> Optional[DealPolicy]:
+    """
+    The policy among the sidecars in directory that was measured for this
+    profile's constraints, or None.
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        return None
+    for path in sorted(directory.glob(f"*{POLICY_SUFFIX}")):
+        policy = DealPolicy.load(path, profile)
+        if len(policy):
+            return policy
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Offline optimizer
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class CandidateResult:
+    """Successes and first-failing-seat counts for one (order, fraction)."""
+
+    dealing_order: Tuple[Seat, ...]
+    pre_allocate_fraction: float
+    attempts: int
+    successes: int = 0
+    fail_as_seat: Dict[Seat, int] = field(default_factory=dict)
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 0.0
+
+    @property
+    def hardest_seat(self) -> Optional[Seat]:
+        """Seat failing first most often, or None if nothing failed."""
+        if not self.fail_as_seat:
+            return None
+        return max(self.fail_as_seat, key=lambda s: self.fail_as_seat[s])
+
+
+@dataclass
+class ComboResult:
+    """Optimizer outcome for one subprofile combination."""
+
+    chosen_indices: Dict[Seat, int]
+    share: float                # Fraction of sampled selections
+    baseline: CandidateResult   # Computed order, PRE_ALLOCATE_FRACTION
+    best: CandidateResult       # Confirmation-run winner
+
+    @property
+    def z_score(self) -> float:
+        """Two-proportion z of best over baseline (0.0 if undefined)."""
+        b, w = self.baseline, self.best
+        pooled = (b.successes + w.successes) / (b.attempts + w.attempts)
+        if pooled in (0.0, 1.0):
+            return 0.0
+        se = math.sqrt(pooled * (1 - pooled) * (1 / b.attempts + 1 / w.attempts))
+        return (w.success_rate - b.success_rate) / se
+
+    @property
+    def improved(self) -> bool:
+        return (
+            self.best is not self.baseline
+            and self.z_score >= DEAL_POLICY_MIN_Z
+        )
+
+
+def _first_unmatched_seat(
+    profile: HandProfile,
+    hands: Dict[Seat, List[int]],
+    chosen_subprofiles: Dict[Seat, SubProfile],
+    chosen_indices: Dict[Seat, int],
+    processing_order: List[Seat],
+    rs_pre_selections: Dict[Seat, List[str]],
+    rng: random.Random,
+) -> Optional[Seat]:
+    """First seat (in processing order) whose hand fails its subprofile."""
+    from .seat_viability import (
+        _compile_subprofile, _hand_suit_stats_ids, _match_seat_compiled,
+    )
+
+    random_suit_choices: Dict[Seat, List[str]] = dict(rs_pre_selections)
+    for seat in processing_order:
+        sp = profile.seat_profiles.get(seat)
+        if not isinstance(sp, SeatProfile) or not sp.subprofiles:
+            continue
+        lengths, suit_hcp = _hand_suit_stats_ids(hands[seat])
+        matched, chosen_rs, _reason = _match_seat_compiled(
+            profile,
+            seat,
+            _compile_subprofile(chosen_subprofiles[seat]),
+            chosen_indices[seat] + 1,
+            lengths,
+            suit_hcp,
+            random_suit_choices,
+            rng,
+            rs_pre_selections,
+        )
+        if not matched:
+            return seat
+        if chosen_rs is not None:
+            random_suit_choices[seat] = chosen_rs
+    return None
+
+
+def _measure_candidate(
+    profile: HandProfile,
+    chosen_subprofiles: Dict[Seat, SubProfile],
+    chosen_indices: Dict[Seat, int],
+    dealing_order: Tuple[Seat, ...],
+    fraction: float,
+    attempts: int,
+    seed: int,
+) -> CandidateResult:
+    """
+    Deal `attempts` attempts for one combination with a fixed dealing order
+    and fraction, the way the v2 builder does (RS suits re-drawn each
+    attempt).  Every candidate starts from the same seed.
+    """
+    from . import deal_generator as _dg
+    from .deal_generator_v2 import (
+        _build_deck_ids, _build_processing_order, _deal_exact_ids,
+        _deal_with_help_ids, _dispersion_check, _pre_select_rs_suits,
+    )
+
+    deal_hands = (
+        _deal_exact_ids if _dg.ENABLE_EXACT_SAMPLER else _deal_with_help_ids
+    )
+    order = list(dealing_order)
+    processing_order = _build_processing_order(profile, order, chosen_subprofiles)
+    result = CandidateResult(dealing_order, fraction, attempts)
+    rng = random.Random(seed)
+    for _ in range(attempts):
+        rs_pre_selections = _pre_select_rs_suits(rng, chosen_subprofiles)
+        tight_seats = _dispersion_check(
+            chosen_subprofiles, rs_pre_selections=rs_pre_selections
+        )
+        deck = _build_deck_ids()
+        rng.shuffle(deck)
+        hands, failed = deal_hands(
+            rng, deck, chosen_subprofiles, tight_seats, order,
+            rs_pre_selections=rs_pre_selections,
+            pre_allocate_fraction=fraction,
+        )
+        if hands is not None:
+            failed = _first_unmatched_seat(
+                profile, hands, chosen_subprofiles, chosen_indices,
+                processing_order, rs_pre_selections, rng,
+            )
+        if failed is None:
+            result.successes += 1
+        else:
+            result.fail_as_seat[failed] = result.fail_as_seat.get(failed, 0) + 1
+    return result
+
+
+def optimize_deal_policy(
+    profile: HandProfile,
+    attempts: int = DEAL_POLICY_ATTEMPTS,
+    seed: int = 0,
+    fractions: Tuple[float, ...] = DEAL_POLICY_FRACTIONS,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[DealPolicy, List[ComboResult]]:
+    """
+    Benchmark every dealing order and pre-allocation fraction for each
+    subprofile combination of profile.
+
+    Each candidate gets `attempts` attempts; the DEAL_POLICY_CONFIRM_TOP
+    leaders and the default are then re-measured on seed + 1 with
+    DEAL_POLICY_CONFIRM_FACTOR times as many, and the rates reported are
+    from that run.  Returns the policy (entries only for combinations whose
+    confirmed winner beat the default by DEAL_POLICY_MIN_Z standard errors)
+    and one ComboResult per combination,
+    most frequently selected first.  progress(done, total) is called after each
+    combination.  With ENABLE_EXACT_SAMPLER set only the order is searched
+    (the exact dealer does not pre-allocate).
+    """
+    from . import deal_generator as _dg
+    from .deal_generator_v2 import _compute_dealing_order
+
+    # Which combinations does the builder draw, and how often?
+    rng = random.Random(seed)
+    profile_dealing_order = list(profile.hand_dealing_order)
+    combos: Dict[PolicyKey, Tuple[Dict[Seat, SubProfile], Dict[Seat, int]]] = {}
+    counts: Dict[PolicyKey, int] = {}
+    for _ in range(DEAL_POLICY_SELECTION_SAMPLES):
+        subs, indices = _dg._select_subprofiles_for_board(
+            rng, profile, profile_dealing_order
+        )
+        key = policy_key(indices)
+        combos.setdefault(key, (subs, indices))
+        counts[key] = counts.get(key, 0) + 1
+
+    if _dg.ENABLE_EXACT_SAMPLER:
+        fractions = (PRE_ALLOCATE_FRACTION,)
+    elif PRE_ALLOCATE_FRACTION not in fractions:
+        fractions = tuple(fractions) + (PRE_ALLOCATE_FRACTION,)
+
+    policy = DealPolicy()
+    results: List[ComboResult] = []
+    ordered = sorted(combos, key=lambda k: (-counts[k], k))
+    for done, key in enumerate(ordered, 1):
+        subs, indices = combos[key]
+        default = (
+            tuple(_compute_dealing_order(subs, profile.dealer)),
+            PRE_ALLOCATE_FRACTION,
+        )
+        screened = sorted(
+            (
+                _measure_candidate(
+                    profile, subs, indices, order, fraction, attempts, seed
+                )
+                for order in permutations(_SEATS)
+                for fraction in fractions
+            ),
+            key=lambda r: -r.successes,
+        )
+        finalists = [default] + [
+            (r.dealing_order, r.pre_allocate_fraction)
+            for r in screened[:DEAL_POLICY_CONFIRM_TOP]
+            if (r.dealing_order, r.pre_allocate_fraction) != default
+        ]
+        confirmed = [
+            _measure_candidate(
+                profile, subs, indices, order, fraction,
+                attempts * DEAL_POLICY_CONFIRM_FACTOR, seed + 1,
+            )
+            for order, fraction in finalists
+        ]
+        baseline = confirmed[0]
+        # Most successes; ties keep the default (listed first).
+        best = max(confirmed, key=lambda r: r.successes)
+        combo = ComboResult(
+            chosen_indices=dict(indices),
+            share=counts[key] / DEAL_POLICY_SELECTION_SAMPLES,
+            baseline=baseline,
+            best=best,
+        )
+        if combo.improved:
+            policy.set(
+                indices,
+                PolicyEntry(
+                    dealing_order=best.dealing_order,
+                    pre_allocate_fraction=best.pre_allocate_fraction,
+                    success_rate=best.success_rate,
+                    baseline_rate=baseline.success_rate,
+                ),
+            )
+        results.append(combo)
+        if progress is not None:
+            progress(done, len(ordered))
+    return policy, results
+
+
+def format_policy_report(results: List[ComboResult]) -> str:
+    """Human-readable table of optimize_deal_policy() results."""
+    lines = [
+        f"  {'Combination':<20} {'Share':>6}  {'Default':<14} {'Rate':>7} "
+        f"{'Hardest':>7}  {'Best':<14} {'Rate':>7} {'Hardest':>7}",
+    ]
+
+    def _cand(r: CandidateResult) -> str:
+        return f"{''.join(r.dealing_order)} @{r.pre_allocate_fraction:.2f}"
+
+    for combo in results:
+        label = " ".join(
+            f"{seat}{i + 1}" for seat, i in sorted(combo.chosen_indices.items())
+        )
+        b = combo.baseline
+        w = combo.best if combo.improved else b
+        lines.append(
+            f"  {label:<20} {combo.share:>6.1%}  {_cand(b):<14} "
+            f"{b.success_rate:>7.2%} {b.hardest_seat or '-':>7}  "
+            f"{_cand(w) if combo.improved else '(default)':<14} "
+            f"{w.success_rate:>7.2%} {w.hardest_seat or '-':>7}"
+        )
+    return "\n".join(lines)
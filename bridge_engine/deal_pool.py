@@ -0,0 +1,350 @@
+# bridge_engine/deal_pool.py
+#
+# Persistent on-disk pool of already-accepted deals.
+#
+# Hard profiles can take seconds per board.  Drill sessions regenerate the
+# same profiles again and again, so boards built ahead of time (e.g. by a
+# background fill while the user reads the previous set) are kept on disk and
+# served first by generate_deals(pool=...).
+#
+# Layout: one append-only file per pool key under the pool directory,
+#   <dir>/<key>.pool
+# holding fixed-size 13-byte records.  A record stores the owner seat of each
+# of the 52 cards (2 bits per card id, N=0 E=1 S=2 W=3).  Records are taken
+# from the end of the file (LIFO) and the file is truncated, so a pool never
+# hands out the same deal twice.
+#
+# The key is a SHA-256 of everything that decides whether a deal is
+# acceptable for the profile (dealer, seat constraints, exclusions, NS role
+# mode, generator path flags) plus the seed policy.  Cosmetic fields (name,
+# description, tag, author, version, rotation default) do not change it.
+#
+# Pooled deals are stored un-rotated, as the builder produced them.  When
+# served they are renumbered and flow through the same
+# _apply_vulnerability_and_rotation() pass as freshly built boards.
+#
+# Only unseeded runs are served from the pool: seeded runs must reproduce the
+# same boards every time.
+#
+# Eviction is size-based LRU over whole pool files: every append/take touches
+# the file's mtime, and when the directory exceeds max_bytes the least
+# recently used files are deleted.
+#
+# The pool is safe against interrupted writes (a trailing partial record is
+# ignored and trimmed) and against concurrent use: every DealPool on the same
+# directory shares one thread lock (so a background fill left running by a
+# previous session cannot interleave with the next session's take), and
+# take/add also hold an exclusive OS lock on the pool file where fcntl is
+# available, so separate processes do not tear records either.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+try:  # POSIX only; elsewhere the per-directory thread lock still applies.
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+from .deal_generator_types import (
+    Deal, DealGenerationError, Seat,
+    _CARD_TO_ID, _ID_TO_CARD,
+)
+from .hand_profile import HandProfile
+
+# Bytes per pooled deal: 52 cards x 2 bits.
+POOL_RECORD_SIZE: int = 13
+
+# Default size cap for a pool directory (all profiles together).
+DEAL_POOL_MAX_BYTES: int = 16 * 1024 * 1024
+
+# Default number of boards the background fill keeps in a profile's pool.
+DEAL_POOL_FILL_TARGET: int = 100
+
+# Bump when the record format or the key recipe changes.
+_POOL_FORMAT_VERSION = 1
+
+_POOL_SUFFIX = ".pool"
+
+_SEATS: tuple = ("N", "E", "S", "W")
+_SEAT_INDEX: Dict[Seat, int] = {s: i for i, s in enumerate(_SEATS)}
+
+# HandProfile.to_dict() fields that affect which deals are acceptable.
+_KEY_FIELDS = (
+    "dealer",
+    "hand_dealing_order",
+    "ns_role_mode",
+    "seat_profiles",
+    "subprofile_exclusions",
+    "is_invariants_safety_profile",
+    "use_rs_w_only_path",
+)
+
+
+# ---------------------------------------------------------------------------
+# Keys and records
+# ---------------------------------------------------------------------------
+
+
+def pool_key(profile: HandProfile, seed_policy: str = "unseeded") -> str:
+    """
+    Stable hex key for a profile's constraints plus seed policy.
+    """
+    data = profile.to_dict()
+    payload = {
+        "format": _POOL_FORMAT_VERSION,
+        "seed_policy": seed_policy,
+        "constraints": {k: data.get(k) for k in _KEY_FIELDS},
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _encode_deal(deal: Deal) -> bytes:
+    """Pack a deal's hands into one 13-byte record."""
+    packed = 0
+    for seat, cards in deal.hands.items():
+        s = _SEAT_INDEX[seat]
+        for card in cards:
+            packed |= s << (2 * _CARD_TO_ID[card])
+    return packed.to_bytes(POOL_RECORD_SIZE, "little")
+
+
+def _decode_hands(record: bytes) -> Optional[Dict[Seat, List[str]]]:
+    """Unpack a record; None if it is not four 13-card hands."""
+    packed = int.from_bytes(record, "little")
+    hands: Dict[Seat, List[str]] = {s: [] for s in _SEATS}
+    for card_id in range(52):
+        hands[_SEATS[(packed >> (2 * card_id)) & 3]].append(_ID_TO_CARD[card_id])
+    if any(len(cards) != 13 for cards in hands.values()):
+        return None
+    return hands
+
+
+# ---------------------------------------------------------------------------
+# Locking
+# ---------------------------------------------------------------------------
+
+# One thread lock and one list of background fillers per pool directory,
+# shared by every DealPool instance pointing at it.
+_registry_lock = threading.Lock()
+_DIR_LOCKS: Dict[Path, threading.Lock] = {}
+_DIR_FILLERS: Dict[Path, List["PoolFiller"]] = {}
+
+
+def _dir_key(directory: Path) -> Path:
+    return Path(os.path.abspath(directory))
+
+
+def _lock_for(directory: Path) -> threading.Lock:
+    with _registry_lock:
+        return _DIR_LOCKS.setdefault(_dir_key(directory), threading.Lock())
+
+
+@contextmanager
+def _file_locked(f: BinaryIO) -> Iterator[None]:
+    """Hold an exclusive OS lock on an open pool file (no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+# ---------------------------------------------------------------------------
+# DealPool
+# ---------------------------------------------------------------------------
+
+
+class DealPool:
+    """
+    Directory of per-profile deal pools.
+
+    Pass an instance to generate_deals(pool=...) to serve unseeded runs from
+    it, and call fill() / fill_in_background() to top it up.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEAL_POOL_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = _lock_for(self.directory)
+
+    # -- paths -------------------------------------------------------------
+
+    def path_for(self, profile: HandProfile) -> Path:
+        return self.directory / f"{pool_key(profile)}{_POOL_SUFFIX}"
+
+    def count(self, profile: HandProfile) -> int:
+        """Number of complete deals pooled for this profile."""
+        try:
+            return self.path_for(profile).stat().st_size // POOL_RECORD_SIZE
+        except OSError:
+            return 0
+
+    # -- take / add ----------------------------------------------------------
+
+    def take(self, profile: HandProfile, n: int) -> List[Dict[Seat, List[str]]]:
+        """
+        Remove and return up to n pooled deals (as hands dicts).
+
+        Returns fewer (possibly none) if the pool is short.  A pool file
+        holding an invalid record is discarded whole.
+        """
+        if n <= 0:
+            return []
+        path = self.path_for(profile)
+        with self._lock:
+            try:
+                with open(path, "r+b") as f, _file_locked(f):
+                    size = f.seek(0, os.SEEK_END)
+                    records = size // POOL_RECORD_SIZE
+                    k = min(n, records)
+                    if k == 0:
+                        f.truncate(0)
+                        return []
+                    start = (records - k) * POOL_RECORD_SIZE
+                    f.seek(start)
+                    blob = f.read(k * POOL_RECORD_SIZE)
+                    f.truncate(start)
+            except FileNotFoundError:
+                return []
+            except OSError:
+                return []
+
+            taken: List[Dict[Seat, List[str]]] = []
+            for i in range(k - 1, -1, -1):
+                hands = _decode_hands(blob[i * POOL_RECORD_SIZE:(i + 1) * POOL_RECORD_SIZE])
+                if hands is None:
+                    path.unlink(missing_ok=True)
+                    return []
+                taken.append(hands)
+            return taken
+
+    def add(self, profile: HandProfile, deals: List[Deal]) -> None:
+        """Append accepted (un-rotated) deals to the profile's pool."""
+        if not deals:
+            return
+        path = self.path_for(profile)
+        blob = b"".join(_encode_deal(d) for d in deals)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(path, "ab") as f, _file_locked(f):
+                # Trim a partial record left by an interrupted write so the
+                # new records stay aligned.
+                size = f.seek(0, os.SEEK_END)
+                if size % POOL_RECORD_SIZE:
+                    f.truncate(size - size % POOL_RECORD_SIZE)
+                f.write(blob)
+            self._evict(keep=path)
+
+    def _evict(self, keep: Optional[Path] = None) -> None:
+        """Delete least recently used pool files until under max_bytes."""
+        try:
+            files = [
+                (p.stat().st_mtime, p.stat().st_size, p)
+                for p in self.directory.glob(f"*{_POOL_SUFFIX}")
+            ]
+        except OSError:
+            return
+        total = sum(size for _mtime, size, _p in files)
+        for _mtime, size, p in sorted(files, key=lambda t: t[0]):
+            if total <= self.max_bytes:
+                break
+            if p == keep:
+                continue
+            p.unlink(missing_ok=True)
+            total -= size
+
+    # -- filling -------------------------------------------------------------
+
+    def fill(
+        self,
+        profile: HandProfile,
+        target: int = DEAL_POOL_FILL_TARGET,
+        stop: Optional[threading.Event] = None,
+    ) -> int:
+        """
+        Build boards until the profile's pool holds `target` deals.
+
+        Boards come from the normal v2 retry loop on an OS-entropy RNG and
+        are appended one at a time, so an interrupted fill keeps what it
+        built.  Stops early when `stop` is set (polled before every builder
+        attempt, so a hard board is abandoned within one attempt) or a board
+        cannot be built.  Returns the number of deals added.
+        """
+        # Late import (as in v1/v2): the retry loop is read through the
+        # facade at call time.
+        from . import deal_generator as _dg
+
+        rng = random.Random()
+        added = 0
+        while self.count(profile) < target:
+            if stop is not None and stop.is_set():
+                break
+            try:
+                deal, rng, _elapsed, _reseeds = _dg._build_board_with_retries(
+                    rng, profile, 1, _dg._system_reseed,
+                    should_stop=stop.is_set if stop is not None else None,
+                )
+            except DealGenerationError:  # includes DealGenerationCancelled
+                break
+            self.add(profile, [deal])
+            added += 1
+        return added
+
+    def fill_in_background(
+        self,
+        profile: HandProfile,
+        target: int = DEAL_POOL_FILL_TARGET,
+    ) -> "PoolFiller":
+        """Start fill() on a daemon thread; returns the running filler."""
+        filler = PoolFiller(self, profile, target)
+        with _registry_lock:
+            fillers = _DIR_FILLERS.setdefault(_dir_key(self.directory), [])
+            fillers[:] = [f for f in fillers if f.is_alive()]
+            fillers.append(filler)
+        filler.start()
+        return filler
+
+    def stop_fillers(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop and join every background filler on this pool directory.
+
+        Call before taking from the pool so a fill started by an earlier
+        session does not keep building (and competing for the GIL) while the
+        next session runs.
+        """
+        with _registry_lock:
+            fillers = _DIR_FILLERS.pop(_dir_key(self.directory), [])
+        for filler in fillers:
+            filler.stop()
+        for filler in fillers:
+            filler.join(timeout)
+
+
+class PoolFiller(threading.Thread):
+    """Daemon thread running DealPool.fill(); stop() ends it between boards."""
+
+    def __init__(self, pool: DealPool, profile: HandProfile, target: int) -> None:
+        super().__init__(name="deal-pool-fill", daemon=True)
+        self.pool = pool
+        self.profile = profile
+        self.target = target
+        self.added = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        self.added = self.pool.fill(self.profile, self.target, stop=self._stop_event)
+
+    def stop(self) -> None:
+        self._stop_event.set()
@@ -0,0 +1,385 @@
+# bridge_engine/deal_service.py
+#
+# Local HTTP deal service: `python -m bridge_engine serve`.
+#
+# A stdlib ThreadingHTTPServer for callers (e.g. a club website) that would
+# otherwise start a CLI process per request.  Profiles are loaded and
+# validated once (batch_cli.ProfileCatalog, which also runs the viability
+# checks), and generation runs in a bounded process pool.  Each worker keeps
+# the first instance it receives of every profile, so the generator's
+# per-instance caches stay warm across requests: compiled subprofile
+# matchers (seat_viability._COMPILED_SUBPROFILES) and feasible-combination
+# tables (deal_generator._FEASIBLE_COMBO_INDEX).
+#
+# Endpoints (GET):
+#   /generate?profile=NAME&n=6&seed=S&format=json|lin&rotate=1|0
+#   /profiles   names and files of the loaded profiles
+#   /health
+#
+# Boards are built in per-board seeding mode, so a given (profile, n, seed,
+# rotate) always returns the same boards.  A request answers 504 once its
+# timeout passes, and the worker stops within one builder attempt (the
+# deadline is polled through the builder's should_stop hook).  While
+# max_pending requests are queued or running, new ones get 503.  Profiles are
+# read once per server run; restart the service to pick up profile edits.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .batch_cli import BatchError, ProfileCatalog
+from .deal_generator import DealGenerationError, DealSet
+from .deal_output import _convert_to_lin_deals
+from .deal_policy import DealPolicy
+from .deal_pool import pool_key
+from .hand_profile import HandProfile
+from .lin_encoder import encode_deal_to_lin_line
+from .profile_store import PROFILE_DIR_NAME, load_profile_dir
+
+SERVICE_DEFAULT_HOST = "127.0.0.1"
+SERVICE_DEFAULT_PORT = 8765
+
+# Generation processes (default: up to 4, never more than the CPU count).
+SERVICE_WORKERS: int = min(4, os.cpu_count() or 1)
+
+# Seconds a /generate request may take before it is answered with 504.
+SERVICE_TIMEOUT_SECONDS: float = 30.0
+
+# Largest n accepted by /generate.
+SERVICE_MAX_BOARDS: int = 100
+
+# Requests queued or running at once, per worker, before 503.
+SERVICE_PENDING_PER_WORKER: int = 4
+
+
+class ServiceError(Exception):
+    """A request the service cannot answer; ``status`` is the HTTP code."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+# ---------------------------------------------------------------------------
+# Worker process side
+# ---------------------------------------------------------------------------
+
+# pool_key(profile) -> (profile, deal_policy).  The first instance received
+# is kept so the generator's id()-keyed caches keep hitting.
+_WORKER_PROFILES: Dict[str, Tuple[HandProfile, Optional[DealPolicy]]] = {}
+
+
+def _init_worker() -> None:
+    """Import the generator up front so the first request is not slower."""
+    from . import deal_generator  # noqa: F401
+
+
+def _generate_in_worker(
+    key: str,
+    profile: HandProfile,
+    deal_policy: Optional[DealPolicy],
+    seed: int,
+    num_deals: int,
+    rotate: bool,
+    deadline: float,
+) -> DealSet:
+    """Build one request's boards in a pool worker (per-board seeding)."""
+    from . import deal_generator as dg
+
+    profile, deal_policy = _WORKER_PROFILES.setdefault(key, (profile, deal_policy))
+    return dg._generate_deals_per_board(
+        seed, profile, num_deals, rotate, 1,
+        deal_policy=deal_policy, deadline=deadline,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+
+class DealService:
+    """Warm profiles plus a bounded generation pool; see the module header."""
+
+    def __init__(
+        self,
+        profiles_dir: Path = Path(PROFILE_DIR_NAME),
+        *,
+        workers: int = SERVICE_WORKERS,
+        timeout: float = SERVICE_TIMEOUT_SECONDS,
+        max_boards: int = SERVICE_MAX_BOARDS,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self.profiles_dir = Path(profiles_dir)
+        self.workers = workers
+        self.timeout = timeout
+        self.max_boards = max_boards
+        self._catalog = ProfileCatalog(self.profiles_dir)
+        self._catalog_lock = threading.Lock()
+        self._keys: Dict[int, str] = {}     # id(profile) -> pool_key(profile)
+        self._slots = threading.BoundedSemaphore(
+            SERVICE_PENDING_PER_WORKER * workers if max_pending is None else max_pending
+        )
+        # spawn: request threads must never fork a threaded server.
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    def preload(self) -> List[str]:
+        """
+        Load and validate every canonical profile in profiles_dir and start
+        the workers.  Returns the names that loaded; invalid profiles are
+        reported on stderr and answer 404 until the service restarts.
+        """
+        names: List[str] = []
+        for path, _profile in load_profile_dir(self.profiles_dir):
+            try:
+                names.append(self.resolve(path.name)[1].profile_name)
+            except BatchError as exc:
+                print(f"WARNING: {exc}", file=sys.stderr)
+        self._pool.submit(_init_worker).result()
+        return names
+
+    def resolve(
+        self, ref: str,
+    ) -> Tuple[Path, HandProfile, Optional[DealPolicy], str]:
+        """Return (path, validated profile, policy, pool key) for a reference."""
+        with self._catalog_lock:
+            path, profile, deal_policy = self._catalog.resolve(ref)
+            key = self._keys.get(id(profile))
+            if key is None:
+                key = self._keys[id(profile)] = pool_key(profile)
+        return path, profile, deal_policy, key
+
+    def profiles(self) -> List[Dict[str, str]]:
+        """The profiles resolved so far (all of them after preload())."""
+        with self._catalog_lock:
+            loaded = {id(p): (path, p) for path, p, _ in self._catalog._by_path.values()}
+        return [
+            {"profile_name": p.profile_name, "file": path.name}
+            for path, p in sorted(loaded.values(), key=lambda item: item[0].name)
+        ]
+
+    def generate(
+        self, ref: str, num_deals: int, seed: int, rotate: Optional[bool] = None,
+    ) -> Tuple[HandProfile, bool, DealSet]:
+        """
+        Build num_deals boards for a profile reference in the pool.
+
+        Returns (profile, rotate used, DealSet).  Raises ServiceError with
+        404 (unknown or invalid profile), 503 (too many requests), 504
+        (timeout) or 500 (generation failed).
+        """
+        try:
+            _path, profile, deal_policy, key = self.resolve(ref)
+        except BatchError as exc:
+            raise ServiceError(404, str(exc)) from exc
+        if rotate is None:
+            rotate = getattr(profile, "rotate_deals_by_default", True)
+
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            raise ServiceError(503, "too many requests in progress; retry later")
+        deadline = time.time() + self.timeout
+        try:
+            future: Future = self._pool.submit(
+                _generate_in_worker, key, profile, deal_policy,
+                seed, num_deals, rotate, deadline,
+            )
+        except Exception:
+            slots.release()
+            raise
+        # The slot is held until the worker is really done, timed out or not.
+        future.add_done_callback(lambda _f: slots.release())
+        try:
+            return profile, rotate, future.result(timeout=self.timeout)
+        except (FutureTimeoutError, TimeoutError) as exc:
+            future.cancel()
+            raise ServiceError(
+                504, f"generation exceeded {self.timeout:g}s ({exc or 'still running'})"
+            ) from exc
+        except DealGenerationError as exc:
+            raise ServiceError(500, f"generation failed: {exc}") from exc
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ---------------------------------------------------------------------------
+# HTTP layer
+# ---------------------------------------------------------------------------
+
+
+def deal_set_to_json(profile: HandProfile, seed: int, rotate: bool, deal_set: DealSet) -> Dict[str, Any]:
+    return {
+        "profile": profile.profile_name,
+        "seed": seed,
+        "rotate": rotate,
+        "boards": [
+            {
+                "board": deal.board_number,
+                "dealer": deal.dealer,
+                "vulnerability": deal.vulnerability,
+                "hands": deal.hands,
+            }
+            for deal in deal_set.deals
+        ],
+    }
+
+
+def deal_set_to_lin(deal_set: DealSet) -> str:
+    return "".join(
+        encode_deal_to_lin_line(d) + "\n" for d in _convert_to_lin_deals(deal_set.deals)
+    )
+
+
+def _query_int(query: Dict[str, List[str]], name: str, default: Optional[int],
+               minimum: int, maximum: Optional[int] = None) -> Optional[int]:
+    if name not in query:
+        return default
+    try:
+        value = int(query[name][-1])
+    except ValueError:
+        raise ServiceError(400, f"{name} must be an integer") from None
+    if value < minimum or (maximum is not None and value > maximum):
+        bound = f"between {minimum} and {maximum}" if maximum is not None else f">= {minimum}"
+        raise ServiceError(400, f"{name} must be {bound}")
+    return value
+
+
+class DealHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], service: DealService,
+                 quiet: bool = False) -> None:
+        super().__init__(address, DealRequestHandler)
+        self.service = service
+        self.quiet = quiet
+
+
+class DealRequestHandler(BaseHTTPRequestHandler):
+    server: DealHTTPServer
+
+    def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+        url = urlsplit(self.path)
+        try:
+            if url.path == "/health":
+                self._send_json(200, {"status": "ok"})
+            elif url.path == "/profiles":
+                self._send_json(200, {"profiles": self.server.service.profiles()})
+            elif url.path == "/generate":
+                self._generate(parse_qs(url.query))
+            else:
+                raise ServiceError(404, f"unknown path {url.path}")
+        except ServiceError as exc:
+            self._send_json(exc.status, {"error": str(exc)})
+
+    def _generate(self, query: Dict[str, List[str]]) -> None:
+        service = self.server.service
+        if not query.get("profile"):
+            raise ServiceError(400, "profile is required")
+        num_deals = _query_int(query, "n", 6, 1, service.max_boards)
+        seed = _query_int(query, "seed", None, 0)
+        if seed is None:
+            seed = random.randint(1, 2**31 - 1)
+        rotate: Optional[bool] = None
+        if "rotate" in query:
+            raw = query["rotate"][-1].lower()
+            if raw not in ("1", "0", "true", "false"):
+                raise ServiceError(400, "rotate must be 1/0 or true/false")
+            rotate = raw in ("1", "true")
+        fmt = query.get("format", ["json"])[-1]
+        if fmt not in ("json", "lin"):
+            raise ServiceError(400, "format must be json or lin")
+
+        start = time.monotonic()
+        profile, rotate, deal_set = service.generate(
+            query["profile"][-1], num_deals, seed, rotate
+        )
+        if fmt == "lin":
+            self._send(200, deal_set_to_lin(deal_set).encode("utf-8"),
+                       "text/plain; charset=utf-8")
+            return
+        payload = deal_set_to_json(profile, seed, rotate, deal_set)
+        payload["elapsed_s"] = round(time.monotonic() - start, 4)
+        self._send_json(200, payload)
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m bridge_engine serve",
+        description="Serve deals over local HTTP with profiles kept warm in memory.",
+    )
+    parser.add_argument("--host", default=SERVICE_DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=SERVICE_DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=SERVICE_WORKERS,
+                        help=f"generation processes (default {SERVICE_WORKERS})")
+    parser.add_argument("--timeout", type=float, default=SERVICE_TIMEOUT_SECONDS,
+                        help="seconds per /generate request before 504")
+    parser.add_argument("--max-boards", type=int, default=SERVICE_MAX_BOARDS,
+                        help="largest n accepted by /generate")
+    parser.add_argument("--profiles-dir", type=Path, default=Path(PROFILE_DIR_NAME))
+    parser.add_argument("-q", "--quiet", action="store_true", help="no request log")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point of the `serve` subcommand; runs until interrupted."""
+    args = build_parser().parse_args(argv)
+    service = DealService(
+        args.profiles_dir, workers=args.workers,
+        timeout=args.timeout, max_boards=args.max_boards,
+    )
+    try:
+        names = service.preload()
+        server = DealHTTPServer((args.host, args.port), service, quiet=args.quiet)
+        host, port = server.server_address[:2]
+        print(
+            f"Serving {len(names)} profile(s) on http://{host}:{port} "
+            f"with {service.workers} worker(s); Ctrl-C to stop."
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+    finally:
+        service.close()
+    return 0
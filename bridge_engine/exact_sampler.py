@@ -0,0 +1,330 @@
+# bridge_engine/exact_sampler.py
+#
+# Exact constructive sampler for a seat's standard constraints.
+#
+# The v2 shape help (_deal_with_help_ids) pre-allocates part of each tight
+# seat's suit minima, random-fills the rest and relies on matching to reject
+# the misses.  Seats needing e.g. a 6-card suit inside a narrow HCP window
+# burn thousands of attempts that way.  This module instead draws a seat's
+# 13 cards uniformly from exactly the hands, within the cards still in the
+# deck, that satisfy its per-suit (cards, HCP) windows and total HCP window.
+#
+# Counting: in the remaining deck a suit is described by which of A/K/Q/J
+# are still there (a 4-bit mask) and how many spot cards are left.  For that
+# (honor mask, spots) pair, _holding_counts()[k][h] counts the k-card
+# holdings with h HCP: a sum over honor subsets of C(spots, k - |subset|).
+# A forward convolution over the four suits gives the number of matching
+# hands per (cards, HCP) state; sampling walks it backwards, choosing each
+# suit's (length, HCP) in proportion to the hands it leaves, then an honor
+# subset and a uniform set of spot cards.  Exact and rejection-free.
+#
+# The convolution is three big-int multiplications (see _layout).  Both
+# tables are cached: holding counts per (honor mask, spots), and the
+# convolution per (suit states, windows), which always hits for the first
+# seat dealt from a full deck.
+#
+# Used by the v2 builder's _deal_exact_ids when ENABLE_EXACT_SAMPLER is set.
+# The same holding counts drive sample_suit_holding(), which the v2 RS
+# pre-allocation uses to draw a suit's cards at a target HCP in one pass.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import random
+from functools import lru_cache
+from math import comb
+from typing import List, Optional, Tuple
+
+from .deal_generator_types import _ID_SUIT
+from .hand_combinatorics import SuitWindow
+
+# HCP of rank index 0..3 (A, K, Q, J); ranks 4..12 are spot cards.
+_HONOR_HCP: Tuple[int, ...] = (4, 3, 2, 1)
+_NUM_HONORS = 4
+
+_MAX_SUIT_HCP = 10
+_MAX_HAND_HCP = 37
+_DECK_HCP = 40
+
+# Generating polynomials in (cards, HCP) are packed into Python ints, one
+# _SLOT_BYTES-wide coefficient per slot at index cards * stride + hcp, so a
+# suit-by-suit convolution is a single big-int multiplication.  The stride
+# leaves _MAX_SUIT_HCP of headroom above the hand's HCP cap, and after every
+# product only slots with <= 13 cards and <= cap HCP are kept (_layout), so
+# the next suit's HCP never spills into the next card count.  A kept
+# coefficient counts partial hands of at most 13 cards (<= C(52, 13) <
+# 2**40); dropped slots may overflow, but carries only run upwards.
+_SLOT_BYTES = 5
+_SLOT_BITS = 8 * _SLOT_BYTES
+
+# One suit of the remaining deck: (available honor mask, spot cards left).
+SuitState = Tuple[int, int]
+
+# Non-zero (cards, hcp, ways) holdings of one suit inside a window.
+_Terms = Tuple[Tuple[int, int, int], ...]
+
+
+@lru_cache(maxsize=None)
+def _honor_subsets(honor_mask: int) -> Tuple[Tuple[int, int, int], ...]:
+    """(subset mask, size, HCP) for every subset of the available honors."""
+    subsets = []
+    for sub in range(1 << _NUM_HONORS):
+        if sub & ~honor_mask:
+            continue
+        size = sub.bit_count()
+        hcp = sum(_HONOR_HCP[r] for r in range(_NUM_HONORS) if sub >> r & 1)
+        subsets.append((sub, size, hcp))
+    return tuple(subsets)
+
+
+@lru_cache(maxsize=None)
+def _holding_counts(honor_mask: int, spots: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    counts[k][h]: number of k-card holdings with h HCP from a suit with the
+    given honors and number of spot cards available.
+    """
+    counts = [[0] * (_MAX_SUIT_HCP + 1) for _ in range(14)]
+    for _sub, size, hcp in _honor_subsets(honor_mask):
+        for extra in range(spots + 1):
+            counts[size + extra][hcp] += comb(spots, extra)
+    return tuple(tuple(row) for row in counts)
+
+
+@lru_cache(maxsize=None)
+def _layout(max_hcp: int) -> Tuple[int, int]:
+    """(stride, keep-mask) of packed polynomials for a hand HCP cap."""
+    # A product adds at most one suit's HCP to a kept slot, and no holding
+    # of the whole deck exceeds 40 HCP.
+    stride = min(max_hcp + _MAX_SUIT_HCP, _DECK_HCP) + 1
+    slot = (1 << _SLOT_BITS) - 1
+    mask = 0
+    for cards in range(14):
+        for hcp in range(max_hcp + 1):
+            mask |= slot << (_SLOT_BITS * (cards * stride + hcp))
+    return stride, mask
+
+
+@lru_cache(maxsize=4096)
+def _suit_terms(
+    state: SuitState, window: SuitWindow, stride: int,
+) -> Tuple[_Terms, int]:
+    """
+    Holdings of one suit that fit its window, as (cards, hcp, ways) terms
+    and as a packed polynomial.
+    """
+    lo_c, hi_c, lo_h, hi_h = window
+    counts = _holding_counts(*state)
+    terms = []
+    poly = 0
+    for k in range(max(lo_c, 0), min(hi_c, 13) + 1):
+        row = counts[k]
+        for h in range(max(lo_h, 0), min(hi_h, _MAX_SUIT_HCP) + 1):
+            if row[h]:
+                terms.append((k, h, row[h]))
+                poly |= row[h] << (_SLOT_BITS * (k * stride + h))
+    return tuple(terms), poly
+
+
+@lru_cache(maxsize=4096)
+def _convolve(
+    states: Tuple[SuitState, SuitState, SuitState, SuitState],
+    windows: Tuple[SuitWindow, SuitWindow, SuitWindow, SuitWindow],
+    max_hcp: int,
+) -> Tuple[Tuple[_Terms, ...], Tuple[bytes, ...], int]:
+    """
+    Forward convolution over the four suits, HCP capped at max_hcp.
+
+    Returns (terms per suit, stages, stride) where stages[i] holds the
+    packed coefficients (read with _coef) of suits 0..i: the number of
+    partial hands per (cards, hcp) slot.
+    """
+    stride, mask = _layout(max_hcp)
+    size = _SLOT_BYTES * 14 * stride
+    terms: List[_Terms] = []
+    stages: List[bytes] = []
+    poly = 1
+    for state, window in zip(states, windows):
+        suit_terms, suit_poly = _suit_terms(state, window, stride)
+        terms.append(suit_terms)
+        poly = (poly * suit_poly) & mask
+        stages.append(poly.to_bytes(size, "little"))
+    return tuple(terms), tuple(stages), stride
+
+
+def _coef(stage: bytes, stride: int, cards: int, hcp: int) -> int:
+    """Coefficient of the (cards, hcp) slot in a packed stage."""
+    if not (0 <= hcp < stride and 0 <= cards <= 13):
+        return 0
+    at = _SLOT_BYTES * (cards * stride + hcp)
+    return int.from_bytes(stage[at:at + _SLOT_BYTES], "little")
+
+
+def _deck_suit_states(
+    deck: List[int],
+) -> Tuple[Tuple[SuitState, ...], Tuple[List[int], ...], Tuple[List[int], ...]]:
+    """Per-suit (honor mask, spots) plus the honor and spot card ids."""
+    id_suit = _ID_SUIT
+    honors: Tuple[List[int], ...] = ([], [], [], [])
+    spots: Tuple[List[int], ...] = ([], [], [], [])
+    masks = [0, 0, 0, 0]
+    for c in deck:
+        s = id_suit[c]
+        r = c - 13 * s
+        if r < _NUM_HONORS:
+            masks[s] |= 1 << r
+            honors[s].append(c)
+        else:
+            spots[s].append(c)
+    states = tuple((masks[s], len(spots[s])) for s in range(4))
+    return states, honors, spots
+
+
+def matching_hand_count(
+    deck: List[int],
+    windows: Tuple[SuitWindow, SuitWindow, SuitWindow, SuitWindow],
+    total_min_hcp: int = 0,
+    total_max_hcp: int = _MAX_HAND_HCP,
+) -> int:
+    """Number of 13-card hands from deck that satisfy the windows."""
+    hi = min(total_max_hcp, _MAX_HAND_HCP)
+    states, _honors, _spots = _deck_suit_states(deck)
+    _terms, stages, stride = _convolve(states, windows, hi)
+    return sum(
+        _coef(stages[3], stride, 13, h) for h in range(max(total_min_hcp, 0), hi + 1)
+    )
+
+
+def _weighted_pick(rng: random.Random, weights: List[int]) -> int:
+    """Index drawn with probability weights[i] / sum(weights)."""
+    r = rng.randrange(sum(weights))
+    for i, w in enumerate(weights):
+        r -= w
+        if r < 0:
+            return i
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def _draw_holding(
+    rng: random.Random,
+    honor_mask: int,
+    honors: List[int],
+    spots: List[int],
+    cards: int,
+    hcp: int,
+) -> List[int]:
+    """
+    Uniform k-card holding with exactly hcp HCP from one suit's available
+    honors and spots (the (cards, hcp) count must be non-zero).
+    """
+    subsets = [
+        (sub, size)
+        for sub, size, h in _honor_subsets(honor_mask)
+        if h == hcp and size <= cards and cards - size <= len(spots)
+    ]
+    sub, size = subsets[
+        _weighted_pick(
+            rng, [comb(len(spots), cards - size) for _sub, size in subsets]
+        )
+    ]
+    holding = [c for c in honors if sub >> (c % 13) & 1]
+    holding.extend(rng.sample(spots, cards - size))
+    return holding
+
+
+def sample_suit_holding(
+    rng: random.Random,
+    available: List[int],
+    cards: int,
+    min_hcp: int,
+    max_hcp: int,
+) -> Optional[List[int]]:
+    """
+    Draw a cards-card subset of one suit's available card ids uniformly
+    among those with min_hcp..max_hcp HCP.
+
+    Returns None if no such subset exists (available is never mutated).
+    """
+    if cards > len(available):
+        return None
+    honor_mask = 0
+    honors: List[int] = []
+    spots: List[int] = []
+    for c in available:
+        r = c % 13
+        if r < _NUM_HONORS:
+            honor_mask |= 1 << r
+            honors.append(c)
+        else:
+            spots.append(c)
+    row = _holding_counts(honor_mask, len(spots))[cards]
+    hcps = range(max(min_hcp, 0), min(max_hcp, _MAX_SUIT_HCP) + 1)
+    weights = [row[h] for h in hcps]
+    if not any(weights):
+        return None
+    hcp = hcps[_weighted_pick(rng, weights)]
+    return _draw_holding(rng, honor_mask, honors, spots, cards, hcp)
+
+
+def sample_hand_exact(
+    rng: random.Random,
+    deck: List[int],
+    windows: Tuple[SuitWindow, SuitWindow, SuitWindow, SuitWindow],
+    total_min_hcp: int = 0,
+    total_max_hcp: int = _MAX_HAND_HCP,
+) -> Optional[List[int]]:
+    """
+    Draw 13 card ids uniformly from the hands in deck that satisfy the
+    windows, and remove them from deck.
+
+    Args:
+        rng: Random number generator.
+        deck: Remaining card ids (mutated: the hand is removed, order of
+            the rest preserved).
+        windows: One (min_cards, max_cards, min_hcp, max_hcp) per suit in
+            S, H, D, C order (hand_combinatorics.subprofile_suit_windows).
+        total_min_hcp / total_max_hcp: Total HCP window.
+
+    Returns:
+        The hand, or None (deck untouched) if no hand in deck qualifies.
+    """
+    lo = max(total_min_hcp, 0)
+    hi = min(total_max_hcp, _MAX_HAND_HCP)
+    if lo > hi:
+        return None
+    states, honors, spots = _deck_suit_states(deck)
+    all_terms, stages, stride = _convolve(states, windows, hi)
+
+    hcps = list(range(lo, hi + 1))
+    weights = [_coef(stages[3], stride, 13, h) for h in hcps]
+    if not any(weights):
+        return None
+    cards, hcp = 13, hcps[_weighted_pick(rng, weights)]
+
+    # Walk back: pick suit i's (cards, hcp) in proportion to the partial
+    # hands of suits 0..i-1 it leaves.
+    picks: List[Tuple[int, int]] = [(0, 0)] * 4
+    for i in range(3, 0, -1):
+        prev = stages[i - 1]
+        options = []
+        weights = []
+        for k, h, n in all_terms[i]:
+            if k > cards or h > hcp:
+                continue
+            at = _SLOT_BYTES * ((cards - k) * stride + hcp - h)
+            ways = int.from_bytes(prev[at:at + _SLOT_BYTES], "little")
+            if ways:
+                options.append((k, h))
+                weights.append(ways * n)
+        k, h = options[_weighted_pick(rng, weights)]
+        picks[i] = (k, h)
+        cards -= k
+        hcp -= h
+    picks[0] = (cards, hcp)  # Suit 0 takes what is left.
+
+    hand: List[int] = []
+    for s, (k, h) in enumerate(picks):
+        if k:
+            hand.extend(_draw_holding(rng, states[s][0], honors[s], spots[s], k, h))
+
+    chosen = set(hand)
+    deck[:] = [c for c in deck if c not in chosen]
+    return hand
@@ -0,0 +1,179 @@
+# bridge_engine/hand_combinatorics.py
+#
+# Exact hand-acceptance probabilities for a subprofile's constraints.
+#
+# Every 13-card hand is four suit holdings; a holding is a subset of the 13
+# ranks, so it is fully described by (length, HCP).  _SUIT_KH_COUNTS[k][h]
+# counts the k-card holdings of one suit with h HCP.  Counting the hands that
+# satisfy per-suit (cards, HCP) windows plus a total HCP window is then a small
+# convolution over the four suits -- exact, no sampling, and cheap enough to
+# run whenever a subprofile combination is (re)selected.  Results are cached
+# on the integer window tuple.
+#
+# Used by the v2 builder's _dispersion_check (shape only: which seats get
+# shape help) and _compute_dealing_order (shape + HCP: which seats are dealt
+# first).
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+from functools import lru_cache
+from math import comb
+from typing import Dict, List, Optional, Tuple
+
+from .deal_generator_types import _RANKSET_HCP
+
+# (min_cards, max_cards, min_hcp, max_hcp) for one suit.
+SuitWindow = Tuple[int, int, int, int]
+
+# Number of distinct 13-card hands.
+TOTAL_HANDS: int = comb(52, 13)
+
+# Maximum HCP in one suit (AKQJ) and in one hand.
+_MAX_SUIT_HCP = 10
+_MAX_HAND_HCP = 37
+
+_SUIT_ATTRS: Tuple[str, ...] = ("spades", "hearts", "diamonds", "clubs")
+_SUIT_LETTERS: Tuple[str, ...] = ("S", "H", "D", "C")
+
+_OPEN_WINDOW: SuitWindow = (0, 13, 0, _MAX_SUIT_HCP)
+
+
+def _build_suit_kh_counts() -> Tuple[Tuple[int, ...], ...]:
+    counts = [[0] * (_MAX_SUIT_HCP + 1) for _ in range(14)]
+    for ranks, hcp in enumerate(_RANKSET_HCP):
+        counts[ranks.bit_count()][hcp] += 1
+    return tuple(tuple(row) for row in counts)
+
+
+# _SUIT_KH_COUNTS[k][h] = number of k-card holdings of one suit with h HCP.
+_SUIT_KH_COUNTS: Tuple[Tuple[int, ...], ...] = _build_suit_kh_counts()
+
+
+@lru_cache(maxsize=4096)
+def hand_counts_by_hcp(
+    windows: Tuple[SuitWindow, SuitWindow, SuitWindow, SuitWindow],
+) -> Tuple[int, ...]:
+    """
+    Count 13-card hands whose suits satisfy the given windows, by total HCP.
+
+    Args:
+        windows: One (min_cards, max_cards, min_hcp, max_hcp) per suit in
+            S, H, D, C order.
+
+    Returns:
+        Tuple of 38 counts; entry h is the number of qualifying hands with
+        exactly h HCP.  sum() of the open-window result is C(52, 13).
+    """
+    # state: (cards so far, hcp so far) -> number of partial hands
+    states: Dict[Tuple[int, int], int] = {(0, 0): 1}
+    for i, (lo_c, hi_c, lo_h, hi_h) in enumerate(windows):
+        lo_c = max(lo_c, 0)
+        hi_h = min(hi_h, _MAX_SUIT_HCP)
+        lo_h = max(lo_h, 0)
+        last = i == 3
+        nxt: Dict[Tuple[int, int], int] = {}
+        for (cards, hcp), ways in states.items():
+            # The last suit takes exactly the remaining cards.
+            k_lo = max(lo_c, 13 - cards) if last else lo_c
+            for k in range(k_lo, min(hi_c, 13 - cards) + 1):
+                row = _SUIT_KH_COUNTS[k]
+                for h in range(lo_h, hi_h + 1):
+                    n = row[h]
+                    if n:
+                        key = (cards + k, hcp + h)
+                        nxt[key] = nxt.get(key, 0) + ways * n
+        states = nxt
+        if not states:
+            break
+
+    by_hcp = [0] * (_MAX_HAND_HCP + 1)
+    for (cards, hcp), ways in states.items():
+        if cards == 13:
+            by_hcp[hcp] += ways
+    return tuple(by_hcp)
+
+
+def window_probability(
+    windows: Tuple[SuitWindow, SuitWindow, SuitWindow, SuitWindow],
+    total_min_hcp: int = 0,
+    total_max_hcp: int = _MAX_HAND_HCP,
+) -> float:
+    """
+    Exact probability that a random 13-card hand satisfies the suit windows
+    and the total HCP window.
+    """
+    lo = max(total_min_hcp, 0)
+    hi = min(total_max_hcp, _MAX_HAND_HCP)
+    if lo > hi:
+        return 0.0
+    counts = hand_counts_by_hcp(windows)
+    return sum(counts[lo:hi + 1]) / TOTAL_HANDS
+
+
+def _range_window(sr: object) -> SuitWindow:
+    """Read a SuitRange-like object (duck-typed, missing fields = open)."""
+    if sr is None:
+        return _OPEN_WINDOW
+    return (
+        getattr(sr, "min_cards", 0),
+        getattr(sr, "max_cards", 13),
+        getattr(sr, "min_hcp", 0),
+        getattr(sr, "max_hcp", _MAX_SUIT_HCP),
+    )
+
+
+def _intersect(a: SuitWindow, b: SuitWindow) -> SuitWindow:
+    return (max(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), min(a[3], b[3]))
+
+
+def subprofile_suit_windows(
+    sub: object,
+    rs_ranges: Optional[Dict[str, object]] = None,
+) -> Tuple[SuitWindow, SuitWindow, SuitWindow, SuitWindow]:
+    """
+    Per-suit windows of a subprofile's standard constraints.
+
+    When rs_ranges (suit letter -> SuitRange, e.g. from _resolve_rs_ranges
+    for pre-selected RS suits) is given, those ranges are intersected in.
+    """
+    std = getattr(sub, "standard", None)
+    windows: List[SuitWindow] = []
+    for attr, letter in zip(_SUIT_ATTRS, _SUIT_LETTERS):
+        w = _range_window(getattr(std, attr, None))
+        if rs_ranges and letter in rs_ranges:
+            w = _intersect(w, _range_window(rs_ranges[letter]))
+        windows.append(w)
+    return (windows[0], windows[1], windows[2], windows[3])
+
+
+def subprofile_shape_probability(
+    sub: object,
+    rs_ranges: Optional[Dict[str, object]] = None,
+) -> float:
+    """
+    Exact probability that a random hand meets the subprofile's suit-length
+    windows (all four suits jointly; HCP ignored).
+    """
+    windows = subprofile_suit_windows(sub, rs_ranges)
+    return window_probability(
+        tuple((w[0], w[1], 0, _MAX_SUIT_HCP) for w in windows)
+    )
+
+
+def subprofile_acceptance_probability(
+    sub: object,
+    rs_ranges: Optional[Dict[str, object]] = None,
+) -> float:
+    """
+    Exact probability that a random hand meets the subprofile's standard
+    constraints: suit-length and suit-HCP windows plus the total HCP range.
+
+    RS ranges are included when given; PC/OC constraints are not (their
+    suit depends on another seat's choice).
+    """
+    std = getattr(sub, "standard", None)
+    return window_probability(
+        subprofile_suit_windows(sub, rs_ranges),
+        getattr(std, "total_min_hcp", 0),
+        getattr(std, "total_max_hcp", _MAX_HAND_HCP),
+    )
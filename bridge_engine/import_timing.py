@@ -0,0 +1,145 @@
+# bridge_engine/import_timing.py
+#
+# Import-time breakdown behind `python -m bridge_engine --profile-import-time`.
+#
+# A fresh interpreter runs under `python -X importtime` and imports what each
+# stage of a session needs, in the order a user reaches them.  The output is
+# split per stage, so the report shows what the main menu costs at start-up
+# and what each feature adds on first use.  Most of the package is deferred
+# (see orchestrator's deferred imports and deal_generator.__getattr__); this
+# report is the way to check that it stays deferred.
+# ---------------------------------------------------------------------------
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+# (label, statement run in the child interpreter), in session order.
+IMPORT_STAGES: Tuple[Tuple[str, str], ...] = (
+    ("Start-up (main menu)", "import bridge_engine.orchestrator"),
+    (
+        "Deal generation (first session)",
+        "bridge_engine.orchestrator._import_deferred()",
+    ),
+    ("Profile management (first visit)", "import bridge_engine.profile_cli"),
+    (
+        "Admin tools (first visit)",
+        "import bridge_engine.lin_tools, bridge_engine.profile_diagnostic",
+    ),
+)
+
+# Modules listed per stage in the report (largest self time first).
+IMPORT_REPORT_TOP: int = 8
+
+_STAGE_MARKER = "-- bridge_engine import stage --"
+
+# "import time:       123 |       4567 |     package.module"
+_LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of `-X importtime` output (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StageTiming:
+    """The imports one stage triggered."""
+
+    label: str
+    records: List[ImportRecord]
+
+    @property
+    def total_us(self) -> int:
+        """Time spent importing in this stage (top-level cumulative sum)."""
+        return sum(r.cumulative_us for r in self.records if r.depth == 0)
+
+
+def parse_import_times(text: str) -> List[List[ImportRecord]]:
+    """
+    Parse `-X importtime` stderr into one record list per stage.
+
+    Stages are separated by marker lines written by the child process;
+    anything that is neither a marker nor an import-time line is ignored.
+    """
+    stages: List[List[ImportRecord]] = [[]]
+    for line in text.splitlines():
+        if line == _STAGE_MARKER:
+            stages.append([])
+            continue
+        m = _LINE_RE.match(line)
+        if m is None:
+            continue
+        self_us, cumulative_us, indent, module = m.groups()
+        stages[-1].append(ImportRecord(
+            module=module,
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=max(0, len(indent) - 1) // 2,
+        ))
+    return stages
+
+
+def measure_import_times(
+    stages: Sequence[Tuple[str, str]] = IMPORT_STAGES,
+) -> List[StageTiming]:
+    """
+    Run the stages in a fresh interpreter and return their import timings.
+
+    The first entry is the interpreter's own start-up (encodings, site, ...)
+    before any bridge_engine code runs.
+    """
+    marker = f"sys.stderr.write({_STAGE_MARKER!r} + '\\n'); sys.stderr.flush()"
+    code = "\n".join(
+        ["import sys", marker]
+        + [line for _label, stmt in stages for line in (stmt, marker)]
+    )
+    env = dict(os.environ)
+    package_parent = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (package_parent, env.get("PYTHONPATH")) if p
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    labels = ["Python interpreter start-up"] + [label for label, _stmt in stages]
+    # The trailing marker opens one empty list past the last stage.
+    return [
+        StageTiming(label, records)
+        for label, records in zip(labels, parse_import_times(proc.stderr))
+    ]
+
+
+def format_import_time_report(
+    timings: Sequence[StageTiming], top: int = IMPORT_REPORT_TOP,
+) -> str:
+    """Human-readable per-stage breakdown of measure_import_times()."""
+    lines = ["Import time by stage (fresh interpreter, python -X importtime):"]
+    for stage in timings:
+        lines.append("")
+        lines.append(f"{stage.label}: {stage.total_us / 1000:.1f} ms")
+        heaviest = sorted(stage.records, key=lambda r: r.self_us, reverse=True)
+        for record in heaviest[:top]:
+            lines.append(
+                f"  {record.module:<40} {record.self_us / 1000:6.1f} ms"
+                f"  (cumulative {record.cumulative_us / 1000:.1f} ms)"
+            )
+    return "\n".join(lines)
+
+
+def print_import_time_report() -> None:
+    print(format_import_time_report(measure_import_times()))
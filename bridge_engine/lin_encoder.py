@@ -29,7 +29,9 @@ Key behaviours
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Sequence
+from typing import Dict, Iterable, List
+
+from .atomic_writer import AtomicBufferedWriter
 
 
 # Suits in BBO / LIN order
@@ -179,10 +181,24 @@ def encode_deal_to_lin_line(deal: Deal) -> str:
     return "%s%s|ah|%s|sv|%s|pg||" % (container, md_part, board_title, vul_code)
 
 
-def write_lin_file(path: Path, deals: Sequence[Deal]) -> None:
+class LinFileWriter(AtomicBufferedWriter):
+    """
+    Incremental LIN writer: one encoded line per write_deal() call.
+
+    Overwrites atomically on close() (or appends in place with append=True);
+    see atomic_writer.AtomicBufferedWriter.
+    """
+
+    def write_deal(self, deal: Deal) -> None:
+        self.write_record(encode_deal_to_lin_line(deal) + "\n")
+
+
+def write_lin_file(path: Path, deals: Iterable[Deal]) -> None:
     """
     Write one LIN line per deal to the given path.
     """
-    lines: List[str] = [encode_deal_to_lin_line(d) for d in deals]
-    text = "\n".join(lines) + "\n"
-    path.write_text(text, encoding="utf-8")
+    with LinFileWriter(path) as writer:
+        for d in deals:
+            writer.write_deal(d)
+        if not writer.records:
+            writer.write("\n")
@@ -30,25 +30,77 @@ It implements:
 
 from __future__ import annotations
 
-import json
-import sys
+import importlib
 import time
 
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .menu_help import get_menu_help
-from .setup_env import run_setup, SetupResult
-from .hand_profile import HandProfile, ProfileError, validate_profile
-from .deal_generator import DealSet, DealGenerationError, generate_deals
-from .deal_output import DealOutputSummary, OutputError, render_deals
-from .profile_cli import _input_int
+from .cli_io import _input_int
 
-from . import profile_cli
-from . import profile_store
-from . import lin_tools
-from . import profile_diagnostic
-from .profile_store import PROFILE_DIR_NAME
+if TYPE_CHECKING:
+    from .deal_generator import DealSet
+    from .deal_output import DealOutputSummary
+    from .deal_policy import DealPolicy
+    from .deal_pool import DealPool
+    from .hand_profile import HandProfile
+    from .setup_env import SetupResult
+
+
+# ---------------------------------------------------------------------------
+# Deferred imports
+#
+# The deal pipeline (profile model, generator, output) takes most of the
+# start-up time and the main menu needs none of it, so these names are bound
+# on first use.  Attribute access from outside (tests monkeypatch
+# orchestrator.generate_deals etc.) goes through __getattr__; functions that
+# use them as globals call _import_deferred() first.  Names already bound,
+# e.g. by a monkeypatch, are left alone.  The menu modules (profile_cli,
+# lin_tools, profile_diagnostic) are imported by the handlers that use them.
+# ---------------------------------------------------------------------------
+
+# name -> (module, attribute); attribute None binds the module itself.
+_DEFERRED_IMPORTS: Dict[str, Tuple[str, Optional[str]]] = {
+    "run_setup": (".setup_env", "run_setup"),
+    "HandProfile": (".hand_profile", "HandProfile"),
+    "ProfileError": (".hand_profile", "ProfileError"),
+    "validate_profile": (".hand_profile", "validate_profile"),
+    "DealGenerationError": (".deal_generator", "DealGenerationError"),
+    "generate_deals": (".deal_generator", "generate_deals"),
+    "DealPool": (".deal_pool", "DealPool"),
+    "checkpoint_path_for": (".deal_checkpoint", "checkpoint_path_for"),
+    "DealCheckpoint": (".deal_checkpoint", "DealCheckpoint"),
+    "find_policy": (".deal_policy", "find_policy"),
+    "format_policy_report": (".deal_policy", "format_policy_report"),
+    "optimize_deal_policy": (".deal_policy", "optimize_deal_policy"),
+    "policy_path_for": (".deal_policy", "policy_path_for"),
+    "DEAL_POLICY_ATTEMPTS": (".deal_generator_types", "DEAL_POLICY_ATTEMPTS"),
+    "OutputError": (".deal_output", "OutputError"),
+    "render_deals": (".deal_output", "render_deals"),
+    "profile_store": (".profile_store", None),
+    "PROFILE_DIR_NAME": (".profile_store", "PROFILE_DIR_NAME"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import and bind a deferred name on first access (PEP 562)."""
+    try:
+        module_name, attr = _DEFERRED_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __package__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def _import_deferred() -> None:
+    """Bind every deferred name that is not bound yet."""
+    bound = globals()
+    for name in _DEFERRED_IMPORTS:
+        if name not in bound:
+            __getattr__(name)
 
 
 # ---------------------------------------------------------------------------
@@ -124,6 +176,7 @@ def _profiles_dir(base_dir: Path | None = None) -> Path:
     """
     Resolve the directory where profiles are stored.
     """
+    _import_deferred()
     if base_dir is None:
         base_dir = Path.cwd()
     return base_dir / PROFILE_DIR_NAME
@@ -135,27 +188,13 @@ def _discover_profiles(base_dir: Path | None = None) -> List[Tuple[Path, HandPro
     objects.
 
     Any file that fails to load cleanly is skipped with a warning.
+    Unchanged files come from profile_store's parsed-profile cache.
     """
+    _import_deferred()
     dir_path = _profiles_dir(base_dir)
-    results: List[Tuple[Path, HandProfile]] = []
-
     if not dir_path.is_dir():
-        return results
-
-    for path in sorted(dir_path.glob("*.json")):
-        if profile_store.is_draft_path(path):
-            continue
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                data: Dict[str, Any] = json.load(f)
-            profile = HandProfile.from_dict(data)
-            results.append((path, profile))
-        except (json.JSONDecodeError, TypeError, KeyError, ValueError, ProfileError) as exc:  # pragma: no cover
-            print(
-                f"WARNING: Failed to load profile from {path}: {exc}",
-                file=sys.stderr,
-            )
-    return results
+        return []
+    return profile_store.load_profile_dir(dir_path)
 
 
 def _choose_profile_for_session() -> HandProfile | None:
@@ -168,6 +207,16 @@ def _choose_profile_for_session() -> HandProfile | None:
     HandProfile or None
         The selected profile, or None if the user cancels or no profiles exist.
     """
+    chosen = _choose_profile_path_for_session()
+    return None if chosen is None else chosen[1]
+
+
+def _choose_profile_path_for_session() -> Tuple[Path, HandProfile] | None:
+    """
+    Like _choose_profile_for_session(), but also return the profile's file
+    path (for tools that write sidecar files next to it).
+    """
+    _import_deferred()
     profiles = _discover_profiles()
     if not profiles:
         print("No profiles found. Please create one in Profile Management first.")
@@ -194,8 +243,7 @@ def _choose_profile_for_session() -> HandProfile | None:
             continue
 
         if choice in display_map:
-            _, profile = display_map[choice]
-            return profile
+            return display_map[choice]
 
         print(f"Invalid choice. Valid numbers: {valid_nums}")
 
@@ -211,6 +259,7 @@ def _validate_for_session(profile: HandProfile) -> HandProfile | None:
 
     Returns the validated (possibly re-normalised) profile, or None on failure.
     """
+    _import_deferred()
     print(f"\nValidating profile '{profile.profile_name}' ...")
     try:
         profile = validate_profile(profile)
@@ -224,6 +273,46 @@ def _validate_for_session(profile: HandProfile) -> HandProfile | None:
     return profile
 
 
+def _ask_resume(
+    checkpoint: Path, profile: HandProfile, num_deals: int, rotate_deals: bool
+) -> Tuple[bool, int, bool]:
+    """
+    Offer to continue the run that left `checkpoint`.  Returns (resume,
+    num_deals, rotate_deals) for generate_deals().
+
+    generate_deals() refuses a checkpoint written for another board count or
+    rotation setting, so for one of those the user either continues it on its
+    own terms or starts afresh (the new run overwrites the checkpoint).
+    """
+    try:
+        saved = DealCheckpoint.load(checkpoint, profile)
+    except DealGenerationError as exc:
+        print(f"Ignoring checkpoint: {exc}")
+        return False, num_deals, rotate_deals
+    if saved is None:
+        return False, num_deals, rotate_deals
+
+    if saved.mode != "serial":
+        print(f"Ignoring checkpoint {checkpoint}: it was written by a parallel run.")
+        return False, num_deals, rotate_deals
+    if (saved.num_deals, saved.enable_rotation) == (num_deals, rotate_deals):
+        resume = _yes_no(
+            "An interrupted run with this profile and seed was found. Resume it?",
+            True,
+        )
+        return resume, num_deals, rotate_deals
+
+    rotation = "on" if saved.enable_rotation else "off"
+    print(
+        f"An interrupted run with this profile and seed was found "
+        f"({len(saved.deals)} of {saved.num_deals} deals, rotation {rotation})."
+    )
+    if _yes_no(f"Resume it with {saved.num_deals} deals, rotation {rotation}?", True):
+        return True, saved.num_deals, saved.enable_rotation
+    print("Starting afresh; the checkpoint will be discarded.")
+    return False, num_deals, rotate_deals
+
+
 def _print_session_summary(
     profile: HandProfile,
     owner: str,
@@ -247,6 +336,9 @@ def _print_session_summary(
         print(f"Avg per board : {avg_time:.1f}s (max {max_time:.1f}s)")
     if reseed_count > 0:
         print(f"Re-seeds      : {reseed_count}")
+    pool_served = getattr(deal_set, "pool_served", 0)
+    if pool_served > 0:
+        print(f"From pool     : {pool_served}")
     print(f"TXT output    : {summary.txt_path}")
     print(f"LIN output    : {summary.lin_path}")
     if summary.warnings:
@@ -274,6 +366,7 @@ def _run_deal_generation_session() -> None:
     7) Print a summary of the session.
     """
     print("\n=== Deal Generation Session ===")
+    _import_deferred()
 
     profile = _choose_profile_for_session()
     if profile is None:
@@ -317,6 +410,38 @@ def _run_deal_generation_session() -> None:
         default_rotate,
     )
 
+    # Unseeded runs are served from (and afterwards top up) the on-disk deal
+    # pool under the base directory.  Seeded runs never touch it.  Sessions
+    # use the fixed reroll schedule: adaptive ComboStats budgets stay opt-in
+    # (generate_deals(combo_stats=...)) until they measurably win.
+    pool: Optional[DealPool] = None
+    extra: Dict[str, Any] = {}
+    if getattr(setup, "use_seeded_run", True) is False:
+        pool = DealPool(base_dir / "pool")
+        # The previous session's background fill must not keep appending
+        # while this session takes from the pool.
+        pool.stop_fillers()
+        extra["pool"] = pool
+
+    # A dealing policy measured by the Admin optimizer (sidecar next to the
+    # profile JSON) applies to seeded and unseeded runs alike.
+    deal_policy: Optional[DealPolicy] = None
+    if isinstance(profile, HandProfile):
+        deal_policy = find_policy(_profiles_dir(), profile)
+    if deal_policy is not None:
+        print(f"Using dealing policy for {len(deal_policy)} subprofile combination(s).")
+        extra["deal_policy"] = deal_policy
+
+    # Boards are checkpointed to logs/ while they are built; a checkpoint
+    # left by an interrupted run with the same profile and seed (seeded
+    # runs always share one) can be continued instead of starting again.
+    if isinstance(profile, HandProfile):
+        checkpoint = checkpoint_path_for(setup.log_dir, profile, setup.seed)
+        resume, num_deals, rotate_deals = _ask_resume(
+            checkpoint, profile, num_deals, rotate_deals
+        )
+        extra.update(checkpoint=checkpoint, resume=resume)
+
     # --- Section C: deal generation ---
     print("\nSection C: generating deals ...")
     gen_start = time.monotonic()
@@ -326,6 +451,7 @@ def _run_deal_generation_session() -> None:
             profile=profile,
             num_deals=num_deals,
             enable_rotation=rotate_deals,
+            **extra,
         )
     except DealGenerationError as exc:
         print(f"\nERROR during deal generation: {exc}")
@@ -348,6 +474,10 @@ def _run_deal_generation_session() -> None:
 
     _print_session_summary(profile, owner, summary, deal_set, gen_elapsed)
 
+    # Refill the pool for the next session while the user reads this one.
+    if pool is not None:
+        pool.fill_in_background(profile)
+
 
 # ---------------------------------------------------------------------------
 # Profile Management wrapper
@@ -418,13 +548,19 @@ def _help_main() -> None:
     print(get_menu_help("main_menu"))
 
 
+def _run_profile_manager() -> None:
+    from . import profile_cli
+
+    profile_cli.run_profile_manager()
+
+
 def main_menu() -> None:
     """Top-level interactive menu for the Bridge Hand Generator."""
     _run_menu_loop(
         title="Bridge Hand Generator",
         items=[
             ("Exit", None),
-            ("Profile management", lambda: profile_cli.run_profile_manager()),
+            ("Profile management", _run_profile_manager),
             ("Deal generation", run_deal_generation),
             ("Admin", admin_menu),
             ("Help", _help_main),
@@ -453,12 +589,63 @@ def _run_profile_diagnostic_interactive() -> None:
         "Number of boards to diagnose", 20, minimum=1
     )
 
+    from . import profile_diagnostic
+
     profile_diagnostic.run_profile_diagnostic(
         profile=profile,
         num_boards=num_boards,
     )
 
 
+def _run_deal_policy_optimizer_interactive() -> None:
+    """
+    Interactive wrapper: benchmark every dealing order and pre-allocation
+    fraction per subprofile combination of a chosen profile, and save the
+    winning policy next to the profile JSON.
+    """
+    print("\n=== Dealing-Order Optimizer ===")
+    _import_deferred()
+
+    chosen = _choose_profile_path_for_session()
+    if chosen is None:
+        return
+    path, profile = chosen
+
+    profile = _validate_for_session(profile)
+    if profile is None:
+        return
+
+    attempts = _input_int_with_default(
+        "Attempts per candidate (24 orders x fractions per combination)",
+        DEAL_POLICY_ATTEMPTS,
+        minimum=10,
+    )
+
+    def _progress(done: int, total: int) -> None:
+        print(f"  combination {done}/{total} measured")
+
+    policy, results = optimize_deal_policy(
+        profile, attempts=attempts, progress=_progress
+    )
+    print()
+    print(format_policy_report(results))
+
+    policy_path = policy_path_for(path)
+    if len(policy) == 0:
+        print("\nNo combination beat the computed default; no policy saved.")
+        if policy_path.exists() and _yes_no(
+            f"Remove the existing policy {policy_path.name}?", False
+        ):
+            policy_path.unlink()
+        return
+    try:
+        policy.save(policy_path, profile)
+    except OSError as exc:
+        print(f"\nERROR: could not save policy: {exc}")
+        return
+    print(f"\nSaved policy for {len(policy)} combination(s) to {policy_path}")
+
+
 def _help_admin() -> None:
     print()
     print(get_menu_help("admin_menu"))
@@ -466,6 +653,8 @@ def _help_admin() -> None:
 
 def admin_menu() -> None:
     """Admin / tools submenu (LIN combiner, draft tools, diagnostics, etc.)."""
+    from . import lin_tools, profile_cli
+
     _run_menu_loop(
         title="Bridge Hand Generator – Admin",
         items=[
@@ -473,6 +662,7 @@ def admin_menu() -> None:
             ("LIN Combiner", lin_tools.combine_lin_files_interactive),
             ("Recover/Delete *_TEST.json drafts", profile_cli.run_draft_tools),
             ("Profile Diagnostic", _run_profile_diagnostic_interactive),
+            ("Dealing-Order Optimizer", _run_deal_policy_optimizer_interactive),
             ("Help", _help_admin),
         ],
         help_key="admin_menu",
@@ -480,13 +670,31 @@ def admin_menu() -> None:
 
 
 
-def main() -> None:
+def main(argv: Optional[Sequence[str]] = None) -> int:
     """
-    Public entrypoint for interactive CLI.
+    Public entrypoint for the CLI; returns the process exit code.
 
-    Always launches the full main menu (with LIN tools).
+    With no arguments, launches the full interactive main menu (with LIN
+    tools).  `generate ...` runs the non-interactive batch command (see
+    batch_cli.py) and `serve ...` the local HTTP deal service (see
+    deal_service.py).  --profile-import-time prints where start-up import time
+    goes (see import_timing.py) and exits.
     """
+    if argv and argv[0] == "generate":
+        from .batch_cli import main as generate_main
+
+        return generate_main(argv[1:])
+    if argv and argv[0] == "serve":
+        from .deal_service import main as serve_main
+
+        return serve_main(argv[1:])
+    if argv and "--profile-import-time" in argv:
+        from .import_timing import print_import_time_report
+
+        print_import_time_report()
+        return 0
     main_menu()
+    return 0
 
 
 if __name__ == "__main__":
@@ -186,25 +186,13 @@ def _load_profiles() -> List[Tuple[Path, HandProfile]]:
     Load all JSON profiles from profiles/ directory.
 
     Returns a list of (path, HandProfile) for successfully loaded profiles.
-    Prints warnings for any files that fail to load.
+    Prints warnings for any files that fail to load.  Unchanged files come
+    from profile_store's parsed-profile cache.
     """
     dir_path = _profiles_dir()
-    results: List[Tuple[Path, HandProfile]] = []
     if not dir_path.is_dir():
-        return results
-
-    for path in sorted(dir_path.glob("*.json")):
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-            profile = HandProfile.from_dict(data)
-            results.append((path, profile))
-        except (json.JSONDecodeError, TypeError, KeyError, ValueError, ProfileError) as exc:
-            print(
-                f"WARNING: Failed to load profile from {path}: {exc}",
-                file=sys.stderr,
-            )
-    return results
+        return []
+    return profile_store.load_profile_dir(dir_path, include_drafts=True)
 
 
 def _save_profile_to_path(profile: HandProfile, path: Path) -> None:
@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 import os
 import re
+import sys
 import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -134,35 +135,85 @@ def _profile_path_for(profile: HandProfile, base_dir: Path | None = None) -> Pat
 # Load / save
 # ---------------------------------------------------------------------------
 
-def _load_profiles(base_dir: Path | None = None) -> List[Tuple[Path, HandProfile]]:
+# File identity used to decide whether a cached parse is still valid:
+# (st_mtime_ns, st_size, st_ino).  Atomic saves (os.replace) change the
+# inode, so even a same-size rewrite within one mtime tick is noticed.
+_FileKey = Tuple[int, int, int]
+
+# In-process cache: resolved directory -> {file name: (file key, profile)}.
+_PARSED_PROFILES: Dict[Path, Dict[str, Tuple[_FileKey, HandProfile]]] = {}
+
+
+def _file_key(st: os.stat_result) -> _FileKey:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def load_profile_dir(
+    dir_path: Path, include_drafts: bool = False,
+) -> List[Tuple[Path, HandProfile]]:
     """
-    Load all canonical profiles (exclude *_TEST.json drafts) from disk.
+    Load every profile JSON in dir_path, parsing only files that changed.
 
-    Skips files that fail to parse or construct, printing a warning to
-    stderr so one corrupted file doesn't crash the entire profile list.
+    Parsed profiles are cached in memory per file (mtime, size, inode), so
+    a menu visit re-reads no profile file that has not changed since the
+    last one.  Cached HandProfile objects are shared between callers and
+    must be treated as read-only (edits build new profiles).
 
-    Returns: list of (path, HandProfile)
+    Files that fail to parse or construct are skipped with a warning on
+    stderr (and retried next time).  *_TEST.json drafts are skipped unless
+    include_drafts.
+
+    Returns: list of (path, HandProfile) sorted by path.
     """
-    import sys
+    dir_path = Path(dir_path)
+    try:
+        names = sorted(p.name for p in dir_path.glob("*.json"))
+    except OSError:
+        return []
 
-    profiles: List[Tuple[Path, HandProfile]] = []
-    dir_path = _profiles_dir(base_dir)
+    cache_key = dir_path.resolve()
+    cached = _PARSED_PROFILES.get(cache_key, {})
 
-    for json_path in sorted(dir_path.glob("*.json")):
-        if is_draft_path(json_path):
+    entries: Dict[str, Tuple[_FileKey, HandProfile]] = {}
+    for name in names:
+        path = dir_path / name
+        try:
+            key = _file_key(path.stat())
+        except OSError:
+            continue
+        hit = cached.get(name)
+        if hit is not None and hit[0] == key:
+            entries[name] = hit
             continue
-
         try:
-            raw = json.loads(json_path.read_text(encoding="utf-8"))
-            profile = HandProfile.from_dict(raw)
-            profiles.append((json_path, profile))
-        except (json.JSONDecodeError, TypeError, KeyError, ValueError, ProfileError) as exc:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            entries[name] = (key, HandProfile.from_dict(raw))
+        except (OSError, json.JSONDecodeError, TypeError, KeyError, ValueError, ProfileError) as exc:
             print(
-                f"WARNING: Failed to load profile from {json_path}: {exc}",
+                f"WARNING: Failed to load profile from {path}: {exc}",
                 file=sys.stderr,
             )
 
-    return profiles
+    _PARSED_PROFILES[cache_key] = entries
+
+    return [
+        (dir_path / name, profile)
+        for name, (_key, profile) in entries.items()
+        if include_drafts or not is_draft_path(dir_path / name)
+    ]
+
+
+def _load_profiles(base_dir: Path | None = None) -> List[Tuple[Path, HandProfile]]:
+    """
+    Load all canonical profiles (exclude *_TEST.json drafts) from disk.
+
+    Skips files that fail to parse or construct, printing a warning to
+    stderr so one corrupted file doesn't crash the entire profile list.
+    Unchanged files come from the parsed-profile cache (load_profile_dir).
+
+    Returns: list of (path, HandProfile)
+    """
+    return load_profile_dir(_profiles_dir(base_dir))
 
 
 # Public alias (some code paths may prefer the non-underscored name)
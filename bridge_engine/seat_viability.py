@@ -14,7 +14,9 @@ from .hand_profile import (
     ProfileError,
     SuitRange,
 )
-from .deal_generator_types import SuitAnalysis, _CARD_HCP
+from .deal_generator_types import (
+    SuitAnalysis, _CARD_HCP, _ID_HCP, _ID_SUIT, _SUIT_INDEX, _SUIT_LETTERS,
+)
 
 
 # Simple type aliases used throughout generation/viability.
@@ -68,6 +70,29 @@ def _compute_suit_analysis(hand: List[Card]) -> SuitAnalysis:
     )
 
 
+def _compute_suit_analysis_ids(hand: List[int]) -> SuitAnalysis:
+    """
+    Like _compute_suit_analysis, for a hand of integer card ids (0..51).
+
+    cards_by_suit holds the ids themselves — matchers only ever take len()
+    of those lists, so no conversion back to strings is needed.
+    """
+    by_suit: Tuple[List[int], ...] = ([], [], [], [])
+    hcp = [0, 0, 0, 0]
+    id_suit = _ID_SUIT
+    id_hcp = _ID_HCP
+    for c in hand:
+        s = id_suit[c]
+        by_suit[s].append(c)
+        hcp[s] += id_hcp[c]
+
+    return SuitAnalysis(
+        cards_by_suit=dict(zip(_SUIT_LETTERS, by_suit)),
+        hcp_by_suit=dict(zip(_SUIT_LETTERS, hcp)),
+        total_hcp=hcp[0] + hcp[1] + hcp[2] + hcp[3],
+    )
+
+
 # ---------------------------------------------------------------------------
 # Standard / Random Suit / Partner Contingent matching
 # ---------------------------------------------------------------------------
@@ -318,16 +343,41 @@ def _is_excluded_for_seat_subprofile(
     if subprofile_index_1based is None:
         return False
 
+    cards = analysis.cards_by_suit
+    return _is_shape_excluded(
+        profile,
+        seat,
+        subprofile_index_1based,
+        (
+            len(cards.get("S", [])),
+            len(cards.get("H", [])),
+            len(cards.get("D", [])),
+            len(cards.get("C", [])),
+        ),
+    )
+
+
+def _is_shape_excluded(
+    profile: HandProfile,
+    seat: Seat,
+    subprofile_index_1based: int,
+    suit_lengths: Tuple[int, int, int, int],
+) -> bool:
+    """
+    Exclusion check on suit lengths (S, H, D, C) alone.
+
+    Shared by _is_excluded_for_seat_subprofile and the compiled matcher,
+    which never builds a SuitAnalysis.
+    """
+    exclusions = getattr(profile, "subprofile_exclusions", None)
+    if not exclusions:
+        return False
+
     # Compute canonical shape string in S/H/D/C order
-    lengths = {
-        "S": len(analysis.cards_by_suit.get("S", [])),
-        "H": len(analysis.cards_by_suit.get("H", [])),
-        "D": len(analysis.cards_by_suit.get("D", [])),
-        "C": len(analysis.cards_by_suit.get("C", [])),
-    }
+    lengths = dict(zip(_SUIT_LETTERS, suit_lengths))
     shape = f"{lengths['S']}{lengths['H']}{lengths['D']}{lengths['C']}"
 
-    for exc in getattr(profile, "subprofile_exclusions", []):
+    for exc in exclusions:
         if getattr(exc, "seat", None) != seat:
             continue
         if getattr(exc, "subprofile_index", None) != subprofile_index_1based:
@@ -376,6 +426,7 @@ def _match_seat(
     random_suit_choices: Dict[Seat, List[str]],
     rng: random.Random,
     rs_pre_selections: Optional[Dict[Seat, List[str]]] = None,
+    analysis: Optional[SuitAnalysis] = None,
 ) -> Tuple[bool, Optional[List[str]], Optional[str]]:
     """
     Match a 13-card hand against the chosen SubProfile for a given seat.
@@ -390,6 +441,10 @@ def _match_seat(
     builder), this seat's pre-selected RS suits are threaded down to the
     RS matcher so it uses the pre-committed suits instead of random sampling.
 
+    When analysis is provided (e.g. from _compute_suit_analysis_ids in the
+    v2 builder, which deals integer card ids), it is used as-is and hand is
+    not inspected.
+
     Returns:
       (matched, chosen_random_suits_for_this_seat_or_None, fail_reason)
 
@@ -411,7 +466,8 @@ def _match_seat(
     else:
         subprofiles = [chosen_subprofile]
 
-    analysis = _compute_suit_analysis(hand)
+    if analysis is None:
+        analysis = _compute_suit_analysis(hand)
 
     # Extract this seat's RS pre-selection (if any) to thread down.
     seat_pre = None
@@ -452,6 +508,234 @@ def _match_seat(
     return False, last_chosen, last_fail_reason
 
 
+# ---------------------------------------------------------------------------
+# Compiled matcher
+#
+# _match_seat walks frozen dataclasses (getattr + dict lookups) and needs a
+# SuitAnalysis with four lists per hand.  The v2 builder instead compiles
+# each SubProfile once into a flat tuple of integer bounds and matches it
+# directly against a hand's 4 suit lengths and 4 suit HCP values.  Same
+# (matched, chosen_rs, fail_reason) contract, same RNG draws, same order of
+# checks (so failure attribution is unchanged).
+#
+# Compiled layout (CompiledSubProfile):
+#   [0]      kind: _KIND_STANDARD / _KIND_RS / _KIND_PC / _KIND_OC / _KIND_INVALID
+#   [1], [2] total_min_hcp, total_max_hcp
+#   [3:19]   per suit S, H, D, C: min_cards, max_cards, min_hcp, max_hcp
+#   [19]     kind payload:
+#              RS: (allowed, required_count, suit_ranges, pair_overrides)
+#              PC: (partner_seat, range4)    OC: (opponent_seat, range4)
+#   range4 = (min_cards, max_cards, min_hcp, max_hcp)
+# ---------------------------------------------------------------------------
+
+_KIND_STANDARD = 0
+_KIND_RS = 1
+_KIND_PC = 2
+_KIND_OC = 3
+_KIND_INVALID = 4
+
+CompiledSubProfile = Tuple
+
+# id(sub) -> (sub, compiled).  Holding the SubProfile keeps its id from being
+# reused while the entry exists; SubProfile itself is unhashable (list fields).
+_COMPILED_SUBPROFILES: Dict[int, Tuple[SubProfile, CompiledSubProfile]] = {}
+_COMPILED_CACHE_MAX = 4096
+
+
+def _range4(sr: SuitRange) -> Tuple[int, int, int, int]:
+    return (sr.min_cards, sr.max_cards, sr.min_hcp, sr.max_hcp)
+
+
+def _compile_subprofile(sub: SubProfile) -> CompiledSubProfile:
+    """
+    Return the flat compiled form of a SubProfile (cached per object).
+    """
+    entry = _COMPILED_SUBPROFILES.get(id(sub))
+    if entry is not None and entry[0] is sub:
+        return entry[1]
+
+    std = sub.standard
+    rs = sub.random_suit_constraint
+    pc = sub.partner_contingent_constraint
+    oc = sub.opponents_contingent_suit_constraint
+
+    payload: object = None
+    if rs is not None and pc is None and oc is None:
+        kind = _KIND_RS
+        overrides: Dict[Tuple[str, ...], Tuple[Tuple[str, Tuple[int, int, int, int]], ...]] = {}
+        if rs.required_suits_count == 2:
+            # First matching override wins, as in _match_random_suit_with_attempt.
+            for po in rs.pair_overrides:
+                key = tuple(sorted(po.suits))
+                if key not in overrides:
+                    overrides[key] = (
+                        (po.suits[0], _range4(po.first_range)),
+                        (po.suits[1], _range4(po.second_range)),
+                    )
+        payload = (
+            list(rs.allowed_suits),
+            rs.required_suits_count,
+            tuple(_range4(sr) for sr in rs.suit_ranges),
+            overrides,
+        )
+    elif pc is not None and rs is None and oc is None:
+        kind = _KIND_PC
+        payload = (pc.partner_seat, _range4(pc.suit_range))
+    elif oc is not None and rs is None and pc is None:
+        kind = _KIND_OC
+        payload = (oc.opponent_seat, _range4(oc.suit_range))
+    elif rs is None and pc is None and oc is None:
+        kind = _KIND_STANDARD
+    else:
+        kind = _KIND_INVALID
+
+    compiled: CompiledSubProfile = (
+        kind,
+        std.total_min_hcp,
+        std.total_max_hcp,
+        *_range4(std.spades),
+        *_range4(std.hearts),
+        *_range4(std.diamonds),
+        *_range4(std.clubs),
+        payload,
+    )
+
+    if len(_COMPILED_SUBPROFILES) >= _COMPILED_CACHE_MAX:
+        _COMPILED_SUBPROFILES.clear()
+    _COMPILED_SUBPROFILES[id(sub)] = (sub, compiled)
+    return compiled
+
+
+def _hand_suit_stats_ids(
+    hand: List[int],
+) -> Tuple[List[int], List[int]]:
+    """
+    Per-suit lengths and HCP (S, H, D, C order) of a hand of card ids.
+    """
+    lengths = [0, 0, 0, 0]
+    hcp = [0, 0, 0, 0]
+    id_suit = _ID_SUIT
+    id_hcp = _ID_HCP
+    for c in hand:
+        s = id_suit[c]
+        lengths[s] += 1
+        hcp[s] += id_hcp[c]
+    return lengths, hcp
+
+
+def _in_range4(
+    r: Tuple[int, int, int, int], suit: str, lengths, hcp
+) -> bool:
+    si = _SUIT_INDEX.get(suit)
+    if si is None:
+        return False
+    return r[0] <= lengths[si] <= r[1] and r[2] <= hcp[si] <= r[3]
+
+
+def _match_compiled(
+    compiled: CompiledSubProfile,
+    lengths,
+    hcp,
+    random_suit_choices: Dict[Seat, List[str]],
+    rng: random.Random,
+    pre_selected_suits: Optional[List[str]] = None,
+) -> Tuple[bool, Optional[List[str]], Optional[str]]:
+    """
+    Compiled equivalent of _match_subprofile.
+
+    lengths / hcp are 4-sequences in S, H, D, C order.
+    """
+    total = hcp[0] + hcp[1] + hcp[2] + hcp[3]
+    if not (compiled[1] <= total <= compiled[2]):
+        return False, None, "hcp"
+
+    # Per-suit checks, unrolled (cards first, then HCP, suit by suit).
+    if not (compiled[3] <= lengths[0] <= compiled[4]):
+        return False, None, "shape"
+    if not (compiled[5] <= hcp[0] <= compiled[6]):
+        return False, None, "hcp"
+    if not (compiled[7] <= lengths[1] <= compiled[8]):
+        return False, None, "shape"
+    if not (compiled[9] <= hcp[1] <= compiled[10]):
+        return False, None, "hcp"
+    if not (compiled[11] <= lengths[2] <= compiled[12]):
+        return False, None, "shape"
+    if not (compiled[13] <= hcp[2] <= compiled[14]):
+        return False, None, "hcp"
+    if not (compiled[15] <= lengths[3] <= compiled[16]):
+        return False, None, "shape"
+    if not (compiled[17] <= hcp[3] <= compiled[18]):
+        return False, None, "hcp"
+
+    kind = compiled[0]
+    if kind == _KIND_STANDARD:
+        return True, None, None
+
+    if kind == _KIND_RS:
+        allowed, required, suit_ranges, overrides = compiled[19]
+        if not allowed or required <= 0 or required > len(allowed):
+            return False, None, "other"
+        if pre_selected_suits is not None:
+            chosen = list(pre_selected_suits)
+        else:
+            chosen = rng.sample(allowed, required)
+
+        override = overrides.get(tuple(sorted(chosen))) if overrides else None
+        if override is not None:
+            ranges_by_suit = dict(override)
+        else:
+            if len(chosen) > len(suit_ranges):
+                return False, chosen, "other"
+            ranges_by_suit = dict(zip(chosen, suit_ranges))
+
+        for suit in chosen:
+            r = ranges_by_suit[suit]
+            si = _SUIT_INDEX[suit]
+            if not (r[0] <= lengths[si] <= r[1] and r[2] <= hcp[si] <= r[3]):
+                return False, chosen, "other"
+        return True, chosen, None
+
+    if kind == _KIND_PC or kind == _KIND_OC:
+        other_seat, r = compiled[19]
+        other_suits = random_suit_choices.get(other_seat)
+        if not other_suits:
+            return False, None, "other"
+        if _in_range4(r, other_suits[0], lengths, hcp):
+            return True, None, None
+        return False, None, "other"
+
+    return False, None, "other"
+
+
+def _match_seat_compiled(
+    profile: HandProfile,
+    seat: Seat,
+    compiled: CompiledSubProfile,
+    chosen_subprofile_index_1based: int,
+    lengths,
+    hcp,
+    random_suit_choices: Dict[Seat, List[str]],
+    rng: random.Random,
+    rs_pre_selections: Optional[Dict[Seat, List[str]]] = None,
+) -> Tuple[bool, Optional[List[str]], Optional[str]]:
+    """
+    Compiled equivalent of _match_seat for a constrained seat whose
+    subprofile has already been chosen (the v2 builder's case).
+
+    Returns the same (matched, chosen_rs, fail_reason) triple, including
+    "other" when the matched hand hits a subprofile exclusion.
+    """
+    seat_pre = rs_pre_selections.get(seat) if rs_pre_selections else None
+    matched, chosen, fail_reason = _match_compiled(
+        compiled, lengths, hcp, random_suit_choices, rng, seat_pre,
+    )
+    if matched and _is_shape_excluded(
+        profile, seat, chosen_subprofile_index_1based, tuple(lengths),
+    ):
+        return False, chosen, "other"
+    return matched, chosen, fail_reason
+
+
 # ---------------------------------------------------------------------------
 # Constrained board construction (C1)
 # ---------------------------------------------------------------------------
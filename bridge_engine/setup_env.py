@@ -17,7 +17,7 @@ This version (v3) reflects the updated project architecture (Nov 2025).
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 from datetime import datetime
 import random
 from . import cli_prompts
@@ -121,6 +121,7 @@ def run_setup(
     profile_name: str,
     ask_seed_choice: bool = False,
     use_seeded_default: bool = True,
+    seed: Optional[int] = None,
 ) -> SetupResult:
     """
     Prepare directories + filenames + seed for this run.
@@ -147,6 +148,10 @@ def run_setup(
             True  → use DEFAULT_SEED
             False → use random seed
 
+    seed : int, optional
+        Use exactly this seed (a seeded run).  Overrides ask_seed_choice
+        and use_seeded_default; used by the batch `generate` command.
+
     Behaviour
     ---------
     • Always uses DEFAULT_SEED unless the user explicitly chooses random.
@@ -166,7 +171,9 @@ def run_setup(
     owner_file = _normalise_owner_for_filename(owner)
 
     # Determine whether to use the default deterministic seed or a random one.
-    if ask_seed_choice:
+    if seed is not None:
+        use_seeded = True
+    elif ask_seed_choice:
         use_seeded = cli_prompts.prompt_yes_no(
             "Use default seeded run?",
             default=True,
@@ -174,7 +181,9 @@ def run_setup(
     else:
         use_seeded = use_seeded_default
 
-    if use_seeded:
+    if seed is not None:
+        seeded_flag = True
+    elif use_seeded:
         seed = DEFAULT_SEED
         seeded_flag = True
     else:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pytest
 import copy
+from typing import Optional
 
 from bridge_engine.hand_profile import (
     HandProfile,
@@ -12,6 +13,7 @@ from bridge_engine.hand_profile import (
     SubProfile,
     SeatProfile,
 )
+from bridge_engine.setup_env import run_setup
 
 
 # ---------------------------------------------------------------------------
@@ -100,4 +102,66 @@ def make_valid_profile():
         # Convert JSON → HandProfile
         return HandProfile.from_dict(data)
 
-    return _make
\ No newline at end of file
+    return _make
+
+
+# ---------------------------------------------------------------------------
+# Shared generation helpers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def make_setup(tmp_path):
+    """
+    Factory returning a run_setup() result with its directories under tmp_path.
+
+    An explicit seed gives a seeded run with exactly that seed; otherwise
+    `seeded` chooses between DEFAULT_SEED and an unseeded (random) run.
+    """
+    def _make(
+        profile_name: str = "p",
+        *,
+        seed: Optional[int] = None,
+        seeded: bool = True,
+    ):
+        return run_setup(
+            base_dir=tmp_path,
+            owner="TestOwner",
+            profile_name=profile_name,
+            ask_seed_choice=False,
+            use_seeded_default=seeded,
+            seed=seed,
+        )
+
+    return _make
+
+
+@pytest.fixture
+def snapshot_deals():
+    """
+    Return a function mapping deals to comparable plain tuples
+    (board number, dealer, vulnerability, hands as lists).
+    """
+    def _snapshot(deals):
+        return [
+            (d.board_number, d.dealer, d.vulnerability,
+             {seat: list(cards) for seat, cards in d.hands.items()})
+            for d in deals
+        ]
+
+    return _snapshot
+
+
+@pytest.fixture
+def with_north_min_hcp():
+    """
+    Return a function copying a profile with North's first subprofile
+    requiring at least min_hcp points (changes the constraints, and so the
+    profile's pool key).
+    """
+    def _with(profile: HandProfile, min_hcp: int) -> HandProfile:
+        data = profile.to_dict()
+        data["seat_profiles"]["N"]["subprofiles"][0]["standard"]["total_min_hcp"] = min_hcp
+        return HandProfile.from_dict(data)
+
+    return _with
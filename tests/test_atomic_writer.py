@@ -0,0 +1,204 @@
+# tests/test_atomic_writer.py
+"""
+Tests for the buffered incremental writers (atomic_writer, LinFileWriter,
+TxtDealWriter) and their use by the Section D entry points.
+"""
+from __future__ import annotations
+
+import os
+import stat
+
+import pytest
+
+from bridge_engine.atomic_writer import AtomicBufferedWriter
+from bridge_engine.deal_generator import generate_deals, iter_deals
+from bridge_engine.deal_output import (
+    OutputError,
+    _write_text_output,
+    render_deals,
+    stream_deals,
+)
+from bridge_engine.lin_encoder import LinFileWriter
+from bridge_engine.setup_env import run_setup
+
+
+def _tmp_files(directory):
+    return sorted(p.name for p in directory.glob("*.tmp"))
+
+
+class TestAtomicBufferedWriter:
+    """Commit on close, discard on abort, O(1) append."""
+
+    def test_overwrite_commits_on_close(self, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_text("old\n", encoding="utf-8")
+        writer = AtomicBufferedWriter(path)
+        writer.write_record("a\n")
+        writer.write_record("b\n")
+        assert path.read_text(encoding="utf-8") == "old\n"
+        writer.close()
+        assert path.read_text(encoding="utf-8") == "a\nb\n"
+        assert _tmp_files(tmp_path) == []
+        writer.close()  # idempotent
+
+    def test_exception_in_block_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_text("old\n", encoding="utf-8")
+        with pytest.raises(RuntimeError):
+            with AtomicBufferedWriter(path) as writer:
+                writer.write_record("new\n")
+                raise RuntimeError("boom")
+        assert path.read_text(encoding="utf-8") == "old\n"
+        assert _tmp_files(tmp_path) == []
+
+    def test_append_writes_in_place(self, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_text("old\n", encoding="utf-8")
+        with AtomicBufferedWriter(path, append=True) as writer:
+            writer.write_record("new\n")
+        assert path.read_text(encoding="utf-8") == "old\nnew\n"
+        assert _tmp_files(tmp_path) == []
+
+    def test_periodic_flush(self, tmp_path):
+        path = tmp_path / "out.txt"
+        writer = AtomicBufferedWriter(path, flush_every=2)
+        writer.write_record("a\n")
+        (tmp,) = tmp_path.glob("*.tmp")
+        assert tmp.stat().st_size == 0
+        writer.write_record("b\n")
+        assert tmp.stat().st_size == 4
+        writer.abort()
+        assert not path.exists()
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_committed_file_permissions(self, tmp_path):
+        old_umask = os.umask(0o022)
+        try:
+            fresh = tmp_path / "new.txt"
+            with AtomicBufferedWriter(fresh) as writer:
+                writer.write_record("a\n")
+            assert stat.S_IMODE(fresh.stat().st_mode) == 0o644
+
+            existing = tmp_path / "shared.txt"
+            existing.write_text("old\n", encoding="utf-8")
+            existing.chmod(0o664)
+            with AtomicBufferedWriter(existing) as writer:
+                writer.write_record("b\n")
+            assert stat.S_IMODE(existing.stat().st_mode) == 0o664
+        finally:
+            os.umask(old_umask)
+
+    def test_lin_writer_lines(self, tmp_path):
+        from bridge_engine.lin_encoder import Deal as LinDeal
+
+        path = tmp_path / "out.lin"
+        hands = {"N": ["AS"], "E": ["KS"], "S": ["QS"], "W": ["JS"]}
+        with LinFileWriter(path) as writer:
+            for n in (1, 2, 3):
+                writer.write_deal(LinDeal(board_number=n, dealer="N", hands=hands))
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+
+class TestSectionDWriters:
+    """render_deals / stream_deals go through the writers."""
+
+    def _setup(self, tmp_path, profile):
+        return run_setup(
+            base_dir=tmp_path,
+            owner="TestOwner",
+            profile_name=profile.profile_name,
+            ask_seed_choice=False,
+            use_seeded_default=True,
+        )
+
+    def test_text_append_does_not_read_back(self, tmp_path, monkeypatch, make_valid_profile):
+        profile = make_valid_profile()
+        path = tmp_path / "out.txt"
+        _write_text_output(path, profile, [], append=False, print_to_console=False)
+        header = path.read_text(encoding="utf-8")
+
+        def no_read(*_a, **_k):
+            raise AssertionError("append must not read the existing file")
+
+        monkeypatch.setattr(type(path), "read_text", no_read)
+        _write_text_output(path, profile, [], append=True, print_to_console=False)
+        monkeypatch.undo()
+        assert path.read_text(encoding="utf-8") == header * 2
+
+    def test_render_writes_boards_as_they_are_formatted(
+        self, tmp_path, make_valid_profile, monkeypatch
+    ):
+        profile = make_valid_profile()
+        setup = self._setup(tmp_path, profile)
+        deal_set = generate_deals(setup, profile, 3, workers=1)
+        records = []
+        real_write_record = AtomicBufferedWriter.write_record
+
+        def spy(self, text):
+            records.append((type(self).__name__, text))
+            real_write_record(self, text)
+
+        monkeypatch.setattr(AtomicBufferedWriter, "write_record", spy)
+        render_deals(setup, profile, deal_set, print_to_console=False)
+        assert [name for name, _ in records] == ["TxtDealWriter"] * 3 + ["LinFileWriter"] * 3
+
+    def test_stream_append_matches_render_append(self, tmp_path, make_valid_profile):
+        profile = make_valid_profile()
+        setup = self._setup(tmp_path, profile)
+        deal_set = generate_deals(setup, profile, 3, workers=1)
+
+        render_deals(setup, profile, deal_set, print_to_console=False)
+        render_deals(setup, profile, deal_set, print_to_console=False, append_txt=True)
+        expected = setup.output_txt_file.read_text(encoding="utf-8")
+
+        stream_deals(setup, profile, iter_deals(setup, profile, num_deals=3))
+        stream_deals(setup, profile, iter_deals(setup, profile, num_deals=3),
+                     append_txt=True)
+        assert setup.output_txt_file.read_text(encoding="utf-8") == expected
+
+    def test_write_failure_keeps_previous_files(
+        self, tmp_path, make_valid_profile, monkeypatch
+    ):
+        profile = make_valid_profile()
+        setup = self._setup(tmp_path, profile)
+        stream_deals(setup, profile, iter_deals(setup, profile, num_deals=2))
+        txt = setup.output_txt_file.read_text(encoding="utf-8")
+        lin = setup.output_lin_file.read_text(encoding="utf-8")
+
+        def failing_write(self, deal):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(LinFileWriter, "write_deal", failing_write)
+        with pytest.raises(OutputError):
+            stream_deals(setup, profile, iter_deals(setup, profile, num_deals=4))
+        assert setup.output_txt_file.read_text(encoding="utf-8") == txt
+        assert setup.output_lin_file.read_text(encoding="utf-8") == lin
+        assert _tmp_files(setup.output_txt_file.parent) == []
+        assert _tmp_files(setup.output_lin_file.parent) == []
+
+    def test_commit_failure_keeps_both_previous_files(
+        self, tmp_path, make_valid_profile, monkeypatch
+    ):
+        # Both temp files are finished (fsync'ed) before either is renamed,
+        # so a failure finishing the LIN file must not commit the TXT file.
+        profile = make_valid_profile()
+        setup = self._setup(tmp_path, profile)
+        stream_deals(setup, profile, iter_deals(setup, profile, num_deals=2))
+        txt = setup.output_txt_file.read_text(encoding="utf-8")
+        lin = setup.output_lin_file.read_text(encoding="utf-8")
+
+        real_fsync, calls = os.fsync, []
+
+        def fsync(fd):
+            calls.append(fd)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        with pytest.raises(OutputError):
+            stream_deals(setup, profile, iter_deals(setup, profile, num_deals=4))
+        assert setup.output_txt_file.read_text(encoding="utf-8") == txt
+        assert setup.output_lin_file.read_text(encoding="utf-8") == lin
+        assert _tmp_files(setup.output_txt_file.parent) == []
+        assert _tmp_files(setup.output_lin_file.parent) == []
@@ -0,0 +1,150 @@
+# tests/test_batch_cli.py
+"""
+Tests for the non-interactive `generate` command (batch_cli.py): job and
+manifest parsing, profile resolution/reuse, and end-to-end runs with a
+JSON run summary.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bridge_engine import batch_cli, orchestrator
+from bridge_engine import deal_generator as dg
+from bridge_engine.batch_cli import BatchError, GenerateJob, load_manifest
+
+PROFILES_DIR = Path("profiles")
+BIG_HANDS = "Big Hands"
+
+
+def _run(tmp_path: Path, *args: str) -> int:
+    return batch_cli.main([
+        *args, "--profiles-dir", str(PROFILES_DIR),
+        "--output-dir", str(tmp_path / "out"), "--quiet",
+    ])
+
+
+def _summary(tmp_path: Path) -> dict:
+    (path,) = (tmp_path / "out" / "logs").glob("generate_*.json")
+    return json.loads(path.read_text())
+
+
+class TestJobs:
+    """GenerateJob.from_dict() and load_manifest()."""
+
+    def test_bad_options_rejected(self):
+        with pytest.raises(BatchError, match="unknown"):
+            GenerateJob.from_dict({"profile": "x", "colour": "red"})
+        with pytest.raises(BatchError, match="needs a 'profile'"):
+            GenerateJob.from_dict({"boards": 3})
+        for bad in ({"boards": 0}, {"workers": "2"}, {"seed": True},
+                    {"format": "pdf"}, {"rotate": "yes"}):
+            with pytest.raises(BatchError):
+                GenerateJob.from_dict({"profile": "x", **bad})
+
+    def test_manifest_precedence(self, tmp_path):
+        manifest = tmp_path / "jobs.json"
+        manifest.write_text(json.dumps({
+            "defaults": {"boards": 3, "seed": 1},
+            "jobs": [{"profile": "a"}, {"profile": "b", "seed": 9}],
+        }))
+        a, b = load_manifest(manifest, {"boards": 10, "owner": "Nightly", "seed": 2})
+        assert (a.boards, a.seed, a.owner) == (3, 1, "Nightly")
+        assert (b.boards, b.seed) == (3, 9)
+
+        manifest.write_text(json.dumps([{"profile": "a", "boards": -1}]))
+        with pytest.raises(BatchError, match="manifest job 1"):
+            load_manifest(manifest)
+
+
+class TestProfileCatalog:
+    """Profile references resolve by path, file name or profile name."""
+
+    def test_references_share_one_validated_profile(self, monkeypatch):
+        calls = []
+        real_validate = batch_cli.validate_profile
+
+        def counting_validate(profile):
+            calls.append(profile.profile_name)
+            return real_validate(profile)
+
+        monkeypatch.setattr(batch_cli, "validate_profile", counting_validate)
+        catalog = batch_cli.ProfileCatalog(PROFILES_DIR)
+        by_name = catalog.resolve("big hands")
+        by_file = catalog.resolve("Big_Hands_v0.1.json")
+        by_path = catalog.resolve(str(PROFILES_DIR / "Big_Hands_v0.1.json"))
+        assert by_name[1] is by_file[1] is by_path[1]
+        assert calls == ["Big Hands"]
+        with pytest.raises(BatchError, match="no profile matches"):
+            catalog.resolve("No Such Profile")
+
+
+class TestGenerateCommand:
+    """batch_cli.main() end to end."""
+
+    def test_seeded_runs_are_reproducible(self, tmp_path):
+        assert _run(tmp_path / "a", BIG_HANDS, "-n", "3", "--seed", "5") == 0
+        assert _run(tmp_path / "b", BIG_HANDS, "-n", "3", "--seed", "5") == 0
+        (job_a,) = _summary(tmp_path / "a")["jobs"]
+        (job_b,) = _summary(tmp_path / "b")["jobs"]
+        assert job_a["status"] == "ok" and job_a["boards_written"] == 3
+        assert job_a["seed"] == 5
+        for key in ("txt_path", "lin_path"):
+            assert Path(job_a[key]).read_bytes() == Path(job_b[key]).read_bytes()
+
+    def test_manifest_with_failing_job(self, tmp_path):
+        manifest = tmp_path / "jobs.json"
+        manifest.write_text(json.dumps({
+            "defaults": {"boards": 2, "seed": 3},
+            "jobs": [
+                {"profile": BIG_HANDS, "format": "lin"},
+                {"profile": "missing"},
+                {"profile": BIG_HANDS, "workers": 1, "rotate": False},
+            ],
+        }))
+        assert _run(tmp_path, "--manifest", str(manifest)) == 1
+        summary = _summary(tmp_path)
+        assert (summary["jobs_total"], summary["jobs_failed"]) == (3, 1)
+        first, missing, third = summary["jobs"]
+        assert first["txt_path"] is None and Path(first["lin_path"]).exists()
+        assert missing["status"] == "error" and "missing" in missing["error"]
+        # Same profile twice: the second job's files get a distinct label.
+        assert third["label"] == "Big Hands_2"
+        assert third["rotate"] is False and Path(third["txt_path"]).exists()
+
+    def test_interrupted_job_resumes_with_its_seed(self, tmp_path, monkeypatch):
+        assert _run(tmp_path / "full", BIG_HANDS, "-n", "4", "--seed", "9") == 0
+        (expected,) = _summary(tmp_path / "full")["jobs"]
+
+        real = dg._build_board_with_retries
+
+        def interrupt(rng, profile, board_number, *args, **kwargs):
+            if board_number == 3:
+                raise KeyboardInterrupt
+            return real(rng, profile, board_number, *args, **kwargs)
+
+        with monkeypatch.context() as m:
+            m.setattr(dg, "_build_board_with_retries", interrupt)
+            with pytest.raises(KeyboardInterrupt):
+                _run(tmp_path, BIG_HANDS, "-n", "4", "--seed", "9")
+        assert list((tmp_path / "out" / "logs").glob("checkpoint_*_9.json"))
+
+        assert _run(tmp_path, BIG_HANDS, "-n", "4", "--resume") == 0
+        (job,) = _summary(tmp_path)["jobs"]
+        assert job["seed"] == 9 and job["resumed"] is True
+        assert Path(job["lin_path"]).read_bytes() == Path(expected["lin_path"]).read_bytes()
+        assert not list((tmp_path / "out" / "logs").glob("checkpoint_*"))
+
+    def test_usage_errors(self, tmp_path, capsys):
+        with pytest.raises(SystemExit):
+            _run(tmp_path)  # neither PROFILE nor --manifest
+        assert _run(tmp_path, "--manifest", str(tmp_path / "none.json")) == 2
+        assert "could not read manifest" in capsys.readouterr().err
+
+    def test_orchestrator_dispatches_generate(self, monkeypatch):
+        seen = []
+        monkeypatch.setattr(batch_cli, "main", lambda argv: seen.append(argv) or 0)
+        assert orchestrator.main(["generate", "Big Hands", "-n", "2"]) == 0
+        assert seen == [["Big Hands", "-n", "2"]]
@@ -0,0 +1,139 @@
+# tests/test_batch_engine.py
+"""
+Tests for the optional NumPy batch-attempt engine (deal_generator_batch.py).
+
+Engine-selection and fallback tests run everywhere; tests that actually
+deal batches are skipped when NumPy is not installed.
+"""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from bridge_engine import deal_generator as dg
+from bridge_engine import deal_generator_batch as dgb
+from bridge_engine.hand_profile import (
+    HandProfile, SeatProfile, SubProfile, StandardSuitConstraints, SuitRange,
+    RandomSuitConstraintData,
+)
+
+
+def _std(spades_min: int = 0, total_min: int = 0, total_max: int = 37):
+    open_r = SuitRange()
+    return StandardSuitConstraints(
+        spades=SuitRange(min_cards=spades_min, max_cards=13),
+        hearts=open_r, diamonds=open_r, clubs=open_r,
+        total_min_hcp=total_min, total_max_hcp=total_max,
+    )
+
+
+def _profile(north_sub: SubProfile) -> HandProfile:
+    seat_profiles = {
+        "N": SeatProfile(seat="N", subprofiles=[north_sub]),
+        "E": SeatProfile(seat="E", subprofiles=[SubProfile(standard=_std())]),
+        "S": SeatProfile(seat="S", subprofiles=[SubProfile(standard=_std())]),
+        "W": SeatProfile(seat="W", subprofiles=[SubProfile(standard=_std())]),
+    }
+    return HandProfile(
+        profile_name="Batch test",
+        description="",
+        dealer="N",
+        hand_dealing_order=["N", "E", "S", "W"],
+        tag="Opener",
+        seat_profiles=seat_profiles,
+    )
+
+
+def _standard_profile() -> HandProfile:
+    return _profile(SubProfile(standard=_std(spades_min=4, total_min=12, total_max=17)))
+
+
+def _rs_profile() -> HandProfile:
+    rs = RandomSuitConstraintData(
+        required_suits_count=1,
+        allowed_suits=["S", "H"],
+        suit_ranges=[SuitRange(min_cards=6, max_cards=6)],
+    )
+    return _profile(SubProfile(standard=_std(), random_suit_constraint=rs))
+
+
+class TestEngineSelection:
+    """_batch_engine_supports() gates on NumPy and standard-only subprofiles."""
+
+    def test_rs_profile_not_supported(self):
+        assert dgb._batch_engine_supports(_rs_profile()) is False
+
+    def test_tight_shape_profile_not_supported(self):
+        """5+ spades is "tight": the scalar path's pre-allocation wins."""
+        tight = _profile(SubProfile(standard=_std(spades_min=5)))
+        assert dgb._batch_engine_supports(tight) is False
+
+    def test_missing_numpy_not_supported(self, monkeypatch):
+        monkeypatch.setattr(dgb, "_NUMPY", False)
+        assert dgb._batch_engine_supports(_standard_profile()) is False
+
+    def test_missing_numpy_falls_back_to_scalar(self, monkeypatch):
+        """With NumPy missing, the flag is harmless: output = scalar path."""
+        profile = _standard_profile()
+        scalar = dg._build_single_constrained_deal_v2(random.Random(5), profile, 1)
+        monkeypatch.setattr(dgb, "_NUMPY", False)
+        monkeypatch.setattr(dg, "ENABLE_NUMPY_BATCH_ENGINE", True)
+        fallback = dg._build_single_constrained_deal_v2(random.Random(5), profile, 1)
+        assert fallback.hands == scalar.hands
+
+    @pytest.mark.parametrize("option", ["should_stop", "telemetry", "deal_policy", "combo_stats"])
+    def test_builder_options_fall_back_to_scalar(self, monkeypatch, option):
+        """Options the batch engine does not honour keep the scalar path."""
+        from bridge_engine import deal_generator_v2 as v2
+        from bridge_engine.board_telemetry import BoardTelemetry
+        from bridge_engine.combo_stats import ComboStats
+        from bridge_engine.deal_policy import DealPolicy
+
+        def no_batch(*args, **kwargs):
+            raise AssertionError("batch engine used")
+
+        monkeypatch.setattr(dg, "ENABLE_NUMPY_BATCH_ENGINE", True)
+        monkeypatch.setattr(v2, "_batch_engine_supports", lambda profile: True)
+        monkeypatch.setattr(v2, "_build_single_constrained_deal_batch", no_batch)
+        value = {
+            "should_stop": lambda: False,
+            "telemetry": BoardTelemetry(),
+            "deal_policy": DealPolicy(),
+            "combo_stats": ComboStats(),
+        }[option]
+        deal = dg._build_single_constrained_deal_v2(
+            random.Random(5), _standard_profile(), 1, **{option: value}
+        )
+        assert deal.board_number == 1
+
+
+class TestBatchDeals:
+    """Boards built by the batch engine (requires NumPy)."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self, monkeypatch):
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(dg, "ENABLE_NUMPY_BATCH_ENGINE", True)
+
+    def test_deal_satisfies_constraints(self):
+        profile = _standard_profile()
+        deal = dg._build_single_constrained_deal_v2(random.Random(1), profile, 1)
+        north = deal.hands["N"]
+        assert sum(1 for c in north if c[1] == "S") >= 4
+        hcp = sum({"A": 4, "K": 3, "Q": 2, "J": 1}.get(c[0], 0) for c in north)
+        assert 12 <= hcp <= 17
+        cards = [c for hand in deal.hands.values() for c in hand]
+        assert len(cards) == 52 and len(set(cards)) == 52
+
+    def test_seeded_reproducible(self):
+        profile = _standard_profile()
+        a = dg._build_single_constrained_deal_v2(random.Random(9), profile, 1)
+        b = dg._build_single_constrained_deal_v2(random.Random(9), profile, 1)
+        assert a.hands == b.hands
+
+    def test_exhaustion_raises(self, monkeypatch):
+        impossible = _profile(SubProfile(standard=_std(total_min=37)))
+        monkeypatch.setattr(dg, "MAX_BOARD_ATTEMPTS", 50)
+        with pytest.raises(dg.DealGenerationError, match="batch"):
+            dg._build_single_constrained_deal_v2(random.Random(2), impossible, 1)
@@ -0,0 +1,63 @@
+# tests/test_benchmark_compare.py
+"""
+Tests for the regression comparison of benchmark_portfolio.py
+(--json / --compare): stored results round-trip and slowdowns are only
+flagged when they exceed the threshold with an interval above zero.
+"""
+from __future__ import annotations
+
+import benchmark_portfolio as bp
+
+
+def _result(label: str, times_ms, attempts=None) -> dict:
+    times = [t / 1000 for t in times_ms]
+    return {
+        "label": label,
+        "board_times": times,
+        "board_attempts": attempts or [10] * len(times),
+    }
+
+
+def _baseline(*results) -> dict:
+    return {"profiles": list(results)}
+
+
+class TestCompare:
+    """compare_results() / bootstrap_delta()."""
+
+    def test_clear_slowdown_is_regression(self):
+        base = [10.0 + i % 3 for i in range(30)]
+        slow = [t * 1.5 for t in base]
+        (row,) = bp.compare_results(_baseline(_result("W2", base)), [_result("W2", slow)])
+        assert row["regression"] is True
+        delta, low, high = row["median_delta"]
+        assert low > 0 and low <= delta <= high
+        assert row["median_pct"] > 40
+
+    def test_within_threshold_or_noise_passes(self):
+        base = [10.0 + i % 3 for i in range(30)]
+        (row,) = bp.compare_results(
+            _baseline(_result("W2", base)), [_result("W2", [t * 1.05 for t in base])],
+        )
+        assert row["regression"] is False
+        # Tiny boards: timer noise, never a failure.
+        (row,) = bp.compare_results(
+            _baseline(_result("A", [0.01] * 20)), [_result("A", [0.05] * 20)],
+        )
+        assert row["regression"] is False
+
+    def test_attempt_delta_and_missing_profiles(self):
+        rows = bp.compare_results(
+            _baseline(_result("D", [1.0] * 10, [5] * 10)),
+            [_result("D", [1.0] * 10, [7] * 10), _result("new", [1.0] * 10)],
+        )
+        assert [row["label"] for row in rows] == ["D"]
+        assert rows[0]["attempts_delta"] == (2.0, 2.0, 2.0)
+
+    def test_results_round_trip(self, tmp_path):
+        path = tmp_path / "base.json"
+        bp.write_results(path, [{**_result("A", [1.0]), "report": "x"}], 1, "shape help")
+        payload = bp.load_results(path)
+        assert payload["profiles"][0]["label"] == "A"
+        assert "report" not in payload["profiles"][0]
+        assert set(payload["environment"]) >= {"commit", "python", "cpu"}
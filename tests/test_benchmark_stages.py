@@ -0,0 +1,38 @@
+# tests/test_benchmark_stages.py
+"""
+Smoke tests for the stage micro-benchmarks (benchmark_stages.py): every
+stage still runs against the current builder signatures, and measure()
+reports sane figures.  Timing itself is not asserted.
+"""
+from __future__ import annotations
+
+import pytest
+
+import benchmark_stages as bs
+
+
+@pytest.fixture(scope="module")
+def fixture():
+    return bs.Fixture()
+
+
+class TestStages:
+    """STAGES factories and measure()."""
+
+    @pytest.mark.parametrize("name", list(bs.STAGES))
+    def test_stage_runs(self, fixture, name):
+        op = bs.STAGES[name](fixture)
+        op()
+        op()  # repeatable: stages never consume the shared fixture
+
+    def test_fixture_hand_is_a_weak_two(self, fixture):
+        matched, _, _ = bs._match_seat_compiled(
+            fixture.profile, "W", fixture.compiled, 1,
+            fixture.lengths, fixture.suit_hcp, {}, fixture.rng, {"W": fixture.rs_suits},
+        )
+        assert len(fixture.hand_ids) == 13 and matched
+
+    def test_measure(self, fixture):
+        (result,) = bs.run_stages(["_match_standard"], min_time=0.001, repeats=2, memory_ops=5)
+        assert result.name == "_match_standard"
+        assert result.ns_per_op > 0 and result.peak_bytes_per_op >= 0
@@ -0,0 +1,135 @@
+# tests/test_board_telemetry.py
+"""
+Tests for per-board builder telemetry (board_telemetry.py and
+generate_deals(telemetry=...)): one record per board, deals unchanged,
+sampled attempt events, JSONL output and identical records across modes.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bridge_engine import batch_cli
+from bridge_engine import deal_generator as dg
+from bridge_engine.board_telemetry import BoardTelemetry, telemetry_path_for
+from bridge_engine.hand_profile import HandProfile
+
+# Several subprofiles per seat and an HCP-heavy opening seat, so the
+# counters are not all zero.
+PROFILE_PATH = Path("profiles/Our_1_Major_&_Opponents_Interference_v0.2.json")
+
+BOARD_KEYS = {
+    "event", "board", "success", "attempts", "builder_calls", "reseeds",
+    "subprofile_rerolls", "rs_rerolls", "hcp_early_rejections",
+    "seat_fail", "seat_seen", "seat_fail_hcp", "seat_fail_shape",
+    "subprofile_indices", "rs_suits", "elapsed_s",
+}
+
+
+def _profile() -> HandProfile:
+    return HandProfile.from_dict(json.loads(PROFILE_PATH.read_text()))
+
+
+def _boards(records):
+    return [r for r in records if r["event"] == "board"]
+
+
+def _without_time(records):
+    return [{k: v for k, v in r.items() if k != "elapsed_s"} for r in records]
+
+
+class TestBoardRecords:
+    """Records written by generate_deals(telemetry=...)."""
+
+    @pytest.mark.parametrize("workers", [None, 1])
+    def test_one_record_per_board(self, workers, make_setup):
+        profile, setup = _profile(), make_setup(seed=31)
+        telemetry = BoardTelemetry()
+        deal_set = dg.generate_deals(setup, profile, 5, workers=workers, telemetry=telemetry)
+
+        boards = _boards(telemetry.records)
+        assert [r["board"] for r in boards] == [1, 2, 3, 4, 5]
+        for record, attempts in zip(boards, deal_set.board_attempts):
+            assert set(record) == BOARD_KEYS
+            assert record["success"] is True
+            assert record["attempts"] == attempts
+            assert sum(record["seat_seen"].values()) >= attempts - record["hcp_early_rejections"]
+            assert set(record["subprofile_indices"]) <= set(profile.seat_profiles)
+
+    @pytest.mark.parametrize("workers", [None, 1])
+    def test_deals_unchanged(self, workers, make_setup):
+        profile, setup = _profile(), make_setup(seed=31)
+        plain = dg.generate_deals(setup, profile, 4, workers=workers)
+        traced = dg.generate_deals(
+            setup, profile, 4, workers=workers,
+            telemetry=BoardTelemetry(attempt_every=1),
+        )
+        assert traced.deals == plain.deals
+
+    def test_worker_processes_match_in_process(self, make_setup):
+        profile, setup = _profile(), make_setup(seed=31)
+        single, multi = BoardTelemetry(attempt_every=3), BoardTelemetry(attempt_every=3)
+        dg.generate_deals(setup, profile, 4, workers=1, telemetry=single)
+        dg.generate_deals(setup, profile, 4, workers=2, telemetry=multi)
+        assert _without_time(multi.records) == _without_time(single.records)
+
+    def test_failed_board_is_recorded(self, monkeypatch, make_setup):
+        monkeypatch.setattr(dg, "MAX_BOARD_ATTEMPTS", 1)
+        monkeypatch.setattr(dg, "MAX_BOARD_RETRIES", 2)
+        telemetry = BoardTelemetry()
+        with pytest.raises(dg.DealGenerationError):
+            dg.generate_deals(make_setup(seed=31), _profile(), 3, telemetry=telemetry)
+        (record,) = _boards(telemetry.records)
+        assert record["success"] is False and record["builder_calls"] == 2
+
+
+class TestAttemptSampling:
+    """attempt_every controls the per-attempt events."""
+
+    def test_sampled_attempts(self, make_setup):
+        profile, setup = _profile(), make_setup(seed=31)
+        every = BoardTelemetry(attempt_every=1)
+        dg.generate_deals(setup, profile, 3, telemetry=every)
+        boards = _boards(every.records)
+        attempts = [r for r in every.records if r["event"] == "attempt"]
+        # Every failed attempt: all but the successful one of each board.
+        assert len(attempts) == sum(r["attempts"] - 1 for r in boards)
+        assert all(a["reason"] in ("hcp_early", "hcp", "shape", "other", None) for a in attempts)
+
+        fifth = BoardTelemetry(attempt_every=5)
+        dg.generate_deals(setup, profile, 3, telemetry=fifth)
+        assert {a["attempt"] % 5 for a in fifth.records if a["event"] == "attempt"} <= {0}
+
+        none = BoardTelemetry()
+        dg.generate_deals(setup, profile, 3, telemetry=none)
+        assert not [r for r in none.records if r["event"] == "attempt"]
+
+    def test_negative_sampling_rejected(self):
+        with pytest.raises(ValueError):
+            BoardTelemetry(attempt_every=-1)
+
+
+class TestFiles:
+    """JSONL output in the run's logs/ directory."""
+
+    def test_jsonl_written(self, make_setup):
+        setup = make_setup(seed=31)
+        path = telemetry_path_for(setup)
+        assert path.parent == Path(setup.log_dir)
+        with BoardTelemetry(path) as telemetry:
+            dg.generate_deals(setup, _profile(), 2, telemetry=telemetry)
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["board"] for r in _boards(lines)] == [1, 2]
+
+    def test_generate_command(self, tmp_path):
+        out = tmp_path / "out"
+        assert batch_cli.main([
+            "Big Hands", "-n", "2", "--seed", "4", "--telemetry",
+            "--profiles-dir", "profiles", "--output-dir", str(out), "--quiet",
+        ]) == 0
+        (summary_path,) = (out / "logs").glob("generate_*.json")
+        (job,) = json.loads(summary_path.read_text())["jobs"]
+        lines = Path(job["telemetry_path"]).read_text().splitlines()
+        assert len(_boards(json.loads(line) for line in lines)) == 2
@@ -0,0 +1,101 @@
+# tests/test_card_encoding.py
+"""
+Tests for the integer card encoding used on the v2 hot path.
+
+Card id i is _MASTER_DECK[i].  The string-card helpers are thin wrappers over the id versions, so both
+must consume the RNG identically and pick the same cards.
+"""
+from __future__ import annotations
+
+import random
+
+from bridge_engine.deal_generator_types import (
+    _MASTER_DECK, _CARD_HCP,
+    _ID_TO_CARD, _CARD_TO_ID, _ID_SUIT, _ID_HCP, _SUIT_LETTERS,
+    _RANKSET_HCP,
+)
+from bridge_engine.deal_generator_helpers import (
+    _build_deck, _build_deck_ids, _cards_to_ids, _ids_to_cards,
+)
+from bridge_engine.deal_generator_v2 import (
+    _pre_allocate, _pre_allocate_ids, _constrained_fill, _constrained_fill_ids,
+)
+from bridge_engine.seat_viability import (
+    _compute_suit_analysis, _compute_suit_analysis_ids,
+)
+from bridge_engine.hand_profile import (
+    StandardSuitConstraints, SubProfile, SuitRange,
+)
+
+
+def _sub_with_spades(min_cards: int) -> SubProfile:
+    open_r = SuitRange()
+    std = StandardSuitConstraints(
+        spades=SuitRange(min_cards=min_cards, max_cards=13),
+        hearts=open_r, diamonds=open_r, clubs=open_r,
+    )
+    return SubProfile(standard=std)
+
+
+class TestTables:
+    """Id tables agree with the string deck."""
+
+    def test_round_trip(self):
+        assert _ids_to_cards(_cards_to_ids(_MASTER_DECK)) == _MASTER_DECK
+        assert all(_CARD_TO_ID[_ID_TO_CARD[i]] == i for i in range(52))
+
+    def test_suit_and_hcp(self):
+        for i, card in enumerate(_MASTER_DECK):
+            assert _SUIT_LETTERS[_ID_SUIT[i]] == card[1]
+            assert _ID_HCP[i] == _CARD_HCP[card]
+
+    def test_rankset_hcp_full_suit(self):
+        assert _RANKSET_HCP[0x1FFF] == 10
+        assert _RANKSET_HCP[0] == 0
+        assert _RANKSET_HCP[0b1111] == 10  # AKQJ
+
+    def test_fresh_decks(self):
+        assert _build_deck_ids() == list(range(52))
+        assert _build_deck() == _ids_to_cards(_build_deck_ids())
+
+
+class TestSuitAnalysis:
+    """Id-based suit analysis matches the string-card version."""
+
+    def test_analysis_from_ids_matches_strings(self):
+        rng = random.Random(11)
+        for _ in range(50):
+            hand = rng.sample(range(52), 13)
+            a = _compute_suit_analysis_ids(hand)
+            b = _compute_suit_analysis(_ids_to_cards(hand))
+            assert a.total_hcp == b.total_hcp
+            assert a.hcp_by_suit == b.hcp_by_suit
+            for s in _SUIT_LETTERS:
+                assert len(a.cards_by_suit[s]) == len(b.cards_by_suit[s])
+
+
+class TestWrapperEquivalence:
+    """String wrappers pick the same cards as the id versions."""
+
+    def test_pre_allocate_same_cards(self):
+        sub = _sub_with_spades(6)
+        deck_s = _build_deck()
+        deck_i = _build_deck_ids()
+        random.Random(3).shuffle(deck_s)
+        random.Random(3).shuffle(deck_i)
+        got_s = _pre_allocate(random.Random(5), deck_s, sub)
+        got_i = _pre_allocate_ids(random.Random(5), deck_i, sub)
+        assert got_s == _ids_to_cards(got_i)
+        assert deck_s == _ids_to_cards(deck_i)
+
+    def test_constrained_fill_same_cards(self):
+        deck_s = _build_deck()
+        random.Random(9).shuffle(deck_s)
+        deck_i = _cards_to_ids(deck_s)
+        maxima = {"S": 2, "H": 13, "D": 13, "C": 13}
+        got_s = _constrained_fill(deck_s, 13, [], maxima, 10, {"H": 3})
+        got_i = _constrained_fill_ids(
+            deck_i, 13, [], (2, 13, 13, 13), 10, (99, 3, 99, 99)
+        )
+        assert got_s == _ids_to_cards(got_i)
+        assert deck_s == _ids_to_cards(deck_i)
@@ -1,7 +1,11 @@
 # tests/test_cli_entrypoints.py
 from __future__ import annotations
 
+import ast
 import builtins
+import subprocess
+import sys
+from pathlib import Path
 from typing import List
 
 from bridge_engine import orchestrator
@@ -17,4 +21,67 @@ def test_orchestrator_main_calls_main_menu(monkeypatch):
 
     orchestrator.main()
 
-    assert calls == ["main_menu"]
\ No newline at end of file
+    assert calls == ["main_menu"]
+
+def test_main_profile_import_time_skips_menu(monkeypatch):
+    from bridge_engine import import_timing
+
+    calls: List[str] = []
+    monkeypatch.setattr(orchestrator, "main_menu", lambda: calls.append("main_menu"))
+    monkeypatch.setattr(
+        import_timing, "print_import_time_report", lambda: calls.append("report")
+    )
+
+    orchestrator.main(["--profile-import-time"])
+
+    assert calls == ["report"]
+
+
+def test_orchestrator_import_defers_heavy_modules():
+    code = (
+        "import sys, bridge_engine.orchestrator as o\n"
+        "print(sorted(m for m in sys.modules if m.startswith('bridge_engine.')))\n"
+        "o._import_deferred()\n"
+        "print(sorted(m for m in sys.modules if m.startswith('bridge_engine.')))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+    ).stdout.splitlines()
+    at_start, after_deferred = (ast.literal_eval(line) for line in out)
+
+    assert at_start == [
+        "bridge_engine.cli_io", "bridge_engine.menu_help", "bridge_engine.orchestrator",
+    ]
+    assert "bridge_engine.deal_generator" in after_deferred
+    for lazy in ("profile_cli", "wizard_flow", "lin_tools", "deal_generator_v1"):
+        assert f"bridge_engine.{lazy}" not in after_deferred
+
+
+def test_deferred_names_resolve_as_module_attributes():
+    from bridge_engine import deal_generator
+
+    assert orchestrator.generate_deals is deal_generator.generate_deals
+    assert orchestrator.PROFILE_DIR_NAME == "profiles"
+    assert deal_generator._build_single_constrained_deal.__module__ == (
+        "bridge_engine.deal_generator_v1"
+    )
+
+
+def test_parse_import_times_splits_stages():
+    from bridge_engine import import_timing as it
+
+    text = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 | site",
+        it._STAGE_MARKER,
+        "import time:        50 |         50 |   typing",
+        "import time:       200 |        250 | bridge_engine.orchestrator",
+    ])
+    pre, stage = it.parse_import_times(text)
+    assert [r.module for r in pre] == ["site"]
+    assert [(r.module, r.depth) for r in stage] == [
+        ("typing", 1), ("bridge_engine.orchestrator", 0),
+    ]
+    assert it.StageTiming("Start-up", stage).total_us == 250
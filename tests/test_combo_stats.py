@@ -0,0 +1,145 @@
+# tests/test_combo_stats.py
+"""
+Tests for per-combination success-rate learning (combo_stats.ComboStats)
+and generate_deals(combo_stats=...).
+"""
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+from bridge_engine.combo_stats import ComboStats, combo_key, stats_path_for
+from bridge_engine.deal_generator import generate_deals
+from bridge_engine.deal_generator_types import (
+    ADAPTIVE_REROLL_PROBE,
+    SUBPROFILE_REROLL_INTERVAL,
+)
+from bridge_engine.hand_profile import HandProfile
+
+WEAK2S_PATH = Path("profiles/Defense_to_3_Weak_2s_v0.2.json")
+
+
+def _key(n_index: int = 0, rs=None):
+    return combo_key({"N": n_index, "E": 0, "S": 0, "W": 0}, rs or {})
+
+
+class TestComboKey:
+    """Keys are order-independent and hashable."""
+
+    def test_order_independent(self):
+        a = combo_key({"S": 1, "N": 0}, {"W": ["H", "S"]})
+        b = combo_key({"N": 0, "S": 1}, {"W": ("H", "S")})
+        assert a == b
+        assert hash(a) == hash(b)
+
+    def test_rs_choice_distinguishes(self):
+        assert _key(rs={"W": ["H"]}) != _key(rs={"W": ["S"]})
+
+
+class TestBudget:
+    """Thompson-sampled round budgets."""
+
+    def test_unseen_key_gets_legacy_interval(self):
+        assert ComboStats().budget(_key(), random.Random(1)) == SUBPROFILE_REROLL_INTERVAL
+
+    def test_easy_key_gets_short_budget(self):
+        stats = ComboStats()
+        stats.record(_key(), 100, True)
+        for _ in range(49):
+            stats.record(_key(), 2, True)
+        rng = random.Random(1)
+        budgets = [stats.budget(_key(), rng) for _ in range(50)]
+        assert all(b == ADAPTIVE_REROLL_PROBE for b in budgets)
+
+    def test_hopeless_key_only_probed(self):
+        stats = ComboStats()
+        stats.record(_key(), 50_000, False)
+        rng = random.Random(1)
+        assert all(stats.budget(_key(), rng) == ADAPTIVE_REROLL_PROBE for _ in range(50))
+
+    def test_moderate_key_budget_tracks_rate(self):
+        stats = ComboStats()
+        for _ in range(100):
+            stats.record(_key(), 200, True)  # p ~ 1/200
+        rng = random.Random(1)
+        budgets = [stats.budget(_key(), rng) for _ in range(200)]
+        assert 500 < sum(budgets) / len(budgets) < 700  # ~3 / p
+
+    def test_unseen_rs_choice_backs_off_to_selection(self):
+        stats = ComboStats()
+        stats.record(_key(rs={"W": ["H"]}), 50_000, False)
+        rng = random.Random(1)
+        assert stats.budget(_key(rs={"W": ["S"]}), rng) == ADAPTIVE_REROLL_PROBE
+        assert stats.budget(_key(n_index=1), rng) == SUBPROFILE_REROLL_INTERVAL
+
+    def test_zero_attempt_rounds_ignored(self):
+        stats = ComboStats()
+        stats.record(_key(), 0, False)
+        assert len(stats) == 0
+        assert stats.counts(_key()) == (0, 0)
+
+
+class TestPersistence:
+    """save() / load() round trip, tied to the profile's constraints."""
+
+    def test_round_trip(self, tmp_path, make_valid_profile):
+        profile = make_valid_profile()
+        stats = ComboStats()
+        stats.record(_key(rs={"W": ["H", "S"]}), 120, True)
+        stats.record(_key(n_index=1), 40, False)
+        path = stats_path_for(tmp_path, profile)
+        stats.save(path, profile)
+
+        loaded = ComboStats.load(path, profile)
+        assert len(loaded) == 2
+        assert loaded.counts(_key(rs={"W": ["H", "S"]})) == (120, 1)
+        assert loaded.counts(_key(n_index=1)) == (40, 0)
+
+    def test_other_profile_ignored(self, tmp_path, make_valid_profile, with_north_min_hcp):
+        profile = make_valid_profile()
+        other = with_north_min_hcp(profile, 12)
+        stats = ComboStats()
+        stats.record(_key(), 10, True)
+        path = tmp_path / "stats.json"
+        stats.save(path, profile)
+        assert len(ComboStats.load(path, other)) == 0
+
+    def test_missing_or_corrupt_file_gives_empty_store(self, tmp_path, make_valid_profile):
+        profile = make_valid_profile()
+        assert len(ComboStats.load(tmp_path / "missing.json", profile)) == 0
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json", encoding="utf-8")
+        assert len(ComboStats.load(bad, profile)) == 0
+        bad.write_text(json.dumps({"format": 99}), encoding="utf-8")
+        assert len(ComboStats.load(bad, profile)) == 0
+
+
+class TestGenerateDealsWithStats:
+    """generate_deals(combo_stats=...) learns into the given store."""
+
+    def test_serial_run_records_rounds(self, make_setup):
+        profile = HandProfile.from_dict(json.loads(WEAK2S_PATH.read_text()))
+        setup = make_setup(profile.profile_name)
+        stats = ComboStats()
+        generate_deals(setup, profile, 3, combo_stats=stats)
+        counts = [stats.counts(key) for key in stats._counts]
+        assert sum(s for _a, s in counts) == 3
+        assert sum(a for a, _s in counts) >= 3
+
+    def test_seeded_run_reproducible(self, make_setup):
+        profile = HandProfile.from_dict(json.loads(WEAK2S_PATH.read_text()))
+        setup = make_setup(profile.profile_name)
+        a = generate_deals(setup, profile, 2, combo_stats=ComboStats())
+        b = generate_deals(setup, profile, 2, combo_stats=ComboStats())
+        assert [d.hands for d in a.deals] == [d.hands for d in b.deals]
+
+    def test_no_store_by_default(self, make_setup, monkeypatch):
+        def _unexpected(*_args, **_kwargs):
+            raise AssertionError("ComboStats used without being passed")
+
+        monkeypatch.setattr(ComboStats, "budget", _unexpected)
+        monkeypatch.setattr(ComboStats, "record", _unexpected)
+        profile = HandProfile.from_dict(json.loads(WEAK2S_PATH.read_text()))
+        deal_set = generate_deals(make_setup(profile.profile_name), profile, 2)
+        assert len(deal_set.deals) == 2
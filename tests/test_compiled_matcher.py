@@ -0,0 +1,187 @@
+# tests/test_compiled_matcher.py
+"""
+Tests for the compiled per-SubProfile matcher in seat_viability.
+
+_match_seat_compiled must return exactly what _match_seat returns for the
+same hand (matched, chosen RS suits, fail reason) and consume the RNG the
+same way, for every constraint kind and with subprofile exclusions.
+"""
+from __future__ import annotations
+
+import random
+
+from bridge_engine.hand_profile import (
+    HandProfile,
+    OpponentContingentSuitData,
+    PartnerContingentData,
+    RandomSuitConstraintData,
+    SeatProfile,
+    StandardSuitConstraints,
+    SubProfile,
+    SubprofileExclusionClause,
+    SubprofileExclusionData,
+    SuitPairOverride,
+    SuitRange,
+)
+from bridge_engine.seat_viability import (
+    _compile_subprofile,
+    _compute_suit_analysis_ids,
+    _hand_suit_stats_ids,
+    _match_seat,
+    _match_seat_compiled,
+)
+
+
+def _std(**kw) -> StandardSuitConstraints:
+    open_r = SuitRange()
+    return StandardSuitConstraints(
+        spades=kw.get("spades", open_r),
+        hearts=kw.get("hearts", open_r),
+        diamonds=kw.get("diamonds", open_r),
+        clubs=kw.get("clubs", open_r),
+        total_min_hcp=kw.get("total_min_hcp", 0),
+        total_max_hcp=kw.get("total_max_hcp", 37),
+    )
+
+
+_RS = RandomSuitConstraintData(
+    required_suits_count=2,
+    allowed_suits=["S", "H", "D"],
+    suit_ranges=[
+        SuitRange(min_cards=4, max_cards=6, min_hcp=2, max_hcp=10),
+        SuitRange(min_cards=3, max_cards=5),
+    ],
+    pair_overrides=[
+        SuitPairOverride(
+            suits=["H", "S"],
+            first_range=SuitRange(min_cards=5, max_cards=7),
+            second_range=SuitRange(min_cards=2, max_cards=4),
+        ),
+    ],
+)
+
+_SUBS = [
+    SubProfile(standard=_std(total_min_hcp=8, total_max_hcp=14)),
+    SubProfile(
+        standard=_std(
+            spades=SuitRange(min_cards=3, max_cards=6, min_hcp=1, max_hcp=8),
+            clubs=SuitRange(min_cards=0, max_cards=4),
+            total_min_hcp=5,
+            total_max_hcp=20,
+        )
+    ),
+    SubProfile(standard=_std(total_max_hcp=25), random_suit_constraint=_RS),
+    SubProfile(
+        standard=_std(),
+        partner_contingent_constraint=PartnerContingentData(
+            partner_seat="S", suit_range=SuitRange(min_cards=2, max_cards=5)
+        ),
+    ),
+    SubProfile(
+        standard=_std(),
+        opponents_contingent_suit_constraint=OpponentContingentSuitData(
+            opponent_seat="E", suit_range=SuitRange(min_cards=0, max_cards=3)
+        ),
+    ),
+]
+
+
+def _profile(exclusions=None) -> HandProfile:
+    seat_profiles = {
+        s: SeatProfile(seat=s, subprofiles=list(_SUBS)) for s in "NESW"
+    }
+    return HandProfile(
+        profile_name="Compiled matcher test",
+        description="",
+        dealer="N",
+        hand_dealing_order=["N", "E", "S", "W"],
+        tag="Opener",
+        seat_profiles=seat_profiles,
+        subprofile_exclusions=exclusions or [],
+    )
+
+
+def _both(profile, sub_idx0, hand, rs_choices, pre):
+    """Run old and compiled matchers with identically seeded RNGs."""
+    seat = "N"
+    sub = _SUBS[sub_idx0]
+    rng_old = random.Random(7)
+    rng_new = random.Random(7)
+    old = _match_seat(
+        profile=profile,
+        seat=seat,
+        hand=hand,
+        seat_profile=profile.seat_profiles[seat],
+        chosen_subprofile=sub,
+        chosen_subprofile_index_1based=sub_idx0 + 1,
+        random_suit_choices=dict(rs_choices),
+        rng=rng_old,
+        rs_pre_selections=pre,
+        analysis=_compute_suit_analysis_ids(hand),
+    )
+    lengths, hcp = _hand_suit_stats_ids(hand)
+    new = _match_seat_compiled(
+        profile, seat, _compile_subprofile(sub), sub_idx0 + 1,
+        lengths, hcp, dict(rs_choices), rng_new, pre,
+    )
+    assert rng_old.getstate() == rng_new.getstate()
+    return old, new
+
+
+class TestCompiledMatchesLegacy:
+    """Random hands give identical results from both matchers."""
+
+    def test_all_kinds_random_hands(self):
+        profile = _profile()
+        rng = random.Random(2024)
+        contexts = [
+            ({}, None),
+            ({"S": ["H", "D"], "E": ["C"]}, None),
+            ({}, {"N": ["S", "H"]}),
+            ({}, {"N": ["D", "S"]}),
+        ]
+        outcomes = set()
+        for _ in range(500):
+            hand = rng.sample(range(52), 13)
+            for idx0 in range(len(_SUBS)):
+                for rs_choices, pre in contexts:
+                    old, new = _both(profile, idx0, hand, rs_choices, pre)
+                    assert old == new
+                    outcomes.add(old[2])
+        # Every fail reason (and success) was exercised.
+        assert outcomes == {None, "hcp", "shape", "other"}
+
+    def test_exclusions_respected(self):
+        exclusions = [
+            SubprofileExclusionData(
+                seat="N", subprofile_index=1,
+                clauses=[SubprofileExclusionClause(group="ANY", length_eq=4, count=1)],
+            ),
+            SubprofileExclusionData(
+                seat="N", subprofile_index=2, excluded_shapes=["4333", "3433"],
+            ),
+        ]
+        profile = _profile(exclusions)
+        rng = random.Random(99)
+        excluded = 0
+        for _ in range(500):
+            hand = rng.sample(range(52), 13)
+            for idx0 in (0, 1):
+                old, new = _both(profile, idx0, hand, {}, None)
+                assert old == new
+                if old[2] == "other":
+                    excluded += 1
+        assert excluded > 0
+
+
+class TestCompileCache:
+    """Compiling is done once per SubProfile object."""
+
+    def test_same_object_same_tuple(self):
+        sub = _SUBS[1]
+        assert _compile_subprofile(sub) is _compile_subprofile(sub)
+
+    def test_equal_but_distinct_objects_compile_equal(self):
+        a = SubProfile(standard=_std(total_min_hcp=10))
+        b = SubProfile(standard=_std(total_min_hcp=10))
+        assert _compile_subprofile(a) == _compile_subprofile(b)
@@ -0,0 +1,129 @@
+# tests/test_deal_async.py
+"""
+Tests for the asyncio API (deal_async.agenerate_deals) and the should_stop
+hook it relies on in the board builder.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from bridge_engine import deal_generator as dg
+from bridge_engine.deal_async import agenerate_deals
+from bridge_engine.deal_generator import DealGenerationCancelled
+from bridge_engine.deal_generator_v2 import _build_single_constrained_deal_v2
+from bridge_engine.hand_profile import HandProfile
+
+PROFILE_A = Path("profiles/Profile_A_Test_-_Loose_constraints_v0.1.json")
+
+
+def _profile_a() -> HandProfile:
+    return HandProfile.from_dict(json.loads(PROFILE_A.read_text()))
+
+
+async def _collect(agen):
+    return [deal async for deal in agen]
+
+
+def _slow_board_builder(started: threading.Event, stopped: threading.Event):
+    """Stand-in for _build_board_from_seed that spins until told to stop."""
+
+    def _build(profile, seed, board_number, deal_policy=None, should_stop=None):
+        started.set()
+        while not should_stop():
+            time.sleep(0.005)
+        stopped.set()
+        raise DealGenerationCancelled(f"Board {board_number} stopped.")
+
+    return _build
+
+
+class TestShouldStop:
+    """The builder polls should_stop before every attempt."""
+
+    def test_v2_builder_stops_before_attempt(self):
+        polls = []
+
+        def should_stop():
+            polls.append(1)
+            return True
+
+        with pytest.raises(DealGenerationCancelled, match="after 0 attempts"):
+            _build_single_constrained_deal_v2(
+                random.Random(1), _profile_a(), 1, should_stop=should_stop,
+            )
+        assert polls == [1]
+
+    def test_not_retried(self, monkeypatch):
+        calls = []
+
+        def cancelled(**kwargs):
+            calls.append(1)
+            raise DealGenerationCancelled("stopped")
+
+        monkeypatch.setattr(dg, "_build_single_constrained_deal_v2", cancelled)
+        with pytest.raises(DealGenerationCancelled):
+            dg._build_board_with_retries(
+                random.Random(1), _profile_a(), 1, dg._system_reseed,
+            )
+        assert calls == [1]
+
+    def test_iter_deals_stops_between_boards(self, make_setup):
+        calls = []
+        deals = dg.iter_deals(
+            make_setup("A", seed=11), _profile_a(), num_deals=5,
+            should_stop=lambda: len(calls) >= 2,
+        )
+        calls.append(next(deals))
+        calls.append(next(deals))
+        with pytest.raises(DealGenerationCancelled):
+            next(deals)
+
+
+class TestAgenerateDeals:
+    """agenerate_deals(): output, cancellation and the overall deadline."""
+
+    def test_matches_generate_deals(self, make_setup):
+        setup, profile = make_setup("A", seed=11), _profile_a()
+        deals = asyncio.run(_collect(agenerate_deals(setup, profile, 4)))
+        expected = dg.generate_deals(setup, profile, 4, workers=1).deals
+        assert deals == expected
+
+    def test_task_cancellation_stops_worker(self, monkeypatch, make_setup):
+        started, stopped = threading.Event(), threading.Event()
+        monkeypatch.setattr(
+            dg, "_build_board_from_seed", _slow_board_builder(started, stopped)
+        )
+
+        async def main():
+            task = asyncio.create_task(
+                _collect(agenerate_deals(make_setup("A", seed=11), _profile_a(), 3))
+            )
+            while not started.is_set():
+                await asyncio.sleep(0.005)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert stopped.wait(2.0)
+
+    def test_deadline_raises_timeout(self, monkeypatch, make_setup):
+        started, stopped = threading.Event(), threading.Event()
+        monkeypatch.setattr(
+            dg, "_build_board_from_seed", _slow_board_builder(started, stopped)
+        )
+        agen = agenerate_deals(make_setup("A", seed=11), _profile_a(), 3, timeout=0.05)
+        with pytest.raises(TimeoutError, match="0 board"):
+            asyncio.run(_collect(agen))
+        assert stopped.is_set()
+
+    def test_invalid_count(self, make_setup):
+        with pytest.raises(dg.DealGenerationError):
+            asyncio.run(_collect(agenerate_deals(make_setup("A", seed=11), _profile_a(), 0)))
@@ -0,0 +1,184 @@
+# tests/test_deal_checkpoint.py
+"""
+Tests for checkpoint / resume of long runs (deal_checkpoint.py and
+generate_deals(checkpoint=..., resume=...)): an interrupted run resumed from
+its checkpoint returns exactly the DealSet of an uninterrupted run.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bridge_engine import deal_checkpoint
+from bridge_engine import deal_generator as dg
+from bridge_engine import deal_generator_v2 as v2
+from bridge_engine.combo_stats import ComboStats
+from bridge_engine.deal_checkpoint import (
+    DealCheckpoint,
+    checkpoint_path_for,
+    checkpoint_seed,
+    latest_checkpoint,
+)
+from bridge_engine.hand_profile import HandProfile
+
+# Several subprofiles per seat, so runs with a ComboStats store depend on it.
+PROFILE_PATH = Path("profiles/Our_1_Major_&_Opponents_Interference_v0.2.json")
+
+
+def _profile() -> HandProfile:
+    return HandProfile.from_dict(json.loads(PROFILE_PATH.read_text()))
+
+
+def _interrupt_at(monkeypatch, board: int, exc: BaseException) -> None:
+    """Make the builder raise exc when it reaches the given board."""
+    for name in ("_build_board_with_retries", "_build_board_from_seed"):
+        real = getattr(dg, name)
+
+        def _wrapped(*args, _real=real, **kwargs):
+            board_number = args[2]
+            if board_number == board:
+                raise exc
+            return _real(*args, **kwargs)
+
+        monkeypatch.setattr(dg, name, _wrapped)
+
+
+class TestResume:
+    """Interrupted + resumed runs equal uninterrupted ones."""
+
+    @pytest.mark.parametrize("workers", [None, 1])
+    def test_ctrl_c_then_resume_is_identical(self, monkeypatch, workers, make_setup):
+        profile, setup = _profile(), make_setup(seed=2024)
+        expected = dg.generate_deals(setup, profile, 8, workers=workers)
+        path = checkpoint_path_for(setup.log_dir, profile, setup.seed)
+
+        with monkeypatch.context() as m:
+            _interrupt_at(m, 5, KeyboardInterrupt())
+            with pytest.raises(KeyboardInterrupt):
+                dg.generate_deals(setup, profile, 8, workers=workers, checkpoint=path)
+        saved = DealCheckpoint.load(path, profile)
+        assert [d.board_number for d in saved.deals] == [1, 2, 3, 4]
+
+        resumed = dg.generate_deals(
+            setup, profile, 8, workers=workers, checkpoint=path, resume=True,
+        )
+        assert resumed.deals == expected.deals
+        assert resumed.board_attempts == expected.board_attempts
+        assert not path.exists()  # a finished run removes its checkpoint
+
+    def test_resume_continues_combo_stats(self, monkeypatch, make_setup):
+        profile, setup = _profile(), make_setup(seed=2024)
+        expected = dg.generate_deals(setup, profile, 8, combo_stats=ComboStats())
+        path = checkpoint_path_for(setup.log_dir, profile, setup.seed)
+
+        with monkeypatch.context() as m:
+            _interrupt_at(m, 5, KeyboardInterrupt())
+            with pytest.raises(KeyboardInterrupt):
+                dg.generate_deals(
+                    setup, profile, 8, combo_stats=ComboStats(), checkpoint=path,
+                )
+        assert DealCheckpoint.load(path, profile).combo_rows
+
+        # The store's rows come from the checkpoint even if none is passed.
+        resumed = dg.generate_deals(setup, profile, 8, checkpoint=path, resume=True)
+        assert resumed.deals == expected.deals
+        assert resumed.board_attempts == expected.board_attempts
+
+    @pytest.mark.parametrize("with_stats", [False, True])
+    def test_interrupt_mid_board_saves_last_finished_state(
+        self, monkeypatch, with_stats, make_setup,
+    ):
+        # Ctrl-C after a few v2 attempts on board 5: the RNG and the store
+        # have moved on, but the checkpoint must hold their state after board 4.
+        profile, setup = _profile(), make_setup(seed=2024)
+        stats = ComboStats if with_stats else (lambda: None)
+        expected = dg.generate_deals(setup, profile, 8, combo_stats=stats())
+        path = checkpoint_path_for(setup.log_dir, profile, setup.seed)
+
+        current = {"board": 0, "calls": 0}
+        real_board, real_deal = dg._build_board_with_retries, v2._deal_with_help_ids
+
+        def _board(*args, **kwargs):
+            current["board"] = args[2]
+            return real_board(*args, **kwargs)
+
+        def _deal(*args, **kwargs):
+            if current["board"] == 5:
+                current["calls"] += 1
+                if current["calls"] > 4:
+                    raise KeyboardInterrupt
+            return real_deal(*args, **kwargs)
+
+        with monkeypatch.context() as m:
+            m.setattr(dg, "_build_board_with_retries", _board)
+            m.setattr(v2, "_deal_with_help_ids", _deal)
+            with pytest.raises(KeyboardInterrupt):
+                dg.generate_deals(
+                    setup, profile, 8, combo_stats=stats(), checkpoint=path,
+                )
+        assert current["calls"] > 4
+        assert len(DealCheckpoint.load(path, profile).deals) == 4
+
+        resumed = dg.generate_deals(
+            setup, profile, 8, combo_stats=stats(), checkpoint=path, resume=True,
+        )
+        assert resumed.deals == expected.deals
+        assert resumed.board_attempts == expected.board_attempts
+
+    def test_periodic_checkpoint_survives_errors(self, monkeypatch, make_setup):
+        profile, setup = _profile(), make_setup(seed=2024)
+        path = checkpoint_path_for(setup.log_dir, profile, setup.seed)
+        monkeypatch.setattr(deal_checkpoint, "CHECKPOINT_INTERVAL_SECONDS", 0.0)
+        _interrupt_at(monkeypatch, 3, dg.DealGenerationError("boom"))
+        with pytest.raises(dg.DealGenerationError):
+            dg.generate_deals(setup, profile, 6, checkpoint=path)
+        saved = DealCheckpoint.load(path, profile)
+        assert len(saved.deals) == 2 and saved.rng_state is not None
+
+    def test_other_run_is_rejected(self, monkeypatch, make_setup):
+        profile, setup = _profile(), make_setup(seed=2024)
+        path = checkpoint_path_for(setup.log_dir, profile, setup.seed)
+        with monkeypatch.context() as m:
+            _interrupt_at(m, 2, KeyboardInterrupt())
+            with pytest.raises(KeyboardInterrupt):
+                dg.generate_deals(setup, profile, 4, checkpoint=path)
+        with pytest.raises(dg.DealGenerationError, match="another run"):
+            dg.generate_deals(setup, profile, 5, checkpoint=path, resume=True)
+        with pytest.raises(dg.DealGenerationError, match="another run"):
+            dg.generate_deals(setup, profile, 4, workers=1, checkpoint=path, resume=True)
+
+    def test_resume_without_checkpoint_starts_fresh(self, make_setup):
+        profile, setup = _profile(), make_setup(seed=2024)
+        path = checkpoint_path_for(setup.log_dir, profile, setup.seed)
+        deal_set = dg.generate_deals(setup, profile, 3, checkpoint=path, resume=True)
+        assert deal_set.deals == dg.generate_deals(setup, profile, 3).deals
+
+
+class TestFiles:
+    """Checkpoint naming and lookup."""
+
+    def test_path_and_latest(self, tmp_path, make_valid_profile):
+        profile = _profile()
+        path = checkpoint_path_for(tmp_path, profile, 77)
+        assert checkpoint_seed(path) == 77
+        assert latest_checkpoint(tmp_path, profile) is None
+        DealCheckpoint(seed=77, num_deals=2, enable_rotation=True, mode="serial").save(
+            path, profile
+        )
+        assert latest_checkpoint(tmp_path, profile) == path
+        assert latest_checkpoint(tmp_path, make_valid_profile()) is None
+
+    def test_other_profile_and_corrupt_files(self, tmp_path, make_valid_profile):
+        profile = _profile()
+        path = tmp_path / "c.json"
+        assert DealCheckpoint.load(path, profile) is None
+        DealCheckpoint(seed=1, num_deals=2, enable_rotation=True, mode="serial").save(
+            path, profile
+        )
+        with pytest.raises(dg.DealGenerationError, match="different profile"):
+            DealCheckpoint.load(path, make_valid_profile())
+        path.write_text("{not json")
+        with pytest.raises(dg.DealGenerationError, match="Unreadable"):
+            DealCheckpoint.load(path, profile)
@@ -0,0 +1,126 @@
+# tests/test_deal_generator_workers.py
+"""
+Tests for generate_deals(workers=N) — per-board seeding / multi-process mode.
+
+Each board is built from its own RNG derived from (seed, board_number), so
+the output must be identical whatever the worker count.
+"""
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from bridge_engine import deal_generator as dg
+from bridge_engine.deal_generator import generate_deals
+from bridge_engine.deal_generator_helpers import _derive_seed
+from bridge_engine.hand_profile import HandProfile
+
+
+class TestDeriveSeed:
+    """_derive_seed() must be stable and discriminate its inputs."""
+
+    def test_stable_across_calls(self):
+        assert _derive_seed(778899, 3) == _derive_seed(778899, 3)
+
+    def test_distinct_boards_distinct_seeds(self):
+        seeds = {_derive_seed(778899, b) for b in range(1, 200)}
+        assert len(seeds) == 199
+
+    def test_non_negative_63_bit(self):
+        s = _derive_seed("x", 1, "reseed", 2)
+        assert 0 <= s < 2**63
+
+
+class TestWorkersMode:
+    """Per-board mode: reproducible for any worker count."""
+
+    def test_workers_1_and_2_identical(self, make_valid_profile, make_setup, snapshot_deals):
+        profile = make_valid_profile()
+        setup = make_setup(profile.profile_name)
+        one = generate_deals(setup, profile, 6, workers=1)
+        two = generate_deals(setup, profile, 6, workers=2)
+        assert snapshot_deals(one.deals) == snapshot_deals(two.deals)
+
+    def test_repeat_runs_identical(self, make_valid_profile, make_setup, snapshot_deals):
+        profile = make_valid_profile()
+        setup = make_setup(profile.profile_name)
+        a = generate_deals(setup, profile, 4, workers=1)
+        b = generate_deals(setup, profile, 4, workers=1)
+        assert snapshot_deals(a.deals) == snapshot_deals(b.deals)
+
+    def test_board_times_and_reseeds_merged(self, make_valid_profile, make_setup):
+        profile = make_valid_profile()
+        setup = make_setup(profile.profile_name)
+        deal_set = generate_deals(setup, profile, 5, workers=2)
+        assert [d.board_number for d in deal_set.deals] == [1, 2, 3, 4, 5]
+        assert len(deal_set.board_times) == 5
+        assert all(t >= 0.0 for t in deal_set.board_times)
+        assert deal_set.reseed_count == 0
+
+    def test_deals_are_complete(self, make_valid_profile, make_setup):
+        profile = make_valid_profile()
+        setup = make_setup(profile.profile_name)
+        deal_set = generate_deals(setup, profile, 3, workers=2)
+        for deal in deal_set.deals:
+            cards = [c for hand in deal.hands.values() for c in hand]
+            assert len(cards) == 52 and len(set(cards)) == 52
+
+    def test_invalid_worker_count_rejected(self, make_valid_profile, make_setup):
+        profile = make_valid_profile()
+        setup = make_setup(profile.profile_name)
+        with pytest.raises(dg.DealGenerationError, match="workers"):
+            generate_deals(setup, profile, 2, workers=0)
+
+
+class TestDerivedReseeding:
+    """Re-seeds are counted in attempts and derived from the run seed."""
+
+    PROFILE = Path("profiles/Defense_to_3_Weak_2s_v0.2.json")
+
+    @pytest.fixture
+    def force_reseeds(self, monkeypatch):
+        # Tiny builder calls on a hard profile: most fail, each triggers a re-seed.
+        monkeypatch.setattr(dg, "MAX_BOARD_ATTEMPTS", 200)
+
+    def _profile(self):
+        return HandProfile.from_dict(json.loads(self.PROFILE.read_text()))
+
+    @pytest.mark.parametrize("workers", [None, 1])
+    def test_reseeded_runs_replay(self, force_reseeds, workers, make_setup, snapshot_deals):
+        profile = self._profile()
+        setup = make_setup(seed=4242)
+        a = generate_deals(setup, profile, 3, workers=workers)
+        b = generate_deals(setup, profile, 3, workers=workers)
+        assert a.reseed_count > 0
+        assert a.reseed_count == b.reseed_count
+        assert a.board_attempts == b.board_attempts
+        assert snapshot_deals(a.deals) == snapshot_deals(b.deals)
+
+    def test_reseed_streams_are_derived(self):
+        reseed = dg._derived_reseed(99)
+        expected = random.Random(_derive_seed(99, 2, "reseed", 1))
+        assert reseed(2, 1).random() == expected.random()
+        assert reseed(2, 2).random() != reseed(3, 2).random()
+
+    def test_every_failed_retry_reseeds(self, monkeypatch):
+        def failing(**kwargs):
+            streams.append(kwargs["rng"])
+            raise dg.DealGenerationError("fail")
+
+        streams = []
+        calls = []
+
+        def reseed(board_number, k):
+            calls.append((board_number, k))
+            return random.Random(k)
+
+        monkeypatch.setattr(dg, "_build_single_constrained_deal_v2", failing)
+        monkeypatch.setattr(dg, "MAX_BOARD_RETRIES", 3)
+        first = random.Random(1)
+        with pytest.raises(dg.DealGenerationError):
+            dg._build_board_with_retries(first, self._profile(), 2, reseed)
+        assert calls == [(2, 1), (2, 2)]
+        assert streams[0] is first and len(set(map(id, streams))) == 3
@@ -0,0 +1,128 @@
+# tests/test_deal_policy.py
+"""
+Tests for measured dealing policies (deal_policy.py): persistence, the
+offline optimizer, and the v2 builder / generate_deals(deal_policy=...).
+"""
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+from bridge_engine import deal_generator as dg
+from bridge_engine.deal_generator_types import PRE_ALLOCATE_FRACTION
+from bridge_engine.deal_generator_v2 import _start_round
+from bridge_engine.deal_policy import (
+    DealPolicy,
+    PolicyEntry,
+    find_policy,
+    format_policy_report,
+    optimize_deal_policy,
+    policy_path_for,
+)
+from bridge_engine.hand_profile import HandProfile
+
+PROFILE_E_PATH = Path(
+    "profiles/Profile_E_Test_-_tight_and_suit_point_constraint_plus_v0.1.json"
+)
+
+ALL_FIRST = {"N": 0, "E": 0, "S": 0, "W": 0}
+
+
+def _profile_e() -> HandProfile:
+    return HandProfile.from_dict(json.loads(PROFILE_E_PATH.read_text()))
+
+
+def _policy(order=("S", "W", "E", "N"), fraction=1.0) -> DealPolicy:
+    policy = DealPolicy()
+    policy.set(ALL_FIRST, PolicyEntry(order, fraction, 0.5, 0.25))
+    return policy
+
+
+class TestPersistence:
+    """save() / load() / find_policy(), tied to the profile's constraints."""
+
+    def test_sidecar_path(self):
+        path = policy_path_for(Path("profiles/Weak_2s_v0.2.json"))
+        assert path == Path("profiles/Weak_2s_v0.2.policy")
+
+    def test_round_trip(self, tmp_path):
+        profile = _profile_e()
+        path = tmp_path / "E.policy"
+        _policy().save(path, profile)
+        loaded = DealPolicy.load(path, profile)
+        assert len(loaded) == 1
+        assert loaded.lookup(ALL_FIRST) == PolicyEntry(("S", "W", "E", "N"), 1.0, 0.5, 0.25)
+        assert loaded.lookup({"N": 1, "E": 0, "S": 0, "W": 0}) is None
+
+    def test_other_profile_and_bad_files_ignored(self, tmp_path, make_valid_profile):
+        profile = _profile_e()
+        path = tmp_path / "E.policy"
+        _policy().save(path, profile)
+        assert len(DealPolicy.load(path, make_valid_profile())) == 0
+        assert len(DealPolicy.load(tmp_path / "missing.policy", profile)) == 0
+        payload = json.loads(path.read_text())
+        payload["entries"][0]["dealing_order"] = ["N", "N", "S", "W"]
+        path.write_text(json.dumps(payload))
+        assert len(DealPolicy.load(path, profile)) == 0
+
+    def test_find_policy_matches_by_constraints(self, tmp_path, make_valid_profile):
+        profile = _profile_e()
+        _policy().save(tmp_path / "Other.policy", make_valid_profile())
+        assert find_policy(tmp_path, profile) is None
+        _policy().save(tmp_path / "Mine.policy", profile)
+        found = find_policy(tmp_path, profile)
+        assert found is not None and len(found) == 1
+        assert find_policy(tmp_path / "missing", profile) is None
+
+
+class TestBuilderUsesPolicy:
+    """_start_round() applies the entry for the selected combination."""
+
+    def test_entry_overrides_order_and_fraction(self):
+        profile = _profile_e()
+        result = _start_round(
+            random.Random(1), profile, list(profile.hand_dealing_order), _policy()
+        )
+        dealing_order, fraction = result[2], result[6]
+        assert dealing_order == ["S", "W", "E", "N"]
+        assert fraction == 1.0
+
+    def test_no_entry_keeps_computed_order(self):
+        profile = _profile_e()
+        rng_a, rng_b = random.Random(1), random.Random(1)
+        default = _start_round(rng_a, profile, list(profile.hand_dealing_order))
+        other = DealPolicy()
+        other.set({"N": 5}, PolicyEntry(("S", "W", "E", "N"), 1.0))
+        result = _start_round(rng_b, profile, list(profile.hand_dealing_order), other)
+        assert result[2] == default[2]
+        assert result[6] == PRE_ALLOCATE_FRACTION
+
+    def test_generate_deals_with_policy(self, make_setup):
+        profile = _profile_e()
+        setup = make_setup(profile.profile_name)
+        for workers in (None, 1):
+            deal_set = dg.generate_deals(
+                setup, profile, 3, deal_policy=_policy(), workers=workers
+            )
+            assert len(deal_set.deals) == 3
+
+
+class TestOptimizer:
+    """optimize_deal_policy() on a profile with a better order/fraction."""
+
+    def test_profile_e_gets_confirmed_entry(self):
+        profile = _profile_e()
+        progress = []
+        policy, results = optimize_deal_policy(
+            profile, attempts=100, progress=lambda done, total: progress.append(done)
+        )
+        assert progress == [1]
+        (combo,) = results
+        assert combo.share == 1.0
+        assert combo.improved
+        assert combo.best.success_rate > combo.baseline.success_rate
+        entry = policy.lookup(combo.chosen_indices)
+        assert entry is not None
+        assert entry.dealing_order == combo.best.dealing_order
+        assert "(default)" not in format_policy_report(results)
@@ -0,0 +1,179 @@
+# tests/test_deal_pool.py
+"""
+Tests for the persistent on-disk deal pool (deal_pool.DealPool) and
+generate_deals(pool=...).
+"""
+from __future__ import annotations
+
+import random
+
+from bridge_engine.deal_generator import generate_deals
+from bridge_engine.deal_generator_types import Deal, _ID_TO_CARD
+from bridge_engine.deal_pool import (
+    POOL_RECORD_SIZE,
+    DealPool,
+    _decode_hands,
+    _encode_deal,
+    pool_key,
+)
+from bridge_engine.hand_profile import HandProfile
+
+
+def _random_deal(seed: int, board_number: int = 1) -> Deal:
+    ids = list(range(52))
+    random.Random(seed).shuffle(ids)
+    hands = {
+        seat: [_ID_TO_CARD[c] for c in ids[i * 13:(i + 1) * 13]]
+        for i, seat in enumerate("NESW")
+    }
+    return Deal(board_number=board_number, dealer="N", vulnerability="None", hands=hands)
+
+
+def _hand_sets(hands):
+    return {seat: set(cards) for seat, cards in hands.items()}
+
+
+class TestRecords:
+    """13-byte record encoding."""
+
+    def test_round_trip(self):
+        for seed in range(20):
+            deal = _random_deal(seed)
+            record = _encode_deal(deal)
+            assert len(record) == POOL_RECORD_SIZE
+            assert _hand_sets(_decode_hands(record)) == _hand_sets(deal.hands)
+
+    def test_invalid_record_rejected(self):
+        # All 52 cards owned by North.
+        assert _decode_hands(bytes(POOL_RECORD_SIZE)) is None
+
+
+class TestPoolKey:
+    """Key depends on constraints and seed policy, not on cosmetics."""
+
+    def test_cosmetic_fields_ignored(self, make_valid_profile):
+        a = make_valid_profile("One", version="0.1")
+        b = make_valid_profile("Two", version="0.9")
+        assert pool_key(a) == pool_key(b)
+
+    def test_constraints_and_policy_change_key(self, make_valid_profile, with_north_min_hcp):
+        a = make_valid_profile()
+        b = with_north_min_hcp(a, 12)
+        assert pool_key(a) != pool_key(b)
+        assert pool_key(a) != pool_key(a, seed_policy="seeded")
+
+
+class TestDealPool:
+    """take / add / eviction on disk."""
+
+    def test_take_is_lifo_and_removes(self, tmp_path, make_valid_profile):
+        profile = make_valid_profile()
+        pool = DealPool(tmp_path)
+        deals = [_random_deal(s) for s in range(5)]
+        pool.add(profile, deals)
+        assert pool.count(profile) == 5
+
+        taken = pool.take(profile, 2)
+        assert [_hand_sets(h) for h in taken] == [
+            _hand_sets(deals[4].hands), _hand_sets(deals[3].hands),
+        ]
+        assert pool.count(profile) == 3
+        assert len(pool.take(profile, 10)) == 3
+        assert pool.take(profile, 1) == []
+
+    def test_partial_record_ignored(self, tmp_path, make_valid_profile):
+        profile = make_valid_profile()
+        pool = DealPool(tmp_path)
+        pool.add(profile, [_random_deal(1)])
+        with open(pool.path_for(profile), "ab") as f:
+            f.write(b"\x01\x02\x03")  # interrupted write
+        pool.add(profile, [_random_deal(2)])
+        assert pool.path_for(profile).stat().st_size == 2 * POOL_RECORD_SIZE
+        taken = pool.take(profile, 2)
+        assert _hand_sets(taken[0]) == _hand_sets(_random_deal(2).hands)
+        assert _hand_sets(taken[1]) == _hand_sets(_random_deal(1).hands)
+
+    def test_lru_eviction(self, tmp_path, make_valid_profile, with_north_min_hcp):
+        old = make_valid_profile()
+        new = with_north_min_hcp(old, 12)
+        pool = DealPool(tmp_path, max_bytes=4 * POOL_RECORD_SIZE)
+        pool.add(old, [_random_deal(s) for s in range(3)])
+        pool.add(new, [_random_deal(s) for s in range(3)])
+        assert pool.count(old) == 0
+        assert pool.count(new) == 3
+
+    def test_fill_builds_valid_deals(self, tmp_path, make_valid_profile):
+        profile = make_valid_profile()
+        pool = DealPool(tmp_path)
+        assert pool.fill(profile, target=3) == 3
+        assert pool.fill(profile, target=3) == 0
+        for hands in pool.take(profile, 3):
+            cards = [c for seat_cards in hands.values() for c in seat_cards]
+            assert len(set(cards)) == 52
+
+
+class TestConcurrentSessions:
+    """A background fill left by one session vs. the next session's pool."""
+
+    def test_instances_share_directory_lock(self, tmp_path):
+        assert DealPool(tmp_path)._lock is DealPool(tmp_path / ".")._lock
+        assert DealPool(tmp_path)._lock is not DealPool(tmp_path / "other")._lock
+
+    def test_take_while_filling_keeps_records_aligned(self, tmp_path, make_valid_profile):
+        profile = make_valid_profile()
+        filler = DealPool(tmp_path).fill_in_background(profile, target=10**6)
+        try:
+            pool = DealPool(tmp_path)
+            taken = []
+            while len(taken) < 20:
+                taken.extend(pool.take(profile, 3))
+        finally:
+            DealPool(tmp_path).stop_fillers(timeout=10)
+        assert not filler.is_alive()
+        assert all(len({c for cards in h.values() for c in cards}) == 52 for h in taken)
+        assert pool.path_for(profile).stat().st_size % POOL_RECORD_SIZE == 0
+
+    def test_stop_fillers_abandons_hard_board(
+        self, tmp_path, make_valid_profile, with_north_min_hcp,
+    ):
+        # North almost never holds 37 HCP: fill() would retry for hours.
+        data = with_north_min_hcp(make_valid_profile(), 37).to_dict()
+        data["is_invariants_safety_profile"] = False
+        profile = HandProfile.from_dict(data)
+        pool = DealPool(tmp_path)
+        filler = pool.fill_in_background(profile, target=1)
+        assert filler.is_alive()
+        pool.stop_fillers(timeout=10)
+        assert not filler.is_alive()
+        assert pool.count(profile) == 0
+
+
+class TestGenerateDealsWithPool:
+    """generate_deals(pool=...) serves unseeded runs only."""
+
+    def test_unseeded_run_served_from_pool(self, tmp_path, make_valid_profile, make_setup):
+        profile = make_valid_profile()
+        pool = DealPool(tmp_path / "pool")
+        pool.add(profile, [_random_deal(s) for s in range(3)])
+
+        setup = make_setup(profile.profile_name, seeded=False)
+        deal_set = generate_deals(setup, profile, 5, enable_rotation=False, pool=pool)
+
+        assert deal_set.pool_served == 3
+        assert len(deal_set.board_times) == 2
+        assert [d.board_number for d in deal_set.deals] == [1, 2, 3, 4, 5]
+        assert _hand_sets(deal_set.deals[0].hands) == _hand_sets(_random_deal(2).hands)
+        assert pool.count(profile) == 0
+
+    def test_seeded_run_ignores_pool(self, tmp_path, make_valid_profile, make_setup):
+        profile = make_valid_profile()
+        pool = DealPool(tmp_path / "pool")
+        pool.add(profile, [_random_deal(s) for s in range(3)])
+
+        setup = make_setup(profile.profile_name, seeded=True)
+        with_pool = generate_deals(setup, profile, 4, pool=pool)
+        without = generate_deals(setup, profile, 4)
+
+        assert with_pool.pool_served == 0
+        assert pool.count(profile) == 3
+        assert [d.hands for d in with_pool.deals] == [d.hands for d in without.deals]
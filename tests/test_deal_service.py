@@ -0,0 +1,153 @@
+# tests/test_deal_service.py
+"""
+Tests for the local HTTP deal service (deal_service.py): a real server on an
+ephemeral port with one spawn worker, JSON and LIN responses, error codes,
+timeouts, and reuse of warm profiles.
+"""
+from __future__ import annotations
+
+import json
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from bridge_engine import deal_generator as dg
+from bridge_engine import deal_service
+from bridge_engine.deal_service import DealHTTPServer, DealService, ServiceError
+from bridge_engine.hand_profile import HandProfile
+
+PROFILE_A = Path("profiles/Profile_A_Test_-_Loose_constraints_v0.1.json")
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    profiles_dir = tmp_path_factory.mktemp("profiles")
+    shutil.copy(PROFILE_A, profiles_dir / PROFILE_A.name)
+    service = DealService(profiles_dir, workers=1, timeout=60, max_boards=20)
+    service.preload()
+    httpd = DealHTTPServer(("127.0.0.1", 0), service, quiet=True)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    service.close()
+
+
+def _get(httpd, path: str):
+    host, port = httpd.server_address[:2]
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}{path}", timeout=60) as resp:
+            return resp.status, resp.headers["Content-Type"], resp.read().decode("utf-8")
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.headers["Content-Type"], exc.read().decode("utf-8")
+
+
+class TestEndpoints:
+    """Responses of /health, /profiles and /generate."""
+
+    def test_health_and_profiles(self, server):
+        assert _get(server, "/health")[0] == 200
+        status, _ctype, body = _get(server, "/profiles")
+        assert status == 200
+        (entry,) = json.loads(body)["profiles"]
+        assert entry["file"] == PROFILE_A.name
+
+    def test_generate_json_is_reproducible(self, server):
+        path = f"/generate?profile={PROFILE_A.stem}&n=3&seed=42"
+        status, ctype, body = _get(server, path)
+        assert status == 200 and ctype == "application/json"
+        payload = json.loads(body)
+        assert payload["seed"] == 42
+        boards = payload["boards"]
+        assert [b["board"] for b in boards] == [1, 2, 3]
+        for board in boards:
+            assert sorted(board["hands"]) == ["E", "N", "S", "W"]
+            assert sum(len(h) for h in board["hands"].values()) == 52
+        again = json.loads(_get(server, path)[2])
+        assert again["boards"] == boards
+
+    def test_generate_lin(self, server):
+        status, ctype, body = _get(
+            server, f"/generate?profile={PROFILE_A.name}&n=2&seed=7&format=lin"
+        )
+        assert status == 200 and ctype.startswith("text/plain")
+        lines = body.splitlines()
+        assert len(lines) == 2
+        assert all(line.startswith("qx|") for line in lines)
+
+    @pytest.mark.parametrize(
+        "query, status",
+        [
+            ("profile=NoSuchProfile", 404),
+            (f"profile={PROFILE_A.stem}&n=0", 400),
+            (f"profile={PROFILE_A.stem}&n=21", 400),
+            (f"profile={PROFILE_A.stem}&seed=abc", 400),
+            (f"profile={PROFILE_A.stem}&format=pbn", 400),
+            ("n=3", 400),
+        ],
+    )
+    def test_bad_requests(self, server, query, status):
+        code, _ctype, body = _get(server, f"/generate?{query}")
+        assert code == status
+        assert "error" in json.loads(body)
+
+    def test_unknown_path(self, server):
+        assert _get(server, "/nothing")[0] == 404
+
+
+class TestService:
+    """DealService limits and warm state, without the HTTP layer."""
+
+    def test_profile_resolved_once(self, server):
+        service = server.service
+        first = service.resolve(PROFILE_A.stem)
+        assert service.resolve(PROFILE_A.name)[1] is first[1]
+        assert first[3] == service.resolve(PROFILE_A.stem)[3]
+
+    def test_timeout_and_busy(self, server, monkeypatch):
+        service = server.service
+        monkeypatch.setattr(service, "timeout", 0.0)
+        with pytest.raises(ServiceError) as exc_info:
+            service.generate(PROFILE_A.stem, 20, seed=1)
+        assert exc_info.value.status == 504
+
+        monkeypatch.setattr(service, "_slots", threading.BoundedSemaphore(1))
+        service._slots.acquire()
+        with pytest.raises(ServiceError) as exc_info:
+            service.generate(PROFILE_A.stem, 1, seed=1)
+        assert exc_info.value.status == 503
+
+    def test_worker_deadline_stops_between_boards(self):
+        profile = HandProfile.from_dict(json.loads(PROFILE_A.read_text()))
+        with pytest.raises(TimeoutError):
+            dg._generate_deals_per_board(1, profile, 3, True, 1, deadline=0.0)
+
+    def test_worker_deadline_stops_unbuildable_board(self, with_north_min_hcp):
+        # North almost never holds 37 HCP: without the deadline reaching the
+        # builder, the worker would retry this board for hours.
+        profile = with_north_min_hcp(
+            HandProfile.from_dict(json.loads(PROFILE_A.read_text())), 37,
+        )
+        start = time.time()
+        with pytest.raises(TimeoutError, match="0 of 2 boards"):
+            deal_service._generate_in_worker("hard", profile, None, 1, 2, True, start + 0.2)
+        assert time.time() - start < 5.0
+
+    def test_worker_keeps_first_profile_instance(self, monkeypatch):
+        profile = HandProfile.from_dict(json.loads(PROFILE_A.read_text()))
+        copy = HandProfile.from_dict(json.loads(PROFILE_A.read_text()))
+        monkeypatch.setattr(deal_service, "_WORKER_PROFILES", {})
+        seen = []
+        monkeypatch.setattr(
+            dg, "_generate_deals_per_board",
+            lambda seed, prof, *args, **kwargs: seen.append(prof),
+        )
+        for instance in (profile, copy):
+            deal_service._generate_in_worker("k", instance, None, 1, 1, True, 1e18)
+        assert seen == [profile, profile] and seen[1] is profile
@@ -0,0 +1,211 @@
+# tests/test_exact_sampler.py
+"""
+Tests for the exact constructive sampler (exact_sampler.py) and the v2
+builder's exact dealing mode (ENABLE_EXACT_SAMPLER / _deal_exact_ids).
+"""
+from __future__ import annotations
+
+import json
+import random
+from collections import Counter
+from itertools import combinations
+from math import comb
+from pathlib import Path
+
+from bridge_engine import deal_generator as dg
+from bridge_engine.deal_generator_types import _ID_HCP, _ID_SUIT
+from bridge_engine.deal_generator_v2 import _deal_exact_ids
+from bridge_engine.exact_sampler import (
+    matching_hand_count, sample_hand_exact, sample_suit_holding,
+)
+from bridge_engine.hand_combinatorics import hand_counts_by_hcp
+from bridge_engine.hand_profile import (
+    HandProfile, SeatProfile, SubProfile, StandardSuitConstraints, SuitRange,
+)
+from bridge_engine.setup_env import run_setup
+
+WEAK2S_PATH = Path("profiles/Defense_to_3_Weak_2s_v0.2.json")
+
+OPEN = (0, 13, 0, 10)
+# Weak two in hearts: exactly 6 hearts with 5-10 HCP in them.
+WEAK2_WINDOWS = (OPEN, (6, 6, 5, 10), OPEN, OPEN)
+
+
+def _suit_stats(hand):
+    lengths = [0, 0, 0, 0]
+    hcps = [0, 0, 0, 0]
+    for c in hand:
+        lengths[_ID_SUIT[c]] += 1
+        hcps[_ID_SUIT[c]] += _ID_HCP[c]
+    return lengths, hcps
+
+
+def _fits(hand, windows, total_min, total_max):
+    lengths, hcps = _suit_stats(hand)
+    return total_min <= sum(hcps) <= total_max and all(
+        lo_c <= n <= hi_c and lo_h <= h <= hi_h
+        for n, h, (lo_c, hi_c, lo_h, hi_h) in zip(lengths, hcps, windows)
+    )
+
+
+class TestCounting:
+    """Hand counts agree with hand_combinatorics and brute force."""
+
+    def test_full_deck_open_windows(self):
+        assert matching_hand_count(list(range(52)), (OPEN,) * 4) == comb(52, 13)
+
+    def test_full_deck_matches_combinatorics(self):
+        counts = hand_counts_by_hcp(WEAK2_WINDOWS)
+        for lo, hi in ((5, 10), (11, 15), (0, 37)):
+            assert matching_hand_count(
+                list(range(52)), WEAK2_WINDOWS, lo, hi
+            ) == sum(counts[lo:hi + 1])
+
+    def test_partial_deck_matches_brute_force(self):
+        deck = [0, 1, 2, 3, 4, 5, 6, 13, 14, 17, 18, 19, 26, 30, 31, 39, 44, 45]
+        windows = ((2, 5, 0, 10), (0, 3, 0, 10), OPEN, OPEN)
+        brute = sum(
+            1 for hand in combinations(deck, 13) if _fits(hand, windows, 12, 16)
+        )
+        assert brute > 0
+        assert matching_hand_count(deck, windows, 12, 16) == brute
+
+
+class TestSampling:
+    """sample_hand_exact draws qualifying hands uniformly."""
+
+    def test_hand_fits_and_is_removed_from_deck(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            deck = list(range(52))
+            rng.shuffle(deck)
+            del deck[:13]
+            rest = list(deck)
+            if not matching_hand_count(deck, WEAK2_WINDOWS, 5, 10):
+                continue
+            hand = sample_hand_exact(rng, deck, WEAK2_WINDOWS, 5, 10)
+            assert len(hand) == 13
+            assert _fits(hand, WEAK2_WINDOWS, 5, 10)
+            assert deck == [c for c in rest if c not in set(hand)]
+
+    def test_uniform_over_qualifying_hands(self):
+        deck0 = [0, 1, 2, 3, 4, 5, 6, 13, 14, 17, 18, 19, 26, 30, 31, 39, 44, 45]
+        windows = ((2, 5, 0, 10), (0, 3, 0, 10), OPEN, OPEN)
+        valid = {
+            hand for hand in combinations(deck0, 13) if _fits(hand, windows, 12, 16)
+        }
+        rng = random.Random(3)
+        seen = Counter()
+        draws = 100 * len(valid)
+        for _ in range(draws):
+            hand = sample_hand_exact(rng, list(deck0), windows, 12, 16)
+            seen[tuple(sorted(hand))] += 1
+        assert set(seen) == valid
+        # Each hand expects 100 draws (sd 10).
+        assert 50 < min(seen.values()) and max(seen.values()) < 150
+
+    def test_infeasible_returns_none_and_keeps_deck(self):
+        deck = list(range(13, 52))  # No spades left.
+        windows = ((1, 13, 0, 10), OPEN, OPEN, OPEN)
+        assert sample_hand_exact(random.Random(1), deck, windows) is None
+        assert deck == list(range(13, 52))
+        assert sample_hand_exact(random.Random(1), deck, (OPEN,) * 4, 20, 10) is None
+
+
+class TestSuitHolding:
+    """sample_suit_holding draws one suit's cards at a target HCP."""
+
+    def test_uniform_over_on_target_subsets(self):
+        hearts = list(range(13, 26))
+        valid = {
+            sub for sub in combinations(hearts, 3)
+            if 2 <= sum(_ID_HCP[c] for c in sub) <= 4
+        }
+        rng = random.Random(9)
+        seen = Counter(
+            tuple(sorted(sample_suit_holding(rng, hearts, 3, 2, 4)))
+            for _ in range(100 * len(valid))
+        )
+        assert set(seen) == valid
+        assert 50 < min(seen.values()) and max(seen.values()) < 150
+
+    def test_unreachable_target(self):
+        spades = [2, 3, 4, 5, 6, 7]  # Q J and spots.
+        assert sample_suit_holding(random.Random(1), spades, 2, 4, 10) is None
+        assert sample_suit_holding(random.Random(1), spades, 7, 0, 10) is None
+        assert spades == [2, 3, 4, 5, 6, 7]
+
+
+def _profile() -> HandProfile:
+    def sub(hearts: SuitRange, total_min: int = 0, total_max: int = 37):
+        open_r = SuitRange()
+        return SubProfile(standard=StandardSuitConstraints(
+            spades=open_r, hearts=hearts, diamonds=open_r, clubs=open_r,
+            total_min_hcp=total_min, total_max_hcp=total_max,
+        ))
+
+    return HandProfile(
+        profile_name="Exact test",
+        description="",
+        dealer="N",
+        hand_dealing_order=["N", "E", "S", "W"],
+        tag="Opener",
+        seat_profiles={
+            "N": SeatProfile(seat="N", subprofiles=[
+                sub(SuitRange(min_cards=6, max_cards=6, min_hcp=5, max_hcp=10), 5, 10),
+            ]),
+            "E": SeatProfile(seat="E", subprofiles=[sub(SuitRange(), 12, 17)]),
+            "S": SeatProfile(seat="S", subprofiles=[sub(SuitRange())]),
+            "W": SeatProfile(seat="W", subprofiles=[sub(SuitRange())]),
+        },
+    )
+
+
+class TestExactDealing:
+    """_deal_exact_ids and the builder's exact mode."""
+
+    def test_deal_exact_ids_meets_each_seat(self):
+        profile = _profile()
+        subs = {seat: sp.subprofiles[0] for seat, sp in profile.seat_profiles.items()}
+        rng = random.Random(11)
+        for _ in range(20):
+            deck = list(range(52))
+            rng.shuffle(deck)
+            hands, rejected = _deal_exact_ids(
+                rng, deck, subs, set(), ["N", "E", "S", "W"]
+            )
+            assert rejected is None
+            assert deck == []
+            assert sorted(c for h in hands.values() for c in h) == list(range(52))
+            assert _fits(hands["N"], WEAK2_WINDOWS, 5, 10)
+            assert 12 <= sum(_suit_stats(hands["E"])[1]) <= 17
+
+    def test_builder_needs_one_attempt_for_standard_profile(self, monkeypatch):
+        # N (the harder seat) is dealt first from a full deck; E's HCP
+        # window can always be met from the 39 cards left.
+        monkeypatch.setattr(dg, "ENABLE_EXACT_SAMPLER", True)
+        attempts = []
+        rng = random.Random(5)
+        for board in range(1, 6):
+            dg._build_single_constrained_deal_v2(
+                rng, _profile(), board, attempt_log=attempts
+            )
+        assert attempts == [1] * 5
+
+    def test_generate_deals_reports_attempts(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(dg, "ENABLE_EXACT_SAMPLER", True)
+        profile = HandProfile.from_dict(json.loads(WEAK2S_PATH.read_text()))
+        setup = run_setup(
+            base_dir=tmp_path,
+            owner="TestOwner",
+            profile_name=profile.profile_name,
+            ask_seed_choice=False,
+            use_seeded_default=True,
+        )
+        deal_set = dg.generate_deals(setup, profile, 3, enable_rotation=False)
+        assert len(deal_set.board_attempts) == 3
+        assert all(n >= 1 for n in deal_set.board_attempts)
+        for deal in deal_set.deals:
+            assert sorted(c for h in deal.hands.values() for c in h) == sorted(
+                dg._build_deck()
+            )
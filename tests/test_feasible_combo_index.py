@@ -0,0 +1,198 @@
+# tests/test_feasible_combo_index.py
+"""
+Tests for the precomputed feasible subprofile-combination table used by
+_select_subprofiles_for_board().
+
+The table must hold exactly the feasible combinations, weight them as one
+round of the old rejection loop would, respect NS/EW index coupling, and
+fall back to the rejection loop when it cannot be used.
+"""
+from __future__ import annotations
+
+import json
+import random
+from collections import Counter
+from itertools import product
+from pathlib import Path
+
+import pytest
+
+from bridge_engine import deal_generator as dg
+from bridge_engine.hand_profile import (
+    HandProfile,
+    SeatProfile,
+    StandardSuitConstraints,
+    SubProfile,
+    SuitRange,
+)
+from bridge_engine.profile_viability import _cross_seat_feasible
+
+WEAK2S_PATH = Path("profiles/Defense_to_3_Weak_2s_v0.2.json")
+
+
+def _load_weak2s() -> HandProfile:
+    if not WEAK2S_PATH.exists():
+        pytest.skip(f"Missing profile: {WEAK2S_PATH}")
+    return HandProfile.from_dict(json.loads(WEAK2S_PATH.read_text(encoding="utf-8")))
+
+
+def _sub(weight: float, min_hcp: int = 0, max_hcp: int = 37) -> SubProfile:
+    open_r = SuitRange()
+    return SubProfile(
+        standard=StandardSuitConstraints(
+            spades=open_r, hearts=open_r, diamonds=open_r, clubs=open_r,
+            total_min_hcp=min_hcp, total_max_hcp=max_hcp,
+        ),
+        weight_percent=weight,
+    )
+
+
+def _ew_coupled_profile() -> HandProfile:
+    """E/W coupled (2 subs each); E sub 2 + W sub 2 need 42+ HCP together."""
+    seat_profiles = {
+        "N": SeatProfile(seat="N", subprofiles=[_sub(100.0)]),
+        "E": SeatProfile(seat="E", subprofiles=[_sub(70.0), _sub(30.0, 21, 37)]),
+        "S": SeatProfile(seat="S", subprofiles=[_sub(100.0)]),
+        "W": SeatProfile(seat="W", subprofiles=[_sub(10.0), _sub(90.0, 21, 37)]),
+    }
+    return HandProfile(
+        profile_name="EW coupled table test",
+        description="",
+        dealer="N",
+        hand_dealing_order=["N", "E", "S", "W"],
+        tag="Opener",
+        seat_profiles=seat_profiles,
+    )
+
+
+def _random_driver_profile() -> HandProfile:
+    """
+    N/S coupled (3 subs each) with a random NS driver; index 2 needs 42+ HCP
+    from N and S together.  N puts 80% of its weight on that index, S 40%.
+    """
+    seat_profiles = {
+        "N": SeatProfile(
+            seat="N", subprofiles=[_sub(10.0), _sub(10.0), _sub(80.0, 21, 37)],
+        ),
+        "E": SeatProfile(seat="E", subprofiles=[_sub(100.0)]),
+        "S": SeatProfile(
+            seat="S", subprofiles=[_sub(50.0), _sub(10.0), _sub(40.0, 21, 37)],
+        ),
+        "W": SeatProfile(seat="W", subprofiles=[_sub(100.0)]),
+    }
+    return HandProfile(
+        profile_name="Random driver table test",
+        description="",
+        dealer="N",
+        hand_dealing_order=["N", "E", "S", "W"],
+        tag="Opener",
+        seat_profiles=seat_profiles,
+        ns_role_mode="random_driver",
+    )
+
+
+class TestTableContents:
+    """The table is the feasible subset of the product, exactly weighted."""
+
+    def test_weak2s_table_matches_enumeration(self):
+        profile = _load_weak2s()
+        combos, cumulative = dg._feasible_combo_table(profile, None, "E")
+
+        expected = {}
+        subs_n = profile.seat_profiles["N"].subprofiles
+        subs_e = profile.seat_profiles["E"].subprofiles
+        for i, j in product(range(len(subs_n)), range(len(subs_e))):
+            chosen = {
+                "N": subs_n[i], "E": subs_e[j],
+                "S": profile.seat_profiles["S"].subprofiles[0],
+                "W": profile.seat_profiles["W"].subprofiles[0],
+            }
+            if _cross_seat_feasible(chosen)[0]:
+                w_n = int(round(subs_n[i].weight_percent * 10))
+                w_e = int(round(subs_e[j].weight_percent * 10))
+                expected[(i, j)] = w_n * w_e
+
+        weights = [b - a for a, b in zip([0] + cumulative, cumulative)]
+        got = {
+            (indices["N"], indices["E"]): w
+            for (_subs, indices), w in zip(combos, weights)
+        }
+        assert got == expected
+
+    def test_cached_per_profile(self):
+        profile = _load_weak2s()
+        assert dg._feasible_combo_table(profile, None, "E") is dg._feasible_combo_table(
+            profile, None, "E"
+        )
+
+
+class TestSelection:
+    """Draws follow the renormalised weights and respect coupling."""
+
+    def test_coupled_pair_shares_feasible_index(self):
+        profile = _ew_coupled_profile()
+        rng = random.Random(11)
+        counts = Counter()
+        for _ in range(4000):
+            _subs, indices = dg._select_subprofiles_for_board(rng, profile, ["N", "E", "S", "W"])
+            assert indices["E"] == indices["W"]
+            counts[indices["E"]] += 1
+        # Index 1 (both seats 21+ HCP) is infeasible; only index 0 remains.
+        assert counts == Counter({0: 4000})
+
+    def test_frequencies_match_weights(self):
+        profile = _load_weak2s()
+        order = list(profile.hand_dealing_order)
+        combos, cumulative = dg._feasible_combo_table(profile, None, "E")
+        total = cumulative[-1]
+        weights = [b - a for a, b in zip([0] + cumulative, cumulative)]
+
+        rng = random.Random(5)
+        draws = 20000
+        counts = Counter()
+        for _ in range(draws):
+            _subs, indices = dg._select_subprofiles_for_board(rng, profile, order)
+            counts[(indices["N"], indices["E"])] += 1
+
+        for (_subs, indices), w in zip(combos, weights):
+            p = w / total
+            sd = (p * (1 - p) / draws) ** 0.5
+            assert abs(counts[(indices["N"], indices["E"])] / draws - p) < 5 * sd + 1e-9
+
+    def test_random_driver_is_part_of_the_draw(self):
+        # Rejection loop: driver N (p=1/2) keeps its 20% feasible mass split
+        # 10/10, driver S keeps 60% split 50/10.  Conditioned on feasibility,
+        # P(index 0) = (0.05 + 0.25) / (0.5 * 0.2 + 0.5 * 0.6) = 0.75 (drawing
+        # the driver first and renormalising per driver would give 2/3).
+        profile = _random_driver_profile()
+        rng = random.Random(3)
+        draws = 8000
+        counts = Counter()
+        for _ in range(draws):
+            _subs, indices = dg._select_subprofiles_for_board(rng, profile, ["N", "E", "S", "W"])
+            assert indices["N"] == indices["S"] != 2
+            counts[indices["N"]] += 1
+        sd = (0.75 * 0.25 / draws) ** 0.5
+        assert abs(counts[0] / draws - 0.75) < 5 * sd
+
+    def test_returned_dicts_are_copies(self):
+        profile = _load_weak2s()
+        order = list(profile.hand_dealing_order)
+        subs, indices = dg._select_subprofiles_for_board(random.Random(1), profile, order)
+        subs.clear()
+        indices.clear()
+        subs2, indices2 = dg._select_subprofiles_for_board(random.Random(1), profile, order)
+        assert len(subs2) == 4 and len(indices2) == 4
+
+
+class TestFallback:
+    """Oversized combination spaces use the rejection loop."""
+
+    def test_oversized_space_falls_back(self, monkeypatch):
+        monkeypatch.setattr(dg, "FEASIBLE_COMBO_INDEX_MAX", 1)
+        profile = _load_weak2s()
+        assert dg._feasible_combo_table(profile, None, "E") is None
+        order = list(profile.hand_dealing_order)
+        for seed in range(50):
+            subs, _ = dg._select_subprofiles_for_board(random.Random(seed), profile, order)
+            assert _cross_seat_feasible(subs)[0]
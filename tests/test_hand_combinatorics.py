@@ -0,0 +1,159 @@
+# tests/test_hand_combinatorics.py
+"""
+Tests for the exact hand-acceptance model (hand_combinatorics).
+
+Counts are checked against closed-form hypergeometric values and against
+brute-force sampling; the v2 consumers (_dispersion_check and
+_compute_dealing_order) are checked for the cases the single-suit table
+could not see.
+"""
+from __future__ import annotations
+
+import random
+from math import comb
+from types import SimpleNamespace
+
+from bridge_engine import deal_generator as dg
+from bridge_engine.deal_generator_types import _ID_HCP, _ID_SUIT
+from bridge_engine.hand_combinatorics import (
+    TOTAL_HANDS,
+    _SUIT_KH_COUNTS,
+    hand_counts_by_hcp,
+    subprofile_acceptance_probability,
+    subprofile_shape_probability,
+    subprofile_suit_windows,
+    window_probability,
+)
+from bridge_engine.hand_profile import StandardSuitConstraints, SubProfile, SuitRange
+
+_OPEN = (0, 13, 0, 10)
+
+
+def _sub(total_min=0, total_max=37, **suits) -> SubProfile:
+    open_r = SuitRange()
+    return SubProfile(
+        standard=StandardSuitConstraints(
+            spades=suits.get("spades", open_r),
+            hearts=suits.get("hearts", open_r),
+            diamonds=suits.get("diamonds", open_r),
+            clubs=suits.get("clubs", open_r),
+            total_min_hcp=total_min,
+            total_max_hcp=total_max,
+        )
+    )
+
+
+class TestSuitTable:
+    """_SUIT_KH_COUNTS covers every holding of one suit exactly once."""
+
+    def test_rows_sum_to_binomials(self):
+        for k in range(14):
+            assert sum(_SUIT_KH_COUNTS[k]) == comb(13, k)
+
+    def test_full_suit_has_10_hcp(self):
+        assert _SUIT_KH_COUNTS[13][10] == 1
+
+
+class TestHandCounts:
+    """Exact counts of 13-card hands."""
+
+    def test_open_windows_count_every_hand(self):
+        counts = hand_counts_by_hcp((_OPEN,) * 4)
+        assert sum(counts) == TOTAL_HANDS
+        assert counts[37] == 4  # all A/K/Q plus any one jack
+
+    def test_mean_hcp_is_10(self):
+        counts = hand_counts_by_hcp((_OPEN,) * 4)
+        assert sum(h * n for h, n in enumerate(counts)) == 10 * TOTAL_HANDS
+
+    def test_single_suit_minimum_matches_hypergeometric(self):
+        for m in range(14):
+            expected = sum(
+                comb(13, k) * comb(39, 13 - k) for k in range(m, 14)
+            ) / TOTAL_HANDS
+            got = window_probability(((m, 13, 0, 10), _OPEN, _OPEN, _OPEN))
+            assert abs(got - expected) < 1e-12
+
+    def test_4333_shape(self):
+        """Any 4-3-3-3 is 10.54% of hands; one fixed long suit is a quarter."""
+        p = window_probability(((4, 4, 0, 10), (3, 3, 0, 10), (3, 3, 0, 10), (3, 3, 0, 10)))
+        assert abs(4 * p - 0.105361) < 1e-6
+
+    def test_empty_total_window_is_zero(self):
+        assert window_probability((_OPEN,) * 4, 20, 10) == 0.0
+
+    def test_matches_sampling(self):
+        """Joint shape + suit HCP + total HCP agrees with brute-force sampling."""
+        windows = ((4, 6, 2, 10), (0, 3, 0, 10), _OPEN, _OPEN)
+        exact = window_probability(windows, 11, 16)
+        rng = random.Random(5)
+        trials = 40000
+        hits = 0
+        for _ in range(trials):
+            hand = rng.sample(range(52), 13)
+            lengths = [0, 0, 0, 0]
+            hcp = [0, 0, 0, 0]
+            for c in hand:
+                lengths[_ID_SUIT[c]] += 1
+                hcp[_ID_SUIT[c]] += _ID_HCP[c]
+            ok = 11 <= sum(hcp) <= 16 and all(
+                w[0] <= lengths[i] <= w[1] and w[2] <= hcp[i] <= w[3]
+                for i, w in enumerate(windows)
+            )
+            hits += ok
+        sd = (exact * (1 - exact) / trials) ** 0.5
+        assert abs(hits / trials - exact) < 4 * sd
+
+
+class TestSubprofileProbabilities:
+    """Window extraction and per-subprofile probabilities."""
+
+    def test_rs_ranges_intersected(self):
+        sub = _sub(spades=SuitRange(min_cards=2, max_cards=8))
+        rs_ranges = {"S": SuitRange(min_cards=6, max_cards=6, min_hcp=3, max_hcp=7)}
+        windows = subprofile_suit_windows(sub, rs_ranges)
+        assert windows[0] == (6, 6, 3, 7)
+        assert windows[1] == (0, 13, 0, 37)
+
+    def test_acceptance_below_shape(self):
+        sub = _sub(total_min=15, total_max=17, spades=SuitRange(min_cards=5, max_cards=13))
+        shape = subprofile_shape_probability(sub)
+        assert abs(shape - 0.176336) < 1e-6
+        assert 0 < subprofile_acceptance_probability(sub) < shape
+
+    def test_duck_typed_subprofile(self):
+        sub = SimpleNamespace(standard=SimpleNamespace(total_min_hcp=0, total_max_hcp=37))
+        assert abs(subprofile_acceptance_probability(sub) - 1.0) < 1e-12
+
+
+class TestV2Consumers:
+    """_dispersion_check / _compute_dealing_order use the exact model."""
+
+    def test_joint_window_flags_seat(self):
+        """4+ in both majors: loose suit by suit, tight jointly."""
+        sub = _sub(
+            spades=SuitRange(min_cards=4, max_cards=13),
+            hearts=SuitRange(min_cards=4, max_cards=13),
+        )
+        assert dg._dispersion_check({"N": sub}) == {"N"}
+
+    def test_max_only_constraints_not_tight(self):
+        """No suit minimum: nothing for pre-allocation to place."""
+        sub = _sub(
+            spades=SuitRange(max_cards=1),
+            hearts=SuitRange(max_cards=1),
+        )
+        assert subprofile_shape_probability(sub) < 0.19
+        assert dg._dispersion_check({"N": sub}) == set()
+
+    def test_dealing_order_acceptance_tiebreak(self):
+        """Equal risk and HCP range: the rarer shape is dealt first."""
+        subs = {
+            "N": _sub(total_min=10, total_max=20),
+            "E": _sub(total_min=10, total_max=20),
+            "S": _sub(total_min=10, total_max=20, hearts=SuitRange(min_cards=6, max_cards=13)),
+            "W": _sub(total_min=10, total_max=20),
+        }
+        order = dg._compute_dealing_order(subs, "N")
+        assert order[0] == "S"
+        assert order[1:] == ["N", "E", "W"]
@@ -0,0 +1,99 @@
+# tests/test_iter_deals.py
+"""
+Tests for the streaming API: deal_generator.iter_deals() and
+deal_output.stream_deals().
+"""
+from __future__ import annotations
+
+from itertools import islice
+
+import pytest
+
+from bridge_engine import deal_generator as dg
+from bridge_engine.deal_generator import generate_deals, iter_deals
+from bridge_engine.deal_generator_helpers import (
+    _apply_vulnerability_and_rotation,
+    _iter_vulnerability_and_rotation,
+)
+from bridge_engine.deal_output import render_deals, stream_deals
+
+
+class TestIterVulnerabilityAndRotation:
+    """Lazy enrichment draws from the RNG exactly like the list version."""
+
+    def test_matches_list_version(self, make_valid_profile, make_setup, snapshot_deals):
+        import random
+
+        profile = make_valid_profile()
+        base = generate_deals(make_setup(profile.profile_name), profile, 6,
+                              enable_rotation=False).deals
+        eager = _apply_vulnerability_and_rotation(random.Random(3), base)
+        lazy = list(_iter_vulnerability_and_rotation(random.Random(3), iter(base)))
+        assert snapshot_deals(lazy) == snapshot_deals(eager)
+
+
+class TestIterDeals:
+    """iter_deals() streams the per-board-seeded boards."""
+
+    def test_matches_per_board_generate_deals(
+        self, make_valid_profile, make_setup, snapshot_deals,
+    ):
+        profile = make_valid_profile()
+        setup = make_setup(profile.profile_name)
+        expected = generate_deals(setup, profile, 5, workers=1).deals
+        streamed = iter_deals(setup, profile, num_deals=5)
+        assert snapshot_deals(streamed) == snapshot_deals(expected)
+
+    def test_unbounded_stream_is_lazy(self, make_valid_profile, monkeypatch, make_setup):
+        profile = make_valid_profile()
+        setup = make_setup(profile.profile_name)
+        built = []
+        real = dg._build_board_from_seed
+
+        def counting(profile, seed, board_number, **kwargs):
+            built.append(board_number)
+            return real(profile, seed, board_number, **kwargs)
+
+        monkeypatch.setattr(dg, "_build_board_from_seed", counting)
+        stream = iter_deals(setup, profile)
+        assert built == []
+        first = next(stream)
+        assert first.board_number == 1
+        assert built == [1]
+        assert [d.board_number for d in islice(stream, 3)] == [2, 3, 4]
+
+    def test_invalid_num_deals_raises_immediately(self, make_valid_profile, make_setup):
+        profile = make_valid_profile()
+        with pytest.raises(dg.DealGenerationError):
+            iter_deals(make_setup(profile.profile_name), profile, num_deals=0)
+
+
+class TestStreamDeals:
+    """stream_deals() writes the same files as render_deals()."""
+
+    def test_files_identical_to_render_deals(self, make_valid_profile, make_setup):
+        profile = make_valid_profile()
+        setup = make_setup(profile.profile_name)
+        deal_set = generate_deals(setup, profile, 4, workers=1)
+
+        render_deals(setup, profile, deal_set, print_to_console=False)
+        txt = setup.output_txt_file.read_text(encoding="utf-8")
+        lin = setup.output_lin_file.read_text(encoding="utf-8")
+
+        summary = stream_deals(setup, profile, iter_deals(setup, profile, num_deals=4))
+        assert summary.num_deals == 4
+        assert setup.output_txt_file.read_text(encoding="utf-8") == txt
+        assert setup.output_lin_file.read_text(encoding="utf-8") == lin
+
+    def test_partial_output_kept_on_generator_error(self, make_valid_profile, make_setup):
+        profile = make_valid_profile()
+        setup = make_setup(profile.profile_name)
+
+        def failing():
+            yield from iter_deals(setup, profile, num_deals=2)
+            raise dg.DealGenerationError("board 3 failed")
+
+        with pytest.raises(dg.DealGenerationError):
+            stream_deals(setup, profile, failing())
+        lin_lines = setup.output_lin_file.read_text(encoding="utf-8").splitlines()
+        assert len(lin_lines) == 2
@@ -307,4 +307,32 @@ def test_run_deal_generation_session_happy_path(monkeypatch, tmp_path: Path, cap
     # Session summary printed
     assert "=== Session complete ===" in out
     assert "Profile       : Defense to Weak 2s" in out
-    assert "Deals created : 4" in out
\ No newline at end of file
+    assert "Deals created : 4" in out
+
+def test_ask_resume_offers_checkpoint_for_other_board_count(
+    monkeypatch, tmp_path: Path, capsys, make_valid_profile
+) -> None:
+    """A checkpoint for another board count is resumed on its terms or dropped."""
+    from bridge_engine.deal_checkpoint import DealCheckpoint
+
+    profile = make_valid_profile()
+    path = tmp_path / "checkpoint.json"
+    DealCheckpoint(seed=5, num_deals=8, enable_rotation=True, mode="serial").save(
+        path, profile
+    )
+    answers: List[bool] = []
+    monkeypatch.setattr(orchestrator, "_yes_no", lambda prompt, default=True: answers.pop(0))
+
+    answers[:] = [True]
+    assert orchestrator._ask_resume(path, profile, 4, True) == (True, 8, True)
+    assert "0 of 8 deals" in capsys.readouterr().out
+
+    answers[:] = [False]
+    assert orchestrator._ask_resume(path, profile, 4, True) == (False, 4, True)
+    assert "Starting afresh" in capsys.readouterr().out
+
+    answers[:] = [True]
+    assert orchestrator._ask_resume(path, profile, 8, True) == (True, 8, True)
+    assert orchestrator._ask_resume(tmp_path / "none.json", profile, 8, True) == (
+        False, 8, True,
+    )
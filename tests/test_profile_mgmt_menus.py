@@ -3,7 +3,7 @@
 Tests for the profile management and admin menu loops:
   - run_profile_manager() dispatches to all 7 actions
   - run_profile_manager() error recovery for wizard exceptions
-  - admin_menu() dispatches to all 4 actions
+  - admin_menu() dispatches to all 5 actions
   - admin_menu() exits immediately on 0
 """
 from __future__ import annotations
@@ -73,9 +73,9 @@ def test_profile_manager_error_recovery(monkeypatch, capsys):
 
 def test_admin_menu_dispatches_all_actions(monkeypatch, capsys):
     """
-    Walking through choices 1-4 then 0 should call each action exactly once.
+    Walking through choices 1-5 then 0 should call each action exactly once.
     """
-    calls = {"lin": 0, "drafts": 0, "diag": 0, "help": 0}
+    calls = {"lin": 0, "drafts": 0, "diag": 0, "policy": 0, "help": 0}
 
     monkeypatch.setattr(lin_tools, "combine_lin_files_interactive", lambda: _inc(calls, "lin"))
     monkeypatch.setattr(pc, "run_draft_tools", lambda: _inc(calls, "drafts"))
@@ -83,15 +83,19 @@ def test_admin_menu_dispatches_all_actions(monkeypatch, capsys):
         orchestrator, "_run_profile_diagnostic_interactive",
         lambda: _inc(calls, "diag"),
     )
+    monkeypatch.setattr(
+        orchestrator, "_run_deal_policy_optimizer_interactive",
+        lambda: _inc(calls, "policy"),
+    )
     monkeypatch.setattr(orchestrator, "get_menu_help", lambda key: _inc(calls, "help") or "help")
 
     # admin_menu imports _input_int directly, so patch on orchestrator module
-    choices = iter([1, 2, 3, 4, 0])
+    choices = iter([1, 2, 3, 4, 5, 0])
     monkeypatch.setattr(orchestrator, "_input_int", lambda prompt, **kw: next(choices))
 
     orchestrator.admin_menu()
 
-    assert calls == {"lin": 1, "drafts": 1, "diag": 1, "help": 1}
+    assert calls == {"lin": 1, "drafts": 1, "diag": 1, "policy": 1, "help": 1}
 
 
 def test_admin_menu_exit_immediately(monkeypatch, capsys):
@@ -51,4 +51,42 @@ def test_save_and_load_profile_roundtrip(tmp_path, monkeypatch):
     loaded_path, loaded_profile = loaded[0]
     assert loaded_path == path
     assert isinstance(loaded_profile, HandProfile)
-    assert loaded_profile.profile_name == "Dummy"
\ No newline at end of file
+    assert loaded_profile.profile_name == "Dummy"
+
+def _write_dummy(dir_path: Path, name: str, description: str = "Test profile") -> Path:
+    profile = make_dummy_profile()
+    profile.description = description
+    path = dir_path / name
+    ps._save_profile_to_path(profile, path)
+    return path
+
+
+def test_load_profile_dir_reuses_unchanged_profiles(tmp_path):
+    path = _write_dummy(tmp_path, "Dummy_v0.1.json")
+    draft = _write_dummy(tmp_path, "Dummy_v0.1_TEST.json")
+
+    first = ps.load_profile_dir(tmp_path)
+    assert [p for p, _ in first] == [path]
+    again = ps.load_profile_dir(tmp_path)
+    assert again[0][1] is first[0][1]
+
+    with_drafts = ps.load_profile_dir(tmp_path, include_drafts=True)
+    assert [p for p, _ in with_drafts] == [path, draft]
+
+    _write_dummy(tmp_path, "Dummy_v0.1.json", description="Edited")
+    (changed,) = ps.load_profile_dir(tmp_path)
+    assert changed[1] is not first[0][1]
+    assert changed[1].description == "Edited"
+
+
+def test_load_profile_dir_skips_bad_files(tmp_path, capsys):
+    good = _write_dummy(tmp_path, "Dummy_v0.1.json")
+    (tmp_path / "Broken.json").write_text("{not json", encoding="utf-8")
+
+    loaded = ps.load_profile_dir(tmp_path)
+    assert [p for p, _ in loaded] == [good]
+    assert "Broken.json" in capsys.readouterr().err
+
+    # Failures are not cached: the file is retried (and warned about) again.
+    ps.load_profile_dir(tmp_path)
+    assert "Broken.json" in capsys.readouterr().err
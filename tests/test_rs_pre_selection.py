@@ -288,6 +288,9 @@ class TestDispersionCheckRS:
 # ===================================================================
 
 
+_HONOR_HCP = {"A": 4, "K": 3, "Q": 2, "J": 1}
+
+
 def _make_deck():
     """Build a standard 52-card deck for testing."""
     ranks = "AKQJT98765432"
@@ -412,6 +415,47 @@ class TestPreAllocateRS:
         # floor(6 * 0.75) = 4
         assert len(pre) == 4
 
+    def test_hcp_target_always_met(self):
+        """Weak-two RS suit (6 cards, 5-7 HCP) is on target every time."""
+        rs = _DummyRS(
+            allowed_suits=["S", "H", "D"],
+            required_suits_count=1,
+            suit_ranges=[_DummySuitRange(min_cards=6, max_cards=6, min_hcp=5, max_hcp=7)],
+        )
+        sub = _DummySubProfile(rs=rs)
+        for seed in range(200):
+            pre = dg._pre_allocate_rs(random.Random(seed), _make_deck(), sub, ["H"])
+            assert len(pre) == 6
+            assert 5 <= sum(_HONOR_HCP.get(c[0], 0) for c in pre) <= 7
+
+    def test_hcp_target_pro_rated_to_fraction(self):
+        """fraction=0.5: 3 of 6 cards, 5-7 HCP pro-rated to 2-4 HCP."""
+        rs = _DummyRS(
+            allowed_suits=["S", "H", "D"],
+            required_suits_count=1,
+            suit_ranges=[_DummySuitRange(min_cards=6, max_cards=6, min_hcp=5, max_hcp=7)],
+        )
+        sub = _DummySubProfile(rs=rs)
+        for seed in range(100):
+            pre = dg._pre_allocate_rs(
+                random.Random(seed), _make_deck(), sub, ["S"], fraction=0.5
+            )
+            assert len(pre) == 3
+            assert 2 <= sum(_HONOR_HCP.get(c[0], 0) for c in pre) <= 4
+
+    def test_unreachable_hcp_target_falls_back_to_random(self):
+        """No subset of the available cards is on target: plain sample."""
+        rs = _DummyRS(
+            allowed_suits=["S", "H", "D"],
+            required_suits_count=1,
+            suit_ranges=[_DummySuitRange(min_cards=4, max_cards=4, min_hcp=8, max_hcp=10)],
+        )
+        sub = _DummySubProfile(rs=rs)
+        deck = [c for c in _make_deck() if c not in ("AS", "KS")]
+        pre = dg._pre_allocate_rs(random.Random(42), deck, sub, ["S"])
+        assert len(pre) == 4
+        assert all(c[1] == "S" for c in pre)
+
 
 # ===================================================================
 # B4 — _deal_with_help() with rs_pre_selections
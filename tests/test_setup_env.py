@@ -63,6 +63,24 @@ def test_run_setup_random_non_interactive(tmp_path: Path) -> None:
     assert isinstance(setup.seed, int)
 
 
+def test_run_setup_explicit_seed_skips_prompt(tmp_path: Path, monkeypatch) -> None:
+    def no_prompt(*args, **kwargs):
+        raise AssertionError("explicit seed must not prompt")
+
+    monkeypatch.setattr("builtins.input", no_prompt)
+    setup = run_setup(
+        base_dir=tmp_path / "out",
+        owner="Batch",
+        profile_name="Seeded",
+        ask_seed_choice=True,
+        use_seeded_default=False,
+        seed=12345,
+    )
+
+    assert setup.seed == 12345
+    assert setup.use_seeded_run is True
+
+
 def test_run_setup_creates_nested_directories(tmp_path: Path) -> None:
     base_dir = tmp_path / "a" / "b" / "c"
 